@@ -210,26 +210,19 @@ def main():
             presentation_id=presentation_id
         )
         
-        # Get the session object to access the queue directly
-        session = session_manager.get_session(session_id)
-        
         # Open microphone and start capturing audio
         print(f"{BOLD}🎙️  Opening microphone...{RESET}")
         with MicrophoneStream(RATE, CHUNK) as stream:
             audio_generator = stream.generator()
             
-            # Start a background thread to feed audio into the queue immediately
-            # Put directly into queue, bypassing status check
+            # Start a background thread to feed audio immediately; frames of
+            # any size are re-chunked and queued until the stream opens
             def audio_feeder():
-                """Feed audio chunks into the session queue"""
+                """Feed microphone frames into the session"""
                 try:
                     for chunk in audio_generator:
                         if chunk:
-                            # Put directly into queue (bypasses ACTIVE status check)
-                            try:
-                                session.audio_queue.put(chunk, timeout=1.0)
-                            except queue.Full:
-                                print(f"⚠️  Audio queue full, dropping chunk")
+                            session_manager.feed_audio(session_id, chunk)
                 except Exception as e:
                     print(f"Audio feeder error: {e}")
             
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark the AutomaticGainControl chunk path and its memory over a long session.
+
+Compares the in-place AGC (preallocated scratch buffers, fused gain/clip/
+convert, running statistics) with the previous implementation (a float
+copy, squared, gained, clipped and int16 array per chunk, and a list of
+every gain). Reports:
+- Chunks per second of CPU time (one core) for process_chunk
+- Chunks per second for process_into writing into the caller's buffer
+- Resident memory growth over a simulated session (default: 8 hours of
+  100ms chunks = 288,000 chunks)
+
+Usage:
+    python scripts/benchmark_agc.py
+    python scripts/benchmark_agc.py --hours 1 --chunk-ms 20
+"""
+
+import argparse
+import logging
+import resource
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.audio_preprocessing import AutomaticGainControl
+
+
+SAMPLE_RATE = 16000
+
+logger = logging.getLogger(__name__)
+
+
+class PreviousAGC(AutomaticGainControl):
+    """The previous process_chunk/get_stats, as a reference"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.gain_adjustments = []
+
+    def process_chunk(self, audio_bytes: bytes) -> bytes:
+        audio_int16 = np.frombuffer(audio_bytes, dtype=np.int16)
+        audio_float = audio_int16.astype(np.float32) / 32768.0
+        current_rms = np.sqrt(np.mean(audio_float ** 2))
+        if current_rms < 1e-10:
+            return audio_bytes
+        current_db = 20 * np.log10(current_rms)
+        required_gain_db = max(
+            self.config.min_gain_db,
+            min(self.config.max_gain_db, self.config.target_db - current_db)
+        )
+        self.current_gain_db = (
+            self.config.smoothing_factor * required_gain_db +
+            (1 - self.config.smoothing_factor) * self.current_gain_db
+        )
+        audio_gained = np.clip(audio_float * 10 ** (self.current_gain_db / 20.0), -1.0, 1.0)
+        self.total_chunks += 1
+        self.gain_adjustments.append(self.current_gain_db)
+        logger.debug(f"AGC: current={current_db:.1f}dB, gain={self.current_gain_db:.1f}dB")
+        return (audio_gained * 32767).astype(np.int16).tobytes()
+
+    def get_stats(self) -> dict:
+        return {
+            "total_chunks": self.total_chunks,
+            "avg_gain_db": np.mean(self.gain_adjustments),
+            "min_gain_db": np.min(self.gain_adjustments),
+            "max_gain_db": np.max(self.gain_adjustments),
+        }
+
+
+def make_chunks(count: int, chunk_ms: float) -> list:
+    """Speech-like chunks at several levels"""
+    rng = np.random.default_rng(0)
+    samples = int(chunk_ms * SAMPLE_RATE / 1000)
+    chunks = []
+    for idx in range(count):
+        amplitude = (0.002, 0.05, 0.2, 0.5)[idx % 4]
+        audio = amplitude * np.sin(np.arange(samples) / (3 + idx % 7)) + rng.normal(0, 0.001, samples)
+        chunks.append((audio * 32767).astype(np.int16).tobytes())
+    return chunks
+
+
+def rss_mb() -> float:
+    """Current resident set size (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize() / 2**20
+    except OSError:
+        scale = 2**20 if sys.platform == 'darwin' else 2**10
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def measure(process, chunks: list, repeat: int = 3) -> float:
+    """Best CPU seconds over repeats"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.process_time()
+        for chunk in chunks:
+            process(chunk)
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def simulate_session(agc: AutomaticGainControl, chunks: list, total: int) -> tuple:
+    """Process `total` chunks; returns (RSS growth MB, CPU seconds, stats)"""
+    before = rss_mb()
+    start = time.process_time()
+    for idx in range(total):
+        agc.process_chunk(chunks[idx % len(chunks)])
+    stats = agc.get_stats()
+    return rss_mb() - before, time.process_time() - start, stats
+
+
+def main():
+    """Run the AGC benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the AGC chunk path and long-session memory")
+    parser.add_argument('--chunks', type=int, default=20000,
+                        help="Chunks per throughput run (default: 20000)")
+    parser.add_argument('--chunk-ms', type=float, default=100.0,
+                        help="Chunk size in ms (default: 100)")
+    parser.add_argument('--hours', type=float, default=8.0,
+                        help="Simulated session length for the memory check (default: 8)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    chunks = make_chunks(64, args.chunk_ms)
+    throughput_chunks = [chunks[idx % len(chunks)] for idx in range(args.chunks)]
+
+    agc = AutomaticGainControl()
+    buffers = [np.frombuffer(bytearray(chunk), dtype=np.int16) for chunk in chunks]
+    rows = [
+        ('previous', measure(PreviousAGC().process_chunk, throughput_chunks)),
+        ('process_chunk', measure(AutomaticGainControl().process_chunk, throughput_chunks)),
+        ('process_into', measure(
+            lambda samples: agc.process_into(samples, out=samples),
+            [buffers[idx % len(buffers)] for idx in range(args.chunks)]
+        )),
+    ]
+
+    print(f"\n{args.chunk_ms:.0f}ms chunks, {args.chunks:,} per run")
+    print(f"{'path':>14} {'chunks/s':>12} {'us/chunk':>9} {'speedup':>8}")
+    for name, cpu_s in rows:
+        print(f"{name:>14} {args.chunks / cpu_s:>12,.0f} {cpu_s / args.chunks * 1e6:>9.1f} "
+              f"{rows[0][1] / cpu_s:>7.1f}x")
+
+    total = int(args.hours * 3600 * 1000 / args.chunk_ms)
+    print(f"\nSimulated {args.hours:g}h session: {total:,} chunks")
+    print(f"{'AGC':>14} {'RSS growth MB':>14} {'CPU s':>8} {'avg gain dB':>12}")
+    # In-place first, so the previous AGC's gain list does not inflate its baseline
+    for name, session_agc in (('in-place', AutomaticGainControl()), ('previous', PreviousAGC())):
+        growth, cpu_s, stats = simulate_session(session_agc, chunks, total)
+        print(f"{name:>14} {growth:>14.1f} {cpu_s:>8.1f} {stats['avg_gain_db']:>12.2f}")
+
+    print("\n✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark audio buffering: per-chunk bytes vs the session ring buffer.
+
+Pushes synthetic audio through the per-session path
+(capture -> AudioChunkHandler -> AudioSendQueue -> renewal AudioBuffer ->
+VAD -> gRPC request payload) in two modes:
+- bytes: every capture returns a new bytes object that the stages hold
+- ring:  capture reads straight into the session AudioRingBuffer and the
+  stages share memoryviews of it
+
+and reports, per second of audio:
+- Bytes allocated (tracemalloc peak above baseline, summed per chunk)
+- Memory retained after the run
+- Processing time per chunk (without tracemalloc)
+
+Usage:
+    python scripts/benchmark_audio_buffers.py
+    python scripts/benchmark_audio_buffers.py --seconds 120 --chunk-ms 200
+"""
+
+import argparse
+import io
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.audio_handler import AudioChunkHandler
+from src.streaming.audio_queue import AudioSendQueue
+from src.streaming.audio_ring_buffer import AudioRingBuffer
+from src.streaming.audio_preprocessing import VoiceActivityDetector
+from src.streaming.session_renewer import AudioBuffer
+
+
+SAMPLE_RATE = 16000
+MODES = ['bytes', 'ring']
+
+
+def make_source(seconds: float) -> io.BytesIO:
+    """Synthetic capture device: speech-like noise"""
+    rng = np.random.default_rng(0)
+    audio = rng.normal(0, 2000, int(seconds * SAMPLE_RATE)).astype(np.int16)
+    return io.BytesIO(audio.tobytes())
+
+
+class Pipeline:
+    """Per-session stages of one mode"""
+
+    def __init__(self, mode: str, chunk_bytes: int):
+        self.mode = mode
+        self.chunk_bytes = chunk_bytes
+        self.ring = AudioRingBuffer(capacity_ms=12000) if mode == 'ring' else None
+        self.handler = AudioChunkHandler(max_buffer_size=2, ring_buffer=self.ring)
+        self.queue = AudioSendQueue(max_ms=2000)
+        self.renewal = AudioBuffer(max_size=50)
+        self.vad = VoiceActivityDetector()
+
+    def step(self, source: io.BytesIO) -> bool:
+        """Capture, buffer, analyse and send one chunk"""
+        if self.ring is not None:
+            start, end = self.ring.write_from(source.readinto, self.chunk_bytes)
+            if end - start < self.chunk_bytes:
+                return False
+            captured = self.ring.view(start, end)
+        else:
+            captured = source.read(self.chunk_bytes)
+            if len(captured) < self.chunk_bytes:
+                return False
+
+        self.handler.process_chunk(captured)
+        chunk = self.handler.last_chunk
+
+        self.queue.put(chunk)
+        if self.renewal.size() >= self.renewal.max_size:
+            self.renewal.get_all()
+        self.renewal.add(chunk)
+        self.vad.process_chunk(chunk)
+
+        # gRPC boundary: the request owns its payload
+        payload = bytes(self.queue.get(timeout=0))
+        return len(payload) > 0
+
+
+def measure(mode: str, seconds: float, chunk_ms: int) -> Dict:
+    """Run one mode and collect allocation and timing figures"""
+    chunk_bytes = SAMPLE_RATE * 2 * chunk_ms // 1000
+
+    # Timing run (no tracing overhead)
+    pipeline = Pipeline(mode, chunk_bytes)
+    source = make_source(seconds)
+    chunks = 0
+    start = time.perf_counter()
+    while pipeline.step(source):
+        chunks += 1
+    elapsed = time.perf_counter() - start
+
+    # Allocation run
+    pipeline = Pipeline(mode, chunk_bytes)
+    source = make_source(seconds)
+    pipeline.step(source)  # warm up lazily created state
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    allocated = 0
+    while True:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        more = pipeline.step(source)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - before
+        if not more:
+            break
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    audio_s = chunks * chunk_ms / 1000
+    return {
+        'mode': mode,
+        'chunks': chunks,
+        'audio_s': audio_s,
+        'allocated_kb_per_audio_s': allocated / 1024 / audio_s,
+        'retained_kb': (retained - baseline) / 1024,
+        'us_per_chunk': elapsed / chunks * 1e6,
+        'ring_wrap_copies': pipeline.ring.wrap_copies if pipeline.ring else 0,
+    }
+
+
+def main():
+    """Run the audio buffering benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark audio buffering allocations")
+    parser.add_argument('--seconds', type=float, default=60.0,
+                        help="Seconds of audio per mode (default: 60)")
+    parser.add_argument('--chunk-ms', type=int, default=100, choices=[100, 200],
+                        help="Chunk size in ms (default: 100)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    results = [measure(mode, args.seconds, args.chunk_ms) for mode in MODES]
+
+    print(f"\n{'mode':<6} {'alloc KB/audio s':>17} {'retained KB':>12} {'us/chunk':>9} {'wrap copies':>12}")
+    for r in results:
+        print(f"{r['mode']:<6} {r['allocated_kb_per_audio_s']:>17.1f} {r['retained_kb']:>12.1f} "
+              f"{r['us_per_chunk']:>9.1f} {r['ring_wrap_copies']:>12}")
+
+    bytes_mode, ring_mode = results
+    saved = 1 - ring_mode['allocated_kb_per_audio_s'] / bytes_mode['allocated_kb_per_audio_s']
+    print(f"\n✅ Ring buffer allocates {saved:.0%} less per second of audio")
+
+
+if __name__ == "__main__":
+    main()
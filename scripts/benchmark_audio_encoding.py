@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark compressed upstream audio: LINEAR16 vs MULAW, FLAC and OGG_OPUS.
+
+Runs N concurrent sessions per encoding against the fake recognizer (no
+network or credentials; it decodes each request as the stream's config
+says). One driver paces 100ms chunks of a speech-like talk for every
+session in real time and each run reports:
+- Bytes on the wire per session (kbit/s) and the ratio to LINEAR16
+- Encoding CPU milliseconds per session-second, and sessions one core
+  could encode
+- Codec lag: audio sent but not yet on the wire, averaged over chunks
+  (FLAC blocks, Ogg pages and the Opus lookahead)
+- Final result latency (arrival after the end of the final's last word)
+  and its increase over LINEAR16. Besides the codec lag this includes the
+  fake recognizer's request granularity: it classifies speech per
+  request, and compressed requests do not line up with chunks
+
+Every run happens in a fresh process.
+
+Usage:
+    python scripts/benchmark_audio_encoding.py
+    python scripts/benchmark_audio_encoding.py --sessions 50 --duration 30 --encodings FLAC,OGG_OPUS
+"""
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+SAMPLE_RATE = 16000
+ENCODINGS = ['LINEAR16', 'MULAW', 'FLAC', 'OGG_OPUS']
+
+
+def make_talk(chunk_ms: int, duration_s: float, seed: int) -> List[bytes]:
+    """Chunks of a talk: ~3s of voiced, syllable-modulated sound then ~1s of pause"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration_s * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 120 + 30 * np.sin(2 * np.pi * 0.7 * t + seed)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 12))
+    syllables = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t + seed) ** 2
+    talking = ((t + seed * 0.7) % 4) < 3
+    noise = np.convolve(rng.normal(0, 1, t.size), np.ones(4) / 4, 'same')
+    audio = 3000 * voiced * syllables * talking + 30 * noise
+    samples = SAMPLE_RATE * chunk_ms // 1000
+    pcm = audio.astype(np.int16).tobytes()
+    return [pcm[pos:pos + samples * 2] for pos in range(0, len(pcm), samples * 2)]
+
+
+def codec_lag_ms(encoding: str, talk: List[bytes]) -> float:
+    """Mean audio (ms) held by the encoder after each chunk"""
+    from src.streaming.audio_encoder import StreamingAudioDecoder, create_encoder
+
+    encoder = create_encoder(encoding)
+    decoder = StreamingAudioDecoder(encoding)
+    fed_s = sent_s = 0.0
+    lags = []
+    for chunk in talk:
+        fed_s += len(chunk) / 2 / SAMPLE_RATE
+        sent_s += decoder.decode(encoder.encode(chunk))[1]
+        lags.append(fed_s - sent_s)
+    return float(np.mean(lags)) * 1000
+
+
+class LatencyStats:
+    """Final result latencies, collected by the result callback"""
+
+    def __init__(self, speed: float):
+        self.speed = speed
+        self.start = None  # Wall time of the first chunk (session audio 0)
+        self.latencies_ms: List[float] = []
+        self._lock = threading.Lock()
+
+    def on_result(self, result):
+        if not result.is_final or not result.words or self.start is None:
+            return
+        spoken = self.start + result.words[-1]["end_time"] / self.speed
+        with self._lock:
+            self.latencies_ms.append((time.perf_counter() - spoken) * 1000)
+
+
+def benchmark(encoding: str, sessions: int, options: Dict) -> Dict:
+    """One encoding's run (executed in a fresh process)"""
+    logging.basicConfig(level=logging.ERROR)
+    from src.streaming.session_manager import StreamingSessionManager
+    from tests.fake_recognizer import FakeSpeechClient
+
+    talks = [make_talk(options['chunk_ms'], options['duration_s'], seed) for seed in range(sessions)]
+    interval_s = options['chunk_ms'] / 1000 / options['speed']
+    stats = LatencyStats(options['speed'])
+
+    manager = StreamingSessionManager(
+        project_id="encoding-benchmark",
+        result_callback=stats.on_result,
+        client=FakeSpeechClient(),
+        audio_encoding=encoding
+    )
+    session_ids = [f"session-{i}" for i in range(sessions)]
+    for session_id in session_ids:
+        manager.create_session(session_id, "encoding-benchmark")
+        manager.start_session(session_id)
+
+    stats.start = start = time.perf_counter()
+    for tick in range(len(talks[0])):
+        delay = start + tick * interval_s - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        for session_id, talk in zip(session_ids, talks):
+            manager.send_audio_chunk(session_id, talk[tick])
+
+    summaries = [manager.close_session(session_id)["session"] for session_id in session_ids]
+    audio_s = sessions * options['duration_s']
+    latencies = np.asarray(stats.latencies_ms) if stats.latencies_ms else np.zeros(1)
+    return {
+        'encoding': encoding,
+        'sessions': sessions,
+        'raw_bytes': sum(s['total_bytes_sent'] for s in summaries),
+        'wire_bytes': sum(s['wire_bytes_sent'] for s in summaries),
+        'kbit_per_s': sum(s['wire_bytes_sent'] for s in summaries) * 8 / 1000 / audio_s,
+        'encode_ms_per_s': sum(s['encode_cpu_ms'] for s in summaries) / audio_s,
+        'codec_lag_ms': codec_lag_ms(encoding, talks[0]),
+        'finals': len(stats.latencies_ms),
+        'latency_ms': {
+            'p50': float(np.percentile(latencies, 50)),
+            'p95': float(np.percentile(latencies, 95)),
+        },
+    }
+
+
+def main():
+    """Run the audio encoding benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark compressed upstream audio")
+    parser.add_argument('--sessions', type=int, default=20,
+                        help="Concurrent sessions per encoding (default: 20)")
+    parser.add_argument('--duration', type=float, default=12.0,
+                        help="Seconds of audio per session (default: 12)")
+    parser.add_argument('--chunk-ms', type=int, default=100,
+                        help="Audio chunk size in ms (default: 100)")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="Pacing speed-up over real time (default: 1.0)")
+    parser.add_argument('--encodings', type=str, default=','.join(ENCODINGS),
+                        help="Encodings to run (default: all)")
+    args = parser.parse_args()
+
+    options = {
+        'duration_s': args.duration,
+        'chunk_ms': args.chunk_ms,
+        'speed': args.speed,
+    }
+    encodings = [e.strip().upper() for e in args.encodings.split(',') if e.strip()]
+    for encoding in encodings:
+        if encoding not in ENCODINGS:
+            print(f"❌ Unknown encoding: {encoding}")
+            sys.exit(1)
+
+    results = []
+    for encoding in encodings:
+        print(f"Running {args.sessions} sessions with {encoding}...")
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results.append(pool.submit(benchmark, encoding, args.sessions, options).result())
+
+    baseline = next((r for r in results if r['encoding'] == 'LINEAR16'), None)
+    print(f"\n{args.sessions} sessions x {args.duration:g}s, {args.chunk_ms}ms chunks")
+    print(f"{'encoding':>9} {'kbit/s':>7} {'ratio':>6} {'encode ms/s':>12} {'sess/core':>10} "
+          f"{'codec lag':>10} {'finals':>7} {'latency p50':>12} {'p95':>8} {'added':>8}")
+    for r in results:
+        per_core = 1000 / r['encode_ms_per_s'] if r['encode_ms_per_s'] else float('inf')
+        added = ''
+        if baseline is not None:
+            added = f"{r['latency_ms']['p50'] - baseline['latency_ms']['p50']:+.0f}ms"
+        print(f"{r['encoding']:>9} {r['kbit_per_s']:>7.1f} {r['wire_bytes'] / r['raw_bytes']:>6.2f} "
+              f"{r['encode_ms_per_s']:>12.2f} {per_core:>10,.0f} {r['codec_lag_ms']:>8.0f}ms {r['finals']:>7} "
+              f"{r['latency_ms']['p50']:>10.0f}ms {r['latency_ms']['p95']:>6.0f}ms {added:>8}")
+
+    print("\n✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
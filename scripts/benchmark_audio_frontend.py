@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-session audio front-end (decode, downmix, resample).
+
+Feeds band-limited noise in common client formats through AudioFrontend
+in fixed-size frames and reports, per format:
+- CPU milliseconds per session-second of audio (one core)
+- Real-time sessions one core could serve
+- SNR of the 16kHz output against librosa.resample of the whole signal
+
+For reference, librosa.resample called on each frame separately (a new
+filter per frame, with edge effects at every frame boundary) is measured
+the same way.
+
+Usage:
+    python scripts/benchmark_audio_frontend.py
+    python scripts/benchmark_audio_frontend.py --seconds 60 --frame-ms 100
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.audio_frontend import AudioFrontend, AudioInputFormat
+
+
+FORMATS = [
+    AudioInputFormat(48000, 2, 'float32'),
+    AudioInputFormat(48000, 1, 'int16'),
+    AudioInputFormat(44100, 2, 'int16'),
+    AudioInputFormat(44100, 2, 'int24'),
+    AudioInputFormat(22050, 1, 'int16'),
+    AudioInputFormat(8000, 1, 'int16'),
+    AudioInputFormat(16000, 2, 'int16'),
+]
+
+
+def make_audio(sample_rate: int, seconds: float) -> np.ndarray:
+    """Noise band-limited below 6kHz (or 0.4 x the rate), in [-1, 1)"""
+    rng = np.random.default_rng(0)
+    noise = rng.normal(0, 0.1, int(sample_rate * seconds))
+    spectrum = np.fft.rfft(noise)
+    spectrum[np.fft.rfftfreq(noise.size, 1 / sample_rate) > min(6000, 0.4 * sample_rate)] = 0
+    return np.fft.irfft(spectrum, noise.size)
+
+
+def encode(audio: np.ndarray, input_format: AudioInputFormat) -> bytes:
+    """Mono float audio to interleaved client PCM"""
+    frames = np.repeat(audio[:, None], input_format.channels, axis=1)
+    if input_format.sample_format == 'float32':
+        return frames.astype('<f4').tobytes()
+    pcm = np.round(frames * 32767).astype(np.int32)
+    if input_format.sample_format == 'int24':
+        return (pcm * 256).astype('<i4').view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    return pcm.astype('<i2').tobytes()
+
+
+def snr_db(expected: np.ndarray, got: np.ndarray) -> float:
+    size = min(expected.size, got.size)
+    edge = slice(200, size - 200)
+    error = expected[edge] - got[edge]
+    return 10 * np.log10(np.sum(expected[edge] ** 2) / max(np.sum(error ** 2), 1e-20))
+
+
+def main():
+    """Run the audio front-end benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the audio front-end")
+    parser.add_argument('--seconds', type=float, default=30.0,
+                        help="Seconds of audio per format (default: 30)")
+    parser.add_argument('--frame-ms', type=float, default=20.0,
+                        help="Client frame size in ms (default: 20)")
+    parser.add_argument('--no-librosa', action='store_true',
+                        help="Skip the librosa accuracy check and reference")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    librosa = None
+    if not args.no_librosa:
+        import librosa
+
+    print(f"\n{args.seconds:g}s per format, {args.frame_ms:g}ms client frames")
+    print(f"{'format':>22} {'ms/session-s':>13} {'sessions/core':>14} {'SNR vs librosa':>15}")
+    for input_format in FORMATS:
+        audio = make_audio(input_format.sample_rate, args.seconds)
+        data = encode(audio, input_format)
+        frame_bytes = int(input_format.sample_rate * args.frame_ms / 1000) * input_format.bytes_per_frame
+        frames = [data[pos:pos + frame_bytes] for pos in range(0, len(data), frame_bytes)]
+
+        frontend = AudioFrontend(input_format)
+        start = time.process_time()
+        output = [frontend.process(frame) for frame in frames]
+        output.append(frontend.flush())
+        per_second = (time.process_time() - start) / args.seconds
+
+        snr = ''
+        if librosa is not None:
+            expected = librosa.resample(
+                audio.astype(np.float32), orig_sr=input_format.sample_rate,
+                target_sr=16000, res_type='soxr_hq'
+            )
+            got = np.frombuffer(b''.join(output), dtype=np.int16) / 32767
+            snr = f"{snr_db(expected, got):.1f} dB"
+
+        name = f"{input_format.sample_rate}Hz/{input_format.channels}ch/{input_format.sample_format}"
+        print(f"{name:>22} {per_second * 1000:>13.2f} {1 / per_second:>14,.0f} {snr:>15}")
+
+    if librosa is not None:
+        print("\nReference: librosa.resample per frame (no state carried between frames)")
+        for sample_rate in (48000, 44100):
+            audio = make_audio(sample_rate, args.seconds).astype(np.float32)
+            size = int(sample_rate * args.frame_ms / 1000)
+            for res_type in ('soxr_hq', 'polyphase'):
+                start = time.process_time()
+                got = np.concatenate([
+                    librosa.resample(audio[pos:pos + size], orig_sr=sample_rate, target_sr=16000, res_type=res_type)
+                    for pos in range(0, audio.size, size)
+                ])
+                per_second = (time.process_time() - start) / args.seconds
+                expected = librosa.resample(audio, orig_sr=sample_rate, target_sr=16000, res_type='soxr_hq')
+                name = f"{sample_rate}Hz {res_type}"
+                print(f"{name:>22} {per_second * 1000:>13.2f} {1 / per_second:>14,.0f} "
+                      f"{snr_db(expected, got):>12.1f} dB")
+
+    print("\n✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
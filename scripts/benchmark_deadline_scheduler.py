@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark session monitoring: per-second scans vs the deadline scheduler.
+
+Simulates N sessions on a virtual clock, each with renewal (270s), idle
+(60s) and stuck (30s) checks, and compares:
+- scan: every second, copy the active sessions and evaluate all three
+  checks on each (what SessionRenewer's polling monitor loop does)
+- heap: DeadlineScheduler; a check runs only when its deadline is due
+  (re-armed from the callback, as the session manager does)
+
+Both modes run the same checks on real StreamingSession objects.
+
+Reports checks evaluated and CPU time per simulated minute.
+
+Usage:
+    python scripts/benchmark_deadline_scheduler.py
+    python scripts/benchmark_deadline_scheduler.py --sessions 100,1000,10000 --minutes 10
+"""
+
+import argparse
+import gc
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.deadline_scheduler import DeadlineScheduler
+from src.streaming.session_manager import StreamingSession, SessionStatus
+from src.streaming.session_renewer import SessionRenewer
+
+
+RENEWAL_S = 270.0
+IDLE_S = 60.0
+STUCK_S = 30.0
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_sessions(count: int) -> Dict[str, StreamingSession]:
+    """Active sessions with staggered starts; audio keeps arriving"""
+    now = time.time()
+    sessions = {}
+    for idx in range(count):
+        session = StreamingSession(session_id=f"s{idx}", presentation_id="p")
+        session.status = SessionStatus.ACTIVE
+        session.created_at = now - idx % 270
+        sessions[session.session_id] = session
+    return sessions
+
+
+def check_session(renewer: SessionRenewer, session: StreamingSession) -> int:
+    """The three per-session checks (renewal, idle, stuck)"""
+    renewer._should_renew(session)
+    session.time_since_last_audio() >= IDLE_S
+    time.time() - session.last_sent_time >= STUCK_S and session.audio_queue.qsize()
+    return 3
+
+
+def run_scan(sessions: Dict[str, StreamingSession], seconds: int) -> Dict:
+    """Every second: copy the active sessions and check each one"""
+    renewer = SessionRenewer(session_manager=None)
+    checks = 0
+    start = time.process_time()
+    for _ in range(seconds):
+        active = {sid: s for sid, s in sessions.items() if s.status == SessionStatus.ACTIVE}
+        for session in active.values():
+            checks += check_session(renewer, session)
+    return {'checks': checks, 'cpu_s': time.process_time() - start}
+
+
+def run_heap(sessions: Dict[str, StreamingSession], seconds: int) -> Dict:
+    """Deadlines per session; a check runs only when its deadline is due"""
+    renewer = SessionRenewer(session_manager=None)
+    clock = VirtualClock()
+    scheduler = DeadlineScheduler(clock=clock)
+    checks = [0]
+
+    def make_check(kind: str, session: StreamingSession, delay: float):
+        key = (kind, session.session_id)
+
+        def due():
+            checks[0] += check_session(renewer, session) // 3
+            scheduler.schedule(key, delay, due)  # Re-armed with the same callback
+        return key, due
+
+    start = time.process_time()
+    for idx, session in enumerate(sessions.values()):
+        for kind, first, delay in (('renewal', RENEWAL_S - idx % 270, RENEWAL_S),
+                                   ('idle', IDLE_S, IDLE_S),
+                                   ('stuck', STUCK_S, STUCK_S)):
+            key, due = make_check(kind, session, delay)
+            scheduler.schedule(key, first, due)
+    for now in range(1, seconds + 1):
+        clock.now = now
+        scheduler.run_due()
+    return {'checks': checks[0], 'cpu_s': time.process_time() - start}
+
+
+def main():
+    """Run the monitoring benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark session deadline monitoring")
+    parser.add_argument('--sessions', type=str, default='100,1000,10000',
+                        help="Comma-separated session counts")
+    parser.add_argument('--minutes', type=int, default=10,
+                        help="Simulated minutes (default: 10)")
+    args = parser.parse_args()
+
+    seconds = args.minutes * 60
+    print(f"\n{'sessions':>9} {'mode':>5} {'checks/min':>11} {'CPU ms/min':>11}")
+    for count in [int(v) for v in args.sessions.split(',') if v.strip()]:
+        for mode, run in (('scan', run_scan), ('heap', run_heap)):
+            logging.disable(logging.INFO)
+            sessions = make_sessions(count)
+            # Keep full collections of long-lived objects (imported libraries,
+            # the sessions) out of the timing
+            gc.collect()
+            gc.freeze()
+            result = run(sessions, seconds)
+            gc.unfreeze()
+            print(f"{count:>9} {mode:>5} {result['checks'] / args.minutes:>11.0f} "
+                  f"{result['cpu_s'] * 1000 / args.minutes:>11.1f}")
+
+    print("\n✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
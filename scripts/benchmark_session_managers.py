@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Load test: threaded vs asyncio streaming session managers.
+
+Runs N concurrent sessions against the fake recognizer (no network or
+credentials) with both StreamingSessionManager and
+AsyncStreamingSessionManager. One driver paces 100ms chunks for every
+session in real time (or --speed times faster) and each run reports:
+- Process CPU time and sessions per core (N * audio seconds / CPU seconds,
+  i.e. how many real-time talks one core could sustain)
+- Peak thread count and peak RSS
+- Driver lag (how late chunk ticks are; rising lag means saturation)
+- Final results received
+
+Every run happens in a fresh process so thread counts and RSS are not
+shared between managers.
+
+Usage:
+    python scripts/benchmark_session_managers.py --sessions 50,200 --duration 10
+    python scripts/benchmark_session_managers.py --sessions 500 --speed 2 --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+SAMPLE_RATE = 16000
+MANAGERS = ['threaded', 'async']
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def make_talk(chunk_ms: int, duration_s: float, seed: int) -> List[bytes]:
+    """Chunks of a talk: ~3s of speech-like noise then ~1s of pause, repeated"""
+    rng = np.random.default_rng(seed)
+    samples = SAMPLE_RATE * chunk_ms // 1000
+    speech = [(rng.normal(0, 2000, samples)).astype(np.int16).tobytes() for _ in range(8)]
+    silence = (rng.normal(0, 30, samples)).astype(np.int16).tobytes()
+
+    chunks = []
+    per_second = 1000 // chunk_ms
+    position = int(rng.integers(0, 4 * per_second))  # desync sessions
+    for idx in range(int(duration_s * per_second)):
+        in_speech = (position + idx) % (4 * per_second) < 3 * per_second
+        chunks.append(speech[idx % len(speech)] if in_speech else silence)
+    return chunks
+
+
+class LoadStats:
+    """Counters shared by the driver and the result callback"""
+
+    def __init__(self):
+        self.finals = 0
+        self.interims = 0
+        self.peak_threads = threading.active_count()
+        self.lags_ms: List[float] = []
+
+    def on_result(self, result):
+        if result.is_final:
+            self.finals += 1
+        else:
+            self.interims += 1
+
+    def tick(self, lag_s: float):
+        self.lags_ms.append(lag_s * 1000)
+        self.peak_threads = max(self.peak_threads, threading.active_count())
+
+
+def run_threaded(talks: List[List[bytes]], interval_s: float, stats: LoadStats):
+    """Drive all sessions through StreamingSessionManager"""
+    from src.streaming.session_manager import StreamingSessionManager
+    from tests.fake_recognizer import FakeSpeechClient
+
+    manager = StreamingSessionManager(
+        project_id="load-test",
+        result_callback=stats.on_result,
+        client=FakeSpeechClient()
+    )
+    session_ids = [f"session-{i}" for i in range(len(talks))]
+    for session_id in session_ids:
+        manager.create_session(session_id, "load-test")
+        manager.start_session(session_id)
+
+    start = time.perf_counter()
+    for tick in range(len(talks[0])):
+        due = start + tick * interval_s
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        stats.tick(time.perf_counter() - due)
+        for session_id, talk in zip(session_ids, talks):
+            manager.send_audio_chunk(session_id, talk[tick])
+
+    for session_id in session_ids:
+        manager.close_session(session_id)
+
+
+def run_async(talks: List[List[bytes]], interval_s: float, stats: LoadStats):
+    """Drive all sessions through AsyncStreamingSessionManager"""
+    from src.streaming.async_session_manager import AsyncStreamingSessionManager
+    from tests.fake_recognizer import FakeSpeechAsyncClient
+
+    async def drive():
+        manager = AsyncStreamingSessionManager(
+            project_id="load-test",
+            result_callback=stats.on_result,
+            client=FakeSpeechAsyncClient()
+        )
+        session_ids = [f"session-{i}" for i in range(len(talks))]
+        for session_id in session_ids:
+            manager.create_session(session_id, "load-test")
+            await manager.start_session(session_id)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for tick in range(len(talks[0])):
+            due = start + tick * interval_s
+            await asyncio.sleep(max(0.0, due - loop.time()))
+            stats.tick(loop.time() - due)
+            for session_id, talk in zip(session_ids, talks):
+                await manager.send_audio_chunk(session_id, talk[tick])
+
+        await asyncio.gather(*(manager.close_session(s) for s in session_ids))
+
+    asyncio.run(drive())
+
+
+def benchmark(manager_name: str, sessions: int, options: Dict) -> Dict:
+    """One load test run (executed in a fresh process)"""
+    logging.basicConfig(level=logging.ERROR)
+    # Import outside the measured section
+    import src.streaming  # noqa: F401
+
+    talks = [make_talk(options['chunk_ms'], options['duration_s'], seed) for seed in range(sessions)]
+    interval_s = options['chunk_ms'] / 1000 / options['speed']
+    stats = LoadStats()
+
+    runner = run_threaded if manager_name == 'threaded' else run_async
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    runner(talks, interval_s, stats)
+    wall_s = time.perf_counter() - wall_start
+    cpu_s = time.process_time() - cpu_start
+
+    audio_s = options['duration_s']
+    lags = np.asarray(stats.lags_ms)
+    return {
+        'manager': manager_name,
+        'sessions': sessions,
+        'audio_s_per_session': audio_s,
+        'wall_s': wall_s,
+        'cpu_s': cpu_s,
+        'cpu_utilization': cpu_s / wall_s if wall_s else 0.0,
+        'sessions_per_core': sessions * audio_s / cpu_s if cpu_s else float('inf'),
+        'peak_threads': stats.peak_threads,
+        'peak_rss_mb': peak_rss_mb(),
+        'driver_lag_ms': {
+            'p50': float(np.percentile(lags, 50)),
+            'p99': float(np.percentile(lags, 99)),
+            'max': float(lags.max()),
+        },
+        'finals': stats.finals,
+        'interims': stats.interims,
+    }
+
+
+def print_results(results: List[Dict]):
+    """Print a comparison table"""
+    print(f"\n{'manager':<9} {'sessions':>8} {'cpu s':>7} {'sess/core':>10} "
+          f"{'threads':>8} {'rss MB':>7} {'lag p99':>8} {'finals':>7}")
+    for r in results:
+        print(f"{r['manager']:<9} {r['sessions']:>8} {r['cpu_s']:>7.2f} "
+              f"{r['sessions_per_core']:>10.0f} {r['peak_threads']:>8} "
+              f"{r['peak_rss_mb']:>7.0f} {r['driver_lag_ms']['p99']:>7.1f}ms {r['finals']:>7}")
+
+
+def main():
+    """Run the session manager load test."""
+    parser = argparse.ArgumentParser(description="Threaded vs asyncio session manager load test")
+    parser.add_argument('--sessions', type=str, default='50,200',
+                        help="Comma-separated concurrent session counts (default: 50,200)")
+    parser.add_argument('--duration', type=float, default=10.0,
+                        help="Seconds of audio per session (default: 10)")
+    parser.add_argument('--chunk-ms', type=int, default=100,
+                        help="Audio chunk size in ms (default: 100)")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="Pacing speed-up over real time (default: 1.0)")
+    parser.add_argument('--managers', type=str, default=','.join(MANAGERS),
+                        help="Managers to run (default: threaded,async)")
+    parser.add_argument('--output', type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+
+    options = {
+        'duration_s': args.duration,
+        'chunk_ms': args.chunk_ms,
+        'speed': args.speed,
+    }
+    counts = [int(n) for n in args.sessions.split(',') if n.strip()]
+    managers = [m.strip() for m in args.managers.split(',') if m.strip()]
+    for name in managers:
+        if name not in MANAGERS:
+            print(f"❌ Unknown manager: {name}")
+            sys.exit(1)
+
+    results = []
+    for sessions in counts:
+        for name in managers:
+            print(f"Running {name} manager with {sessions} sessions...")
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                results.append(pool.submit(benchmark, name, sessions, options).result())
+
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'options': options, 'results': results}, f, indent=2)
+        print(f"\n✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
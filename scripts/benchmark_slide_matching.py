@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Benchmark the slide matching pipeline.
+
+Runs every presentation fixture (and optional synthetic decks of any
+size, see scripts/generate_synthetic_deck.py) through SlideProcessor and reports, per deck:
+- Deck build time (keyword extraction, indexing, embeddings)
+- Per-segment latency percentiles for each stage:
+  tokenize, exact, fuzzy, semantic, combine, total
+- Peak RSS
+- Accuracy / precision / recall / F1 against the labelled slides
+
+Results are written as JSON. With --compare, results are checked against
+a stored baseline and regressions are flagged (non-zero exit status).
+Each deck is benchmarked --runs times and every timing is the median over
+the runs. A latency change counts only when it exceeds the relative
+tolerance and the stage's own run-to-run spread (so a 2x slowdown of a
+1ms stage is caught while the noise of a slow stage is not flagged).
+
+Runs fully offline unless --embeddings is given.
+
+Usage:
+    python scripts/benchmark_slide_matching.py --output bench.json
+    python scripts/benchmark_slide_matching.py --synthetic-slides 100,500 \\
+        --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.slide_processing.stage_timing import MATCH_STAGES
+from src.slide_processing.synthetic_deck import SyntheticDeckGenerator
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_FIXTURES = PROJECT_ROOT / 'tests' / 'fixtures' / 'test_presentations'
+
+STAGES = list(MATCH_STAGES)
+PERCENTILES = [50, 90, 95, 99]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def summarize_latencies(samples: List[float]) -> Dict[str, float]:
+    """Latency percentiles in ms"""
+    if not samples:
+        return {'count': 0}
+
+    values = np.asarray(samples)
+    summary = {'count': len(samples), 'mean': float(values.mean()), 'max': float(values.max())}
+    for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f'p{p}'] = float(value)
+    return summary
+
+
+def calculate_accuracy(expected: List[int], matched: List[Optional[int]]) -> Dict[str, float]:
+    """Accuracy and micro precision / recall / F1 (E2E test counting)"""
+    total = len(expected)
+    correct = sum(1 for e, m in zip(expected, matched) if e == m)
+    answered = sum(1 for m in matched if m is not None)
+
+    precision = correct / answered if answered else 0.0
+    recall = correct / total if total else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) else 0.0
+
+    return {
+        'accuracy': correct / total if total else 0.0,
+        'precision': precision,
+        'recall': recall,
+        'f1_score': f1,
+    }
+
+
+def benchmark_deck(presentation: Dict, options: Dict) -> Dict:
+    """Build a deck and match its transcript, collecting measurements"""
+    from src.slide_processing import SlideProcessor
+
+    rss_start = peak_rss_mb()
+
+    processor = SlideProcessor(
+        use_embeddings=options['embeddings'],
+        keyword_scoring=options['keyword_scoring']
+    )
+
+    start = time.perf_counter()
+    processor.process_slides(presentation['slides'])
+    build_time = time.perf_counter() - start
+    rss_built = peak_rss_mb()
+
+    segments = presentation['transcript_segments']
+    timings = {stage: [] for stage in STAGES}
+    expected = []
+    matched = []
+
+    for _ in range(options['repeat']):
+        processor.score_combiner.reset()
+        expected.clear()
+        matched.clear()
+
+        for segment in segments:
+            result = processor.match_segment(segment['text'], segment.get('start_time', 0.0))
+            for stage, latency_ms in processor.stage_timer.last_spans.items():
+                timings[stage].append(latency_ms)
+            expected.append(segment['expected_slide'])
+            matched.append(result.slide_id if result else None)
+
+    return {
+        'slides': len(presentation['slides']),
+        'segments': len(segments),
+        'keywords': len(processor.exact_matcher.inverted_index),
+        'build_time_s': build_time,
+        'latency_ms': {stage: summarize_latencies(timings[stage]) for stage in STAGES},
+        'rss_mb': {
+            'start': rss_start,
+            'after_build': rss_built,
+            'peak': peak_rss_mb(),
+        },
+        'metrics': calculate_accuracy(expected, matched),
+    }
+
+
+def run_benchmark(presentation: Dict, options: Dict) -> Dict:
+    """Run one deck benchmark, in a fresh process unless disabled"""
+    if not options['isolate']:
+        return benchmark_deck(presentation, options)
+
+    # A fresh interpreter per deck keeps peak RSS attributable to the deck
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(benchmark_deck, presentation, options).result()
+
+
+def exceeds(now: float, before: float, tolerance: float, floor: float) -> bool:
+    """Whether now is above before by more than max(tolerance x before, floor)"""
+    return now - before > max(tolerance * before, floor)
+
+
+def median_results(runs: List[Dict]) -> Dict:
+    """
+    Combine runs of one deck: the median of every latency, build time and
+    RSS, and each latency's spread (max - min) over the runs.
+    """
+    combined = dict(runs[0])
+    combined['runs'] = len(runs)
+    combined['build_time_s'] = float(np.median([run['build_time_s'] for run in runs]))
+    combined['latency_ms'] = {
+        stage: {
+            key: float(np.median([run['latency_ms'][stage][key] for run in runs]))
+            for key in summary
+        }
+        for stage, summary in runs[0]['latency_ms'].items()
+    }
+    combined['latency_spread_ms'] = {
+        stage: {
+            key: float(np.ptp([run['latency_ms'][stage][key] for run in runs]))
+            for key in summary
+        }
+        for stage, summary in runs[0]['latency_ms'].items()
+    }
+    combined['rss_mb'] = {
+        key: float(np.median([run['rss_mb'][key] for run in runs]))
+        for key in runs[0]['rss_mb']
+    }
+    return combined
+
+
+def compare_results(current: Dict, baseline: Dict, latency_tolerance: float = 0.5,
+                    rss_tolerance: float = 0.20, accuracy_tolerance: float = 0.02,
+                    min_latency_ms: float = 0.1, min_build_ms: float = 20.0,
+                    min_rss_mb: float = 16.0, noise_factor: float = 2.0) -> List[str]:
+    """
+    Compare against a baseline run.
+
+    Latency, build time and RSS increases are regressions only above
+    max(relative tolerance x baseline, floor). A latency's floor is
+    noise_factor x its larger run-to-run spread in the two results (see
+    median_results), and at least min_latency_ms, so it scales per stage.
+
+    Returns:
+        List of regression descriptions (empty if none)
+    """
+    regressions = []
+
+    for name, deck in current['decks'].items():
+        base = baseline.get('decks', {}).get(name)
+        if not base:
+            continue
+
+        for stage in STAGES:
+            for key in ('p50', 'p95'):
+                now = deck['latency_ms'][stage].get(key)
+                before = base.get('latency_ms', {}).get(stage, {}).get(key)
+                if now is None or before is None:
+                    continue
+                spread = max(
+                    deck.get('latency_spread_ms', {}).get(stage, {}).get(key, 0.0),
+                    base.get('latency_spread_ms', {}).get(stage, {}).get(key, 0.0)
+                )
+                if exceeds(now, before, latency_tolerance, max(min_latency_ms, noise_factor * spread)):
+                    regressions.append(
+                        f"{name}: {stage} {key} {before:.3f}ms -> {now:.3f}ms "
+                        f"(+{(now / max(before, 1e-9) - 1) * 100:.0f}%)"
+                    )
+
+        before = base.get('build_time_s')
+        now = deck['build_time_s']
+        if before and exceeds(now, before, latency_tolerance, min_build_ms / 1000):
+            regressions.append(f"{name}: build time {before:.3f}s -> {now:.3f}s")
+
+        before = base.get('rss_mb', {}).get('peak')
+        now = deck['rss_mb']['peak']
+        if before and exceeds(now, before, rss_tolerance, min_rss_mb):
+            regressions.append(f"{name}: peak RSS {before:.1f}MB -> {now:.1f}MB")
+
+        for metric in ('accuracy', 'f1_score'):
+            before = base.get('metrics', {}).get(metric)
+            now = deck['metrics'][metric]
+            if before is not None and now < before - accuracy_tolerance:
+                regressions.append(f"{name}: {metric} {before:.1%} -> {now:.1%}")
+
+    return regressions
+
+
+def print_report(results: Dict):
+    """Print per-deck summary table"""
+    print("\n" + "=" * 100)
+    print(f"{'Deck':<28} {'Slides':>6} {'Segs':>6} {'Build':>8} "
+          f"{'p50':>8} {'p95':>8} {'p99':>8} {'RSS':>8} {'Acc':>7} {'F1':>7}")
+    print("-" * 100)
+    for name, deck in results['decks'].items():
+        total = deck['latency_ms']['total']
+        print(f"{name:<28} {deck['slides']:>6} {deck['segments']:>6} "
+              f"{deck['build_time_s']:>7.2f}s "
+              f"{total.get('p50', 0):>6.2f}ms {total.get('p95', 0):>6.2f}ms "
+              f"{total.get('p99', 0):>6.2f}ms {deck['rss_mb']['peak']:>6.0f}MB "
+              f"{deck['metrics']['accuracy']:>6.1%} {deck['metrics']['f1_score']:>7.3f}")
+    print("=" * 100)
+
+    print("\nPer-stage p95 latency (ms):")
+    print(f"{'Deck':<28} " + " ".join(f"{stage:>9}" for stage in STAGES))
+    for name, deck in results['decks'].items():
+        print(f"{name:<28} " + " ".join(
+            f"{deck['latency_ms'][stage].get('p95', 0):>9.3f}" for stage in STAGES
+        ))
+
+
+def main():
+    """Run the slide matching benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark slide matching")
+    parser.add_argument('--fixtures', type=Path, default=DEFAULT_FIXTURES,
+                        help="Directory of presentation JSON fixtures")
+    parser.add_argument('--deck', type=Path, action='append', default=[],
+                        help="Additional presentation JSON file (repeatable)")
+    parser.add_argument('--synthetic-slides', type=str, default='',
+                        help="Comma-separated synthetic deck sizes, e.g. 100,500")
+    parser.add_argument('--synthetic-segments-per-slide', type=float, default=4.0,
+                        help="Transcript segments per synthetic slide (default: 4)")
+    parser.add_argument('--synthetic-noise', type=float, default=0.1,
+                        help="ASR noise level of synthetic transcripts (default: 0.1)")
+    parser.add_argument('--seed', type=int, default=0, help="Synthetic deck seed")
+    parser.add_argument('--embeddings', action='store_true',
+                        help="Enable semantic matching (needs the embedding model)")
+    parser.add_argument('--keyword-scoring', choices=['tfidf', 'bm25'], default='tfidf')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Passes over each transcript for latency samples")
+    parser.add_argument('--runs', type=int, default=3,
+                        help="Runs per deck; timings are the median over runs (default: 3)")
+    parser.add_argument('--no-isolate', action='store_true',
+                        help="Run all decks in this process (peak RSS is cumulative)")
+    parser.add_argument('--output', type=Path, help="Write results JSON here")
+    parser.add_argument('--compare', type=Path, help="Baseline results JSON to compare against")
+    parser.add_argument('--latency-tolerance', type=float, default=0.5,
+                        help="Allowed relative latency increase (default: 0.5)")
+    parser.add_argument('--rss-tolerance', type=float, default=0.20,
+                        help="Allowed relative peak RSS increase (default: 0.20)")
+    parser.add_argument('--accuracy-tolerance', type=float, default=0.02,
+                        help="Allowed absolute accuracy/F1 drop (default: 0.02)")
+    parser.add_argument('--min-latency-ms', type=float, default=0.1,
+                        help="Ignore latency changes smaller than this (default: 0.1)")
+    parser.add_argument('--noise-factor', type=float, default=2.0,
+                        help="Ignore latency changes within this many run-to-run "
+                             "spreads of the stage (default: 2)")
+    parser.add_argument('--min-build-ms', type=float, default=20.0,
+                        help="Ignore build time changes smaller than this (default: 20)")
+    parser.add_argument('--min-rss-mb', type=float, default=16.0,
+                        help="Ignore peak RSS changes smaller than this (default: 16)")
+    args = parser.parse_args()
+
+    options = {
+        'embeddings': args.embeddings,
+        'keyword_scoring': args.keyword_scoring,
+        'repeat': max(1, args.repeat),
+        'runs': max(1, args.runs),
+        'isolate': not args.no_isolate,
+    }
+
+    presentations = {}
+    for path in sorted(args.fixtures.glob('*.json')) + list(args.deck):
+        with open(path, encoding='utf-8') as f:
+            presentations[path.stem] = json.load(f)
+
+    sizes = [int(size) for size in args.synthetic_slides.split(',') if size]
+    if sizes:
+        generator = SyntheticDeckGenerator.from_fixture_dir(str(args.fixtures), seed=args.seed)
+        for size in sizes:
+            presentations[f'synthetic_{size}'] = generator.generate(
+                num_slides=size,
+                num_segments=int(size * args.synthetic_segments_per_slide),
+                noise=args.synthetic_noise
+            )
+
+    if not presentations:
+        print("❌ No presentations to benchmark")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("SLIDE MATCHING BENCHMARK")
+    print("=" * 60)
+    print(f"Decks: {len(presentations)}, embeddings={args.embeddings}, "
+          f"keyword_scoring={args.keyword_scoring}, repeat={options['repeat']}, "
+          f"runs={options['runs']}")
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'options': options,
+        },
+        'decks': {},
+    }
+
+    for name, presentation in presentations.items():
+        print(f"\n▶ {name}: {len(presentation['slides'])} slides, "
+              f"{len(presentation['transcript_segments'])} segments")
+        results['decks'][name] = median_results([
+            run_benchmark(presentation, options) for _ in range(options['runs'])
+        ])
+        deck = results['decks'][name]
+        print(f"   build={deck['build_time_s']:.2f}s "
+              f"p95={deck['latency_ms']['total'].get('p95', 0):.2f}ms "
+              f"accuracy={deck['metrics']['accuracy']:.1%}")
+
+    print_report(results)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✅ Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare_results(
+            results,
+            baseline,
+            args.latency_tolerance,
+            args.rss_tolerance,
+            args.accuracy_tolerance,
+            args.min_latency_ms,
+            args.min_build_ms,
+            args.min_rss_mb,
+            args.noise_factor
+        )
+
+        print("\n" + "=" * 60)
+        print(f"COMPARISON WITH BASELINE: {args.compare}")
+        print("=" * 60)
+        if regressions:
+            for regression in regressions:
+                print(f"   ❌ {regression}")
+            print(f"\n❌ {len(regressions)} regression(s) detected")
+            sys.exit(1)
+        print("   ✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic Japanese slide decks and labelled transcripts.
+
+Decks are composed from the vocabulary of the test presentation
+fixtures and written as fixture JSON (slides + transcript segments with
+expected_slide labels) and as PDF, for scale testing of slide matching.
+
+Usage:
+    python scripts/generate_synthetic_deck.py --slides 500 --duration-min 180
+    python scripts/generate_synthetic_deck.py --slides 50,100,250,500 --noise 0.2 \\
+        --output-dir tests/test_data/synthetic
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.slide_processing.synthetic_deck import SyntheticDeckGenerator, write_pdf
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_FIXTURES = PROJECT_ROOT / 'tests' / 'fixtures' / 'test_presentations'
+
+
+def main():
+    """Generate synthetic decks."""
+    parser = argparse.ArgumentParser(description="Generate synthetic slide decks")
+    parser.add_argument('--slides', type=str, default='100',
+                        help="Comma-separated deck sizes (default: 100)")
+    parser.add_argument('--segments-per-slide', type=float, default=4.0,
+                        help="Transcript segments per slide (default: 4)")
+    parser.add_argument('--duration-min', type=float,
+                        help="Transcript length in minutes (overrides --segments-per-slide)")
+    parser.add_argument('--noise', type=float, default=0.1,
+                        help="ASR noise level 0-1 (default: 0.1)")
+    parser.add_argument('--backtrack-rate', type=float, default=0.05,
+                        help="Probability of referring back to the previous slide")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--fixtures', type=Path, default=DEFAULT_FIXTURES,
+                        help="Fixture directory providing the vocabulary")
+    parser.add_argument('--output-dir', type=Path, default=Path('synthetic_decks'))
+    parser.add_argument('--no-pdf', action='store_true', help="Only write fixture JSON")
+    args = parser.parse_args()
+
+    generator = SyntheticDeckGenerator.from_fixture_dir(str(args.fixtures), seed=args.seed)
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"Vocabulary: {len(generator.terms)} terms from {args.fixtures}")
+
+    for size in (int(s) for s in args.slides.split(',') if s):
+        presentation = generator.generate(
+            num_slides=size,
+            num_segments=int(size * args.segments_per_slide),
+            duration_s=args.duration_min * 60 if args.duration_min else None,
+            noise=args.noise,
+            backtrack_rate=args.backtrack_rate
+        )
+
+        stem = f"synthetic_{size}_seed{args.seed}"
+        json_path = args.output_dir / f"{stem}.json"
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(presentation, f, ensure_ascii=False, indent=2)
+
+        segments = presentation['transcript_segments']
+        print(f"✅ {json_path}: {size} slides, {len(segments)} segments, "
+              f"{segments[-1]['end_time'] / 60:.1f} min")
+
+        if not args.no_pdf:
+            pdf_path = args.output_dir / f"{stem}.pdf"
+            write_pdf(presentation, str(pdf_path))
+            print(f"✅ {pdf_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tune slide matching weights against the labelled test presentations.
+
+Raw exact / fuzzy / semantic scores are computed once per presentation
+and cached; every weight combination is then evaluated by re-combining
+the cached scores, so thousands of configurations take seconds.
+
+Usage:
+    python scripts/tune_matching_weights.py
+    python scripts/tune_matching_weights.py --workers 8 --sort-by f1_score \\
+        --grid exact_weight=0.5:2.0:0.25 --grid switch_multiplier=1.0,1.1,1.3
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.slide_processing.weight_tuner import (
+    TUNABLE_PARAMS,
+    WeightTuner,
+    build_grid,
+    load_or_compute_deck_scores,
+)
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_FIXTURES = PROJECT_ROOT / 'tests' / 'fixtures' / 'test_presentations'
+DEFAULT_CACHE = PROJECT_ROOT / '.cache' / 'weight_tuner'
+
+# Default search space (8 * 6 * 5 * 5 * 6 = 7,200 configurations)
+DEFAULT_GRID = {
+    'exact_weight': [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.5],
+    'fuzzy_weight': [0.0, 0.3, 0.5, 0.7, 1.0, 1.3],
+    'temporal_boost': [0.0, 0.05, 0.2, 0.5, 1.0],
+    'min_score_threshold': [0.5, 1.0, 1.5, 2.0, 3.0],
+    'switch_multiplier': [1.0, 1.1, 1.2, 1.5, 2.0, 3.0],
+}
+
+
+def parse_grid_values(spec: str):
+    """
+    Parse 'name=v1,v2,...' or 'name=start:stop:step' (stop inclusive).
+    """
+    name, _, values = spec.partition('=')
+    if name not in TUNABLE_PARAMS or not values:
+        raise argparse.ArgumentTypeError(
+            f"Expected one of {sorted(TUNABLE_PARAMS)} as name=values, got '{spec}'"
+        )
+
+    if ':' in values:
+        start, stop, step = (float(v) for v in values.split(':'))
+        points = np.arange(start, stop + step / 2, step)
+        return name, [round(float(v), 6) for v in points]
+
+    return name, [float(v) for v in values.split(',')]
+
+
+def main():
+    """Run the weight tuner."""
+    parser = argparse.ArgumentParser(description="Tune slide matching weights")
+    parser.add_argument('--fixtures', type=Path, default=DEFAULT_FIXTURES,
+                        help="Directory of labelled presentation JSON files")
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE,
+                        help="Directory for cached raw scores")
+    parser.add_argument('--grid', type=parse_grid_values, action='append', default=[],
+                        help="Override search values, e.g. exact_weight=0.5:2.0:0.25")
+    parser.add_argument('--embeddings', action='store_true',
+                        help="Include semantic scores (downloads the embedding model)")
+    parser.add_argument('--keyword-scoring', choices=['tfidf', 'bm25'], default='tfidf')
+    parser.add_argument('--title-metadata', action='store_true',
+                        help="Apply title_boost on title keyword hits")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Processes for scoring and evaluation")
+    parser.add_argument('--sort-by', choices=['accuracy', 'f1_score'], default='accuracy')
+    parser.add_argument('--top', type=int, default=10, help="Configurations to print")
+    parser.add_argument('--output', type=Path, help="Write ranked results as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    grid = dict(DEFAULT_GRID)
+    if args.embeddings:
+        # Semantic weight only matters when semantic scores exist
+        grid.setdefault('semantic_weight', [0.0, 0.35, 0.7, 1.0, 1.5])
+    if args.title_metadata:
+        grid.setdefault('title_boost', [1.0, 1.5, 2.0, 3.0])
+    grid.update(dict(args.grid))
+
+    fixture_paths = sorted(args.fixtures.glob('*.json'))
+    if not fixture_paths:
+        print(f"❌ No fixtures found in {args.fixtures}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("SLIDE MATCHING WEIGHT TUNER")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    decks = [
+        load_or_compute_deck_scores(
+            str(path),
+            str(args.cache_dir),
+            use_embeddings=args.embeddings,
+            keyword_scoring=args.keyword_scoring,
+            workers=args.workers
+        )
+        for path in fixture_paths
+    ]
+    print(f"Loaded {len(decks)} decks, {sum(d.num_segments for d in decks)} segments "
+          f"in {time.perf_counter() - start:.1f}s")
+
+    configs = build_grid(**grid)
+    tuner = WeightTuner(decks, title_metadata=args.title_metadata, workers=args.workers)
+
+    start = time.perf_counter()
+    results = tuner.evaluate(configs, sort_by=args.sort_by)
+    elapsed = time.perf_counter() - start
+    print(f"Evaluated {len(configs)} configurations in {elapsed:.2f}s "
+          f"({len(configs) / max(elapsed, 1e-9):.0f}/s, workers={args.workers})")
+
+    baseline = tuner.evaluate([dict(TUNABLE_PARAMS)])[0]
+    print(f"\nCurrent defaults: accuracy={baseline['accuracy']:.1%}, "
+          f"F1={baseline['f1_score']:.3f}")
+
+    print(f"\nTop {args.top} by {args.sort_by}:")
+    for rank, result in enumerate(results[:args.top], 1):
+        tuned = {k: v for k, v in result['params'].items() if k in grid}
+        print(f"  {rank:2d}. accuracy={result['accuracy']:.1%} "
+              f"F1={result['f1_score']:.3f}  {tuned}")
+
+    print("\nBest configuration per deck:")
+    for name, metrics in tuner.evaluate_per_deck(results[0]['params']).items():
+        print(f"  {name}: accuracy={metrics['accuracy']:.1%}, F1={metrics['f1_score']:.3f}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'baseline': baseline, 'results': results}, f, indent=2)
+        print(f"\n✅ Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
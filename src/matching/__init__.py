@@ -6,12 +6,14 @@ Implements multi-pass matching algorithm:
 2. Fuzzy matching (Levenshtein distance)
 3. Semantic matching (embedding similarity)
 4. Score combination with temporal smoothing
+5. Offline Viterbi decoding of full transcripts
 """
 
 from .exact_matcher import ExactMatcher
 from .fuzzy_matcher import FuzzyMatcher
 from .semantic_matcher import SemanticMatcher
 from .score_combiner import ScoreCombiner, MatchResult
+from .timeline_decoder import ViterbiDecoder
 
 __all__ = [
     'ExactMatcher',
@@ -19,4 +21,5 @@ __all__ = [
     'SemanticMatcher',
     'ScoreCombiner',
     'MatchResult',
+    'ViterbiDecoder',
 ]
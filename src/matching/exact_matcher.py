@@ -16,19 +16,26 @@ class ExactMatcher:
     Exact keyword matching using inverted index.
     
     Provides fast lookup of slides containing specific keywords
-    with TF-IDF based scoring.
+    with TF-IDF or BM25 based scoring.
     """
     
-    def __init__(self, inverted_index: Dict[str, List[Tuple[int, int, float]]]):
+    def __init__(self,
+                 inverted_index: Dict[str, List[Tuple[int, int, float]]],
+                 positional: bool = True):
         """
         Initialize exact matcher with prebuilt inverted index.
         
         Args:
-            inverted_index: Inverted index {keyword: [(slide_id, position, tf-idf)]}
+            inverted_index: Inverted index {keyword: [(slide_id, position, tf-idf)]},
+                or {keyword: [(slide_id, term_frequency, bm25)]} for BM25 indexes
+            positional: Whether the second posting field is a keyword position
+                (TF-IDF index) or a term frequency (BM25 index)
         """
         self.inverted_index = inverted_index
+        self.positional = positional
         self.total_keywords = len(inverted_index)
-        logger.info(f"Initialized ExactMatcher with {self.total_keywords} keywords")
+        logger.info(f"Initialized ExactMatcher with {self.total_keywords} keywords "
+                   f"({'positional' if positional else 'per-slide'} postings)")
         
     def match(self, keywords: List[str]) -> Dict[int, Dict[str, any]]:
         """
@@ -41,13 +48,16 @@ class ExactMatcher:
             Dict mapping slide_id to match details:
             {
                 slide_id: {
-                    'score': float,  # Sum of TF-IDF scores
+                    'score': float,  # Sum of TF-IDF (or BM25) scores
                     'matched_keywords': List[str],  # Keywords that matched
-                    'positions': List[int],  # Positions in slide
+                    'positions': List[int],  # Positions in slide (TF-IDF index only)
                     'match_count': int  # Number of matches
                 }
             }
         """
+        if not self.positional:
+            return self._match_per_slide(keywords)
+            
         slide_matches: Dict[int, Dict[str, any]] = defaultdict(lambda: {
             'score': 0.0,
             'matched_keywords': [],
@@ -67,6 +77,33 @@ class ExactMatcher:
                 
         return dict(slide_matches)
         
+    def _match_per_slide(self, keywords: List[str]) -> Dict[int, Dict[str, any]]:
+        """
+        Single pass over per-slide postings (BM25 index).
+        
+        Each posting already holds the length-normalized weight for the
+        (keyword, slide) pair, so one lookup per query keyword is enough.
+        """
+        slide_matches: Dict[int, Dict[str, any]] = {}
+        
+        for keyword in keywords:
+            for slide_id, term_frequency, weight in self.inverted_index.get(keyword, ()):
+                data = slide_matches.get(slide_id)
+                if data is None:
+                    data = slide_matches[slide_id] = {
+                        'score': 0.0,
+                        'matched_keywords': [],
+                        'positions': [],
+                        'term_frequencies': [],
+                        'match_count': 0
+                    }
+                data['score'] += weight
+                data['matched_keywords'].append(keyword)
+                data['term_frequencies'].append(term_frequency)
+                data['match_count'] += 1
+                
+        return slide_matches
+        
     def match_single_keyword(self, keyword: str) -> List[Tuple[int, float]]:
         """
         Find slides matching a single keyword.
@@ -75,7 +112,7 @@ class ExactMatcher:
             keyword: Keyword to match
             
         Returns:
-            List of (slide_id, tf-idf) tuples
+            List of (slide_id, score) tuples
         """
         matches = self.inverted_index.get(keyword, [])
         return [(slide_id, tfidf) for slide_id, _, tfidf in matches]
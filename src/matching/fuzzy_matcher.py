@@ -5,7 +5,7 @@ Matches keywords with small differences using Levenshtein distance
 and phonetic similarity (hiragana comparison).
 """
 
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set
 import Levenshtein
 import logging
 
@@ -61,13 +61,17 @@ class FuzzyMatcher:
                 
     def match(self, 
              query_keywords: List[str],
-             query_readings: List[str] = None) -> Dict[int, Dict[str, any]]:
+             query_readings: List[str] = None,
+             string_cache: Optional[Dict[str, List[Tuple[int, str, float]]]] = None) -> Dict[int, Dict[str, any]]:
         """
         Find slides with fuzzy keyword matches.
         
         Args:
             query_keywords: Keywords to match
             query_readings: Hiragana readings (optional, for phonetic matching)
+            string_cache: Optional dict of per-keyword string matches, read
+                and filled in place. Streaming interims of one utterance
+                share a cache, so the final only scans keywords it adds.
             
         Returns:
             Dict mapping slide_id to match details
@@ -76,7 +80,13 @@ class FuzzyMatcher:
         
         for query_keyword in query_keywords:
             # Try string similarity
-            string_matches = self._fuzzy_match_string(query_keyword)
+            if string_cache is None:
+                string_matches = self._fuzzy_match_string(query_keyword)
+            else:
+                string_matches = string_cache.get(query_keyword)
+                if string_matches is None:
+                    string_matches = self._fuzzy_match_string(query_keyword)
+                    string_cache[query_keyword] = string_matches
             self._merge_matches(slide_matches, string_matches, 'string')
             
             # Try phonetic similarity if readings available
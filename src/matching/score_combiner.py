@@ -91,15 +91,74 @@ class ScoreCombiner:
         Returns:
             Best MatchResult or None if no good match
         """
+        slide_scores = self.score_slides(
+            exact_matches,
+            fuzzy_matches,
+            semantic_matches,
+            slide_metadata
+        )
+        
+        if not slide_scores:
+            return None
+            
+        # Apply temporal smoothing
+        best_match = self._apply_temporal_smoothing(slide_scores)
+        
+        return best_match
+        
+    def peek(self,
+             exact_matches: Dict[int, Dict],
+             fuzzy_matches: Dict[int, Dict],
+             semantic_matches: Dict[int, Dict],
+             slide_metadata: Dict[int, Dict] = None) -> Optional[MatchResult]:
+        """
+        Combine like combine() without committing temporal state.
+        
+        Used for speculative matches on interim results: the returned
+        match is what combine() would return now, but the current slide
+        and match history are left untouched for the final result.
+        
+        Returns:
+            Best MatchResult or None if no good match
+        """
+        slide_scores = self.score_slides(
+            exact_matches,
+            fuzzy_matches,
+            semantic_matches,
+            slide_metadata
+        )
+        
+        if not slide_scores:
+            return None
+            
+        return self._apply_temporal_smoothing(slide_scores, commit=False)
+        
+    def score_slides(self,
+                    exact_matches: Dict[int, Dict],
+                    fuzzy_matches: Dict[int, Dict],
+                    semantic_matches: Dict[int, Dict],
+                    slide_metadata: Dict[int, Dict] = None) -> Dict[int, Dict]:
+        """
+        Calculate combined per-slide scores without temporal smoothing.
+        
+        Does not touch temporal state, so it can be used by offline
+        decoders that need the full segment x slide score matrix.
+        
+        Args:
+            exact_matches: Results from ExactMatcher
+            fuzzy_matches: Results from FuzzyMatcher
+            semantic_matches: Results from SemanticMatcher
+            slide_metadata: Optional metadata (e.g., which blocks are titles)
+            
+        Returns:
+            Dict mapping slide_id to combined score data
+        """
         # Combine all slide IDs
         all_slide_ids = set()
         all_slide_ids.update(exact_matches.keys())
         all_slide_ids.update(fuzzy_matches.keys())
         all_slide_ids.update(semantic_matches.keys())
         
-        if not all_slide_ids:
-            return None
-            
         # Calculate combined scores
         slide_scores: Dict[int, Dict] = {}
         
@@ -113,10 +172,7 @@ class ScoreCombiner:
             )
             slide_scores[slide_id] = combined_data
             
-        # Apply temporal smoothing
-        best_match = self._apply_temporal_smoothing(slide_scores)
-        
-        return best_match
+        return slide_scores
         
     def _combine_slide_scores(self,
                              slide_id: int,
@@ -161,12 +217,11 @@ class ScoreCombiner:
         if has_title_match:
             score *= self.title_boost
             
-        # Normalize by slide length (optional)
-        slide_length = metadata.get('text_length', 1)
-        normalized_score = score / max(slide_length / 100, 1)
-        
+        # No slide length normalization here: BM25 indexes fold slide
+        # length into the exact scores, and the weight tuner replays
+        # these sums unnormalized
         return {
-            'score': normalized_score,
+            'score': score,
             'raw_score': score,
             'matched_keywords': list(set(matched_keywords)),  # Deduplicate
             'match_types': list(set(match_types)),
@@ -175,19 +230,24 @@ class ScoreCombiner:
         }
         
     def _apply_temporal_smoothing(self,
-                                 slide_scores: Dict[int, Dict]) -> Optional[MatchResult]:
+                                 slide_scores: Dict[int, Dict],
+                                 commit: bool = True) -> Optional[MatchResult]:
         """
         Apply temporal smoothing to prevent flickering.
         
         Current slide gets a boost. Only switch if new slide scores
-        significantly higher (switch_multiplier).
+        significantly higher (switch_multiplier). With commit=False the
+        switch decision and history are not recorded.
         """
         if not slide_scores:
             return None
             
+        # Read once: peek() may run on another thread than combine()
+        current_slide_id = self.current_slide_id
+        
         # Boost current slide
-        if self.current_slide_id and self.current_slide_id in slide_scores:
-            slide_scores[self.current_slide_id]['score'] += self.temporal_boost
+        if current_slide_id and current_slide_id in slide_scores:
+            slide_scores[current_slide_id]['score'] += self.temporal_boost
             
         # Find best slide
         best_slide_id = max(slide_scores.keys(), key=lambda sid: slide_scores[sid]['score'])
@@ -200,18 +260,18 @@ class ScoreCombiner:
             
         # Check if we should switch slides
         should_switch = True
-        if self.current_slide_id and self.current_slide_id != best_slide_id:
+        if current_slide_id and current_slide_id != best_slide_id:
             # Current slide score (without temporal boost)
-            current_score = slide_scores.get(self.current_slide_id, {}).get('score', 0.0)
+            current_score = slide_scores.get(current_slide_id, {}).get('score', 0.0)
             current_score -= self.temporal_boost  # Remove boost for comparison
             
             # Only switch if new score is significantly higher
             if best_score < current_score * self.switch_multiplier:
                 should_switch = False
-                best_slide_id = self.current_slide_id
+                best_slide_id = current_slide_id
                 best_score = current_score + self.temporal_boost
                 
-        if should_switch and best_slide_id != self.current_slide_id:
+        if commit and should_switch and best_slide_id != current_slide_id:
             logger.info(f"Switching slide: {self.current_slide_id} -> {best_slide_id} "
                        f"(score: {best_score:.2f})")
             self.current_slide_id = best_slide_id
@@ -231,9 +291,10 @@ class ScoreCombiner:
         )
         
         # Update history
-        self.match_history.append((best_slide_id, best_score))
-        if len(self.match_history) > 100:  # Keep last 100
-            self.match_history = self.match_history[-100:]
+        if commit:
+            self.match_history.append((best_slide_id, best_score))
+            if len(self.match_history) > 100:  # Keep last 100
+                self.match_history = self.match_history[-100:]
             
         return result
         
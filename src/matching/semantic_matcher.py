@@ -47,9 +47,24 @@ class SemanticMatcher:
         Returns:
             Dict mapping slide_id to match details
         """
-        # Find similar slides
-        results = self.embedding_generator.find_similar(
-            query_text=query_text,
+        return self.match_vector(self.embedding_generator.encode(query_text), top_k=top_k)
+        
+    def match_vector(self, query_embedding: np.ndarray, top_k: int = 5) -> Dict[int, Dict[str, any]]:
+        """
+        Find slides similar to a precomputed embedding.
+        
+        Used for rolling-context matching, where the query is a decayed
+        average of recent segment embeddings rather than a single text.
+        
+        Args:
+            query_embedding: Query vector
+            top_k: Maximum number of results
+            
+        Returns:
+            Dict mapping slide_id to match details
+        """
+        results = self.embedding_generator.find_similar_to_vector(
+            query_embedding,
             top_k=top_k,
             min_similarity=self.min_similarity
         )
@@ -0,0 +1,167 @@
+"""
+Viterbi Timeline Decoder
+
+Offline alternative to the greedy temporal smoothing in ScoreCombiner.
+Takes the full segment x slide score matrix of a batch transcript and
+finds the globally best slide path, favouring small (+/-1) slide moves.
+"""
+
+from typing import List, Optional, Tuple
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ViterbiDecoder:
+    """
+    Viterbi decoder over a segment x slide score matrix.
+
+    Path score = sum of emission scores - transition penalties:
+    - Stay on the same slide: no penalty
+    - Move to the next slide (+1): forward_penalty
+    - Move to the previous slide (-1): backward_penalty
+    - Any other jump: jump_penalty
+
+    Because every non-adjacent jump costs the same, the best predecessor
+    of each slide is one of: itself, its two neighbours, or the overall
+    best slide of the previous step. Each step is therefore O(S) and the
+    full decode is O(N * S).
+    """
+
+    def __init__(self,
+                 forward_penalty: float = 0.5,
+                 backward_penalty: float = 1.0,
+                 jump_penalty: float = 3.0):
+        """
+        Initialize Viterbi decoder.
+
+        Args:
+            forward_penalty: Penalty for moving to the next slide
+            backward_penalty: Penalty for moving to the previous slide
+            jump_penalty: Penalty for any non-adjacent slide change
+        """
+        if min(forward_penalty, backward_penalty, jump_penalty) < 0:
+            raise ValueError("Transition penalties must be non-negative")
+
+        self.forward_penalty = forward_penalty
+        self.backward_penalty = backward_penalty
+        self.jump_penalty = jump_penalty
+
+        logger.info(f"Initialized ViterbiDecoder: forward={forward_penalty}, "
+                   f"backward={backward_penalty}, jump={jump_penalty}")
+
+    def decode(self, score_matrix: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Find the best slide path through a score matrix.
+
+        Args:
+            score_matrix: Emission scores, shape (n_segments, n_slides),
+                columns ordered by slide position in the deck
+
+        Returns:
+            Tuple of (path, path_score) where path is an int array of
+            column indices, one per segment
+        """
+        scores = np.asarray(score_matrix, dtype=np.float64)
+        if scores.ndim != 2:
+            raise ValueError(f"score_matrix must be 2-D, got shape {scores.shape}")
+
+        n_segments, n_slides = scores.shape
+        if n_segments == 0 or n_slides == 0:
+            return np.zeros(0, dtype=np.intp), 0.0
+
+        columns = np.arange(n_slides)
+
+        # Predecessor candidates per step: [stay, from j-1, from j+1, best jump]
+        candidates = np.empty((4, n_slides), dtype=np.float64)
+        sources = np.empty((4, n_slides), dtype=np.intp)
+        sources[0] = columns
+        sources[1] = columns - 1
+        sources[2] = columns + 1
+        sources[1, 0] = 0
+        sources[2, -1] = n_slides - 1
+
+        backpointers = np.empty((n_segments, n_slides), dtype=np.intp)
+        backpointers[0] = columns
+
+        delta = scores[0].copy()
+
+        for t in range(1, n_segments):
+            candidates[0] = delta
+
+            candidates[1, 0] = -np.inf
+            np.subtract(delta[:-1], self.forward_penalty, out=candidates[1, 1:])
+
+            candidates[2, -1] = -np.inf
+            np.subtract(delta[1:], self.backward_penalty, out=candidates[2, :-1])
+
+            best_prev = int(np.argmax(delta))
+            candidates[3] = delta[best_prev] - self.jump_penalty
+            sources[3] = best_prev
+
+            choice = np.argmax(candidates, axis=0)
+            backpointers[t] = sources[choice, columns]
+            delta = candidates[choice, columns] + scores[t]
+
+        # Backtrack
+        path = np.empty(n_segments, dtype=np.intp)
+        path[-1] = int(np.argmax(delta))
+        path_score = float(delta[path[-1]])
+
+        for t in range(n_segments - 1, 0, -1):
+            path[t - 1] = backpointers[t, path[t]]
+
+        return path, path_score
+
+    def decode_slide_ids(self,
+                        score_matrix: np.ndarray,
+                        slide_ids: List[int]) -> List[int]:
+        """
+        Decode and map column indices back to slide IDs.
+
+        Args:
+            score_matrix: Emission scores, shape (n_segments, n_slides)
+            slide_ids: Slide ID for each column, in deck order
+
+        Returns:
+            List of slide IDs, one per segment
+        """
+        if len(slide_ids) != np.shape(score_matrix)[1]:
+            raise ValueError("slide_ids must have one entry per score_matrix column")
+
+        path, _ = self.decode(score_matrix)
+        return [slide_ids[idx] for idx in path]
+
+    def transition_penalty(self, from_idx: int, to_idx: int) -> float:
+        """Penalty for moving between two slide columns"""
+        step = to_idx - from_idx
+        if step == 0:
+            return 0.0
+        if step == 1:
+            return self.forward_penalty
+        if step == -1:
+            return self.backward_penalty
+        return self.jump_penalty
+
+    def score_path(self,
+                  score_matrix: np.ndarray,
+                  path: List[int]) -> Optional[float]:
+        """
+        Score an arbitrary path under the decoder's transition model.
+
+        Args:
+            score_matrix: Emission scores, shape (n_segments, n_slides)
+            path: Column index per segment
+
+        Returns:
+            Total path score, or None for an empty path
+        """
+        if len(path) == 0:
+            return None
+
+        scores = np.asarray(score_matrix, dtype=np.float64)
+        total = float(scores[np.arange(len(path)), path].sum())
+        for prev_idx, idx in zip(path[:-1], path[1:]):
+            total -= self.transition_penalty(int(prev_idx), int(idx))
+        return total
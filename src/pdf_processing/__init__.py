@@ -7,18 +7,21 @@ for matching with speech transcripts.
 Components:
 - PDFExtractor: Extract text and structure from PDF files
 - JapaneseNLP: Japanese text processing and normalization
-- KeywordIndexer: TF-IDF based keyword extraction and indexing
+- TaggerPool: Thread-safe pool of MeCab taggers shared by JapaneseNLP instances
+- KeywordIndexer: TF-IDF / BM25 based keyword extraction and indexing
 - EmbeddingGenerator: Semantic embeddings for slides
 """
 
 from .pdf_extractor import PDFExtractor
-from .japanese_nlp import JapaneseNLP
+from .japanese_nlp import JapaneseNLP, TaggerPool, get_tagger_pool
 from .keyword_indexer import KeywordIndexer
 from .embedding_generator import EmbeddingGenerator
 
 __all__ = [
     'PDFExtractor',
     'JapaneseNLP',
+    'TaggerPool',
+    'get_tagger_pool',
     'KeywordIndexer',
     'EmbeddingGenerator',
 ]
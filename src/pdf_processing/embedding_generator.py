@@ -136,11 +136,40 @@ class EmbeddingGenerator:
         if self.embeddings is None:
             raise ValueError("No embeddings generated yet")
             
-        # Encode query
-        query_embedding = self.model.encode(
-            [query_text],
-            convert_to_numpy=True
-        )[0]
+        return self.find_similar_to_vector(self.encode(query_text), top_k, min_similarity)
+        
+    def encode(self, text: str) -> np.ndarray:
+        """
+        Encode a single query text.
+        
+        Args:
+            text: Query text
+            
+        Returns:
+            Embedding vector (embedding_dim,)
+        """
+        return self.model.encode([text], convert_to_numpy=True)[0]
+        
+    def find_similar_to_vector(self,
+                               query_embedding: np.ndarray,
+                               top_k: int = 5,
+                               min_similarity: float = 0.7) -> List[Tuple[int, str, float]]:
+        """
+        Find slides most similar to a precomputed query embedding.
+        
+        Args:
+            query_embedding: Query vector, e.g. from encode()
+            top_k: Number of results to return
+            min_similarity: Minimum cosine similarity threshold
+            
+        Returns:
+            List of (slide_id, text, similarity) tuples
+        """
+        if self.embeddings is None:
+            raise ValueError("No embeddings generated yet")
+            
+        # FAISS normalizes the query in place
+        query_embedding = np.array(query_embedding, dtype=np.float32)
         
         # Search
         if self.use_faiss and self.faiss_index is not None:
@@ -8,13 +8,29 @@ using MeCab tokenizer.
 import MeCab
 import unicodedata
 import re
-from typing import List, Set, Dict, Optional
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Set, Dict, Optional
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Full-width ASCII (0xFF01-0xFF5E) -> half-width (0x0021-0x007E)
+_FULL_TO_HALF_TABLE = {code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)}
+_FULL_WIDTH_PATTERN = re.compile('[\uFF01-\uFF5E]+')
+
+# Katakana (0x30A0-0x30FF) -> hiragana (0x3040-0x309F)
+_KATAKANA_TO_HIRAGANA_TABLE = {code: code - 0x60 for code in range(0x30A0, 0x3100)}
+_KATAKANA_PATTERN = re.compile('[\u30A0-\u30FF]+')
+
+# str.translate walks every character of non-ASCII text, so the tables
+# are only applied to the matched runs
+def _translate_runs(match: 're.Match', table: Dict[int, int]) -> str:
+    return match.group().translate(table)
+
+
 @dataclass
 class Token:
     """Represents a tokenized word"""
@@ -25,6 +41,89 @@ class Token:
     pos_detail: str  # Detailed POS
 
 
+class TaggerPool:
+    """
+    Process-wide pool of MeCab taggers.
+    
+    A MeCab.Tagger must not be used by two threads at once. Callers check
+    out a tagger for the duration of a parse (or a whole batch) and return
+    it afterwards, so each thread works on its own tagger while idle
+    taggers are reused instead of re-loading the dictionary.
+    
+    Checkout and return are single list operations (atomic under the GIL),
+    so the per-call overhead is negligible. Forked worker processes inherit
+    the idle taggers and can use them immediately.
+    """
+    
+    def __init__(self, tagger_args: str = ''):
+        """
+        Initialize tagger pool.
+        
+        Args:
+            tagger_args: Arguments passed to MeCab.Tagger (e.g. '-d <dicdir>')
+        """
+        self.tagger_args = tagger_args
+        self._idle: List[MeCab.Tagger] = []
+        self.created = 0
+    
+    def _create(self) -> MeCab.Tagger:
+        try:
+            tagger = MeCab.Tagger(self.tagger_args) if self.tagger_args else MeCab.Tagger()
+        except Exception as e:
+            logger.error(f"Failed to initialize MeCab: {e}")
+            raise
+        
+        self.created += 1
+        logger.debug(f"Created MeCab tagger #{self.created}")
+        return tagger
+    
+    @contextmanager
+    def checkout(self) -> Iterator[MeCab.Tagger]:
+        """
+        Borrow a tagger for exclusive use by the calling thread.
+        
+        Example:
+            with pool.checkout() as tagger:
+                node = tagger.parseToNode(text)
+        """
+        try:
+            tagger = self._idle.pop()
+        except IndexError:
+            tagger = self._create()
+        
+        try:
+            yield tagger
+        finally:
+            self._idle.append(tagger)
+    
+    def warm_up(self, count: int = 1):
+        """Pre-create taggers so the first parses do not pay for loading"""
+        while len(self._idle) < count:
+            self._idle.append(self._create())
+    
+    @property
+    def idle_count(self) -> int:
+        """Number of taggers currently available"""
+        return len(self._idle)
+
+
+# Shared pools keyed by tagger arguments
+_tagger_pools: Dict[str, TaggerPool] = {}
+_tagger_pools_lock = threading.Lock()
+
+
+def get_tagger_pool(tagger_args: str = '') -> TaggerPool:
+    """Get the process-wide tagger pool for the given MeCab arguments"""
+    pool = _tagger_pools.get(tagger_args)
+    if pool is None:
+        with _tagger_pools_lock:
+            pool = _tagger_pools.get(tagger_args)
+            if pool is None:
+                pool = TaggerPool(tagger_args)
+                _tagger_pools[tagger_args] = pool
+    return pool
+
+
 class JapaneseNLP:
     """
     Japanese text processing with MeCab tokenizer.
@@ -59,22 +158,42 @@ class JapaneseNLP:
         '百': '100', '千': '1000', '万': '10000',
     }
     
-    def __init__(self, use_stop_words: bool = True):
+    # Single-character numerals go through one character class and a
+    # translate table; multi-character words (ゼロ) are replaced first
+    _KANJI_NUMBER_WORDS = tuple(k for k in KANJI_NUMBERS if len(k) > 1)
+    _KANJI_NUMBER_TABLE = {ord(k): v for k, v in KANJI_NUMBERS.items() if len(k) == 1}
+    _KANJI_NUMBER_PATTERN = re.compile(
+        '[' + ''.join(k for k in KANJI_NUMBERS if len(k) == 1) + ']+'
+    )
+    
+    # Kanji numerals are also parts of ordinary words (一般, 統一, 千葉), so
+    # they are only converted in tokens MeCab tags as numerals (数詞 in
+    # UniDic, 数 in IPADIC)
+    _NUMERAL_POS_DETAILS = {'数詞', '数'}
+    _NUMERAL_CHARS_PATTERN = re.compile(
+        '|'.join([_KANJI_NUMBER_PATTERN.pattern] + list(_KANJI_NUMBER_WORDS))
+    )
+    
+    def __init__(self,
+                 use_stop_words: bool = True,
+                 tagger_pool: Optional[TaggerPool] = None):
         """
         Initialize Japanese NLP processor.
         
+        Taggers come from a shared pool, so any number of JapaneseNLP
+        instances (one per session, one per thread) share a few taggers,
+        and a single instance is safe to use from several threads.
+        
         Args:
             use_stop_words: Whether to filter stop words
+            tagger_pool: Tagger pool to use (default: process-wide pool)
         """
         self.use_stop_words = use_stop_words
+        self.tagger_pool = tagger_pool or get_tagger_pool()
         
-        try:
-            # Initialize MeCab with ipadic dictionary
-            self.mecab = MeCab.Tagger()
-            logger.info("MeCab tokenizer initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize MeCab: {e}")
-            raise
+        # Fail fast if MeCab or its dictionary is unavailable
+        self.tagger_pool.warm_up()
+        logger.info("MeCab tokenizer initialized successfully")
             
     def tokenize(self, text: str) -> List[Token]:
         """
@@ -88,9 +207,27 @@ class JapaneseNLP:
         """
         if not text:
             return []
+        
+        with self.tagger_pool.checkout() as tagger:
+            return self._tokenize_with(tagger, text)
+    
+    def tokenize_many(self, texts: List[str]) -> List[List[Token]]:
+        """
+        Tokenize many texts with one tagger checkout.
+        
+        Args:
+            texts: Input texts
             
+        Returns:
+            List of token lists, one per text
+        """
+        with self.tagger_pool.checkout() as tagger:
+            return [self._tokenize_with(tagger, text) if text else [] for text in texts]
+    
+    def _tokenize_with(self, tagger: MeCab.Tagger, text: str) -> List[Token]:
+        """Tokenize using a checked-out tagger"""
         tokens = []
-        node = self.mecab.parseToNode(text)
+        node = tagger.parseToNode(text)
         
         while node:
             if node.surface:  # Skip BOS/EOS nodes
@@ -119,7 +256,22 @@ class JapaneseNLP:
         Returns:
             List of keyword base forms
         """
-        tokens = self.tokenize(text)
+        return self._keywords_from_tokens(self.tokenize(text))
+    
+    def extract_keywords_many(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract keywords from many texts with one tagger checkout.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            List of keyword lists, one per text
+        """
+        return [self._keywords_from_tokens(tokens) for tokens in self.tokenize_many(texts)]
+    
+    def _keywords_from_tokens(self, tokens: List[Token]) -> List[str]:
+        """Filter tokens down to content keywords"""
         keywords = []
         
         for token in tokens:
@@ -140,7 +292,7 @@ class JapaneseNLP:
         Normalize Japanese text.
         
         - Convert full-width to half-width (alphanumeric)
-        - Convert kanji numbers to Arabic
+        - Convert kanji numbers to Arabic (numeral tokens only)
         - Normalize whitespace
         
         Args:
@@ -151,35 +303,59 @@ class JapaneseNLP:
         """
         if not text:
             return ""
-            
-        # Convert full-width alphanumeric to half-width
+        
+        with self.tagger_pool.checkout() as tagger:
+            return self._normalize_with(tagger, text)
+        
+    def normalize_many(self, texts: List[str]) -> List[str]:
+        """Normalize a batch of texts with one tagger checkout"""
+        with self.tagger_pool.checkout() as tagger:
+            return [self._normalize_with(tagger, text) if text else "" for text in texts]
+        
+    def _normalize_with(self, tagger: MeCab.Tagger, text: str) -> str:
+        """Normalize using a checked-out tagger"""
         text = self._full_to_half(text)
         
-        # Convert kanji numbers to Arabic
-        text = self._kanji_to_arabic(text)
+        # Most texts have no kanji numerals, so only those are tokenized
+        if self._NUMERAL_CHARS_PATTERN.search(text):
+            text = self._numeral_tokens_to_arabic(tagger, text)
         
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        return ' '.join(text.split())
         
-        return text
+    def _numeral_tokens_to_arabic(self, tagger: MeCab.Tagger, text: str) -> str:
+        """Convert kanji numbers in numeral tokens, leaving other words intact"""
+        parts = []
+        copied = end = 0
+        for token in self._tokenize_with(tagger, text):
+            # Tokens skip whitespace, so find each surface after the last one
+            start = text.find(token.surface, end)
+            if start < 0:
+                continue
+            end = start + len(token.surface)
+            if token.pos_detail in self._NUMERAL_POS_DETAILS:
+                parts.append(text[copied:start])
+                parts.append(self._kanji_to_arabic(token.surface))
+                copied = end
+        parts.append(text[copied:])
+        return ''.join(parts)
         
     def _full_to_half(self, text: str) -> str:
         """Convert full-width alphanumeric to half-width"""
-        result = []
-        for char in text:
-            code = ord(char)
-            # Full-width alphanumeric range: 0xFF01-0xFF5E
-            # Convert to half-width: 0x0021-0x007E
-            if 0xFF01 <= code <= 0xFF5E:
-                result.append(chr(code - 0xFEE0))
-            else:
-                result.append(char)
-        return ''.join(result)
+        return _FULL_WIDTH_PATTERN.sub(lambda m: _translate_runs(m, _FULL_TO_HALF_TABLE), text)
         
     def _kanji_to_arabic(self, text: str) -> str:
         """Convert simple kanji numbers to Arabic numerals"""
-        for kanji, arabic in self.KANJI_NUMBERS.items():
-            text = text.replace(kanji, arabic)
+        text = self._replace_number_words(text)
+        return self._KANJI_NUMBER_PATTERN.sub(
+            lambda m: _translate_runs(m, self._KANJI_NUMBER_TABLE), text
+        )
+        
+    def _replace_number_words(self, text: str) -> str:
+        """Replace multi-character numerals (rare, so check before replacing)"""
+        for word in self._KANJI_NUMBER_WORDS:
+            if word in text:
+                text = text.replace(word, self.KANJI_NUMBERS[word])
         return text
         
     def get_reading(self, text: str) -> str:
@@ -206,16 +382,7 @@ class JapaneseNLP:
         Returns:
             Text with katakana converted to hiragana
         """
-        result = []
-        for char in text:
-            code = ord(char)
-            # Katakana range: 0x30A0-0x30FF
-            # Hiragana range: 0x3040-0x309F
-            if 0x30A0 <= code <= 0x30FF:
-                result.append(chr(code - 0x60))
-            else:
-                result.append(char)
-        return ''.join(result)
+        return _KATAKANA_PATTERN.sub(lambda m: _translate_runs(m, _KATAKANA_TO_HIRAGANA_TABLE), text)
         
     def segment_sentences(self, text: str) -> List[str]:
         """
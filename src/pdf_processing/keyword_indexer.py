@@ -1,7 +1,12 @@
 """
-Keyword Indexer with TF-IDF Scoring
+Keyword Indexer with TF-IDF / BM25 Scoring
 
 Builds inverted index for fast keyword lookup and ranks keywords by importance.
+
+Two scoring modes are supported:
+- "tfidf": one posting per keyword position, scored with raw TF-IDF (default)
+- "bm25": one posting per (keyword, slide) carrying the term frequency and a
+  BM25 weight that already includes the slide's length normalization
 """
 
 from typing import List, Dict, Set, Tuple
@@ -14,24 +19,50 @@ logger = logging.getLogger(__name__)
 
 class KeywordIndexer:
     """
-    Build keyword index with TF-IDF scoring.
+    Build keyword index with TF-IDF or BM25 scoring.
     
     Creates an inverted index mapping keywords to their locations in slides,
-    with importance scores based on TF-IDF.
+    with importance scores based on TF-IDF (per position) or BM25
+    (per keyword/slide pair).
     """
     
-    def __init__(self, min_keyword_length: int = 2):
+    SCORING_MODES = ('tfidf', 'bm25')
+    
+    def __init__(self,
+                 min_keyword_length: int = 2,
+                 scoring: str = 'tfidf',
+                 k1: float = 1.2,
+                 b: float = 0.75):
         """
         Initialize keyword indexer.
         
         Args:
             min_keyword_length: Minimum length for keywords
+            scoring: Scoring mode, "tfidf" (default) or "bm25"
+            k1: BM25 term frequency saturation parameter
+            b: BM25 length normalization strength (0 = none, 1 = full)
         """
+        if scoring not in self.SCORING_MODES:
+            raise ValueError(f"scoring must be one of {self.SCORING_MODES}, got '{scoring}'")
+            
         self.min_keyword_length = min_keyword_length
+        self.scoring = scoring
+        self.k1 = k1
+        self.b = b
         self.inverted_index: Dict[str, List[Tuple[int, int, float]]] = defaultdict(list)
         self.document_count = 0
         self.keyword_df: Dict[str, int] = Counter()  # Document frequency
         
+        # BM25 state: per-slide length norm (1 - b + b * len / avg_len)
+        self.slide_lengths: Dict[int, int] = {}
+        self.slide_norms: Dict[int, float] = {}
+        self.avg_slide_length = 0.0
+        
+    @property
+    def is_positional(self) -> bool:
+        """Whether postings carry keyword positions (tfidf) or term frequencies (bm25)"""
+        return self.scoring == 'tfidf'
+        
     def build_index(self, 
                    slide_keywords: List[List[str]],
                    slide_ids: List[int]) -> Dict[str, List[Tuple[int, int, float]]]:
@@ -43,7 +74,9 @@ class KeywordIndexer:
             slide_ids: List of slide IDs
             
         Returns:
-            Inverted index: {keyword: [(slide_id, position, tf-idf)]}
+            Inverted index:
+                tfidf: {keyword: [(slide_id, position, tf-idf)]}
+                bm25:  {keyword: [(slide_id, term_frequency, bm25)]}
         """
         if len(slide_keywords) != len(slide_ids):
             raise ValueError("slide_keywords and slide_ids must have same length")
@@ -51,6 +84,9 @@ class KeywordIndexer:
         self.document_count = len(slide_ids)
         self.inverted_index = defaultdict(list)
         self.keyword_df = Counter()
+        self.slide_lengths = {}
+        self.slide_norms = {}
+        self.avg_slide_length = 0.0
         
         # First pass: Calculate document frequency
         for keywords in slide_keywords:
@@ -59,6 +95,13 @@ class KeywordIndexer:
                 if len(keyword) >= self.min_keyword_length:
                     self.keyword_df[keyword] += 1
                     
+        if self.scoring == 'bm25':
+            self._build_bm25_postings(slide_keywords, slide_ids)
+            logger.info(f"Built BM25 index with {len(self.inverted_index)} unique keywords "
+                       f"across {self.document_count} slides "
+                       f"(avg slide length {self.avg_slide_length:.1f})")
+            return dict(self.inverted_index)
+            
         # Second pass: Calculate TF-IDF and build index
         for slide_id, keywords in zip(slide_ids, slide_keywords):
             # Calculate term frequency for this slide
@@ -84,6 +127,33 @@ class KeywordIndexer:
         
         return dict(self.inverted_index)
         
+    def _build_bm25_postings(self,
+                            slide_keywords: List[List[str]],
+                            slide_ids: List[int]):
+        """Build one posting per (keyword, slide) with precomputed BM25 weights"""
+        slide_counts = []
+        for slide_id, keywords in zip(slide_ids, slide_keywords):
+            counts = Counter(kw for kw in keywords if len(kw) >= self.min_keyword_length)
+            self.slide_lengths[slide_id] = sum(counts.values())
+            slide_counts.append((slide_id, counts))
+            
+        total_length = sum(self.slide_lengths.values())
+        self.avg_slide_length = total_length / max(self.document_count, 1)
+        
+        for slide_id, counts in slide_counts:
+            norm = self._calculate_slide_norm(self.slide_lengths[slide_id])
+            self.slide_norms[slide_id] = norm
+            
+            for keyword, tf in counts.items():
+                weight = self._calculate_bm25_idf(keyword) * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+                self.inverted_index[keyword].append((slide_id, tf, weight))
+                
+    def _calculate_slide_norm(self, slide_length: int) -> float:
+        """Calculate BM25 length norm for a slide"""
+        if self.avg_slide_length <= 0:
+            return 1.0
+        return 1.0 - self.b + self.b * slide_length / self.avg_slide_length
+        
     def _calculate_idf(self, keyword: str) -> float:
         """Calculate inverse document frequency"""
         df = self.keyword_df.get(keyword, 0)
@@ -91,6 +161,13 @@ class KeywordIndexer:
             return 0.0
         return math.log(self.document_count / df)
         
+    def _calculate_bm25_idf(self, keyword: str) -> float:
+        """Calculate BM25 inverse document frequency (non-negative variant)"""
+        df = self.keyword_df.get(keyword, 0)
+        if df == 0:
+            return 0.0
+        return math.log(1.0 + (self.document_count - df + 0.5) / (df + 0.5))
+        
     def lookup(self, keyword: str) -> List[Tuple[int, int, float]]:
         """
         Look up keyword in index.
@@ -99,7 +176,8 @@ class KeywordIndexer:
             keyword: Keyword to look up
             
         Returns:
-            List of (slide_id, position, tf-idf) tuples
+            List of (slide_id, position, tf-idf) tuples, or
+            (slide_id, term_frequency, bm25) tuples in BM25 mode
         """
         return self.inverted_index.get(keyword, [])
         
@@ -107,14 +185,14 @@ class KeywordIndexer:
                         slide_keywords: List[str],
                         top_k: int = 10) -> List[Tuple[str, float]]:
         """
-        Get top keywords by TF-IDF score for a slide.
+        Get top keywords by TF-IDF (or BM25) score for a slide.
         
         Args:
             slide_keywords: Keywords from a slide
             top_k: Number of top keywords to return
             
         Returns:
-            List of (keyword, tf-idf) tuples
+            List of (keyword, score) tuples
         """
         keyword_counts = Counter(slide_keywords)
         total_keywords = len(slide_keywords)
@@ -122,18 +200,25 @@ class KeywordIndexer:
         if total_keywords == 0:
             return []
             
-        # Calculate TF-IDF for each keyword
+        if self.scoring == 'bm25':
+            slide_length = sum(count for keyword, count in keyword_counts.items()
+                               if len(keyword) >= self.min_keyword_length)
+            norm = self._calculate_slide_norm(slide_length)
+            
+        # Calculate score for each keyword
         keyword_scores = []
         for keyword, count in keyword_counts.items():
             if len(keyword) < self.min_keyword_length:
                 continue
                 
-            tf = count / total_keywords
-            idf = self._calculate_idf(keyword)
-            tfidf = tf * idf
-            keyword_scores.append((keyword, tfidf))
+            if self.scoring == 'bm25':
+                score = self._calculate_bm25_idf(keyword) * count * (self.k1 + 1) / (count + self.k1 * norm)
+            else:
+                tf = count / total_keywords
+                score = tf * self._calculate_idf(keyword)
+            keyword_scores.append((keyword, score))
             
-        # Sort by TF-IDF score
+        # Sort by score
         keyword_scores.sort(key=lambda x: x[1], reverse=True)
         
         return keyword_scores[:top_k]
@@ -156,15 +241,17 @@ class KeywordIndexer:
                 continue
                 
             matches = self.lookup(keyword)
-            for slide_id, position, tfidf in matches:
-                slide_scores[slide_id] += tfidf
+            for slide_id, _, score in matches:
+                slide_scores[slide_id] += score
                 
         return dict(slide_scores)
         
     def get_index_stats(self) -> Dict[str, any]:
         """Get statistics about the index"""
         return {
+            "scoring": self.scoring,
             "total_keywords": len(self.inverted_index),
+            "total_postings": sum(len(postings) for postings in self.inverted_index.values()),
             "total_slides": self.document_count,
             "avg_keywords_per_slide": sum(self.keyword_df.values()) / max(self.document_count, 1),
             "top_keywords": sorted(self.keyword_df.items(), key=lambda x: x[1], reverse=True)[:20]
@@ -178,7 +265,13 @@ class KeywordIndexer:
                 'inverted_index': dict(self.inverted_index),
                 'document_count': self.document_count,
                 'keyword_df': dict(self.keyword_df),
-                'min_keyword_length': self.min_keyword_length
+                'min_keyword_length': self.min_keyword_length,
+                'scoring': self.scoring,
+                'k1': self.k1,
+                'b': self.b,
+                'slide_lengths': self.slide_lengths,
+                'slide_norms': self.slide_norms,
+                'avg_slide_length': self.avg_slide_length
             }, f)
         logger.info(f"Saved index to {filepath}")
         
@@ -189,10 +282,18 @@ class KeywordIndexer:
         with open(filepath, 'rb') as f:
             data = pickle.load(f)
             
-        indexer = cls(min_keyword_length=data['min_keyword_length'])
+        indexer = cls(
+            min_keyword_length=data['min_keyword_length'],
+            scoring=data.get('scoring', 'tfidf'),
+            k1=data.get('k1', 1.2),
+            b=data.get('b', 0.75)
+        )
         indexer.inverted_index = defaultdict(list, data['inverted_index'])
         indexer.document_count = data['document_count']
         indexer.keyword_df = Counter(data['keyword_df'])
+        indexer.slide_lengths = data.get('slide_lengths', {})
+        indexer.slide_norms = data.get('slide_norms', {})
+        indexer.avg_slide_length = data.get('avg_slide_length', 0.0)
         
         logger.info(f"Loaded index from {filepath}")
         return indexer
@@ -1,10 +1,17 @@
 """Slide processing package for Phase 4."""
 
 from .slide_processor import SlideProcessor, SlideProcessingError, PDFProcessingError, MatchingError
+from .weight_tuner import WeightTuner, DeckScores
+from .synthetic_deck import SyntheticDeckGenerator
+from .rolling_context import RollingContext
 
 __all__ = [
     'SlideProcessor',
     'SlideProcessingError',
     'PDFProcessingError',
     'MatchingError',
+    'WeightTuner',
+    'DeckScores',
+    'SyntheticDeckGenerator',
+    'RollingContext',
 ]
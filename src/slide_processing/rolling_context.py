@@ -0,0 +1,157 @@
+"""
+Rolling Matching Context
+
+Per-session memory of recent final results for streaming slide matching.
+Short finals ("そうですね、この部分") rarely carry enough keywords to match
+on their own; the rolling context lets them borrow keywords and meaning
+from the last few seconds of speech.
+
+Both views are maintained incrementally: a keyword Counter over a time
+window and an exponentially decayed sum of segment embeddings. Adding a
+result (or evicting an old one) costs O(keywords + embedding_dim),
+independent of how much history the window holds, and the history is
+never re-encoded.
+"""
+
+import logging
+import math
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ContextEntry:
+    """One final result held in the context window"""
+    timestamp: float
+    keywords: List[str]
+    embedding: Optional[np.ndarray] = None  # Unit length
+
+
+class RollingContext:
+    """
+    Keywords and decayed embedding of the last window_s seconds of finals.
+
+    The embedding is stored as an un-normalized decayed sum referenced to
+    the time of the latest update; each update decays it once and adds the
+    new unit vector. Evicted entries subtract their decayed contribution.
+
+    Example:
+        context = RollingContext(window_s=30.0)
+        match = processor.match_segment(text, timestamp, context=context)
+    """
+
+    def __init__(self,
+                 window_s: float = 30.0,
+                 half_life_s: float = 10.0,
+                 keyword_weight: float = 0.5,
+                 short_segment_keywords: int = 6):
+        """
+        Initialize rolling context.
+
+        Args:
+            window_s: Seconds of history kept
+            half_life_s: Half-life of a segment's weight in the context embedding
+            keyword_weight: Multiplier for exact scores of context keywords
+            short_segment_keywords: Segments with fewer distinct keywords
+                than this are matched with the context
+        """
+        if window_s <= 0 or half_life_s <= 0:
+            raise ValueError("window_s and half_life_s must be positive")
+
+        self.window_s = window_s
+        self.half_life_s = half_life_s
+        self.keyword_weight = keyword_weight
+        self.short_segment_keywords = short_segment_keywords
+
+        self._decay_rate = math.log(2) / half_life_s
+        self._entries: Deque[ContextEntry] = deque()
+        self.keyword_counts: Counter = Counter()
+        self._embedding_sum: Optional[np.ndarray] = None
+        self._updated_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self,
+            timestamp: float,
+            keywords: List[str],
+            embedding: Optional[np.ndarray] = None):
+        """
+        Add a final result and evict results older than the window.
+
+        Args:
+            timestamp: Result time in seconds (out-of-order times are
+                clamped to the latest one seen)
+            keywords: Keywords extracted from the result
+            embedding: Optional segment embedding
+        """
+        if self._updated_at is not None and timestamp < self._updated_at:
+            timestamp = self._updated_at
+
+        self._evict(timestamp - self.window_s)
+
+        if embedding is not None:
+            embedding = np.asarray(embedding, dtype=np.float64)
+            norm = np.linalg.norm(embedding)
+            embedding = embedding / norm if norm > 0 else None
+
+        if embedding is not None:
+            if self._embedding_sum is None:
+                self._embedding_sum = embedding.copy()
+            else:
+                self._embedding_sum *= math.exp(-self._decay_rate * (timestamp - self._updated_at))
+                self._embedding_sum += embedding
+
+        self._entries.append(ContextEntry(timestamp, list(keywords), embedding))
+        self.keyword_counts.update(keywords)
+        self._updated_at = timestamp
+
+    def _evict(self, cutoff: float):
+        """Drop entries older than cutoff"""
+        while self._entries and self._entries[0].timestamp < cutoff:
+            entry = self._entries.popleft()
+
+            for keyword in entry.keywords:
+                count = self.keyword_counts[keyword] - 1
+                if count > 0:
+                    self.keyword_counts[keyword] = count
+                else:
+                    del self.keyword_counts[keyword]
+
+            if entry.embedding is not None and self._embedding_sum is not None:
+                age = self._updated_at - entry.timestamp
+                self._embedding_sum -= entry.embedding * math.exp(-self._decay_rate * age)
+
+        if not self._entries:
+            # Start fresh rather than carry rounding residue
+            self._embedding_sum = None
+
+    def keywords(self) -> List[str]:
+        """Distinct keywords in the window, most frequent first"""
+        return [keyword for keyword, _ in self.keyword_counts.most_common()]
+
+    def embedding(self) -> Optional[np.ndarray]:
+        """Unit-length decayed context embedding, or None without embeddings"""
+        if self._embedding_sum is None:
+            return None
+
+        norm = np.linalg.norm(self._embedding_sum)
+        if norm == 0:
+            return None
+        return (self._embedding_sum / norm).astype(np.float32)
+
+    def is_short(self, keywords: List[str]) -> bool:
+        """Whether a segment is too short to be matched on its own"""
+        return len(set(keywords)) < self.short_segment_keywords
+
+    def reset(self):
+        """Clear all history"""
+        self._entries.clear()
+        self.keyword_counts.clear()
+        self._embedding_sum = None
+        self._updated_at = None
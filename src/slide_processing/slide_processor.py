@@ -7,10 +7,14 @@ high-level interface for file and streaming pipelines.
 
 import logging
 import json
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import tempfile
 
+import numpy as np
+
 from ..pdf_processing.pdf_extractor import PDFExtractor, SlideContent
 from ..pdf_processing.japanese_nlp import JapaneseNLP
 from ..pdf_processing.keyword_indexer import KeywordIndexer
@@ -19,6 +23,9 @@ from ..matching.exact_matcher import ExactMatcher
 from ..matching.fuzzy_matcher import FuzzyMatcher
 from ..matching.semantic_matcher import SemanticMatcher
 from ..matching.score_combiner import ScoreCombiner, MatchResult
+from ..matching.timeline_decoder import ViterbiDecoder
+from .stage_timing import StageTimer
+from .rolling_context import RollingContext
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +53,7 @@ class SlideProcessor:
     1. PDF extraction
     2. Keyword indexing
     3. Embedding generation
-    4. Transcript segment matching
+    4. Transcript segment matching (greedy or Viterbi)
     5. Timeline generation
     """
     
@@ -59,7 +66,10 @@ class SlideProcessor:
         temporal_boost: float = 0.05,
         min_score_threshold: float = 1.5,
         switch_multiplier: float = 1.1,
-        use_embeddings: bool = True
+        use_embeddings: bool = True,
+        keyword_scoring: str = 'tfidf',
+        enable_stage_timing: bool = True,
+        normalize: bool = True
     ):
         """
         Initialize slide processor with matching parameters.
@@ -73,9 +83,13 @@ class SlideProcessor:
             min_score_threshold: Minimum score to return a match (default: 1.5)
             switch_multiplier: Threshold multiplier for switching slides (default: 1.1)
             use_embeddings: Whether to generate and use embeddings (default: True)
+            keyword_scoring: Keyword index scoring, 'tfidf' or 'bm25' (default: 'tfidf')
+            enable_stage_timing: Record per-stage matching latency histograms (default: True)
+            normalize: Apply JapaneseNLP.normalize_text to slides and transcript
+                segments before matching (default: True)
         """
         self.nlp = JapaneseNLP()
-        self.keyword_indexer = KeywordIndexer()
+        self.keyword_indexer = KeywordIndexer(scoring=keyword_scoring)
         self.use_embeddings = use_embeddings
         
         if use_embeddings:
@@ -91,6 +105,7 @@ class SlideProcessor:
         self.temporal_boost = temporal_boost
         self.min_score_threshold = min_score_threshold
         self.switch_multiplier = switch_multiplier
+        self.normalize = normalize
         
         # Will be initialized after processing PDF
         self.exact_matcher = None
@@ -98,15 +113,23 @@ class SlideProcessor:
         self.semantic_matcher = None
         self.score_combiner = None
         
+        # Offline decoder for match_transcript(decoder='viterbi')
+        self.timeline_decoder = ViterbiDecoder()
+        
+        # Per-stage latency histograms (None = instrumentation off)
+        self.stage_timer: Optional[StageTimer] = StageTimer() if enable_stage_timing else None
+        
         # Slide data
         self.slides: List[SlideContent] = []
-        self.slide_texts: List[str] = []
+        self.slide_ids: List[int] = []
+        self.slide_texts: List[str] = []  # Normalized when normalize=True
         self.slide_keywords: Dict[int, List[str]] = {}
+        self.slide_info: Dict[int, Dict] = {}
         
         logger.info(
             f"Initialized SlideProcessor: "
             f"weights=({exact_weight}, {fuzzy_weight}, {semantic_weight}), "
-            f"embeddings={use_embeddings}"
+            f"embeddings={use_embeddings}, keyword_scoring={keyword_scoring}"
         )
     
     def process_pdf(self, pdf_path: str) -> Dict:
@@ -127,98 +150,427 @@ class SlideProcessor:
         try:
             # Extract PDF content
             extractor = PDFExtractor()
-            self.slides = extractor.extract_from_file(pdf_path)
+            slides = extractor.extract_from_file(pdf_path)
             
-            if not self.slides:
+            if not slides:
                 raise PDFProcessingError("No slides extracted from PDF")
             
-            logger.info(f"Extracted {len(self.slides)} slides from PDF")
+            logger.info(f"Extracted {len(slides)} slides from PDF")
             
-            # Process each slide
-            slide_keywords_list = []
-            slide_ids = []
+            stats = self._build_deck([
+                {
+                    'page': slide.page_number,
+                    'title': slide.title or '',
+                    'content': ' '.join(slide.headings + slide.bullets + slide.body)
+                }
+                for slide in slides
+            ])
+            self.slides = slides
             
-            for slide in self.slides:
-                # Combine title and content
-                text = slide.title
-                if slide.text_blocks:
-                    text += " " + " ".join(block.text for block in slide.text_blocks)
-                
-                self.slide_texts.append(text)
-                
-                # Extract keywords
-                keywords = self.nlp.extract_keywords(text)
-                self.slide_keywords[slide.page] = keywords
-                slide_keywords_list.append(keywords)
-                slide_ids.append(slide.page)
-                
-                logger.debug(
-                    f"Slide {slide.page}: {len(keywords)} keywords from "
-                    f"{len(text)} chars"
-                )
+            return stats
             
-            # Build keyword index
-            inverted_index = self.keyword_indexer.build_index(
-                slide_keywords_list,
-                slide_ids
-            )
+        except Exception as e:
+            logger.error(f"PDF processing failed: {e}")
+            raise PDFProcessingError(f"Failed to process PDF: {e}")
+    
+    def process_slides(self, slides: List[Dict]) -> Dict:
+        """
+        Build slide index from already-extracted slide content.
+        
+        Accepts the same slide dicts as the test presentation fixtures,
+        so decks can be indexed without a PDF.
+        
+        Args:
+            slides: List of dicts with 'page', 'title' and 'content'
             
-            logger.info(
-                f"Built keyword index: {len(inverted_index)} unique keywords"
-            )
+        Returns:
+            dict with slide_count, keywords_count, has_embeddings
+            
+        Raises:
+            SlideProcessingError: If no slides are given
+        """
+        if not slides:
+            raise SlideProcessingError("No slides to process")
+        
+        self.slides = []
+        return self._build_deck(slides)
+    
+    def _build_deck(self, slides: List[Dict]) -> Dict:
+        """Extract keywords, build indexes and initialize matchers"""
+        self.slide_texts = []
+        self.slide_keywords = {}
+        self.slide_info = {}
+        self.slide_ids = []
+        
+        # Combine title and content
+        for slide in slides:
+            title = slide.get('title') or ''
+            content = slide.get('content') or ''
+            self.slide_texts.append(f"{title} {content}".strip())
+        
+        # Normalize once at build time; transcripts get the same treatment
+        # in _score_segment, and exported deck states carry the result
+        if self.normalize:
+            self.slide_texts = self.nlp.normalize_many(self.slide_texts)
+        
+        # Extract keywords (one tagger checkout for the whole deck)
+        deck_keywords = self.nlp.extract_keywords_many(self.slide_texts)
+        
+        # Process each slide
+        slide_keywords_list = []
+        
+        for slide, text, keywords in zip(slides, self.slide_texts, deck_keywords):
+            slide_id = slide['page']
+            title = slide.get('title') or ''
+            content = slide.get('content') or ''
+            
+            self.slide_keywords[slide_id] = keywords
+            self.slide_info[slide_id] = {'title': title, 'content': content}
+            slide_keywords_list.append(keywords)
+            self.slide_ids.append(slide_id)
             
-            # Initialize matchers
-            self.exact_matcher = ExactMatcher(inverted_index)
-            self.fuzzy_matcher = FuzzyMatcher(
-                self.slide_keywords,
-                similarity_threshold=0.8
+            logger.debug(
+                f"Slide {slide_id}: {len(keywords)} keywords from "
+                f"{len(text)} chars"
             )
+        
+        # Build keyword index
+        inverted_index = self.keyword_indexer.build_index(
+            slide_keywords_list,
+            self.slide_ids
+        )
+        
+        logger.info(
+            f"Built keyword index: {len(inverted_index)} unique keywords"
+        )
+        
+        # Initialize matchers
+        self.exact_matcher = ExactMatcher(
+            inverted_index,
+            positional=self.keyword_indexer.is_positional
+        )
+        self.fuzzy_matcher = FuzzyMatcher(
+            self.slide_keywords,
+            similarity_threshold=0.8
+        )
+        
+        # Generate embeddings if enabled
+        has_embeddings = False
+        self.semantic_matcher = None
+        if self.use_embeddings and self.embedding_gen:
+            try:
+                self.embedding_gen.generate_embeddings(
+                    self.slide_texts,
+                    self.slide_ids
+                )
+                self.semantic_matcher = SemanticMatcher(
+                    self.embedding_gen,
+                    min_similarity=0.7
+                )
+                has_embeddings = True
+                logger.info("Generated semantic embeddings")
+            except Exception as e:
+                logger.warning(f"Failed to generate embeddings: {e}")
+                self.semantic_matcher = None
+        
+        # Initialize score combiner
+        self.score_combiner = ScoreCombiner(
+            exact_weight=self.exact_weight,
+            fuzzy_weight=self.fuzzy_weight,
+            semantic_weight=self.semantic_weight,
+            title_boost=self.title_boost,
+            temporal_boost=self.temporal_boost,
+            min_score_threshold=self.min_score_threshold,
+            switch_multiplier=self.switch_multiplier
+        )
+        
+        return {
+            'slide_count': len(self.slide_ids),
+            'keywords_count': len(inverted_index),
+            'has_embeddings': has_embeddings
+        }
+    
+    def export_deck_state(self) -> Dict:
+        """
+        Export the built deck as a picklable dict.
+        
+        Used to load the same index into worker processes without
+        re-extracting keywords. MeCab taggers and embedding models are
+        not included; the loading process takes taggers from its own
+        pool and reloads the embedding model.
+        
+        Returns:
+            dict with slide data, inverted index, embeddings and parameters
+        """
+        if not self.exact_matcher or not self.score_combiner:
+            raise MatchingError("Slide processor not initialized. Call process_pdf() first.")
+        
+        state = {
+            'params': {
+                'exact_weight': self.exact_weight,
+                'fuzzy_weight': self.fuzzy_weight,
+                'semantic_weight': self.semantic_weight,
+                'title_boost': self.title_boost,
+                'temporal_boost': self.temporal_boost,
+                'min_score_threshold': self.min_score_threshold,
+                'switch_multiplier': self.switch_multiplier,
+                'keyword_scoring': self.keyword_indexer.scoring,
+                'normalize': self.normalize,
+            },
+            'slide_ids': list(self.slide_ids),
+            'slide_texts': list(self.slide_texts),
+            'slide_keywords': dict(self.slide_keywords),
+            'slide_info': dict(self.slide_info),
+            'inverted_index': dict(self.exact_matcher.inverted_index),
+            'positional': self.exact_matcher.positional,
+            'fuzzy_threshold': self.fuzzy_matcher.similarity_threshold,
+            'embeddings': None,
+        }
+        
+        if self.semantic_matcher:
+            state['embeddings'] = {
+                'model_name': self.embedding_gen.model_name,
+                'use_faiss': self.embedding_gen.use_faiss,
+                'vectors': self.embedding_gen.embeddings,
+                'slide_ids': list(self.embedding_gen.slide_ids),
+                'text_blocks': list(self.embedding_gen.text_blocks),
+                'min_similarity': self.semantic_matcher.min_similarity,
+            }
+        
+        return state
+    
+    @classmethod
+    def from_deck_state(cls, state: Dict) -> 'SlideProcessor':
+        """
+        Create a ready-to-match processor from export_deck_state() output.
+        
+        Args:
+            state: Deck state dict
             
-            # Generate embeddings if enabled
-            has_embeddings = False
-            if self.use_embeddings and self.embedding_gen:
-                try:
-                    embeddings, index = self.embedding_gen.generate_embeddings(
-                        self.slide_texts,
-                        slide_ids
-                    )
-                    self.semantic_matcher = SemanticMatcher(
-                        embeddings,
-                        index,
-                        slide_ids,
-                        min_similarity=0.7
-                    )
-                    has_embeddings = True
-                    logger.info("Generated semantic embeddings")
-                except Exception as e:
-                    logger.warning(f"Failed to generate embeddings: {e}")
-                    self.semantic_matcher = None
-            
-            # Initialize score combiner
-            self.score_combiner = ScoreCombiner(
-                exact_weight=self.exact_weight,
-                fuzzy_weight=self.fuzzy_weight,
-                semantic_weight=self.semantic_weight,
-                title_boost=self.title_boost,
-                temporal_boost=self.temporal_boost,
-                min_score_threshold=self.min_score_threshold,
-                switch_multiplier=self.switch_multiplier
+        Returns:
+            SlideProcessor with matchers initialized
+        """
+        embeddings = state['embeddings']
+        processor = cls(use_embeddings=False, **state['params'])
+        
+        processor.slide_ids = list(state['slide_ids'])
+        processor.slide_texts = list(state['slide_texts'])
+        processor.slide_keywords = dict(state['slide_keywords'])
+        processor.slide_info = dict(state['slide_info'])
+        
+        processor.exact_matcher = ExactMatcher(
+            state['inverted_index'],
+            positional=state['positional']
+        )
+        processor.fuzzy_matcher = FuzzyMatcher(
+            processor.slide_keywords,
+            similarity_threshold=state['fuzzy_threshold']
+        )
+        
+        if embeddings is not None:
+            processor.use_embeddings = True
+            processor.embedding_gen = EmbeddingGenerator(
+                model_name=embeddings['model_name'],
+                use_faiss=embeddings['use_faiss']
+            )
+            processor.embedding_gen.embeddings = embeddings['vectors']
+            processor.embedding_gen.slide_ids = list(embeddings['slide_ids'])
+            processor.embedding_gen.text_blocks = list(embeddings['text_blocks'])
+            if processor.embedding_gen.use_faiss:
+                processor.embedding_gen._build_faiss_index(embeddings['vectors'])
+            processor.semantic_matcher = SemanticMatcher(
+                processor.embedding_gen,
+                min_similarity=embeddings['min_similarity']
             )
+        
+        processor.score_combiner = ScoreCombiner(
+            exact_weight=processor.exact_weight,
+            fuzzy_weight=processor.fuzzy_weight,
+            semantic_weight=processor.semantic_weight,
+            title_boost=processor.title_boost,
+            temporal_boost=processor.temporal_boost,
+            min_score_threshold=processor.min_score_threshold,
+            switch_multiplier=processor.switch_multiplier
+        )
+        
+        return processor
+    
+    def _score_segment(
+        self,
+        text: str,
+        spans: Optional[Dict[str, float]] = None,
+        work_cache: Optional[Dict] = None
+    ) -> Tuple[Dict, Dict, Dict]:
+        """
+        Run the three matching passes for one transcript segment.
+        
+        If spans is given, per-stage latencies in ms are written to it.
+        work_cache (see match_segment) memoizes per-keyword fuzzy matches
+        and segment embeddings across calls.
+        """
+        fuzzy_cache = work_cache.setdefault('fuzzy', {}) if work_cache is not None else None
+        
+        if spans is None:
+            if self.normalize:
+                text = self.nlp.normalize_text(text)
             
-            return {
-                'slide_count': len(self.slides),
-                'keywords_count': len(inverted_index),
-                'has_embeddings': has_embeddings
-            }
+            # Extract keywords from transcript
+            keywords = self.nlp.extract_keywords(text)
+            readings = [self.nlp.get_reading(text)]
             
-        except Exception as e:
-            logger.error(f"PDF processing failed: {e}")
-            raise PDFProcessingError(f"Failed to process PDF: {e}")
+            # Run three-pass matching
+            exact_results = self.exact_matcher.match(keywords)
+            fuzzy_results = self.fuzzy_matcher.match(keywords, readings, string_cache=fuzzy_cache)
+            
+            semantic_results = {}
+            if self.semantic_matcher:
+                semantic_results = self._semantic_scores(text, work_cache)
+            
+            return exact_results, fuzzy_results, semantic_results
+        
+        # Same passes with timing spans
+        clock = time.perf_counter
+        t0 = clock()
+        if self.normalize:
+            text = self.nlp.normalize_text(text)
+        keywords = self.nlp.extract_keywords(text)
+        readings = [self.nlp.get_reading(text)]
+        t1 = clock()
+        exact_results = self.exact_matcher.match(keywords)
+        t2 = clock()
+        fuzzy_results = self.fuzzy_matcher.match(keywords, readings, string_cache=fuzzy_cache)
+        t3 = clock()
+        
+        semantic_results = {}
+        if self.semantic_matcher:
+            semantic_results = self._semantic_scores(text, work_cache)
+        t4 = clock()
+        
+        spans['tokenize'] = (t1 - t0) * 1000
+        spans['exact'] = (t2 - t1) * 1000
+        spans['fuzzy'] = (t3 - t2) * 1000
+        spans['semantic'] = (t4 - t3) * 1000
+        
+        return exact_results, fuzzy_results, semantic_results
+    
+    def _score_segments(
+        self,
+        texts: List[str],
+        workers: int = 1
+    ) -> List[Tuple[Dict, Dict, Dict]]:
+        """
+        Run the matching passes for many segments.
+        
+        Scoring is independent per segment, so with workers > 1 it runs
+        in a process pool. Each worker loads the deck index once via the
+        pool initializer; results come back in input order.
+        """
+        if workers <= 1 or len(texts) < 2:
+            return [self._score_segment(text) for text in texts]
+        
+        workers = min(workers, len(texts))
+        chunksize = max(1, len(texts) // (workers * 4))
+        
+        logger.info(f"Scoring {len(texts)} segments with {workers} worker processes")
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_scoring_worker,
+            initargs=(self.export_deck_state(),)
+        ) as executor:
+            return list(executor.map(_score_segment_in_worker, texts, chunksize=chunksize))
+    
+    def _semantic_scores(self, text: str, work_cache: Optional[Dict]) -> Dict:
+        """Semantic pass, reusing a cached embedding of the same text"""
+        if work_cache is None:
+            return self.semantic_matcher.match(text, top_k=5)
+        return self.semantic_matcher.match_vector(self._encode(text, work_cache), top_k=5)
+    
+    def _encode(self, text: str, work_cache: Optional[Dict]):
+        """Encode a segment, memoized in work_cache by (normalized) text"""
+        if work_cache is None:
+            return self.embedding_gen.encode(text)
+        
+        embeddings = work_cache.setdefault('embeddings', {})
+        embedding = embeddings.get(text)
+        if embedding is None:
+            embedding = embeddings[text] = self.embedding_gen.encode(text)
+        return embedding
+    
+    def _score_segment_in_context(
+        self,
+        text: str,
+        context: RollingContext,
+        timestamp: float,
+        spans: Optional[Dict[str, float]] = None,
+        work_cache: Optional[Dict] = None
+    ) -> Tuple[Dict, Dict, Dict]:
+        """
+        Run the matching passes for one segment and add it to a rolling context.
+        
+        The segment is encoded once and merged into the context. Short
+        segments are then scored with the context: exact scores of the
+        recent keywords they lack (scaled by context.keyword_weight) are
+        added, and the semantic pass queries the decayed context embedding
+        instead of the segment's own.
+        """
+        clock = time.perf_counter
+        t0 = clock()
+        if self.normalize:
+            text = self.nlp.normalize_text(text)
+        keywords = self.nlp.extract_keywords(text)
+        readings = [self.nlp.get_reading(text)]
+        use_context = context.is_short(keywords)
+        t1 = clock()
+        
+        exact_results = self.exact_matcher.match(keywords)
+        if use_context and context.keyword_weight > 0:
+            own = set(keywords)
+            borrowed = [keyword for keyword in context.keywords() if keyword not in own]
+            for slide_id, data in self.exact_matcher.match(borrowed).items():
+                target = exact_results.setdefault(slide_id, {
+                    'score': 0.0,
+                    'matched_keywords': [],
+                    'positions': [],
+                    'match_count': 0
+                })
+                target['score'] += data['score'] * context.keyword_weight
+                target['context_keywords'] = data['matched_keywords']
+        t2 = clock()
+        
+        fuzzy_results = self.fuzzy_matcher.match(
+            keywords,
+            readings,
+            string_cache=work_cache.setdefault('fuzzy', {}) if work_cache is not None else None
+        )
+        t3 = clock()
+        
+        embedding = None
+        semantic_results = {}
+        if self.semantic_matcher:
+            embedding = self._encode(text, work_cache)
+        context.add(timestamp, keywords, embedding)
+        if self.semantic_matcher:
+            query = context.embedding() if use_context else None
+            if query is None:
+                query = embedding
+            semantic_results = self.semantic_matcher.match_vector(query, top_k=5)
+        t4 = clock()
+        
+        if spans is not None:
+            spans['tokenize'] = (t1 - t0) * 1000
+            spans['exact'] = (t2 - t1) * 1000
+            spans['fuzzy'] = (t3 - t2) * 1000
+            spans['semantic'] = (t4 - t3) * 1000
+        
+        return exact_results, fuzzy_results, semantic_results
     
     def match_segment(
         self,
         text: str,
-        timestamp: Optional[float] = None
+        timestamp: Optional[float] = None,
+        context: Optional[RollingContext] = None,
+        work_cache: Optional[Dict] = None
     ) -> Optional[MatchResult]:
         """
         Match a transcript segment to a slide.
@@ -226,6 +578,12 @@ class SlideProcessor:
         Args:
             text: Transcript text to match
             timestamp: Optional timestamp for temporal smoothing
+            context: Optional per-session RollingContext; the segment is
+                added to it and short segments are matched with it
+            work_cache: Optional dict shared with earlier peek_segment()
+                calls on interims of the same utterance; fuzzy matches of
+                keywords seen in those interims and the embedding of an
+                identical interim are reused
             
         Returns:
             MatchResult with slide_id, score, confidence, or None if no match
@@ -237,23 +595,35 @@ class SlideProcessor:
             raise MatchingError("Slide processor not initialized. Call process_pdf() first.")
         
         try:
-            # Extract keywords from transcript
-            keywords = self.nlp.extract_keywords(text)
-            readings = [self.nlp.get_reading(text)]
+            timer = self.stage_timer
+            spans = None
+            if timer is not None:
+                spans = {}
+                start = time.perf_counter()
             
-            # Run three-pass matching
-            exact_results = self.exact_matcher.match(keywords)
-            fuzzy_results = self.fuzzy_matcher.match(keywords, readings)
-            
-            semantic_results = {}
-            if self.semantic_matcher:
-                semantic_results = self.semantic_matcher.match(text, top_k=5)
+            if context is not None:
+                exact_results, fuzzy_results, semantic_results = self._score_segment_in_context(
+                    text,
+                    context,
+                    timestamp if timestamp is not None else time.time(),
+                    spans,
+                    work_cache
+                )
+            else:
+                exact_results, fuzzy_results, semantic_results = self._score_segment(
+                    text,
+                    spans,
+                    work_cache
+                )
             
             # Combine scores
             metadata = {}
             if timestamp is not None:
                 metadata['timestamp'] = timestamp
             
+            if timer is not None:
+                combine_start = time.perf_counter()
+            
             match_result = self.score_combiner.combine(
                 exact_results,
                 fuzzy_results,
@@ -261,21 +631,130 @@ class SlideProcessor:
                 metadata
             )
             
+            if timer is not None:
+                end = time.perf_counter()
+                spans['combine'] = (end - combine_start) * 1000
+                spans['total'] = (end - start) * 1000
+                timer.record(spans)
+            
             return match_result
             
         except Exception as e:
             logger.error(f"Matching failed for segment: {e}")
             raise MatchingError(f"Failed to match segment: {e}")
     
+    def peek_segment(
+        self,
+        text: str,
+        timestamp: Optional[float] = None,
+        work_cache: Optional[Dict] = None
+    ) -> Optional[MatchResult]:
+        """
+        Speculatively match an interim transcript.
+        
+        Returns the match match_segment() would give now, without changing
+        temporal smoothing state or stage timing histograms. Safe to call
+        from a background thread while finals are matched.
+        
+        Args:
+            text: Interim transcript text
+            timestamp: Optional timestamp
+            work_cache: Per-utterance cache to fill for the final result
+            
+        Returns:
+            MatchResult or None if no match
+            
+        Raises:
+            MatchingError: If matching fails
+        """
+        if not self.exact_matcher or not self.score_combiner:
+            raise MatchingError("Slide processor not initialized. Call process_pdf() first.")
+        
+        try:
+            exact_results, fuzzy_results, semantic_results = self._score_segment(
+                text,
+                work_cache=work_cache
+            )
+            
+            metadata = {}
+            if timestamp is not None:
+                metadata['timestamp'] = timestamp
+            
+            return self.score_combiner.peek(
+                exact_results,
+                fuzzy_results,
+                semantic_results,
+                metadata
+            )
+            
+        except Exception as e:
+            logger.error(f"Speculative matching failed for segment: {e}")
+            raise MatchingError(f"Failed to match segment: {e}")
+    
+    def score_transcript(
+        self,
+        segments: List[Dict],
+        workers: int = 1
+    ) -> Tuple[np.ndarray, List[Dict[int, Dict]]]:
+        """
+        Build the segment x slide combined score matrix.
+        
+        Scores are combined with the configured weights but without
+        temporal smoothing, so the score combiner state is untouched.
+        
+        Args:
+            segments: List of dicts with 'text'
+            workers: Number of processes for segment scoring (default: 1)
+            
+        Returns:
+            Tuple of (score_matrix, per_segment_slide_scores) where
+            score_matrix has shape (len(segments), slide_count) with
+            columns in self.slide_ids order
+            
+        Raises:
+            MatchingError: If matching fails
+        """
+        if not self.exact_matcher or not self.score_combiner:
+            raise MatchingError("Slide processor not initialized. Call process_pdf() first.")
+        
+        column = {slide_id: idx for idx, slide_id in enumerate(self.slide_ids)}
+        score_matrix = np.zeros((len(segments), len(self.slide_ids)), dtype=np.float64)
+        segment_scores = []
+        
+        try:
+            raw_scores = self._score_segments(
+                [segment.get('text', '') for segment in segments],
+                workers=workers
+            )
+            for row, raw in enumerate(raw_scores):
+                slide_scores = self.score_combiner.score_slides(*raw)
+                for slide_id, data in slide_scores.items():
+                    score_matrix[row, column[slide_id]] = data['score']
+                segment_scores.append(slide_scores)
+        except Exception as e:
+            logger.error(f"Scoring failed for transcript: {e}")
+            raise MatchingError(f"Failed to score transcript: {e}")
+        
+        return score_matrix, segment_scores
+    
     def match_transcript(
         self,
-        segments: List[Dict]
+        segments: List[Dict],
+        decoder: str = 'greedy',
+        workers: int = 1
     ) -> List[Dict]:
         """
         Match all transcript segments to slides.
         
+        With workers > 1, matching runs in two phases: all segments are
+        scored in a process pool, then temporal smoothing is applied in a
+        single sequential pass. Results are identical to the serial path.
+        
         Args:
             segments: List of dicts with 'text', 'start_time', 'end_time'
+            decoder: 'greedy' for per-segment temporal smoothing (default),
+                or 'viterbi' for the globally best slide path (offline only)
+            workers: Number of processes for segment scoring (default: 1)
             
         Returns:
             List of dicts with original segment data plus:
@@ -287,17 +766,41 @@ class SlideProcessor:
         Raises:
             MatchingError: If matching fails
         """
+        if decoder == 'viterbi':
+            return self._match_transcript_viterbi(segments, workers=workers)
+        if decoder != 'greedy':
+            raise ValueError(f"Unknown decoder: {decoder}")
+        
         logger.info(f"Matching {len(segments)} transcript segments")
         
+        raw_scores = None
+        if workers > 1:
+            if not self.exact_matcher or not self.score_combiner:
+                raise MatchingError("Slide processor not initialized. Call process_pdf() first.")
+            try:
+                raw_scores = self._score_segments(
+                    [segment.get('text', '') for segment in segments],
+                    workers=workers
+                )
+            except Exception as e:
+                logger.error(f"Parallel scoring failed: {e}")
+                raise MatchingError(f"Failed to score segments: {e}")
+        
         results = []
         matched_count = 0
         
-        for segment in segments:
+        for idx, segment in enumerate(segments):
             text = segment.get('text', '')
             start_time = segment.get('start_time', 0.0)
             
-            # Match segment
-            match_result = self.match_segment(text, start_time)
+            # Match segment (sequential smoothing over precomputed scores)
+            if raw_scores is not None:
+                match_result = self.score_combiner.combine(
+                    *raw_scores[idx],
+                    {'timestamp': start_time}
+                )
+            else:
+                match_result = self.match_segment(text, start_time)
             
             # Add match data to segment
             result = segment.copy()
@@ -323,6 +826,55 @@ class SlideProcessor:
         
         return results
     
+    def _match_transcript_viterbi(
+        self,
+        segments: List[Dict],
+        workers: int = 1
+    ) -> List[Dict]:
+        """
+        Match all segments by decoding the full score matrix at once.
+        
+        Like the greedy decoder, segments whose decoded slide scores below
+        the combiner's min_score_threshold (after the temporal boost for
+        staying on the same slide) are left unmatched (slide_id None).
+        """
+        logger.info(f"Decoding {len(segments)} transcript segments with Viterbi")
+        
+        score_matrix, segment_scores = self.score_transcript(segments, workers=workers)
+        path, _ = self.timeline_decoder.decode(score_matrix)
+        threshold = self.score_combiner.min_score_threshold
+        
+        results = []
+        for row, (segment, idx) in enumerate(zip(segments, path)):
+            slide_id = self.slide_ids[idx]
+            score = float(score_matrix[row, idx])
+            slide_data = segment_scores[row].get(slide_id, {})
+            
+            # The greedy decoder boosts the current slide before the
+            # threshold check; staying on the previous slide gets the same
+            boost = self.score_combiner.temporal_boost if row and path[row - 1] == idx else 0.0
+            
+            result = segment.copy()
+            if score + boost >= threshold:
+                result['slide_id'] = slide_id
+                result['score'] = score
+                result['confidence'] = min(score / 10.0, 1.0)
+                result['matched_keywords'] = slide_data.get('matched_keywords', [])
+            else:
+                result['slide_id'] = None
+                result['score'] = 0.0
+                result['confidence'] = 0.0
+                result['matched_keywords'] = []
+            results.append(result)
+        
+        switches = int(np.count_nonzero(np.diff(path))) if len(path) else 0
+        logger.info(
+            f"Decoded {len(segments)} segments into "
+            f"{switches + 1 if len(path) else 0} slide runs"
+        )
+        
+        return results
+    
     def generate_timeline(
         self,
         matched_segments: List[Dict]
@@ -401,6 +953,28 @@ class SlideProcessor:
         
         return timeline
     
+    def set_stage_timing(self, enabled: bool):
+        """
+        Turn per-stage latency instrumentation on or off.
+        
+        When off, match_segment takes no timestamps at all.
+        """
+        if enabled and self.stage_timer is None:
+            self.stage_timer = StageTimer()
+        elif not enabled:
+            self.stage_timer = None
+    
+    def get_stage_stats(self) -> Dict:
+        """
+        Get per-stage matching latency histograms.
+        
+        Returns:
+            dict from StageTimer.get_stats(), or {} if instrumentation is off
+        """
+        if self.stage_timer is None:
+            return {}
+        return self.stage_timer.get_stats()
+    
     def get_slide_info(self, slide_id: int) -> Optional[Dict]:
         """
         Get information about a specific slide.
@@ -411,12 +985,27 @@ class SlideProcessor:
         Returns:
             dict with title, content, keywords, or None if not found
         """
-        for slide in self.slides:
-            if slide.page == slide_id:
-                return {
-                    'slide_id': slide.page,
-                    'title': slide.title,
-                    'content': ' '.join(block.text for block in slide.text_blocks),
-                    'keywords': self.slide_keywords.get(slide_id, [])
-                }
-        return None
+        info = self.slide_info.get(slide_id)
+        if info is None:
+            return None
+        return {
+            'slide_id': slide_id,
+            'title': info['title'],
+            'content': info['content'],
+            'keywords': self.slide_keywords.get(slide_id, [])
+        }
+
+
+# Per-process state for parallel scoring (see SlideProcessor._score_segments)
+_worker_processor: Optional[SlideProcessor] = None
+
+
+def _init_scoring_worker(deck_state: Dict):
+    """Process pool initializer: load the deck index once per worker"""
+    global _worker_processor
+    _worker_processor = SlideProcessor.from_deck_state(deck_state)
+
+
+def _score_segment_in_worker(text: str) -> Tuple[Dict, Dict, Dict]:
+    """Score one segment with the worker's deck (no temporal smoothing)"""
+    return _worker_processor._score_segment(text)
@@ -0,0 +1,179 @@
+"""
+Stage Timing for Slide Matching
+
+Low-overhead per-stage latency instrumentation for the matching hot path
+(tokenize, exact, fuzzy, semantic, combine). Spans are measured with
+time.perf_counter() and folded into fixed-bucket histograms, so memory
+stays constant however long a session runs.
+"""
+
+import logging
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+# Matching stages in pipeline order, plus the end-to-end total
+MATCH_STAGES = ('tokenize', 'exact', 'fuzzy', 'semantic', 'combine', 'total')
+
+# Histogram bucket upper bounds in ms (last bucket is +inf)
+LATENCY_BUCKETS_MS = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0,
+    50.0, 100.0, 200.0, 500.0, 1000.0, 2500.0,
+)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Percentiles are estimated as the upper bound of the bucket holding
+    the requested rank (capped at the observed maximum).
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_MS):
+        """
+        Initialize histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds in ms
+        """
+        self.buckets = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, latency_ms: float):
+        """Add one measurement"""
+        self.counts[bisect_left(self.buckets, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+
+    def merge(self, other: 'LatencyHistogram'):
+        """Add another histogram's counts (bucket layouts must match)"""
+        if other.buckets != self.buckets:
+            raise ValueError("Cannot merge histograms with different buckets")
+
+        for idx, count in enumerate(other.counts):
+            self.counts[idx] += count
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def percentile(self, q: float) -> float:
+        """Estimated latency at quantile q (0-100) in ms"""
+        if self.count == 0:
+            return 0.0
+
+        rank = q / 100.0 * self.count
+        cumulative = 0
+        for idx, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank and count:
+                if idx < len(self.buckets):
+                    return min(self.buckets[idx], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def reset(self):
+        """Clear all measurements"""
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def to_dict(self) -> Dict:
+        """Summary plus raw bucket counts"""
+        return {
+            'count': self.count,
+            'avg_ms': self.total_ms / self.count if self.count else 0.0,
+            'max_ms': self.max_ms,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'buckets_ms': list(self.buckets),
+            'counts': list(self.counts),
+        }
+
+
+class StageTimer:
+    """
+    Per-stage latency histograms for slide matching.
+
+    The matcher measures spans itself and hands them over once per
+    segment with record(). The spans of the most recent segment are kept
+    so a slow segment can be attributed to a stage.
+    """
+
+    def __init__(self,
+                 budget_ms: Optional[float] = 200.0,
+                 buckets: Sequence[float] = LATENCY_BUCKETS_MS):
+        """
+        Initialize stage timer.
+
+        Args:
+            budget_ms: Total latency budget per segment; slower segments
+                are counted and logged with their stage breakdown
+                (None to disable)
+            buckets: Histogram bucket upper bounds in ms
+        """
+        self.budget_ms = budget_ms
+        self.histograms: Dict[str, LatencyHistogram] = {
+            stage: LatencyHistogram(buckets) for stage in MATCH_STAGES
+        }
+        self.last_spans: Dict[str, float] = {}
+        self.over_budget = 0
+
+    def record(self, spans: Dict[str, float]):
+        """
+        Record one segment's stage latencies.
+
+        Args:
+            spans: Stage name -> latency in ms (stages may be missing)
+        """
+        for stage, latency_ms in spans.items():
+            histogram = self.histograms.get(stage)
+            if histogram is not None:
+                histogram.observe(latency_ms)
+
+        self.last_spans = spans
+
+        total = spans.get('total')
+        if self.budget_ms is not None and total is not None and total > self.budget_ms:
+            self.over_budget += 1
+            slowest = max(
+                (stage for stage in spans if stage != 'total'),
+                key=lambda stage: spans[stage],
+                default='total'
+            )
+            breakdown = ", ".join(f"{stage}={ms:.1f}ms" for stage, ms in spans.items())
+            logger.warning(
+                f"Slide matching over budget ({total:.1f}ms > {self.budget_ms:.0f}ms), "
+                f"slowest stage: {slowest} [{breakdown}]"
+            )
+
+    def reset(self):
+        """Clear all histograms"""
+        for histogram in self.histograms.values():
+            histogram.reset()
+        self.last_spans = {}
+        self.over_budget = 0
+
+    def get_stats(self) -> Dict:
+        """
+        Get per-stage latency statistics.
+
+        Returns:
+            dict with per-stage histogram summaries, the last segment's
+            spans and the over-budget count
+        """
+        return {
+            'stages': {stage: hist.to_dict() for stage, hist in self.histograms.items()},
+            'last_spans_ms': dict(self.last_spans),
+            'budget_ms': self.budget_ms,
+            'over_budget': self.over_budget,
+        }
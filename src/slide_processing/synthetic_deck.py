@@ -0,0 +1,309 @@
+"""
+Synthetic Deck Generator
+
+Composes large Japanese slide decks and aligned lecture transcripts
+from the vocabulary of the test presentation fixtures, for scale
+testing of indexing and matching (hundreds of slides, hours of speech).
+
+Output uses the fixture JSON format (slides + transcript_segments with
+expected_slide labels) and can also be rendered to PDF.
+"""
+
+import json
+import logging
+import random
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import fitz  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+
+# Bullet phrase templates ({term} = slide keyword)
+BULLET_TEMPLATES = [
+    "{term}の概要",
+    "{term}の特徴",
+    "{term}の課題",
+    "{term}の活用事例",
+    "{term}と{other}の比較",
+    "{term}による{other}の改善",
+    "{term}の評価方法",
+    "{term}を用いた{other}",
+]
+
+TITLE_TEMPLATES = [
+    "{a}と{b}",
+    "{a}の{b}",
+    "{a}：{b}の基礎",
+    "{a}における{b}",
+]
+
+# Spoken sentence templates for transcript segments
+SENTENCE_TEMPLATES = [
+    "次に、{a}について説明します。",
+    "{a}は{b}と深く関係しています。",
+    "ここでは{a}と{b}を見ていきましょう。",
+    "{a}の特徴として、{b}が挙げられます。",
+    "実際に{a}を使うと、{b}が改善されます。",
+    "{a}を理解するためには、{b}が重要です。",
+    "このスライドでは{a}の{b}をまとめています。",
+    "{a}と{b}の違いに注意してください。",
+]
+
+# ASR-style disfluencies
+FILLERS = ["えー", "あの", "えっと", "まあ", "その"]
+
+# Seconds of speech per character (about 7-8 morae per second)
+SECONDS_PER_CHAR = 0.13
+
+_KATAKANA = re.compile(r'[ァ-ヶ]')
+
+
+class SyntheticDeckGenerator:
+    """
+    Generate synthetic presentations from fixture vocabulary.
+
+    Every slide gets its own combination of fixture keywords, so slides
+    stay distinguishable at any deck size while overall term frequencies
+    remain realistic (each term is shared by several slides).
+
+    Example:
+        generator = SyntheticDeckGenerator.from_fixture_dir('tests/fixtures/test_presentations')
+        presentation = generator.generate(num_slides=500, duration_s=3 * 3600)
+        write_pdf(presentation, 'deck_500.pdf')
+    """
+
+    def __init__(self, source_presentations: List[Dict], seed: int = 0):
+        """
+        Initialize generator.
+
+        Args:
+            source_presentations: Fixture dicts providing the vocabulary
+            seed: Random seed (output is deterministic for a given seed)
+        """
+        terms = set()
+        for presentation in source_presentations:
+            for segment in presentation.get('transcript_segments', []):
+                terms.update(keyword for keyword in segment.get('keywords', []) if len(keyword) >= 2)
+
+        if len(terms) < 8:
+            raise ValueError("Source presentations provide too few keywords")
+
+        self.terms = sorted(terms)
+        self.seed = seed
+
+        logger.info(f"Initialized SyntheticDeckGenerator: {len(self.terms)} terms, seed={seed}")
+
+    @classmethod
+    def from_fixture_dir(cls, fixture_dir: str, seed: int = 0) -> 'SyntheticDeckGenerator':
+        """Create a generator from every JSON fixture in a directory"""
+        presentations = []
+        for path in sorted(Path(fixture_dir).glob('*.json')):
+            with open(path, encoding='utf-8') as f:
+                presentations.append(json.load(f))
+        return cls(presentations, seed=seed)
+
+    def generate(self,
+                 num_slides: int,
+                 num_segments: Optional[int] = None,
+                 duration_s: Optional[float] = None,
+                 terms_per_slide: int = 6,
+                 noise: float = 0.1,
+                 backtrack_rate: float = 0.05) -> Dict:
+        """
+        Generate a presentation with an aligned, labelled transcript.
+
+        Args:
+            num_slides: Number of slides
+            num_segments: Number of transcript segments (default: 4 per slide)
+            duration_s: Target transcript duration; overrides num_segments
+            terms_per_slide: Keywords assigned to each slide
+            noise: ASR noise level in [0, 1] (term corruption, substitution
+                with other slides' terms, dropped terms, fillers)
+            backtrack_rate: Probability a segment refers back to the
+                previous slide
+
+        Returns:
+            Presentation dict in the fixture format
+        """
+        if num_slides < 1:
+            raise ValueError("num_slides must be positive")
+        if not 0.0 <= noise <= 1.0:
+            raise ValueError("noise must be in [0, 1]")
+
+        rng = random.Random(self.seed)
+        terms_per_slide = min(terms_per_slide, len(self.terms))
+
+        slide_terms = self._assign_terms(rng, num_slides, terms_per_slide)
+        slides = [
+            self._make_slide(rng, page, slide_terms[page - 1])
+            for page in range(1, num_slides + 1)
+        ]
+
+        if duration_s is not None:
+            # Average segment is ~23 characters of speech
+            num_segments = max(num_slides, int(duration_s / (23 * SECONDS_PER_CHAR)))
+        elif num_segments is None:
+            num_segments = num_slides * 4
+        num_segments = max(num_segments, num_slides)
+
+        segments = self._make_transcript(rng, slide_terms, num_segments, noise, backtrack_rate)
+
+        if duration_s is not None:
+            # Stretch the timeline to hit the target duration exactly
+            scale = duration_s / segments[-1]['end_time']
+            for segment in segments:
+                segment['start_time'] = round(segment['start_time'] * scale, 2)
+                segment['end_time'] = round(segment['end_time'] * scale, 2)
+
+        logger.info(f"Generated synthetic deck: {num_slides} slides, {len(segments)} segments, "
+                   f"{segments[-1]['end_time'] / 60:.1f} min")
+
+        return {
+            'presentation_id': f'synthetic_{num_slides}_{self.seed}',
+            'title': f'合成プレゼンテーション（{num_slides}枚）',
+            'description': 'Synthetic deck generated from fixture vocabulary',
+            'generator': {
+                'seed': self.seed,
+                'num_slides': num_slides,
+                'terms_per_slide': terms_per_slide,
+                'noise': noise,
+                'backtrack_rate': backtrack_rate,
+            },
+            'slides': slides,
+            'transcript_segments': segments,
+        }
+
+    def _assign_terms(self, rng: random.Random, num_slides: int, terms_per_slide: int) -> List[List[str]]:
+        """Give each slide a distinct keyword set, spreading terms evenly"""
+        pool: List[str] = []
+        slide_terms = []
+        seen = set()
+
+        for _ in range(num_slides):
+            for _attempt in range(10):
+                chosen = []
+                while len(chosen) < terms_per_slide:
+                    if not pool:
+                        pool = list(self.terms)
+                        rng.shuffle(pool)
+                    term = pool.pop()
+                    if term not in chosen:
+                        chosen.append(term)
+                if frozenset(chosen) not in seen:
+                    break
+            seen.add(frozenset(chosen))
+            slide_terms.append(chosen)
+
+        return slide_terms
+
+    def _make_slide(self, rng: random.Random, page: int, terms: List[str]) -> Dict:
+        """Compose title and bullet content from the slide's terms"""
+        title = rng.choice(TITLE_TEMPLATES).format(a=terms[0], b=terms[1])
+
+        bullets = []
+        for idx, term in enumerate(terms):
+            other = terms[(idx + 1) % len(terms)]
+            bullets.append("• " + rng.choice(BULLET_TEMPLATES).format(term=term, other=other))
+
+        content = f"本スライドのテーマ：{terms[0]}\n\n" + "\n".join(bullets)
+        return {'page': page, 'title': title, 'content': content}
+
+    def _make_transcript(self,
+                         rng: random.Random,
+                         slide_terms: List[List[str]],
+                         num_segments: int,
+                         noise: float,
+                         backtrack_rate: float) -> List[Dict]:
+        """Speak about slides in order, with ASR noise and back references"""
+        num_slides = len(slide_terms)
+
+        # Every slide gets at least one segment, the rest are spread randomly
+        counts = [1] * num_slides
+        for _ in range(num_segments - num_slides):
+            counts[rng.randrange(num_slides)] += 1
+
+        segments = []
+        clock = 0.0
+
+        for slide_idx, count in enumerate(counts):
+            for _ in range(count):
+                label = slide_idx
+                if slide_idx > 0 and rng.random() < backtrack_rate:
+                    label = slide_idx - 1
+
+                terms = slide_terms[label]
+                a, b = rng.sample(terms, 2)
+                spoken = [self._corrupt(rng, term, noise, slide_terms) for term in (a, b)]
+                text = rng.choice(SENTENCE_TEMPLATES).format(a=spoken[0], b=spoken[1])
+
+                if rng.random() < noise:
+                    text = rng.choice(FILLERS) + "、" + text
+
+                duration = round(max(2.0, len(text) * SECONDS_PER_CHAR), 2)
+                segments.append({
+                    'segment_id': f'seg_{len(segments) + 1:05d}',
+                    'text': text,
+                    'start_time': round(clock, 2),
+                    'end_time': round(clock + duration, 2),
+                    'expected_slide': label + 1,
+                    'keywords': [a, b],
+                })
+                clock += duration
+
+        return segments
+
+    def _corrupt(self, rng: random.Random, term: str, noise: float, slide_terms: List[List[str]]) -> str:
+        """Apply one ASR-style error to a term with probability noise"""
+        if rng.random() >= noise:
+            return term
+
+        error = rng.random()
+        if error < 0.3 and len(term) > 2:
+            # Dropped character
+            idx = rng.randrange(len(term))
+            return term[:idx] + term[idx + 1:]
+        if error < 0.5 and _KATAKANA.search(term):
+            # Katakana heard as hiragana
+            return _KATAKANA.sub(lambda m: chr(ord(m.group()) - 0x60), term)
+        if error < 0.8:
+            # Misrecognized as another slide's term
+            return rng.choice(rng.choice(slide_terms))
+        # Term not recognized at all
+        return "これ"
+
+
+def write_pdf(presentation: Dict, pdf_path: str,
+              width: float = 960, height: float = 540):
+    """
+    Render a presentation dict as a 16:9 PDF, one page per slide.
+
+    Titles use a large font and bullets a small one, so PDFExtractor
+    classifies them as title and bullet blocks.
+
+    Args:
+        presentation: Presentation dict with 'slides'
+        pdf_path: Output PDF path
+        width: Page width in points
+        height: Page height in points
+    """
+    doc = fitz.open()
+    try:
+        for slide in presentation['slides']:
+            page = doc.new_page(width=width, height=height)
+            page.insert_text((40, 70), slide['title'], fontname="japan", fontsize=28)
+            page.insert_textbox(
+                fitz.Rect(40, 100, width - 40, height - 30),
+                slide['content'],
+                fontname="japan",
+                fontsize=12
+            )
+
+        Path(pdf_path).parent.mkdir(parents=True, exist_ok=True)
+        doc.save(pdf_path, garbage=3, deflate=True)
+    finally:
+        doc.close()
+
+    logger.info(f"Wrote {len(presentation['slides'])} slides to {pdf_path}")
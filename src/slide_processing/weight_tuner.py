@@ -0,0 +1,464 @@
+"""
+Matching Weight Tuner
+
+Tunes ScoreCombiner parameters against labelled presentations without
+re-running the matching pipeline per configuration:
+
+1. Raw exact / fuzzy / semantic scores are computed once per deck
+   (segment x slide matrices) and cached to disk as .npz files.
+2. Each configuration is evaluated by re-combining the cached matrices
+   and replaying temporal smoothing, vectorized across configurations.
+
+Replay follows ScoreCombiner._apply_temporal_smoothing exactly, so a
+configuration scores the same here as in SlideProcessor.match_transcript.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from .slide_processor import SlideProcessor
+
+logger = logging.getLogger(__name__)
+
+
+# Parameters that can be tuned, with ScoreCombiner defaults
+TUNABLE_PARAMS = {
+    'exact_weight': 1.0,
+    'fuzzy_weight': 0.7,
+    'semantic_weight': 0.7,
+    'title_boost': 2.0,
+    'temporal_boost': 0.05,
+    'min_score_threshold': 1.5,
+    'switch_multiplier': 1.1,
+}
+
+# Bump when the cache layout or raw scoring changes
+CACHE_VERSION = 3
+
+
+@dataclass
+class DeckScores:
+    """Cached raw matcher scores for one labelled presentation"""
+    name: str
+    slide_ids: np.ndarray  # (S,) slide IDs in deck order
+    expected: np.ndarray  # (N,) expected slide ID per segment
+    exact: np.ndarray  # (N, S) raw ExactMatcher scores
+    fuzzy: np.ndarray  # (N, S) raw FuzzyMatcher scores
+    semantic: np.ndarray  # (N, S) raw SemanticMatcher scores
+    candidates: np.ndarray  # (N, S) slide returned by any matcher
+    title_hits: np.ndarray  # (N, S) exact match on a slide title keyword
+
+    @property
+    def num_segments(self) -> int:
+        return len(self.expected)
+
+    def save(self, filepath: str):
+        """Save scores to .npz file"""
+        np.savez_compressed(
+            filepath,
+            name=self.name,
+            slide_ids=self.slide_ids,
+            expected=self.expected,
+            exact=self.exact,
+            fuzzy=self.fuzzy,
+            semantic=self.semantic,
+            candidates=self.candidates,
+            title_hits=self.title_hits
+        )
+
+    @classmethod
+    def load(cls, filepath: str) -> 'DeckScores':
+        """Load scores from .npz file"""
+        data = np.load(filepath)
+        return cls(
+            name=str(data['name']),
+            slide_ids=data['slide_ids'],
+            expected=data['expected'],
+            exact=data['exact'],
+            fuzzy=data['fuzzy'],
+            semantic=data['semantic'],
+            candidates=data['candidates'],
+            title_hits=data['title_hits']
+        )
+
+
+def compute_deck_scores(processor: SlideProcessor,
+                        presentation: Dict,
+                        workers: int = 1) -> DeckScores:
+    """
+    Compute raw matcher scores for a labelled presentation.
+
+    Args:
+        processor: SlideProcessor with the presentation's slides loaded
+        presentation: Fixture dict with 'transcript_segments'
+        workers: Number of processes for segment scoring
+
+    Returns:
+        DeckScores for the presentation
+    """
+    segments = presentation['transcript_segments']
+    slide_ids = list(processor.slide_ids)
+    column = {slide_id: idx for idx, slide_id in enumerate(slide_ids)}
+    shape = (len(segments), len(slide_ids))
+
+    exact = np.zeros(shape)
+    fuzzy = np.zeros(shape)
+    semantic = np.zeros(shape)
+    candidates = np.zeros(shape, dtype=bool)
+    title_hits = np.zeros(shape, dtype=bool)
+
+    titles = {slide_id: info['title'] for slide_id, info in processor.slide_info.items()}
+    if processor.normalize:
+        titles = {slide_id: processor.nlp.normalize_text(title) for slide_id, title in titles.items()}
+    title_keywords = {
+        slide_id: set(processor.nlp.extract_keywords(title))
+        for slide_id, title in titles.items()
+    }
+
+    raw_scores = processor._score_segments(
+        [segment.get('text', '') for segment in segments],
+        workers=workers
+    )
+
+    for row, raw in enumerate(raw_scores):
+        for matrix, matches in zip((exact, fuzzy, semantic), raw):
+            for slide_id, data in matches.items():
+                matrix[row, column[slide_id]] = data.get('score', 0.0)
+                candidates[row, column[slide_id]] = True
+
+        for slide_id, data in raw[0].items():
+            if title_keywords[slide_id] & set(data.get('matched_keywords', [])):
+                title_hits[row, column[slide_id]] = True
+
+    return DeckScores(
+        name=presentation.get('presentation_id', ''),
+        slide_ids=np.array(slide_ids),
+        expected=np.array([segment['expected_slide'] for segment in segments]),
+        exact=exact,
+        fuzzy=fuzzy,
+        semantic=semantic,
+        candidates=candidates,
+        title_hits=title_hits
+    )
+
+
+def load_or_compute_deck_scores(fixture_path: str,
+                                cache_dir: str,
+                                use_embeddings: bool = False,
+                                keyword_scoring: str = 'tfidf',
+                                workers: int = 1) -> DeckScores:
+    """
+    Load cached raw scores for a fixture, computing them on a cache miss.
+
+    The cache key covers the fixture contents and the scoring options,
+    so editing a fixture invalidates its cache entry.
+
+    Args:
+        fixture_path: Path to a test presentation JSON fixture
+        cache_dir: Directory for .npz cache files
+        use_embeddings: Whether to include semantic scores
+        keyword_scoring: Keyword index scoring, 'tfidf' or 'bm25'
+        workers: Number of processes for segment scoring on a cache miss
+
+    Returns:
+        DeckScores for the fixture
+    """
+    fixture_path = Path(fixture_path)
+    raw = fixture_path.read_bytes()
+
+    key = hashlib.sha256(raw)
+    key.update(f"{CACHE_VERSION}:{use_embeddings}:{keyword_scoring}".encode())
+    cache_file = Path(cache_dir) / f"{fixture_path.stem}-{key.hexdigest()[:16]}.npz"
+
+    if cache_file.exists():
+        logger.info(f"Loaded cached scores: {cache_file}")
+        return DeckScores.load(str(cache_file))
+
+    presentation = json.loads(raw.decode('utf-8'))
+    processor = SlideProcessor(
+        use_embeddings=use_embeddings,
+        keyword_scoring=keyword_scoring
+    )
+    processor.process_slides(presentation['slides'])
+
+    scores = compute_deck_scores(processor, presentation, workers=workers)
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    scores.save(str(cache_file))
+    logger.info(f"Cached scores for {scores.num_segments} segments: {cache_file}")
+
+    return scores
+
+
+def build_grid(**param_values: Sequence[float]) -> List[Dict[str, float]]:
+    """
+    Build the cartesian product of parameter values.
+
+    Parameters not given keep their ScoreCombiner defaults.
+
+    Example:
+        build_grid(exact_weight=[0.5, 1.0], fuzzy_weight=[0.3, 0.7])
+    """
+    unknown = set(param_values) - set(TUNABLE_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {sorted(unknown)}")
+
+    names = list(param_values)
+    configs = []
+    for values in itertools.product(*(param_values[name] for name in names)):
+        config = dict(TUNABLE_PARAMS)
+        config.update(zip(names, (float(v) for v in values)))
+        configs.append(config)
+    return configs
+
+
+def replay_smoothing(deck: DeckScores,
+                     configs: List[Dict[str, float]],
+                     title_metadata: bool = False) -> np.ndarray:
+    """
+    Replay score combination and temporal smoothing for many configs.
+
+    Args:
+        deck: Cached raw scores
+        configs: Parameter dicts (missing keys use defaults)
+        title_metadata: Apply title_boost on title keyword hits. The
+            pipeline does not pass title metadata to ScoreCombiner, so
+            leave this off to reproduce match_transcript.
+
+    Returns:
+        (K, N) array of matched slide IDs, 0 where no slide matched
+    """
+    params = {
+        name: np.array([config.get(name, default) for config in configs], dtype=np.float64)
+        for name, default in TUNABLE_PARAMS.items()
+    }
+    num_configs = len(configs)
+    num_slides = len(deck.slide_ids)
+    rows = np.arange(num_configs)
+
+    temporal_boost = params['temporal_boost']
+    threshold = params['min_score_threshold']
+    switch_multiplier = params['switch_multiplier']
+
+    predictions = np.zeros((num_configs, deck.num_segments), dtype=np.int64)
+    if num_slides == 0:
+        return predictions
+
+    # -1 = no current slide (ScoreCombiner.current_slide_id is None)
+    current = np.full(num_configs, -1, dtype=np.int64)
+    # ScoreCombiner tests `if self.current_slide_id`, so slide ID 0 is inactive
+    truthy_slide = deck.slide_ids != 0
+
+    for t in range(deck.num_segments):
+        candidates = deck.candidates[t]
+        if not candidates.any():
+            continue
+
+        scores = (
+            np.outer(params['exact_weight'], deck.exact[t])
+            + np.outer(params['fuzzy_weight'], deck.fuzzy[t])
+            + np.outer(params['semantic_weight'], deck.semantic[t])
+        )
+        if title_metadata:
+            scores = np.where(deck.title_hits[t], scores * params['title_boost'][:, None], scores)
+        scores[:, ~candidates] = -np.inf
+
+        has_current = current >= 0
+        current_col = np.where(has_current, current, 0)
+        active = has_current & truthy_slide[current_col]
+
+        # Boost current slide
+        boosted = active & candidates[current_col]
+        scores[rows[boosted], current_col[boosted]] += temporal_boost[boosted]
+
+        best = np.argmax(scores, axis=1)
+        best_score = scores[rows, best]
+
+        matched = best_score >= threshold
+
+        # Only switch if the new slide scores significantly higher
+        current_score = np.where(
+            boosted,
+            scores[rows, current_col] - temporal_boost,
+            -temporal_boost
+        )
+        stay = (
+            matched & active & (current_col != best)
+            & (best_score < current_score * switch_multiplier)
+        )
+        chosen = np.where(stay, current_col, best)
+
+        current = np.where(matched, chosen, current)
+        predictions[:, t] = np.where(matched, deck.slide_ids[chosen], 0)
+
+    return predictions
+
+
+def score_predictions(predictions: np.ndarray, expected: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Accuracy and micro precision / recall / F1 per configuration.
+
+    Uses the same counting as the E2E matching tests: a wrong match is
+    a false positive and a false negative, no match is a false negative.
+
+    Args:
+        predictions: (K, N) matched slide IDs, 0 for no match
+        expected: (N,) expected slide IDs
+
+    Returns:
+        Dict of (K,) arrays: accuracy, precision, recall, f1_score
+    """
+    correct = (predictions == expected).sum(axis=1)
+    matched = (predictions != 0).sum(axis=1)
+    return _metrics(correct, matched, len(expected))
+
+
+def _metrics(correct: np.ndarray, matched: np.ndarray, total: int) -> Dict[str, np.ndarray]:
+    total = max(total, 1)
+    precision = np.divide(correct, matched, out=np.zeros(len(correct)), where=matched > 0)
+    recall = correct / total
+    denom = precision + recall
+    f1 = np.divide(2 * precision * recall, denom, out=np.zeros(len(correct)), where=denom > 0)
+
+    return {
+        'accuracy': correct / total,
+        'precision': precision,
+        'recall': recall,
+        'f1_score': f1,
+    }
+
+
+# Per-process deck scores for parallel evaluation
+_worker_decks: List[DeckScores] = []
+
+
+def _init_tuner_worker(decks: List[DeckScores]):
+    global _worker_decks
+    _worker_decks = decks
+
+
+def _evaluate_in_worker(args) -> Dict[str, np.ndarray]:
+    configs, title_metadata = args
+    return _evaluate_decks(_worker_decks, configs, title_metadata)
+
+
+def _evaluate_decks(decks: List[DeckScores],
+                    configs: List[Dict[str, float]],
+                    title_metadata: bool) -> Dict[str, np.ndarray]:
+    """Pool metrics over all decks (micro-averaged by segment count)"""
+    correct = np.zeros(len(configs))
+    matched = np.zeros(len(configs))
+    total = 0
+
+    for deck in decks:
+        predictions = replay_smoothing(deck, configs, title_metadata)
+        correct += (predictions == deck.expected).sum(axis=1)
+        matched += (predictions != 0).sum(axis=1)
+        total += deck.num_segments
+
+    return _metrics(correct, matched, total)
+
+
+class WeightTuner:
+    """
+    Evaluate ScoreCombiner configurations on cached raw scores.
+
+    Example:
+        tuner = WeightTuner(decks)
+        results = tuner.evaluate(build_grid(exact_weight=[0.5, 1.0, 1.5]))
+        best = results[0]
+    """
+
+    def __init__(self,
+                 decks: List[DeckScores],
+                 title_metadata: bool = False,
+                 workers: int = 1,
+                 chunk_size: int = 256):
+        """
+        Initialize weight tuner.
+
+        Args:
+            decks: Cached raw scores for each labelled presentation
+            title_metadata: Apply title_boost on title keyword hits
+                (see replay_smoothing)
+            workers: Number of processes for evaluation
+            chunk_size: Configurations per vectorized batch
+        """
+        if not decks:
+            raise ValueError("At least one deck is required")
+
+        self.decks = decks
+        self.title_metadata = title_metadata
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+        logger.info(f"Initialized WeightTuner: {len(decks)} decks, "
+                   f"{sum(d.num_segments for d in decks)} segments, workers={workers}")
+
+    def evaluate(self,
+                 configs: List[Dict[str, float]],
+                 sort_by: str = 'accuracy') -> List[Dict]:
+        """
+        Evaluate configurations across all decks.
+
+        Args:
+            configs: Parameter dicts (e.g. from build_grid)
+            sort_by: Metric to rank by ('accuracy' or 'f1_score')
+
+        Returns:
+            List of {'params', 'accuracy', 'precision', 'recall',
+            'f1_score'} dicts, best first
+        """
+        if sort_by not in ('accuracy', 'precision', 'recall', 'f1_score'):
+            raise ValueError(f"Unknown metric: {sort_by}")
+        if not configs:
+            return []
+
+        chunks = [
+            configs[start:start + self.chunk_size]
+            for start in range(0, len(configs), self.chunk_size)
+        ]
+
+        if self.workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(chunks)),
+                initializer=_init_tuner_worker,
+                initargs=(self.decks,)
+            ) as executor:
+                chunk_metrics = list(executor.map(
+                    _evaluate_in_worker,
+                    [(chunk, self.title_metadata) for chunk in chunks]
+                ))
+        else:
+            chunk_metrics = [
+                _evaluate_decks(self.decks, chunk, self.title_metadata)
+                for chunk in chunks
+            ]
+
+        results = []
+        for chunk, metrics in zip(chunks, chunk_metrics):
+            for idx, config in enumerate(chunk):
+                result = {'params': dict(config)}
+                result.update({name: float(values[idx]) for name, values in metrics.items()})
+                results.append(result)
+
+        # Stable sort keeps grid order among ties
+        results.sort(key=lambda r: (r[sort_by], r['f1_score']), reverse=True)
+        return results
+
+    def evaluate_per_deck(self, config: Dict[str, float]) -> Dict[str, Dict[str, float]]:
+        """Metrics for a single configuration, broken down by deck"""
+        report = {}
+        for deck in self.decks:
+            predictions = replay_smoothing(deck, [config], self.title_metadata)
+            metrics = score_predictions(predictions, deck.expected)
+            report[deck.name] = {name: float(values[0]) for name, values in metrics.items()}
+        return report
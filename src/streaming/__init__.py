@@ -10,17 +10,33 @@ This module implements Phase 3 of the Speech-to-Text system:
 """
 
 from .session_manager import StreamingSessionManager, StreamingSession
+from .async_session_manager import AsyncStreamingSessionManager, AsyncStreamingSession
 from .audio_handler import AudioChunkHandler, AudioChunkValidator
+from .audio_ring_buffer import AudioRingBuffer
+from .audio_rechunker import AudioRechunker
+from .deadline_scheduler import DeadlineScheduler, AsyncDeadlineScheduler
+from .audio_queue import AudioSendQueue, AsyncAudioSendQueue, BackpressurePolicy
 from .result_handler import StreamingResultHandler, StreamingResult
+from .speculative_matcher import SpeculativeMatcher
 from .session_renewer import SessionRenewer, RenewalEvent, RenewalStatus, AudioBuffer
 from .audio_preprocessing import (
     AudioPreprocessor,
     VoiceActivityDetector,
     AutomaticGainControl,
+    NoiseSuppressor,
     VADConfig,
     AGCConfig,
+    NoiseSuppressionConfig,
     AudioActivity,
 )
+from .audio_frontend import AudioFrontend, AudioInputFormat, PolyphaseResampler
+from .audio_encoder import (
+    StreamingAudioEncoder,
+    StreamingAudioDecoder,
+    create_encoder,
+)
+from .speech_gate import SpeechGate
+from .batch_preprocessor import BatchPreprocessor
 from .metrics_collector import (
     MetricsCollector,
     get_metrics_collector,
@@ -50,10 +66,20 @@ __all__ = [
     # Core streaming
     "StreamingSessionManager",
     "StreamingSession",
+    "AsyncStreamingSessionManager",
+    "AsyncStreamingSession",
     "AudioChunkHandler",
     "AudioChunkValidator",
+    "AudioRingBuffer",
+    "AudioRechunker",
+    "DeadlineScheduler",
+    "AsyncDeadlineScheduler",
+    "AudioSendQueue",
+    "AsyncAudioSendQueue",
+    "BackpressurePolicy",
     "StreamingResultHandler",
     "StreamingResult",
+    "SpeculativeMatcher",
     
     # Session renewal
     "SessionRenewer",
@@ -65,9 +91,19 @@ __all__ = [
     "AudioPreprocessor",
     "VoiceActivityDetector",
     "AutomaticGainControl",
+    "NoiseSuppressor",
     "VADConfig",
     "AGCConfig",
+    "NoiseSuppressionConfig",
     "AudioActivity",
+    "AudioFrontend",
+    "AudioInputFormat",
+    "PolyphaseResampler",
+    "StreamingAudioEncoder",
+    "StreamingAudioDecoder",
+    "create_encoder",
+    "SpeechGate",
+    "BatchPreprocessor",
     
     # Monitoring
     "MetricsCollector",
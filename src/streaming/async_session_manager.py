@@ -0,0 +1,885 @@
+"""
+Asyncio Streaming Session Manager for Google Cloud Speech-to-Text V2 API.
+
+Session API of StreamingSessionManager, but every session runs on one
+event loop through SpeechAsyncClient:
+- Audio is sent through an async request generator fed by a bounded AsyncAudioSendQueue
+- Results are received by one asyncio task per session (no listener thread)
+- start_session / send_audio_chunk / feed_audio / renew_stream /
+  close_session are coroutines
+- Deadlines (renewal, idle, stuck stream) run on an AsyncDeadlineScheduler;
+  due renewals and replay restarts run as tasks on the same loop
+
+Hundreds of concurrent sessions cost hundreds of tasks instead of
+hundreds of threads. Result handlers run on the loop, so they must stay
+non-blocking (speculative slide matching, when enabled, runs off-loop).
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional, Set
+
+from google.cloud.speech_v2 import SpeechAsyncClient
+from google.cloud.speech_v2.types import cloud_speech
+from google.api_core import exceptions as google_exceptions
+
+from .audio_encoder import check_encoding, create_encoder
+from .audio_queue import AsyncAudioSendQueue
+from .deadline_scheduler import AsyncDeadlineScheduler
+from .errors import SessionNotFoundError, SessionRenewalError
+from .session_manager import (
+    BYTES_PER_MS,
+    RECOVERABLE_STREAM_ERRORS,
+    StreamingSessionManager,
+    StreamingSession,
+    SessionStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _stopped(stop: asyncio.Event, timeout: float) -> bool:
+    """Wait up to timeout seconds for stop; True if it was set."""
+    try:
+        await asyncio.wait_for(stop.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+@dataclass
+class AsyncStreamingSession(StreamingSession):
+    """
+    Streaming session driven by the event loop.
+    """
+    audio_queue: AsyncAudioSendQueue = field(default_factory=AsyncAudioSendQueue)
+    receive_task: Optional[asyncio.Task] = None
+    renewal_task: Optional[asyncio.Task] = None  # Renewal started by the deadline
+    enqueue_lock: asyncio.Lock = field(default_factory=asyncio.Lock)  # Serializes producers
+
+
+class AsyncStreamingSessionManager(StreamingSessionManager):
+    """
+    Manages multiple concurrent streaming sessions on one event loop.
+
+    Stream lifecycle as in StreamingSessionManager, on the loop:
+    - renew_stream() opens the next call, mirrors audio to it for
+      overlap_ms, then drains the old call's receive task
+    - A recoverable stream error restarts the call with replayed audio
+    - With an AsyncDeadlineScheduler, idle sessions are closed, stuck
+      streams restarted and streams renewed when due (renewal_handler
+      defaults to a renewal task; SessionRenewer is for threads)
+
+    Example:
+        manager = AsyncStreamingSessionManager(project_id="my-project")
+        manager.create_session("s1", "p1")
+        await manager.start_session("s1")
+        await manager.send_audio_chunk("s1", chunk)
+        summary = await manager.close_session("s1")
+    """
+
+    session_class = AsyncStreamingSession
+
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        project_id: Optional[str] = None,
+        result_callback: Optional[Callable] = None,
+        client=None,
+        **kwargs
+    ):
+        """
+        Initialize session manager.
+
+        Args:
+            credentials_path: Path to GCP service account key
+            project_id: GCP project ID (required for V2 API)
+            result_callback: Callback for streaming results (called on the loop)
+            client: Optional pre-built async speech client (e.g.
+                tests.fake_recognizer.FakeSpeechAsyncClient for load tests)
+            **kwargs: Audio queue, metrics and deadline options of
+                StreamingSessionManager (a scheduler must be an
+                AsyncDeadlineScheduler)
+
+        Raises:
+            TypeError: If scheduler is a thread-driven DeadlineScheduler
+        """
+        scheduler = kwargs.get("scheduler")
+        if scheduler is not None and not isinstance(scheduler, AsyncDeadlineScheduler):
+            raise TypeError(
+                "AsyncStreamingSessionManager needs an AsyncDeadlineScheduler "
+                "(deadline callbacks must run on the event loop)"
+            )
+
+        if client is None:
+            client = SpeechAsyncClient.from_service_account_file(credentials_path) \
+                if credentials_path else SpeechAsyncClient()
+
+        super().__init__(
+            credentials_path=credentials_path,
+            project_id=project_id,
+            result_callback=result_callback,
+            client=client,
+            **kwargs
+        )
+        self._preprocess_alock: Optional[asyncio.Lock] = None  # Created on the loop
+        self._background_tasks: Set[asyncio.Task] = set()  # Deadline work in flight
+        self.renewal_handler = self._renew_in_background
+
+    async def start_session(
+        self,
+        session_id: str,
+        language_code: str = "ja-JP",
+        model: str = "latest_long",
+        enable_interim_results: bool = True,
+        audio_encoding: Optional[str] = None
+    ) -> bool:
+        """
+        Start (initialize) a streaming session.
+
+        Opens the streaming call and starts the session's receive task.
+        Audio sending is done via send_audio_chunk().
+
+        Args:
+            session_id: Session identifier
+            language_code: Language code
+            model: Speech model
+            enable_interim_results: Enable interim results
+            audio_encoding: Encoding on the wire (default: the manager's)
+
+        Returns:
+            True if started successfully
+
+        Raises:
+            SessionNotFoundError: If session doesn't exist
+        """
+        session = self.get_session(session_id)
+
+        try:
+            session.stream_config = {
+                "language_code": language_code,
+                "model": model,
+                "enable_interim_results": enable_interim_results,
+                "audio_encoding": check_encoding(audio_encoding or self.audio_encoding),
+            }
+            session.stream, session.receive_task = await self._open_stream(
+                session_id, session, session.audio_queue, audio_start_ms=0.0
+            )
+
+            session.status = SessionStatus.ACTIVE
+            session.last_audio_time = session.last_sent_time = time.time()
+            self._watch_session(session_id, session)
+
+            logger.info(
+                f"Session started: {session_id} "
+                f"(model={model}, language={language_code})"
+            )
+
+            return True
+
+        except Exception as e:
+            session.status = SessionStatus.ERROR
+            logger.error(f"Failed to start session {session_id}: {e}")
+            raise
+
+    async def _open_stream(
+        self,
+        session_id: str,
+        session: AsyncStreamingSession,
+        audio_queue: AsyncAudioSendQueue,
+        audio_start_ms: float
+    ):
+        """
+        Open a streaming call fed from audio_queue and create its receive task.
+
+        Args:
+            session_id: Session identifier
+            session: Session the stream belongs to
+            audio_queue: Queue the request generator reads audio from
+            audio_start_ms: Session audio clock at the stream's first byte
+                (shifts the stream's result offsets onto the session clock)
+
+        Returns:
+            (stream, receive task; it first runs when the caller yields)
+        """
+        config_request = self._build_config_request(**session.stream_config)
+
+        async def request_generator():
+            # First request: config only
+            yield config_request
+
+            # Each stream is its own bitstream (codec headers first)
+            encoder = create_encoder(session.stream_config.get("audio_encoding", "LINEAR16"))
+
+            # Subsequent requests: audio chunks until the queue is closed
+            while True:
+                chunk = await audio_queue.get()
+                if chunk is None:
+                    # End of stream: what the codec still holds
+                    audio = encoder.flush()
+                else:
+                    session.last_sent_time = time.time()
+                    cpu_before = encoder.cpu_s
+                    audio = encoder.encode(chunk)
+                    session.encode_cpu_s += encoder.cpu_s - cpu_before
+                if audio:  # Empty while the codec fills a frame
+                    session.wire_bytes_sent += len(audio)
+                    yield cloud_speech.StreamingRecognizeRequest(audio=audio)
+                if chunk is None:
+                    break
+
+        # Open bidirectional gRPC stream
+        stream = await self.client.streaming_recognize(
+            requests=request_generator()
+        )
+
+        receive_task = asyncio.create_task(
+            self._receive_results(session_id, session, stream, audio_start_ms),
+            name=f"stt-receive-{session_id}"
+        )
+
+        return stream, receive_task
+
+    async def send_audio_chunk(
+        self,
+        session_id: str,
+        chunk: bytes
+    ) -> bool:
+        """
+        Send audio chunk to Google Cloud.
+
+        Args:
+            session_id: Session identifier
+            chunk: Audio bytes (LINEAR16, 16kHz, mono)
+
+        Returns:
+            True if sent successfully
+
+        Raises:
+            SessionNotFoundError: If session doesn't exist
+            AudioChunkError: If chunk is invalid
+        """
+        session = self.get_session(session_id)
+
+        if session.status != SessionStatus.ACTIVE:
+            logger.warning(
+                f"Cannot send audio: session {session_id} "
+                f"status is {session.status.value}"
+            )
+            return False
+
+        return await self._submit_chunk(session_id, session, chunk)
+
+    async def feed_audio(
+        self,
+        session_id: str,
+        frame: bytes
+    ) -> int:
+        """
+        Send client audio frames of any size.
+
+        Frames are re-chunked into valid requests (see AudioRechunker);
+        a partial request is flushed after rechunk_max_delay_ms. Audio
+        fed before start_session() waits in the session's queue.
+
+        Args:
+            session_id: Session identifier
+            frame: Audio bytes in the session's input format (default
+                LINEAR16, 16kHz, mono), any length
+
+        Returns:
+            Number of requests queued (or withheld by VAD gating)
+
+        Raises:
+            SessionNotFoundError: If session doesn't exist
+        """
+        session = self.get_session(session_id)
+
+        if session.status not in (SessionStatus.INITIALIZING, SessionStatus.ACTIVE):
+            logger.warning(
+                f"Cannot feed audio: session {session_id} "
+                f"status is {session.status.value}"
+            )
+            return 0
+
+        if session.frontend is not None:
+            frame = session.frontend.process(frame)
+        sent = 0
+        for chunk in session.rechunker.push(frame):
+            sent += await self._submit_chunk(session_id, session, chunk)
+
+        self._start_rechunk_flusher()
+        return sent
+
+    async def _submit_chunk(
+        self,
+        session_id: str,
+        session: AsyncStreamingSession,
+        chunk: bytes
+    ) -> bool:
+        """
+        Queue a chunk, through the session's speech gate if gating is on.
+
+        Returns:
+            True if queued or withheld as silence
+        """
+        chunks = self._gate_chunk(session_id, session, chunk)
+        if chunks is None:
+            return await self._enqueue_chunk(session_id, session, chunk)
+        queued = True
+        for gated in chunks:
+            queued = await self._enqueue_chunk(session_id, session, gated) and queued
+        return queued
+
+    async def _enqueue_chunk(
+        self,
+        session_id: str,
+        session: AsyncStreamingSession,
+        chunk: bytes
+    ) -> bool:
+        """
+        Validate a chunk and put it on the session's send queue.
+
+        Args:
+            session_id: Session identifier
+            session: Session receiving the chunk
+            chunk: Audio bytes (LINEAR16, 16kHz, mono)
+
+        Returns:
+            True if queued
+        """
+        # One producer at a time per session (feed_audio, the re-chunk
+        # flusher and the preprocess ticker), so last_chunk belongs to
+        # this chunk and chunks are queued in ring order
+        async with session.enqueue_lock:
+            if not session.audio_handler.process_chunk(chunk):
+                return False
+
+            # BLOCK policy: wait for room (in the overlap queue too), then
+            # queue without suspending, so a restart or renewal cannot swap
+            # the queues between the checks and the puts
+            await session.audio_queue.wait_for_space(len(chunk))
+            overlap_queue = session.overlap_queue
+            if overlap_queue is not None:
+                await overlap_queue.wait_for_space(len(chunk))
+
+            dropped_before = session.audio_queue.dropped_chunks
+            queued = session.audio_queue.put_nowait(session.audio_handler.last_chunk)
+            overlap_dropped = False
+            if queued and session.overlap_queue is not None:
+                # Renewal overlap: the next stream hears it too
+                overlap_dropped = not session.overlap_queue.put_nowait(
+                    session.audio_handler.last_chunk
+                )
+            if queued:
+                session.audio_clock_ms += len(chunk) / BYTES_PER_MS
+                if session.audio_handler.last_offset is not None:
+                    session.queued_offset = session.audio_handler.last_offset + len(chunk)
+            self._record_queue_metrics(session_id, session, dropped_before)
+
+        if overlap_dropped:
+            # Only BLOCK timeouts get here; the next stream misses it
+            logger.error(
+                f"Renewal overlap queue full for session {session_id}, "
+                "dropping the next stream's copy of a chunk"
+            )
+            if self.metrics_collector:
+                self.metrics_collector.record_audio_queue(
+                    session_id, depth_ms=session.audio_queue.depth_ms, dropped_chunks=1
+                )
+
+        if not queued:
+            logger.error(
+                f"Audio queue full for session {session_id}, dropping chunk"
+            )
+            return False
+
+        session.total_chunks_sent += 1
+        session.total_bytes_sent += len(chunk)
+        session.last_audio_time = time.time()
+
+        if session.should_renew(self.RENEWAL_THRESHOLD_SECONDS):
+            logger.warning(
+                f"Session {session_id} approaching timeout, "
+                "renewal needed"
+            )
+
+        return True
+
+    async def close_session(self, session_id: str) -> dict:
+        """
+        Close a streaming session gracefully.
+
+        Ends the request stream, waits for the remaining results and
+        cancels the call if it does not finish in time.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Session summary dictionary
+
+        Raises:
+            SessionNotFoundError: If session doesn't exist
+        """
+        session = self.get_session(session_id)
+
+        try:
+            # A renewal in flight finishes first (it owns the next stream)
+            renewal = session.renewal_task
+            if renewal is not None and renewal is not asyncio.current_task():
+                await asyncio.wait([renewal])
+
+            # Send what is left of fed frames
+            await self._flush_rechunker(session_id, session, force=True)
+            if self.batch_preprocessor is not None:
+                await self._run_preprocess_tick()
+            self._close_speech_gate(session_id, session)
+
+            session.status = SessionStatus.CLOSING
+
+            if session.receive_task:
+                # Closing the queue ends the request generator; the receive
+                # task drains the final results and exits when the stream ends
+                session.audio_queue.close()
+                try:
+                    await asyncio.wait_for(session.receive_task, timeout=5.0)
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        f"Receive task for {session_id} did not stop gracefully"
+                    )
+                session.stop_listener.set()
+
+            if session.stream:
+                try:
+                    session.stream.cancel()
+                    logger.debug(f"gRPC stream closed for {session_id}")
+                except Exception as e:
+                    logger.warning(
+                        f"Error closing gRPC stream for {session_id}: {e}"
+                    )
+
+            summary = {
+                "session": session.to_dict(),
+                "results": session.result_handler.export_results(),
+                "audio_metrics": session.audio_handler.get_metrics(),
+            }
+            if session.speech_gate:
+                summary["speech_gate"] = self._speech_gate_stats(session_id, session)
+            if session.frontend:
+                summary["audio_frontend"] = session.frontend.get_stats()
+
+            session.status = SessionStatus.CLOSED
+
+            with self.lock:
+                del self.sessions[session_id]
+            self._unwatch_session(session_id, session)
+            if self.batch_preprocessor is not None:
+                self.batch_preprocessor.remove_session(session_id)
+
+            if self.metrics_collector:
+                self.metrics_collector.remove_audio_queue(session_id)
+
+            logger.info(
+                f"Session closed: {session_id} "
+                f"(duration={session.duration():.1f}s, "
+                f"chunks={session.total_chunks_sent})"
+            )
+
+            return summary
+
+        except Exception as e:
+            session.status = SessionStatus.ERROR
+            logger.error(f"Error closing session {session_id}: {e}")
+            raise
+
+    async def close_all_sessions(self) -> dict:
+        """
+        Close every session and stop the background tasks (shutdown).
+
+        Returns:
+            Session summaries by session ID; sessions that fail to close
+            are logged and left out
+        """
+        session_ids = list(self.sessions)
+        closed = await asyncio.gather(
+            *(self.close_session(session_id) for session_id in session_ids),
+            return_exceptions=True
+        )
+
+        summaries = {}
+        for session_id, summary in zip(session_ids, closed):
+            if isinstance(summary, SessionNotFoundError):
+                continue  # Closed meanwhile
+            if isinstance(summary, Exception):
+                logger.error(f"Error closing session {session_id}: {summary}")
+                continue
+            summaries[session_id] = summary
+
+        await self._stop_rechunk_flusher()
+        await self._stop_preprocess_ticker()
+        return summaries
+
+    async def renew_stream(self, session_id: str, overlap_ms: float = 1000.0) -> dict:
+        """
+        Replace a session's streaming call without a gap (make-before-break).
+
+        The next call is opened first, primed with the last replay_ms of
+        audio, and receives a copy of every chunk for overlap_ms while the
+        current call keeps running, so the session stays ACTIVE throughout.
+        The current call's queue is then closed and its receive task
+        drained; the next call's results from the replay and overlap are
+        held until then and de-duplicated against the last final by audio
+        offset.
+
+        Args:
+            session_id: Session identifier
+            overlap_ms: Wall-clock time both calls receive audio
+
+        Returns:
+            dict with open latency, replayed and overlap audio (ms) and
+            duplicates removed
+
+        Raises:
+            SessionNotFoundError: If session doesn't exist
+            SessionRenewalError: If the session is not active
+        """
+        session = self.get_session(session_id)
+        if session.status != SessionStatus.ACTIVE:
+            raise SessionRenewalError(
+                f"Cannot renew session {session_id}: "
+                f"status is {session.status.value}"
+            )
+
+        started = time.time()
+        duplicates_before = (session.duplicate_results, session.duplicate_words)
+        next_queue = self._new_audio_queue()
+
+        # Make: recent audio, then from here on every chunk, goes to the
+        # next call (no await in between, so no chunk is queued meanwhile)
+        audio_start_ms = self._replay_audio(session, next_queue, self.replay_ms)
+        overlap_start_ms = session.audio_clock_ms
+        session.overlap_queue = next_queue
+        session.held_responses = []
+
+        try:
+            next_stream, next_task = await self._open_stream(
+                session_id, session, next_queue, audio_start_ms
+            )
+        except Exception:
+            session.overlap_queue = None
+            session.held_responses = None
+            raise
+        session.overlap_stream = next_stream
+        open_latency = time.time() - started
+
+        await asyncio.sleep(overlap_ms / 1000)
+
+        # Break: the next call becomes the session's call
+        session.overlap_queue = None
+        old_queue, old_stream, old_task = (
+            session.audio_queue, session.stream, session.receive_task
+        )
+        session.audio_queue = next_queue
+        session.stream = next_stream
+        session.receive_task = next_task
+        session.created_at = started
+        session.renewal_count += 1
+        overlap_audio_ms = session.audio_clock_ms - overlap_start_ms
+
+        # The old call sends its last finals once its requests end
+        old_queue.close()
+        if old_task:
+            try:
+                await asyncio.wait_for(old_task, timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Receive task for renewed stream of {session_id} "
+                    "did not stop gracefully"
+                )
+        if old_stream:
+            try:
+                old_stream.cancel()
+            except Exception as e:
+                logger.warning(f"Error closing renewed stream for {session_id}: {e}")
+
+        # Release held finals (stale interims are dropped), then go live
+        held, session.held_responses = session.held_responses, None
+        session.overlap_stream = None
+        for response in held:
+            if any(result.is_final for result in response.results):
+                self._handle_response(session_id, session, response, audio_start_ms)
+
+        stats = {
+            "open_latency_s": open_latency,
+            "renewal_duration_s": time.time() - started,
+            "overlap_audio_ms": overlap_audio_ms,
+            "replayed_ms": overlap_start_ms - audio_start_ms,
+            "duplicate_results": session.duplicate_results - duplicates_before[0],
+            "duplicate_words": session.duplicate_words - duplicates_before[1],
+        }
+
+        logger.info(
+            f"Stream renewed for {session_id}: "
+            f"open {open_latency * 1000:.0f}ms, "
+            f"replay {stats['replayed_ms']:.0f}ms + "
+            f"overlap {overlap_audio_ms:.0f}ms of audio, "
+            f"{stats['duplicate_results']} duplicate results / "
+            f"{stats['duplicate_words']} words removed"
+        )
+
+        return stats
+
+    async def _restart_stream(self, session_id: str, session: AsyncStreamingSession, stream) -> bool:
+        """
+        Replace a stream that failed with a recoverable error.
+
+        The new stream is primed with recent audio (and anything the failed
+        stream had not sent yet), so words at the break are recognized again;
+        overlap with earlier finals is removed by audio offset.
+
+        Args:
+            session_id: Session identifier
+            session: Session whose stream failed
+            stream: The failed stream
+
+        Returns:
+            True if the session continues (restarted, or a renewal in
+            progress already has the audio)
+        """
+        if session.overlap_stream is not None:
+            # Mid-renewal: the next stream already hears the audio
+            return stream is session.stream
+        if (
+            session.status != SessionStatus.ACTIVE
+            or session.stop_listener.is_set()
+            or stream is not session.stream
+            or session.stream_restarts >= self.max_stream_restarts
+        ):
+            return False
+
+        # Replay and swap with no await in between, so live chunks go to
+        # the new queue right after the replay; with no current stream
+        # while the next opens, other checks see the failed one as superseded
+        failed_queue = session.audio_queue
+        next_queue = self._new_audio_queue()
+        audio_start_ms = self._replay_audio(
+            session, next_queue, max(self.replay_ms, failed_queue.depth_ms)
+        )
+        session.audio_queue = next_queue
+        session.stream = None
+        session.stream_restarts += 1
+        failed_queue.close()
+
+        try:
+            session.stream, session.receive_task = await self._open_stream(
+                session_id, session, next_queue, audio_start_ms
+            )
+        except Exception as e:
+            logger.error(f"Failed to restart stream for {session_id}: {e}")
+            return False
+
+        logger.warning(
+            f"Stream restarted for {session_id} "
+            f"(restart #{session.stream_restarts}, "
+            f"replaying {session.audio_clock_ms - audio_start_ms:.0f}ms)"
+        )
+        return True
+
+    def _spawn(self, coro: Awaitable, name: str) -> asyncio.Task:
+        """Run deadline work as a task (kept referenced until done)."""
+        task = asyncio.create_task(coro, name=name)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def _renew_in_background(self, session_id: str, session: AsyncStreamingSession):
+        """Default renewal_handler: renew on the loop (once at a time)."""
+        if session.renewal_task is not None and not session.renewal_task.done():
+            return
+        session.renewal_task = self._spawn(
+            self._renew_quietly(session_id), name=f"stt-renew-{session_id}"
+        )
+
+    async def _renew_quietly(self, session_id: str):
+        """Renew a session from its renewal deadline."""
+        try:
+            await self.renew_stream(session_id)
+        except (SessionNotFoundError, SessionRenewalError):
+            pass  # Closed or stopped meanwhile
+        except Exception as e:
+            logger.error(f"Error renewing session {session_id}: {e}")
+
+    def _replace_stuck_stream(self, session_id: str, session: AsyncStreamingSession):
+        """Restart a session's stuck stream (as a task), then cancel the stuck one."""
+        self._spawn(
+            self._restart_stuck_stream(session_id, session, session.stream),
+            name=f"stt-restart-{session_id}"
+        )
+
+    async def _restart_stuck_stream(self, session_id: str, session: AsyncStreamingSession, stream):
+        """Replace a stuck stream, then cancel it (its receive task ends)."""
+        if await self._restart_stream(session_id, session, stream) and stream:
+            try:
+                stream.cancel()
+            except Exception as e:
+                logger.warning(f"Error cancelling stuck stream for {session_id}: {e}")
+
+    def _close_in_background(self, session_id: str):
+        """Close a session from a deadline (as a task)."""
+        self._spawn(self._close_quietly(session_id), name=f"stt-close-{session_id}")
+
+    async def _close_quietly(self, session_id: str):
+        """Close a session from a background check."""
+        try:
+            await self.close_session(session_id)
+        except SessionNotFoundError:
+            pass  # Closed meanwhile
+        except Exception as e:
+            logger.error(f"Error closing idle session {session_id}: {e}")
+
+    def _new_audio_queue(self) -> AsyncAudioSendQueue:
+        """Create a session's bounded audio queue."""
+        return AsyncAudioSendQueue(
+            max_ms=self.audio_queue_ms,
+            policy=self.backpressure_policy
+        )
+
+    def _start_rechunk_flusher(self):
+        """Start the task that flushes overdue partial requests (once)."""
+        if self._rechunk_flusher is None or self._rechunk_flusher.done():
+            self._rechunk_stop = asyncio.Event()
+            self._rechunk_flusher = asyncio.create_task(
+                self._rechunk_flush_loop(self._rechunk_stop),
+                name="rechunk-flusher"
+            )
+
+    async def _stop_rechunk_flusher(self):
+        """Stop the flusher task; the next fed session starts a new one."""
+        flusher, self._rechunk_flusher = self._rechunk_flusher, None
+        if flusher is not None:
+            self._rechunk_stop.set()
+            await flusher
+
+    async def _run_preprocess_tick(self):
+        """One batch preprocessing tick; queues what the gates let through."""
+        if self._preprocess_alock is None:
+            self._preprocess_alock = asyncio.Lock()
+        async with self._preprocess_alock:
+            for session_id, session, chunks in self._preprocess_tick():
+                try:
+                    for chunk in chunks:
+                        await self._enqueue_chunk(session_id, session, chunk)
+                except Exception as e:
+                    logger.error(f"Error queuing gated audio for {session_id}: {e}")
+
+    def _start_preprocess_ticker(self):
+        """Start the task that ticks the batch preprocessor (once)."""
+        if self._preprocess_ticker is None or self._preprocess_ticker.done():
+            self._preprocess_stop = asyncio.Event()
+            self._preprocess_ticker = asyncio.create_task(
+                self._preprocess_tick_loop(self._preprocess_stop),
+                name="preprocess-ticker"
+            )
+
+    async def _stop_preprocess_ticker(self):
+        """Stop the ticker task; the next gated session starts a new one."""
+        ticker, self._preprocess_ticker = self._preprocess_ticker, None
+        if ticker is not None:
+            self._preprocess_stop.set()
+            await ticker
+
+    async def _preprocess_tick_loop(self, stop: asyncio.Event):
+        """Tick the batch preprocessor (one task for all sessions)."""
+        interval = self.preprocess_tick_ms / 1000
+        while self.sessions and not await _stopped(stop, interval):
+            try:
+                await self._run_preprocess_tick()
+            except Exception as e:
+                logger.error(f"Error in batch preprocessing: {e}")
+
+    async def _rechunk_flush_loop(self, stop: asyncio.Event):
+        """Poll every session's re-chunker (one task for all sessions)."""
+        interval = self.rechunk_max_delay_ms / 2000
+        while self.sessions and not await _stopped(stop, interval):
+            for session_id, session in list(self.sessions.items()):
+                if session.rechunker.pending_bytes:
+                    try:
+                        await self._flush_rechunker(session_id, session)
+                    except Exception as e:
+                        logger.error(f"Error flushing audio for {session_id}: {e}")
+
+    async def _flush_rechunker(self, session_id: str, session: AsyncStreamingSession, force: bool = False):
+        """Queue a session's overdue (or, with force, any) partial request."""
+        rechunker = session.rechunker
+        if rechunker is None:
+            return
+        chunks = []
+        if force and session.frontend is not None:
+            # End of stream: the resampler's last samples
+            chunks += rechunker.push(session.frontend.flush())
+        if rechunker.pending_bytes:
+            chunk = rechunker.flush() if force else rechunker.poll()
+            chunks += [chunk] if chunk is not None else []
+        if session.status in (SessionStatus.INITIALIZING, SessionStatus.ACTIVE):
+            for chunk in chunks:
+                await self._submit_chunk(session_id, session, chunk)
+
+    async def _receive_results(
+        self,
+        session_id: str,
+        session: AsyncStreamingSession,
+        stream,
+        audio_start_ms: float = 0.0
+    ):
+        """
+        Receive streaming results from one call until it ends.
+
+        Args:
+            session_id: Session identifier
+            session: Session the call belongs to
+            stream: Streaming call (async iterator of responses)
+            audio_start_ms: Session audio clock at the stream's first byte
+        """
+        logger.info(f"Result receiver started for session {session_id}")
+
+        try:
+            async for response in stream:
+                if session.stop_listener.is_set():
+                    logger.debug(f"Stop signal received for {session_id}")
+                    break
+
+                # A renewal's next stream is held until the old one drains
+                if stream is session.overlap_stream and session.held_responses is not None:
+                    session.held_responses.append(response)
+                    continue
+
+                if not self._handle_response(session_id, session, response, audio_start_ms):
+                    break
+
+        except asyncio.CancelledError:
+            raise
+
+        except google_exceptions.GoogleAPICallError as e:
+            logger.error(
+                f"gRPC error in result receiver for {session_id}: {e}"
+            )
+            if stream is not session.stream and stream is not session.overlap_stream:
+                pass  # Superseded by a restart or renewal
+            elif not (
+                isinstance(e, RECOVERABLE_STREAM_ERRORS)
+                and await self._restart_stream(session_id, session, stream)
+            ):
+                session.status = SessionStatus.ERROR
+
+        except Exception as e:
+            logger.error(
+                f"Unexpected error in result receiver for {session_id}: {e}",
+                exc_info=True
+            )
+            session.status = SessionStatus.ERROR
+
+        finally:
+            logger.info(f"Result receiver stopped for session {session_id}")
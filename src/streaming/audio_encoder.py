@@ -0,0 +1,482 @@
+"""
+Compressed upstream audio for streaming sessions.
+
+LINEAR16 at 16kHz mono is 256 kbit/s per session on the wire. The V2
+API also accepts compressed streaming audio (ExplicitDecodingConfig),
+so a session can send less:
+- MULAW: G.711 8-bit companding, 128 kbit/s, no dependencies
+- FLAC: lossless, typically 50-80% of LINEAR16 on speech (libsndfile)
+- OGG_OPUS: lossy speech codec, ~32 kbit/s (libsndfile >= 1.0.29)
+
+Encoders are incremental: each LINEAR16 chunk is encoded as it is sent,
+and every request carries whole FLAC frames or Ogg pages, so nothing
+waits for the end of the stream. One encoder belongs to one streaming
+call; a new call (renewal, error recovery) starts a new bitstream with
+its own headers.
+
+StreamingAudioDecoder is the receiving side, used by the fake recognizer.
+"""
+
+import io
+import logging
+import struct
+import time
+from typing import Dict, Tuple, Union
+
+import numpy as np
+
+from .audio_handler import AudioChunkValidator
+
+logger = logging.getLogger(__name__)
+
+# libsndfile (FLAC, Ogg/Opus) is optional
+try:
+    import soundfile
+    SOUNDFILE_AVAILABLE = True
+except (ImportError, OSError):
+    logger.warning("soundfile not available. Install with: pip install soundfile")
+    SOUNDFILE_AVAILABLE = False
+
+
+# Encodings a session can stream (ExplicitDecodingConfig.AudioEncoding names)
+STREAMING_ENCODINGS = ("LINEAR16", "MULAW", "FLAC", "OGG_OPUS")
+
+# Encodings that need libsndfile
+SOUNDFILE_ENCODINGS = ("FLAC", "OGG_OPUS")
+
+# sf_command() to set the longest audio an Ogg page holds (libsndfile >= 1.2;
+# not wrapped by soundfile). The default is about a second.
+SFC_SET_OGG_PAGE_LATENCY_MS = 0x1302
+
+# Opus granule positions count 48kHz samples
+OPUS_GRANULE_RATE = 48000
+
+# G.711 mu-law (14-bit linear input)
+MULAW_BIAS = 0x84
+MULAW_CLIP = 8159
+MULAW_SEGMENT_ENDS = (0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF)
+
+
+def _build_mulaw_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """(int16 -> mu-law table indexed by the uint16 view, mu-law -> int16 table)"""
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(pcm), MULAW_CLIP) + (MULAW_BIAS >> 2)
+    segment = np.searchsorted(MULAW_SEGMENT_ENDS, magnitude)
+    code = np.where(
+        segment >= 8, 0x7F,
+        (np.minimum(segment, 7) << 4) | ((magnitude >> (np.minimum(segment, 7) + 1)) & 0x0F)
+    )
+    encode = (code ^ mask).astype(np.uint8)
+
+    code = ~np.arange(256, dtype=np.int32) & 0xFF
+    linear = ((((code & 0x0F) << 3) + MULAW_BIAS) << ((code >> 4) & 0x07)) - MULAW_BIAS
+    decode = np.where(code & 0x80, -linear, linear).astype(np.int16)
+    return encode, decode
+
+
+MULAW_ENCODE, MULAW_DECODE = _build_mulaw_tables()
+
+
+def check_encoding(encoding: str) -> str:
+    """
+    Validate a streaming encoding name.
+
+    Args:
+        encoding: One of STREAMING_ENCODINGS (case-insensitive)
+
+    Returns:
+        The upper-case encoding name
+
+    Raises:
+        ValueError: Unknown encoding, or libsndfile is needed but missing
+    """
+    name = encoding.upper()
+    if name not in STREAMING_ENCODINGS:
+        raise ValueError(
+            f"Unsupported streaming encoding: {encoding} "
+            f"(expected one of {', '.join(STREAMING_ENCODINGS)})"
+        )
+    if name in SOUNDFILE_ENCODINGS and not SOUNDFILE_AVAILABLE:
+        raise ValueError(f"{name} streaming needs soundfile (pip install soundfile)")
+    return name
+
+
+class StreamingAudioEncoder:
+    """
+    Encodes one streaming call's LINEAR16 chunks (LINEAR16: as is).
+
+    Subclasses implement _encode() and _flush().
+    """
+
+    encoding = "LINEAR16"
+
+    def __init__(self, sample_rate: int = AudioChunkValidator.SAMPLE_RATE):
+        """
+        Initialize encoder.
+
+        Args:
+            sample_rate: Sample rate of the LINEAR16 mono input (Hz)
+        """
+        self.sample_rate = sample_rate
+
+        # Counters
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_s = 0.0  # Thread CPU time spent encoding
+
+    def encode(self, chunk: Union[bytes, bytearray, memoryview]) -> bytes:
+        """
+        Encode the next chunk.
+
+        Args:
+            chunk: LINEAR16 mono audio
+
+        Returns:
+            Encoded bytes ready to send (empty while the codec buffers)
+        """
+        start = time.thread_time()
+        data = self._encode(chunk)
+        self.cpu_s += time.thread_time() - start
+        self.bytes_in += len(chunk)
+        self.bytes_out += len(data)
+        return data
+
+    def flush(self) -> bytes:
+        """
+        End of stream: everything the codec still holds.
+
+        Returns:
+            Encoded bytes (possibly empty)
+        """
+        start = time.thread_time()
+        data = self._flush()
+        self.cpu_s += time.thread_time() - start
+        self.bytes_out += len(data)
+        return data
+
+    def _encode(self, chunk) -> bytes:
+        return bytes(chunk)
+
+    def _flush(self) -> bytes:
+        return b''
+
+    def get_stats(self) -> Dict:
+        """
+        Get encoding statistics.
+
+        Returns:
+            dict with the encoding, bytes in/out, their ratio and CPU ms
+        """
+        return {
+            'encoding': self.encoding,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'ratio': self.bytes_out / self.bytes_in if self.bytes_in else 1.0,
+            'cpu_ms': self.cpu_s * 1000,
+        }
+
+
+class MulawEncoder(StreamingAudioEncoder):
+    """G.711 mu-law: one byte per sample, by table lookup."""
+
+    encoding = "MULAW"
+
+    def _encode(self, chunk) -> bytes:
+        samples = np.frombuffer(chunk, dtype=np.uint16, count=len(chunk) // 2)
+        return MULAW_ENCODE[samples].tobytes()
+
+
+class _StreamSink:
+    """
+    Append-only file object for libsndfile's virtual IO.
+
+    take() hands out what was written since the last call. Writes before
+    that point (header rewrites when the file is closed) are dropped:
+    those bytes are already on the wire, and streamed FLAC/Ogg do not
+    need them.
+    """
+
+    def __init__(self):
+        self._pending = bytearray()
+        self._taken = 0  # Stream offset of _pending[0]
+        self._pos = 0
+
+    def write(self, data) -> int:
+        size = len(data)
+        start = self._pos - self._taken
+        if start < 0:
+            data = memoryview(data)[-start:]
+            start = 0
+        end = start + len(data)
+        if end > len(self._pending):
+            self._pending.extend(bytes(end - len(self._pending)))
+        self._pending[start:end] = data
+        self._pos += size
+        return size
+
+    def read(self, size: int = -1) -> bytes:
+        return b''
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._taken + len(self._pending)
+        self._pos = offset
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def take(self) -> bytes:
+        data = bytes(self._pending)
+        self._taken += len(data)
+        self._pending.clear()
+        return data
+
+
+class _SoundFileEncoder(StreamingAudioEncoder):
+    """Incremental libsndfile encoder writing into a _StreamSink."""
+
+    format = ''
+    subtype = ''
+
+    def __init__(
+        self,
+        sample_rate: int = AudioChunkValidator.SAMPLE_RATE,
+        compression_level: Union[float, None] = None
+    ):
+        """
+        Initialize encoder.
+
+        Args:
+            sample_rate: Sample rate of the LINEAR16 mono input (Hz)
+            compression_level: libsndfile compression level, 0.0-1.0
+                (None: the codec default)
+        """
+        super().__init__(sample_rate)
+        self._sink = _StreamSink()
+        self._file = soundfile.SoundFile(
+            self._sink, mode='w', samplerate=sample_rate, channels=1,
+            format=self.format, subtype=self.subtype,
+            compression_level=compression_level
+        )
+
+    def _encode(self, chunk) -> bytes:
+        self._file.buffer_write(chunk, dtype='int16')
+        return self._sink.take()
+
+    def _flush(self) -> bytes:
+        if not self._file.closed:
+            self._file.close()
+        return self._sink.take()
+
+
+class FlacEncoder(_SoundFileEncoder):
+    """
+    Lossless FLAC frames.
+
+    Compression level 0 uses 1152-sample blocks, so a frame is sent at
+    most 72ms after its audio (higher levels use 4096-sample blocks).
+    """
+
+    encoding = "FLAC"
+    format = 'FLAC'
+    subtype = 'PCM_16'
+
+    def __init__(self, sample_rate: int = AudioChunkValidator.SAMPLE_RATE, compression_level: float = 0.0):
+        super().__init__(sample_rate, compression_level)
+
+
+class OggOpusEncoder(_SoundFileEncoder):
+    """
+    Opus in Ogg pages, flushed every page_latency_ms of audio.
+    """
+
+    encoding = "OGG_OPUS"
+    format = 'OGG'
+    subtype = 'OPUS'
+
+    def __init__(
+        self,
+        sample_rate: int = AudioChunkValidator.SAMPLE_RATE,
+        compression_level: Union[float, None] = None,
+        page_latency_ms: float = 100.0
+    ):
+        """
+        Initialize encoder.
+
+        Args:
+            sample_rate: Sample rate of the LINEAR16 mono input (Hz)
+            compression_level: libsndfile compression level, 0.0-1.0
+                (lower is a higher bitrate; None: the codec default)
+            page_latency_ms: Longest audio held in an unsent Ogg page
+        """
+        super().__init__(sample_rate, compression_level)
+        latency = soundfile._ffi.new('double*', page_latency_ms)
+        result = soundfile._snd.sf_command(
+            self._file._file, SFC_SET_OGG_PAGE_LATENCY_MS, latency, soundfile._ffi.sizeof('double')
+        )
+        if result != 0:
+            logger.debug("libsndfile cannot set the Ogg page latency (pages are sent about every second)")
+
+
+ENCODERS = {
+    "LINEAR16": StreamingAudioEncoder,
+    "MULAW": MulawEncoder,
+    "FLAC": FlacEncoder,
+    "OGG_OPUS": OggOpusEncoder,
+}
+
+
+def create_encoder(encoding: str, sample_rate: int = AudioChunkValidator.SAMPLE_RATE) -> StreamingAudioEncoder:
+    """
+    Create the encoder for one streaming call.
+
+    Args:
+        encoding: One of STREAMING_ENCODINGS
+        sample_rate: Sample rate of the LINEAR16 mono input (Hz)
+
+    Returns:
+        StreamingAudioEncoder
+
+    Raises:
+        ValueError: See check_encoding()
+    """
+    return ENCODERS[check_encoding(encoding)](sample_rate)
+
+
+class StreamingAudioDecoder:
+    """
+    Decodes one streaming call's requests back to LINEAR16 samples.
+
+    Assumes what StreamingAudioEncoder sends: every request holds whole
+    FLAC frames or Ogg pages. Each request is decoded on its own (with the
+    stream's headers), so decoders keep no codec state between requests.
+    """
+
+    def __init__(self, encoding: str, sample_rate: int = AudioChunkValidator.SAMPLE_RATE):
+        """
+        Initialize decoder.
+
+        Args:
+            encoding: One of STREAMING_ENCODINGS
+            sample_rate: Sample rate of the decoded audio (Hz)
+
+        Raises:
+            ValueError: See check_encoding()
+        """
+        self.encoding = check_encoding(encoding)
+        self.sample_rate = sample_rate
+        self._header = b''
+        self._header_done = False
+        self._granule = None  # Opus: granule position at the end of the last page
+        self._last_page = b''  # Opus: last audio page of the previous request
+
+    def decode(self, data: bytes) -> Tuple[np.ndarray, float]:
+        """
+        Decode one request.
+
+        Args:
+            data: Encoded request audio
+
+        Returns:
+            (int16 samples, seconds of stream audio the request carried)
+        """
+        if self.encoding == "LINEAR16":
+            samples = np.frombuffer(data, dtype=np.int16, count=len(data) // 2)
+            return samples, samples.size / self.sample_rate
+        if self.encoding == "MULAW":
+            samples = MULAW_DECODE[np.frombuffer(data, dtype=np.uint8)]
+            return samples, samples.size / self.sample_rate
+        if self.encoding == "FLAC":
+            return self._decode_flac(data)
+        return self._decode_opus(data)
+
+    def _decode_flac(self, data: bytes) -> Tuple[np.ndarray, float]:
+        if not self._header_done:
+            data = self._header + data
+            end = _flac_header_size(data)
+            if end is None:
+                self._header = data
+                return np.empty(0, dtype=np.int16), 0.0
+            self._header, data = data[:end], data[end:]
+            self._header_done = True
+        if not data:
+            return np.empty(0, dtype=np.int16), 0.0
+        samples = _read_soundfile(self._header + data)
+        return samples, samples.size / self.sample_rate
+
+    def _decode_opus(self, data: bytes) -> Tuple[np.ndarray, float]:
+        audio_pages = []
+        for page, granule in _ogg_pages(data):
+            if not self._header_done and granule == 0:
+                self._header += page
+                continue
+            if self._granule is None:
+                # Playback starts after the encoder's pre-skip (OpusHead)
+                self._granule = struct.unpack_from('<H', self._header, self._header.find(b'OpusHead') + 10)[0]
+            self._header_done = True
+            audio_pages.append((page, granule))
+        if not audio_pages:
+            return np.empty(0, dtype=np.int16), 0.0
+
+        duration = 0.0
+        last = audio_pages[-1][1]
+        if last != -1:
+            duration = max(last - self._granule, 0) / OPUS_GRANULE_RATE
+            self._granule = last
+
+        # Decoded after the previous page, which primes the decoder (and
+        # takes the pre-skip); its samples are dropped
+        pages = b''.join(page for page, _ in audio_pages)
+        samples = _read_soundfile(self._header + self._last_page + pages)
+        self._last_page = audio_pages[-1][0]
+        count = min(int(round(duration * self.sample_rate)), samples.size)
+        return samples[samples.size - count:], duration
+
+
+def _flac_header_size(data: bytes) -> Union[int, None]:
+    """Bytes of the 'fLaC' marker and metadata blocks, None if incomplete"""
+    pos = 4
+    while pos + 4 <= len(data):
+        last = data[pos] & 0x80
+        pos += 4 + int.from_bytes(data[pos + 1:pos + 4], 'big')
+        if last:
+            return pos if pos <= len(data) else None
+    return None
+
+
+def _ogg_pages(data: bytes):
+    """(page bytes, granule position) of each whole Ogg page"""
+    pos = 0
+    while pos + 27 <= len(data):
+        segments = data[pos + 26]
+        size = 27 + segments + sum(data[pos + 27:pos + 27 + segments])
+        granule = struct.unpack_from('<q', data, pos + 6)[0]
+        yield data[pos:pos + size], granule
+        pos += size
+
+
+def _read_soundfile(data: bytes) -> np.ndarray:
+    """
+    Decode a headers-plus-frames byte string to int16 samples.
+
+    Streamed files have no sample count, so soundfile's read() (which
+    sizes its output from it and seeks after reading) cannot be used;
+    libsndfile is read until it runs out instead.
+    """
+    blocks = []
+    with soundfile.SoundFile(io.BytesIO(data)) as sound:
+        while True:
+            block = np.empty(4096 * sound.channels, dtype=np.int16)
+            count = soundfile._snd.sf_readf_short(
+                sound._file, soundfile._ffi.cast('short*', block.ctypes.data), 4096
+            )
+            if count <= 0:
+                break
+            blocks.append(block[:count * sound.channels])
+    if not blocks:
+        return np.empty(0, dtype=np.int16)
+    return np.concatenate(blocks)
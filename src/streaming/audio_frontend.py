@@ -0,0 +1,329 @@
+"""
+Per-session audio front-end for client capture formats.
+
+The streaming path sends LINEAR16, 16kHz mono (AudioChunkValidator,
+_build_streaming_config), while browsers and capture devices commonly
+produce 44.1/48kHz stereo, float32 or 24-bit audio. The front-end
+converts client frames as they arrive:
+- Decodes int16, int24, int32, float32 and uint8 PCM; a sample frame
+  split across client frames carries over
+- Downmixes channels to mono (mean)
+- Resamples with a stateful polyphase FIR (Kaiser-windowed sinc): filter
+  history and output phase carry across frames, so output does not depend
+  on frame sizes and nothing is rebuilt per frame
+
+Its output goes to the re-chunker and validator like native 16kHz frames.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Dict, Union
+
+import numpy as np
+
+from .audio_handler import AudioChunkValidator
+
+logger = logging.getLogger(__name__)
+
+
+# Bytes per sample of each supported PCM sample format (little-endian)
+SAMPLE_FORMATS = {
+    'int16': 2,
+    'int24': 3,
+    'int32': 4,
+    'float32': 4,
+    'uint8': 1,
+}
+
+
+@dataclass
+class AudioInputFormat:
+    """Client audio format."""
+    # Sample rate (Hz)
+    sample_rate: int = AudioChunkValidator.SAMPLE_RATE
+
+    # Interleaved channels
+    channels: int = AudioChunkValidator.CHANNELS
+
+    # PCM sample format (see SAMPLE_FORMATS)
+    sample_format: str = 'int16'
+
+    def __post_init__(self):
+        if self.sample_format not in SAMPLE_FORMATS:
+            raise ValueError(
+                f"Unsupported sample format: {self.sample_format} "
+                f"(expected one of {', '.join(SAMPLE_FORMATS)})"
+            )
+        if self.sample_rate <= 0 or self.channels <= 0:
+            raise ValueError("sample_rate and channels must be positive")
+
+    @property
+    def bytes_per_frame(self) -> int:
+        """Bytes per sample frame (one sample of every channel)"""
+        return SAMPLE_FORMATS[self.sample_format] * self.channels
+
+    @property
+    def is_native(self) -> bool:
+        """Whether audio is already what the streaming API is sent"""
+        return (
+            self.sample_rate == AudioChunkValidator.SAMPLE_RATE
+            and self.channels == AudioChunkValidator.CHANNELS
+            and self.sample_format == 'int16'
+        )
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational resampler (polyphase FIR).
+
+    Output sample m is the filtered input at time m * down / up input
+    samples; the filter is centred on it, so output is aligned with input
+    and only waits for half the filter's input span.
+    """
+
+    def __init__(
+        self,
+        orig_sr: int,
+        target_sr: int = AudioChunkValidator.SAMPLE_RATE,
+        zero_crossings: int = 24,
+        rolloff: float = 0.9,
+        kaiser_beta: float = 8.6
+    ):
+        """
+        Initialize resampler.
+
+        Args:
+            orig_sr: Input sample rate (Hz)
+            target_sr: Output sample rate (Hz)
+            zero_crossings: Sinc zero crossings on each side of the centre
+                tap (longer filters have sharper cutoffs)
+            rolloff: Cutoff as a fraction of the lower Nyquist frequency
+            kaiser_beta: Kaiser window shape (stopband attenuation)
+        """
+        g = math.gcd(orig_sr, target_sr)
+        self.up = target_sr // g
+        self.down = orig_sr // g
+        self.orig_sr = orig_sr
+        self.target_sr = target_sr
+
+        # Low-pass prototype at the upsampled rate, cutoff relative to its Nyquist
+        cutoff = rolloff / max(self.up, self.down)
+        self.delay = int(math.ceil(zero_crossings / cutoff))
+        n = np.arange(2 * self.delay + 1) - self.delay
+        prototype = self.up * cutoff * np.sinc(cutoff * n) * np.kaiser(n.size, kaiser_beta)
+
+        # Polyphase table: row p holds taps p, p + up, ...; reversed so a row
+        # lines up with input in ascending order
+        self.taps_per_phase = -(-prototype.size // self.up)
+        table = np.zeros(self.up * self.taps_per_phase)
+        table[:prototype.size] = prototype
+        taps = table.reshape(self.taps_per_phase, self.up).T[:, ::-1]
+
+        # Output m uses phase (m * down + delay) % up, which repeats every up
+        # outputs; rows in output order, twice so any rotation is a slice
+        cycle = (np.arange(self.up) * self.down + self.delay) % self.up
+        self._cycle_taps = np.ascontiguousarray(np.tile(taps[cycle], (2, 1)), dtype=np.float32)
+        self.latency_ms = self.delay / self.up / orig_sr * 1000
+
+        self.reset()
+
+    def reset(self):
+        """Drop filter history; the next sample starts a new stream."""
+        history = self.taps_per_phase - 1
+        self._buffer = np.zeros(history, dtype=np.float32)  # Silence before the stream
+        self._buffer_start = -history  # Input index of _buffer[0]
+        self._next_out = 0
+        self.samples_in = 0
+        self.samples_out = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Resample the next input samples.
+
+        Args:
+            samples: Mono float32 samples
+
+        Returns:
+            Every output sample whose filter span is now complete
+        """
+        buffer = np.concatenate([self._buffer, samples.astype(np.float32, copy=False)])
+        self.samples_in += samples.size
+        end = self._buffer_start + buffer.size
+
+        # Outputs whose newest input tap has arrived
+        last = (self.up * end - 1 - self.delay) // self.down
+        output = np.empty(0, dtype=np.float32)
+        if last >= self._next_out:
+            count = last + 1 - self._next_out
+            windows = np.lib.stride_tricks.sliding_window_view(buffer, self.taps_per_phase)
+            if self.up == 1:
+                # Integer decimation: one phase, windows on a fixed stride
+                first = self._next_out * self.down + self.delay - (self.taps_per_phase - 1) - self._buffer_start
+                output = np.einsum('ij,j->i', windows[first::self.down][:count], self._cycle_taps[0])
+            else:
+                # Whole phase cycles: (cycles, up, taps) windows against one
+                # (up, taps) table; the padded tail of the last cycle is dropped
+                cycles = -(-count // self.up)
+                positions = np.arange(self._next_out, self._next_out + cycles * self.up, dtype=np.int64)
+                starts = (positions * self.down + self.delay) // self.up
+                starts -= (self.taps_per_phase - 1) + self._buffer_start
+                np.minimum(starts, len(windows) - 1, out=starts)
+                rotation = self._next_out % self.up
+                output = np.einsum(
+                    'qrk,rk->qr',
+                    windows[starts.reshape(cycles, self.up)],
+                    self._cycle_taps[rotation:rotation + self.up]
+                ).ravel()[:count]
+            self._next_out = last + 1
+            self.samples_out += output.size
+
+        # Keep the history the next output needs
+        next_base = (self._next_out * self.down + self.delay) // self.up
+        keep = next_base - (self.taps_per_phase - 1) - self._buffer_start
+        self._buffer = buffer[keep:]
+        self._buffer_start += keep
+        return output
+
+    def flush(self) -> np.ndarray:
+        """
+        Finish the stream: output the remaining samples (input followed by
+        silence), ceil(samples_in * up / down) in total.
+        """
+        total = -(-self.samples_in * self.up // self.down)
+        if total <= self._next_out:
+            return np.empty(0, dtype=np.float32)
+        end = self._buffer_start + self._buffer.size
+        needed = ((total - 1) * self.down + self.delay) // self.up + 1 - end
+        samples_in = self.samples_in
+        output = self.process(np.zeros(max(needed, 0), dtype=np.float32))
+        self.samples_in = samples_in
+        output = output[:output.size - (self._next_out - total)]
+        self.samples_out = total
+        self._next_out = total
+        return output
+
+
+class AudioFrontend:
+    """
+    Converts one session's client audio to 16kHz mono LINEAR16.
+
+    Not thread-safe by itself; session managers use it
+    under their re-chunker's lock.
+    """
+
+    def __init__(
+        self,
+        input_format: AudioInputFormat,
+        target_sr: int = AudioChunkValidator.SAMPLE_RATE,
+        zero_crossings: int = 24
+    ):
+        """
+        Initialize front-end.
+
+        Args:
+            input_format: Client audio format
+            target_sr: Output sample rate (Hz)
+            zero_crossings: Resampling filter length (see PolyphaseResampler)
+        """
+        self.input_format = input_format
+        self.target_sr = target_sr
+        self.resampler = (
+            PolyphaseResampler(input_format.sample_rate, target_sr, zero_crossings)
+            if input_format.sample_rate != target_sr else None
+        )
+        self._partial = b''  # Incomplete sample frame from the last client frame
+
+        # Counters
+        self.frames_in = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+        logger.info(
+            f"Audio front-end: {input_format.sample_rate}Hz, "
+            f"{input_format.channels}ch {input_format.sample_format} "
+            f"-> {target_sr}Hz mono int16"
+        )
+
+    def process(self, frame: Union[bytes, bytearray, memoryview]) -> bytes:
+        """
+        Convert a client frame.
+
+        Args:
+            frame: Interleaved PCM in the input format, any length
+
+        Returns:
+            LINEAR16 mono audio at the target rate (possibly empty)
+        """
+        self.frames_in += 1
+        self.bytes_in += len(frame)
+        if self.input_format.is_native and self.target_sr == AudioChunkValidator.SAMPLE_RATE:
+            self.bytes_out += len(frame)
+            return bytes(frame)
+
+        data = self._partial + bytes(frame) if self._partial else frame
+        usable = len(data) - len(data) % self.input_format.bytes_per_frame
+        self._partial = bytes(data[usable:])
+        samples = self._decode(memoryview(data)[:usable])
+
+        if self.input_format.channels > 1:
+            samples = samples.reshape(-1, self.input_format.channels).mean(axis=1)
+        if self.resampler is not None:
+            samples = self.resampler.process(samples)
+        return self._encode(samples)
+
+    def flush(self) -> bytes:
+        """
+        End of stream: the resampler's remaining output.
+
+        Returns:
+            LINEAR16 mono audio (possibly empty)
+        """
+        self._partial = b''
+        if self.resampler is None:
+            return b''
+        return self._encode(self.resampler.flush())
+
+    def _decode(self, data: memoryview) -> np.ndarray:
+        """PCM bytes to float32 samples on the int16 scale"""
+        sample_format = self.input_format.sample_format
+        if sample_format == 'int16':
+            return np.frombuffer(data, dtype='<i2').astype(np.float32)
+        if sample_format == 'int32':
+            return np.frombuffer(data, dtype='<i4') * np.float32(1 / 65536)
+        if sample_format == 'float32':
+            return np.frombuffer(data, dtype='<f4') * np.float32(32768)
+        if sample_format == 'uint8':
+            return (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128) * 256
+        # int24: three bytes into the top of an int32
+        triples = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+        packed = np.zeros((triples.shape[0], 4), dtype=np.uint8)
+        packed[:, 1:] = triples
+        return packed.view('<i4').ravel() * np.float32(1 / 65536)
+
+    def _encode(self, samples: np.ndarray) -> bytes:
+        """float32 samples on the int16 scale to LINEAR16 bytes"""
+        pcm = np.clip(np.rint(samples), -32768, 32767).astype(np.int16).tobytes()
+        self.bytes_out += len(pcm)
+        return pcm
+
+    def get_stats(self) -> Dict:
+        """
+        Get conversion statistics.
+
+        Returns:
+            dict with the input format, frames and audio in/out (ms) and
+            the resampler's added latency
+        """
+        input_format = self.input_format
+        bytes_per_ms_in = input_format.sample_rate * input_format.bytes_per_frame / 1000
+        return {
+            'input_format': (
+                f"{input_format.sample_rate}Hz/{input_format.channels}ch/"
+                f"{input_format.sample_format}"
+            ),
+            'frames_in': self.frames_in,
+            'input_ms': self.bytes_in / bytes_per_ms_in,
+            'output_ms': self.bytes_out / (self.target_sr * 2 / 1000),
+            'latency_ms': self.resampler.latency_ms if self.resampler else 0.0,
+        }
@@ -3,16 +3,18 @@ Audio chunk handler and validator for streaming pipeline.
 
 Handles:
 - Chunk size validation (3200-6400 bytes for 100-200ms audio)
-- Buffer management
+- Buffer management (optionally in a shared AudioRingBuffer)
 - Chunk timing control
 - LINEAR16 format validation
 """
 
 import logging
 import time
-from typing import Optional
+from collections import deque
+from typing import Optional, Union
 from dataclasses import dataclass
 
+from .audio_ring_buffer import AudioRingBuffer
 from .errors import AudioChunkError
 
 logger = logging.getLogger(__name__)
@@ -143,7 +145,8 @@ class AudioChunkHandler:
     def __init__(
         self,
         max_buffer_size: int = 2,
-        strict_validation: bool = True
+        strict_validation: bool = True,
+        ring_buffer: Optional[AudioRingBuffer] = None
     ):
         """
         Initialize audio chunk handler.
@@ -151,12 +154,20 @@ class AudioChunkHandler:
         Args:
             max_buffer_size: Maximum chunks to buffer (keep small for latency)
             strict_validation: Whether to raise exceptions on invalid chunks
+            ring_buffer: Optional session ring buffer; valid chunks are
+                written into it once and buffered as memoryviews
         """
         self.max_buffer_size = max_buffer_size
         self.strict_validation = strict_validation
         self.validator = AudioChunkValidator()
         self.metrics = AudioChunkMetrics()
-        self.buffer = []
+        self.ring_buffer = ring_buffer
+        self.buffer = deque(maxlen=max_buffer_size)
+        
+        # Latest valid chunk (a ring view when ring_buffer is set) and
+        # its absolute ring offset
+        self.last_chunk: Optional[Union[bytes, memoryview]] = None
+        self.last_offset: Optional[int] = None
         
         logger.info(
             f"AudioChunkHandler initialized: "
@@ -164,10 +175,13 @@ class AudioChunkHandler:
             f"strict_validation={strict_validation}"
         )
     
-    def process_chunk(self, chunk: bytes) -> bool:
+    def process_chunk(self, chunk: Union[bytes, memoryview]) -> bool:
         """
         Process incoming audio chunk.
         
+        With a ring buffer, the chunk is copied into the ring (unless it
+        already is the ring's latest write) and last_chunk is the view.
+        
         Args:
             chunk: Raw audio bytes (LINEAR16)
             
@@ -191,16 +205,19 @@ class AudioChunkHandler:
             )
             self.metrics.last_chunk_time = time.time()
             
-            # Add to buffer if not full
-            if len(self.buffer) < self.max_buffer_size:
-                self.buffer.append(chunk)
-            else:
-                logger.warning(
-                    f"Buffer full ({len(self.buffer)} chunks), "
-                    "dropping oldest chunk"
-                )
-                self.buffer.pop(0)
-                self.buffer.append(chunk)
+            if self.ring_buffer is not None:
+                ring = self.ring_buffer
+                if ring.owns(chunk):
+                    # Already written in place (AudioRingBuffer.write_from)
+                    start = ring.end_offset - len(chunk)
+                else:
+                    start = ring.write(chunk)
+                chunk = ring.view(start, start + len(chunk))
+                self.last_offset = start
+            
+            # Keep the latest chunks (the deque drops the oldest)
+            self.buffer.append(chunk)
+            self.last_chunk = chunk
             
             return True
             
@@ -219,9 +236,9 @@ class AudioChunkHandler:
             clear: Whether to clear buffer after getting chunks
             
         Returns:
-            List of audio chunk bytes
+            List of audio chunks (bytes, or ring memoryviews)
         """
-        chunks = self.buffer.copy()
+        chunks = list(self.buffer)
         if clear:
             self.buffer.clear()
         return chunks
@@ -8,6 +8,7 @@ Implements:
 """
 
 import logging
+import math
 import numpy as np
 from typing import Optional, Tuple
 from dataclasses import dataclass
@@ -40,6 +41,12 @@ class VADConfig:
     
     # Frame size for analysis (samples)
     frame_size: int = 160  # 10ms at 16kHz
+    
+    # Optional per-frame checks (None = energy only)
+    # Max zero-crossing rate (crossings per sample) for a speech frame
+    zcr_threshold: Optional[float] = None
+    # Max spectral flatness (0 = tonal, 1 = white noise) for a speech frame
+    flatness_threshold: Optional[float] = None
 
 
 @dataclass
@@ -58,6 +65,136 @@ class AGCConfig:
     smoothing_factor: float = 0.1
 
 
+@dataclass
+class NoiseSuppressionConfig:
+    """Spectral noise suppression configuration."""
+    # STFT frame length (50% overlap); also the added latency
+    frame_ms: float = 20.0
+    
+    # Multiple of the noise floor subtracted from each bin's power
+    over_subtraction: float = 2.0
+    
+    # Most attenuation applied to any bin (dB)
+    max_attenuation_db: float = 15.0
+    
+    # Time constant of the per-bin power smoothing used for tracking (seconds)
+    smoothing_time_s: float = 0.1
+    
+    # How fast the noise floor estimate may rise (dB per second)
+    noise_rise_db_per_s: float = 3.0
+    
+    # Sample rate (Hz)
+    sample_rate: int = 16000
+
+
+# VAD state codes, for per-session state kept in arrays
+STATE_UNKNOWN = -1
+STATE_SILENCE = 0
+STATE_SPEECH = 1
+
+STATE_ACTIVITY = {
+    STATE_UNKNOWN: AudioActivity.UNKNOWN,
+    STATE_SILENCE: AudioActivity.SILENCE,
+    STATE_SPEECH: AudioActivity.SPEECH,
+}
+
+
+def hangover_frames(config: VADConfig) -> Tuple[int, int]:
+    """Minimum speech / silence runs of config, in frames"""
+    frame_s = config.frame_size / config.sample_rate
+    return (
+        max(1, int(np.ceil(config.min_speech_duration / frame_s - 1e-9))),
+        max(1, int(np.ceil(config.min_silence_duration / frame_s - 1e-9))),
+    )
+
+
+def frame_speech_flags(frames: np.ndarray, config: VADConfig) -> np.ndarray:
+    """
+    Raw per-frame speech decisions.
+    
+    Args:
+        frames: int16 samples shaped (..., frame_size), usually a view
+        config: Thresholds
+        
+    Returns:
+        bool array shaped frames.shape[:-1]
+    """
+    frame_size = frames.shape[-1]
+    # Mean square per frame (int16 units), accumulated in float32 without a
+    # converted copy; compared in the linear domain
+    energy = np.einsum('...k,...k->...', frames, frames, dtype=np.float32) / frame_size
+    flags = energy > (10 ** (config.energy_threshold_db / 20) * 32768.0) ** 2
+    
+    if config.zcr_threshold is not None:
+        crossings = np.count_nonzero(np.diff(np.signbit(frames), axis=-1), axis=-1)
+        flags &= crossings / (frame_size - 1) <= config.zcr_threshold
+    
+    if config.flatness_threshold is not None:
+        power = np.abs(np.fft.rfft(frames.astype(np.float32), axis=-1)) ** 2 + 1e-10
+        flatness = np.exp(np.mean(np.log(power), axis=-1)) / np.mean(power, axis=-1)
+        flags &= flatness <= config.flatness_threshold
+    
+    return flags
+
+
+def apply_hangover(
+    flags: np.ndarray,
+    speech_runs: np.ndarray,
+    silence_runs: np.ndarray,
+    states: np.ndarray,
+    min_speech_frames: int,
+    min_silence_frames: int
+) -> np.ndarray:
+    """
+    Smooth raw flags of several streams at once, continuing each stream's
+    runs and state from its previous call.
+    
+    A stream switches to SPEECH after min_speech_frames consecutive speech
+    frames and to SILENCE after min_silence_frames consecutive non-speech
+    frames.
+    
+    Args:
+        flags: Raw speech flags shaped (streams, frames)
+        speech_runs: Speech run per stream at the last frame (updated)
+        silence_runs: Non-speech run per stream at the last frame (updated)
+        states: STATE_* code per stream (updated)
+        min_speech_frames: Run that switches to SPEECH
+        min_silence_frames: Run that switches to SILENCE
+        
+    Returns:
+        Per-frame SPEECH state shaped like flags
+    """
+    n_frames = flags.shape[1]
+    if n_frames == 0:
+        return np.zeros(flags.shape, dtype=bool)
+    
+    idx = np.arange(n_frames)
+    # Length of the speech / non-speech run ending at each frame; a run
+    # carried over from the previous call starts before frame 0
+    last_silent = np.maximum.accumulate(np.where(flags, -1 - speech_runs[:, None], idx), axis=1)
+    last_speech = np.maximum.accumulate(np.where(flags, idx, -1 - silence_runs[:, None]), axis=1)
+    speech_run = idx - last_silent
+    silence_run = idx - last_speech
+    
+    # State: whichever transition happened last (none yet: previous state)
+    last_to_speech = np.maximum.accumulate(np.where(speech_run >= min_speech_frames, idx, -1), axis=1)
+    last_to_silence = np.maximum.accumulate(np.where(silence_run >= min_silence_frames, idx, -1), axis=1)
+    frame_states = np.where(
+        last_to_speech == last_to_silence,  # Both -1
+        (states == STATE_SPEECH)[:, None],
+        last_to_speech > last_to_silence
+    )
+    
+    states[:] = np.where(
+        last_to_speech[:, -1] == last_to_silence[:, -1],
+        states,
+        np.where(frame_states[:, -1], STATE_SPEECH, STATE_SILENCE)
+    )
+    speech_runs[:] = speech_run[:, -1]
+    silence_runs[:] = silence_run[:, -1]
+    return frame_states
+
+
 class VoiceActivityDetector:
     """
     Voice Activity Detection using energy-based approach.
@@ -66,6 +203,14 @@ class VoiceActivityDetector:
     - Save API costs by not sending silence
     - Improve transcription by filtering out non-speech
     - Provide better UX by detecting when speaker pauses
+    
+    Chunks are analysed in frames of config.frame_size samples (a 2-D
+    view of the chunk, all frames in one vectorized pass). A frame is
+    speech when its energy is above the threshold (and, if configured,
+    its zero-crossing rate and spectral flatness are below theirs). The
+    state follows with hangover: SPEECH after min_speech_duration of
+    consecutive speech frames, SILENCE after min_silence_duration of
+    consecutive non-speech frames.
     """
     
     def __init__(self, config: Optional[VADConfig] = None):
@@ -77,10 +222,17 @@ class VoiceActivityDetector:
         """
         self.config = config or VADConfig()
         
-        # State tracking
+        self._min_speech_frames, self._min_silence_frames = hangover_frames(self.config)
+        
+        # State tracking (speech_frames/silence_frames: current runs)
         self.current_state = AudioActivity.UNKNOWN
         self.speech_frames = 0
         self.silence_frames = 0
+        self._tail = np.zeros(0, dtype=np.int16)  # Samples short of a frame
+        
+        # Per-frame output of the last chunk
+        self.last_frame_flags = np.zeros(0, dtype=bool)  # Raw speech decisions
+        self.last_frame_states = np.zeros(0, dtype=bool)  # After hangover
         
         # Statistics
         self.total_frames = 0
@@ -99,89 +251,83 @@ class VoiceActivityDetector:
         Process audio chunk and detect voice activity.
         
         Args:
-            audio_bytes: LINEAR16 audio bytes
+            audio_bytes: LINEAR16 audio (bytes or a ring buffer memoryview)
             
         Returns:
-            AudioActivity status (SPEECH or SILENCE)
+            AudioActivity status at the end of the chunk (SPEECH or SILENCE,
+            UNKNOWN until the first transition)
+        """
+        self.process_frames(audio_bytes)
+        return self.current_state
+    
+    def process_frames(self, audio_bytes: bytes) -> np.ndarray:
         """
-        # Convert bytes to numpy array (int16)
-        audio_int16 = np.frombuffer(audio_bytes, dtype=np.int16)
+        Detect voice activity per frame.
         
-        # Calculate energy (RMS in dB)
-        energy_db = self._calculate_energy_db(audio_int16)
+        Samples short of a whole frame are carried into the next call.
         
-        # Determine if speech or silence
-        is_speech = energy_db > self.config.energy_threshold_db
+        Args:
+            audio_bytes: LINEAR16 audio (bytes or a ring buffer memoryview)
+            
+        Returns:
+            Per-frame speech flags after hangover smoothing (True while
+            the state is SPEECH); raw flags are in last_frame_flags
+        """
+        samples = np.frombuffer(audio_bytes, dtype=np.int16)
+        if self._tail.size:
+            samples = np.concatenate([self._tail, samples])
         
-        # Update frame counters
-        self.total_frames += 1
+        frame_size = self.config.frame_size
+        n_frames = samples.size // frame_size
+        self._tail = samples[n_frames * frame_size:].copy()
+        frames = samples[:n_frames * frame_size].reshape(n_frames, frame_size)
         
-        if is_speech:
-            self.speech_frames += 1
-            self.silence_frames = 0
-            self.total_speech_frames += 1
-        else:
-            self.silence_frames += 1
-            self.speech_frames = 0
-            self.total_silence_frames += 1
-        
-        # Determine state based on duration
-        speech_duration = (
-            self.speech_frames * len(audio_bytes) / 
-            (self.config.sample_rate * 2)  # 2 bytes per sample
-        )
-        silence_duration = (
-            self.silence_frames * len(audio_bytes) / 
-            (self.config.sample_rate * 2)
-        )
+        flags = frame_speech_flags(frames, self.config)
+        states = self._smooth(flags)
         
-        # Update state
-        if speech_duration >= self.config.min_speech_duration:
-            self.current_state = AudioActivity.SPEECH
-        elif silence_duration >= self.config.min_silence_duration:
-            self.current_state = AudioActivity.SILENCE
-        # else: keep current state
+        # Update frame counters
+        speech_count = int(np.count_nonzero(flags))
+        self.total_frames += n_frames
+        self.total_speech_frames += speech_count
+        self.total_silence_frames += n_frames - speech_count
+        
+        self.last_frame_flags = flags
+        self.last_frame_states = states
         
         logger.debug(
-            f"VAD: energy={energy_db:.1f}dB, "
+            f"VAD: frames={n_frames}, speech={speech_count}, "
             f"state={self.current_state.value}, "
             f"speech_frames={self.speech_frames}, "
             f"silence_frames={self.silence_frames}"
         )
         
-        return self.current_state
+        return states
     
-    def _calculate_energy_db(self, audio_int16: np.ndarray) -> float:
-        """
-        Calculate audio energy in dB.
-        
-        Args:
-            audio_int16: Audio samples as int16
-            
-        Returns:
-            Energy in dBFS (decibels relative to full scale)
-        """
-        if len(audio_int16) == 0:
-            return -100.0  # Very low energy
-        
-        # Convert to float32 [-1.0, 1.0]
-        audio_float = audio_int16.astype(np.float32) / 32768.0
-        
-        # Calculate RMS (Root Mean Square)
-        rms = np.sqrt(np.mean(audio_float ** 2))
-        
-        # Convert to dB (with floor to avoid log(0))
-        if rms < 1e-10:
-            return -100.0
+    def _smooth(self, flags: np.ndarray) -> np.ndarray:
+        """Apply hangover to raw flags, continuing the previous chunk's runs"""
+        speech_runs = np.array([self.speech_frames])
+        silence_runs = np.array([self.silence_frames])
+        states = np.array([
+            STATE_SPEECH if self.current_state == AudioActivity.SPEECH
+            else STATE_SILENCE if self.current_state == AudioActivity.SILENCE
+            else STATE_UNKNOWN
+        ])
+        frame_states = apply_hangover(
+            flags[None, :], speech_runs, silence_runs, states,
+            self._min_speech_frames, self._min_silence_frames
+        )
         
-        db = 20 * np.log10(rms)
-        return db
+        self.current_state = STATE_ACTIVITY[int(states[0])]
+        self.speech_frames = int(speech_runs[0])
+        self.silence_frames = int(silence_runs[0])
+        return frame_states[0]
     
     def reset(self):
         """Reset VAD state."""
         self.current_state = AudioActivity.UNKNOWN
         self.speech_frames = 0
         self.silence_frames = 0
+        self._tail = np.zeros(0, dtype=np.int16)
     
     def get_stats(self) -> dict:
         """Get VAD statistics."""
@@ -224,9 +370,16 @@ class AutomaticGainControl:
         # Current gain level
         self.current_gain_db = 0.0
         
-        # Statistics
+        # Scratch buffers, grown to the largest chunk seen; after that the
+        # gain path allocates nothing but the bytes process_chunk returns
+        self._scratch = np.empty(0, dtype=np.float32)
+        self._out = np.empty(0, dtype=np.int16)
+        
+        # Statistics (running aggregates, O(1) memory in long sessions)
         self.total_chunks = 0
-        self.gain_adjustments = []
+        self._gain_sum = 0.0
+        self._gain_min = 0.0
+        self._gain_max = 0.0
         
         logger.info(
             f"AGC initialized: "
@@ -239,24 +392,51 @@ class AutomaticGainControl:
         Process audio chunk with automatic gain control.
         
         Args:
-            audio_bytes: LINEAR16 audio bytes
+            audio_bytes: LINEAR16 audio (bytes or a ring buffer memoryview)
             
         Returns:
             Normalized audio bytes
         """
-        # Convert bytes to numpy array
-        audio_int16 = np.frombuffer(audio_bytes, dtype=np.int16)
-        audio_float = audio_int16.astype(np.float32) / 32768.0
+        samples = np.frombuffer(audio_bytes, dtype=np.int16)
+        gained = self.process_into(samples)
+        if gained is samples:
+            # Silent chunk, no adjustment needed
+            return audio_bytes
+        return gained.tobytes()
+    
+    def process_into(self, samples: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Apply automatic gain control without per-chunk allocations.
+        
+        Args:
+            samples: int16 samples
+            out: int16 array to write into; may be `samples` itself for
+                in-place processing (default: an internal buffer that the
+                next call overwrites)
+            
+        Returns:
+            The gained samples (`samples` itself for a silent chunk when no
+            out is given)
+        """
+        size = samples.size
+        if self._scratch.size < size:
+            self._scratch = np.empty(size, dtype=np.float32)
+            self._out = np.empty(size, dtype=np.int16)
+        audio = self._scratch[:size]
         
-        # Calculate current RMS
-        current_rms = np.sqrt(np.mean(audio_float ** 2))
+        # Current RMS of the chunk scaled to [-1.0, 1.0)
+        np.multiply(samples, np.float32(1 / 32768.0), out=audio)
+        current_rms = math.sqrt(float(np.dot(audio, audio)) / size) if size else 0.0
         
         if current_rms < 1e-10:
             # Silent chunk, no adjustment needed
-            return audio_bytes
+            if out is None:
+                return samples
+            np.copyto(out, samples)
+            return out
         
         # Calculate current level in dB
-        current_db = 20 * np.log10(current_rms)
+        current_db = 20 * math.log10(current_rms)
         
         # Calculate required gain
         required_gain_db = self.config.target_db - current_db
@@ -273,27 +453,32 @@ class AutomaticGainControl:
             (1 - self.config.smoothing_factor) * self.current_gain_db
         )
         
-        # Apply gain
+        # Apply gain and the int16 scale in one multiply, clamp to full
+        # scale to prevent wrap-around, and truncate into the output
         gain_linear = 10 ** (self.current_gain_db / 20.0)
-        audio_gained = audio_float * gain_linear
-        
-        # Clamp to [-1.0, 1.0] to prevent clipping
-        audio_gained = np.clip(audio_gained, -1.0, 1.0)
-        
-        # Convert back to int16
-        audio_int16_gained = (audio_gained * 32767).astype(np.int16)
+        np.multiply(audio, np.float32(gain_linear * 32767), out=audio)
+        np.clip(audio, -32767.0, 32767.0, out=audio)
+        if out is None:
+            out = self._out[:size]
+        np.copyto(out, audio, casting='unsafe')
         
         # Track statistics
+        if self.total_chunks:
+            self._gain_min = min(self._gain_min, self.current_gain_db)
+            self._gain_max = max(self._gain_max, self.current_gain_db)
+        else:
+            self._gain_min = self._gain_max = self.current_gain_db
         self.total_chunks += 1
-        self.gain_adjustments.append(self.current_gain_db)
+        self._gain_sum += self.current_gain_db
         
-        logger.debug(
-            f"AGC: current={current_db:.1f}dB, "
-            f"gain={self.current_gain_db:.1f}dB, "
-            f"target={self.config.target_db}dB"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"AGC: current={current_db:.1f}dB, "
+                f"gain={self.current_gain_db:.1f}dB, "
+                f"target={self.config.target_db}dB"
+            )
         
-        return audio_int16_gained.tobytes()
+        return out
     
     def reset(self):
         """Reset AGC state."""
@@ -301,7 +486,7 @@ class AutomaticGainControl:
     
     def get_stats(self) -> dict:
         """Get AGC statistics."""
-        if not self.gain_adjustments:
+        if not self.total_chunks:
             return {
                 "total_chunks": 0,
                 "avg_gain_db": 0.0,
@@ -311,13 +496,150 @@ class AutomaticGainControl:
         
         return {
             "total_chunks": self.total_chunks,
-            "avg_gain_db": np.mean(self.gain_adjustments),
-            "min_gain_db": np.min(self.gain_adjustments),
-            "max_gain_db": np.max(self.gain_adjustments),
+            "avg_gain_db": self._gain_sum / self.total_chunks,
+            "min_gain_db": self._gain_min,
+            "max_gain_db": self._gain_max,
             "current_gain_db": self.current_gain_db,
         }
 
 
+class NoiseSuppressor:
+    """
+    Streaming spectral noise suppression.
+    
+    Short-time Fourier transform with overlap-add (square-root Hann
+    windows, 50% overlap), vectorized over all frames a chunk completes:
+    - Per-bin power is smoothed over time and the noise floor follows its
+      minimum, rising at most noise_rise_db_per_s (steady noise such as
+      HVAC is tracked; speech bursts are not)
+    - Each bin is scaled by a spectral subtraction gain, limited to
+      max_attenuation_db to keep musical noise down
+    
+    Output has the input's length and lags it by exactly one frame.
+    """
+    
+    def __init__(self, config: Optional[NoiseSuppressionConfig] = None):
+        """
+        Initialize noise suppressor.
+        
+        Args:
+            config: Noise suppression configuration
+        """
+        self.config = config or NoiseSuppressionConfig()
+        
+        # Even frame length so frames overlap by exactly one hop
+        self.hop_size = max(1, int(self.config.sample_rate * self.config.frame_ms / 2000))
+        self.frame_size = 2 * self.hop_size
+        self.latency_ms = self.frame_size * 1000 / self.config.sample_rate
+        
+        # Periodic Hann, square-rooted: analysis x synthesis windows sum to 1
+        phase = 2 * np.pi * np.arange(self.frame_size) / self.frame_size
+        self.window = np.sqrt(0.5 - 0.5 * np.cos(phase))
+        
+        hop_s = self.hop_size / self.config.sample_rate
+        self._decay = np.exp(-hop_s / self.config.smoothing_time_s)
+        self._rise_per_frame = 10 ** (self.config.noise_rise_db_per_s * hop_s / 10)
+        self._gain_floor = 10 ** (-self.config.max_attenuation_db / 20)
+        
+        # Statistics
+        self.total_frames = 0
+        self.input_energy = 0.0
+        self.output_energy = 0.0
+        
+        self.reset()
+        
+        logger.info(
+            f"Noise suppressor initialized: "
+            f"frame={self.frame_size} samples, "
+            f"latency={self.latency_ms:.0f}ms, "
+            f"max_attenuation={self.config.max_attenuation_db}dB"
+        )
+    
+    def process_chunk(self, audio_bytes: bytes) -> bytes:
+        """
+        Suppress stationary noise in an audio chunk.
+        
+        Args:
+            audio_bytes: LINEAR16 audio (bytes or a ring buffer memoryview)
+        
+        Returns:
+            Denoised audio bytes, same length, delayed by one frame
+        """
+        samples = np.frombuffer(audio_bytes, dtype=np.int16)
+        buffer = np.concatenate([self._input, samples])
+        
+        n_frames = (buffer.size - self.frame_size) // self.hop_size + 1 if buffer.size >= self.frame_size else 0
+        if n_frames:
+            frames = np.lib.stride_tricks.sliding_window_view(buffer, self.frame_size)[::self.hop_size][:n_frames]
+            spectrum = np.fft.rfft(frames * self.window, axis=1)
+            power = spectrum.real ** 2 + spectrum.imag ** 2
+            
+            self._track_noise(power)
+            
+            # Spectral subtraction gain from power averaged over neighbouring
+            # bins (lower variance, less musical noise)
+            local = power.copy()
+            local[:, 1:-1] += power[:, :-2] + power[:, 2:]
+            local[:, 1:-1] /= 3
+            gain = np.maximum(1.0 - self.config.over_subtraction * self._noise / (local + 1e-9), self._gain_floor ** 2)
+            spectrum *= np.sqrt(gain)
+            
+            frames_out = np.fft.irfft(spectrum, n=self.frame_size, axis=1) * self.window
+            
+            # Overlap-add: hop k is final once frame k is in
+            finished = frames_out[:, :self.hop_size].copy()
+            finished[0] += self._overlap
+            finished[1:] += frames_out[:-1, self.hop_size:]
+            self._overlap = frames_out[-1, self.hop_size:]
+            self._output = np.concatenate([self._output, finished.ravel()])
+            self._input = buffer[n_frames * self.hop_size:]
+            
+            self.total_frames += n_frames
+            self.input_energy += float(power.sum())
+            self.output_energy += float((power * gain).sum())
+        else:
+            self._input = buffer
+        
+        denoised, self._output = self._output[:samples.size], self._output[samples.size:]
+        return np.clip(np.rint(denoised), -32768, 32767).astype(np.int16).tobytes()
+    
+    def _track_noise(self, power: np.ndarray):
+        """Update the smoothed power and noise floor with a chunk's frames"""
+        n_frames = power.shape[0]
+        if self._noise is None:
+            self._smoothed = power.mean(axis=0)
+            self._noise = self._smoothed.copy()
+            return
+        
+        # First-order smoothing over all frames at once
+        weights = (1 - self._decay) * self._decay ** np.arange(n_frames - 1, -1, -1)
+        self._smoothed = self._decay ** n_frames * self._smoothed + weights @ power
+        self._noise = np.minimum(self._noise * self._rise_per_frame ** n_frames, self._smoothed)
+    
+    def reset(self):
+        """Reset noise floor and overlap-add state."""
+        self._input = np.zeros(self.hop_size)  # Virtual silence before the first frame
+        self._output = np.zeros(self.hop_size)  # Covers partially filled hops
+        self._overlap = np.zeros(self.hop_size)
+        self._smoothed = None
+        self._noise = None
+    
+    def get_stats(self) -> dict:
+        """Get noise suppression statistics."""
+        stats = {
+            "total_frames": self.total_frames,
+            "latency_ms": self.latency_ms,
+            "attenuation_db": 0.0,
+        }
+        if self.output_energy > 0:
+            stats["attenuation_db"] = 10 * math.log10(self.input_energy / self.output_energy)
+        if self._noise is not None:
+            # Mean noise power per sample, relative to full scale
+            noise = float(self._noise.mean()) / (self.window ** 2).sum() / 32768.0 ** 2
+            stats["noise_floor_db"] = 10 * math.log10(max(noise, 1e-20))
+        return stats
+
+
 class AudioPreprocessor:
     """
     Combined audio preprocessing pipeline.
@@ -331,6 +653,8 @@ class AudioPreprocessor:
         enable_agc: bool = True,
         vad_config: Optional[VADConfig] = None,
         agc_config: Optional[AGCConfig] = None,
+        enable_noise_suppression: bool = False,
+        noise_config: Optional[NoiseSuppressionConfig] = None,
     ):
         """
         Initialize audio preprocessor.
@@ -340,16 +664,22 @@ class AudioPreprocessor:
             enable_agc: Enable automatic gain control
             vad_config: VAD configuration
             agc_config: AGC configuration
+            enable_noise_suppression: Enable spectral noise suppression
+                (delays output by one STFT frame)
+            noise_config: Noise suppression configuration
         """
         self.enable_vad = enable_vad
         self.enable_agc = enable_agc
+        self.enable_noise_suppression = enable_noise_suppression
         
         self.vad = VoiceActivityDetector(vad_config) if enable_vad else None
         self.agc = AutomaticGainControl(agc_config) if enable_agc else None
+        self.noise_suppressor = NoiseSuppressor(noise_config) if enable_noise_suppression else None
         
         logger.info(
             f"AudioPreprocessor initialized: "
-            f"VAD={enable_vad}, AGC={enable_agc}"
+            f"VAD={enable_vad}, AGC={enable_agc}, "
+            f"noise suppression={enable_noise_suppression}"
         )
     
     def process_chunk(
@@ -360,7 +690,7 @@ class AudioPreprocessor:
         Process audio chunk through preprocessing pipeline.
         
         Args:
-            audio_bytes: LINEAR16 audio bytes
+            audio_bytes: LINEAR16 audio (bytes or a ring buffer memoryview)
             
         Returns:
             Tuple of (processed_audio_bytes, activity_status)
@@ -368,11 +698,15 @@ class AudioPreprocessor:
         processed_audio = audio_bytes
         activity = AudioActivity.UNKNOWN
         
-        # Step 1: AGC (before VAD for better detection)
+        # Step 1: Noise suppression (before AGC, which would lift the noise)
+        if self.enable_noise_suppression and self.noise_suppressor:
+            processed_audio = self.noise_suppressor.process_chunk(processed_audio)
+        
+        # Step 2: AGC (before VAD for better detection)
         if self.enable_agc and self.agc:
             processed_audio = self.agc.process_chunk(processed_audio)
         
-        # Step 2: VAD
+        # Step 3: VAD
         if self.enable_vad and self.vad:
             activity = self.vad.process_chunk(processed_audio)
         
@@ -400,12 +734,15 @@ class AudioPreprocessor:
             self.vad.reset()
         if self.agc:
             self.agc.reset()
+        if self.noise_suppressor:
+            self.noise_suppressor.reset()
     
     def get_stats(self) -> dict:
         """Get preprocessing statistics."""
         stats = {
             "vad_enabled": self.enable_vad,
             "agc_enabled": self.enable_agc,
+            "noise_suppression_enabled": self.enable_noise_suppression,
         }
         
         if self.vad:
@@ -414,4 +751,7 @@ class AudioPreprocessor:
         if self.agc:
             stats["agc"] = self.agc.get_stats()
         
+        if self.noise_suppressor:
+            stats["noise_suppression"] = self.noise_suppressor.get_stats()
+        
         return stats
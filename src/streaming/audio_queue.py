@@ -0,0 +1,432 @@
+"""
+Bounded per-session audio send queues.
+
+Audio waiting to be streamed is capped in milliseconds of audio, so a
+stalled gRPC stream can't grow memory without limit. What happens when
+the cap is reached is selected per queue:
+- BLOCK: the producer waits up to block_timeout_s for space, then the
+  new chunk is dropped
+- DROP_OLDEST: the oldest queued audio is dropped to make room (keeps
+  latency bounded; the recognizer skips ahead)
+- COALESCE: like DROP_OLDEST on overflow, but get() merges queued chunks
+  into requests of up to max_request_bytes so a lagging stream catches
+  up with fewer, larger requests
+
+Replayed audio primed into a new stream's queue (prime()) is admitted
+outside the cap: the cap grows by the primed bytes until they are taken,
+so replay never evicts or blocks, and live audio keeps its full cap.
+
+Queue depth and drop counters are kept for metrics export.
+
+AudioSendQueue is for threads (StreamingSessionManager);
+AsyncAudioSendQueue is for one event loop (AsyncStreamingSessionManager).
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackpressurePolicy(Enum):
+    """What a full audio queue does with new audio."""
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+
+
+class _AudioQueueState:
+    """
+    Queue contents, limits and counters shared by both queue front-ends.
+
+    Not synchronized; callers hold their own lock (or run on one loop).
+    """
+
+    def __init__(
+        self,
+        max_ms: float = 2000.0,
+        policy: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST,
+        sample_rate: int = 16000,
+        bytes_per_sample: int = 2,
+        block_timeout_s: float = 1.0,
+        max_request_bytes: int = 15360
+    ):
+        """
+        Initialize queue state.
+
+        Args:
+            max_ms: Maximum queued audio in milliseconds
+            policy: Backpressure policy when the queue is full
+            sample_rate: Audio sample rate (mono)
+            bytes_per_sample: Bytes per sample (2 for LINEAR16)
+            block_timeout_s: BLOCK policy: longest wait for space
+            max_request_bytes: COALESCE policy: largest merged request
+        """
+        self.policy = BackpressurePolicy(policy)
+        self.bytes_per_ms = sample_rate * bytes_per_sample / 1000
+        self.max_bytes = int(max_ms * self.bytes_per_ms)
+        self.block_timeout_s = block_timeout_s
+        self.max_request_bytes = max_request_bytes
+
+        self._chunks: Deque[bytes] = deque()
+        self._bytes = 0
+        self._closed = False
+        self._primed_bytes = 0  # Primed audio still queued (above the cap)
+
+        # Counters
+        self.enqueued_chunks = 0
+        self.dropped_chunks = 0
+        self.dropped_bytes = 0
+        self.coalesced_chunks = 0
+        self.blocked_seconds = 0.0
+        self.peak_bytes = 0
+
+    @property
+    def depth_bytes(self) -> int:
+        """Queued audio in bytes"""
+        return self._bytes
+
+    @property
+    def depth_ms(self) -> float:
+        """Queued audio in milliseconds"""
+        return self._bytes / self.bytes_per_ms
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def qsize(self) -> int:
+        """Number of queued chunks"""
+        return len(self._chunks)
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def _fits(self, size: int) -> bool:
+        # An oversized chunk is still accepted into an empty queue
+        return self._bytes + size <= self.max_bytes or not self._chunks
+
+    def _drop_new(self, chunk: bytes):
+        self.dropped_chunks += 1
+        self.dropped_bytes += len(chunk)
+
+    def _admit(self, chunk: bytes):
+        """Add a chunk, evicting the oldest audio if it doesn't fit"""
+        while not self._fits(len(chunk)):
+            oldest = self._chunks.popleft()
+            self._bytes -= len(oldest)
+            self._release_primed(len(oldest))
+            self.dropped_chunks += 1
+            self.dropped_bytes += len(oldest)
+
+        self._chunks.append(chunk)
+        self._bytes += len(chunk)
+        self.enqueued_chunks += 1
+        self.peak_bytes = max(self.peak_bytes, self._bytes)
+
+    def _prime(self, chunk: bytes):
+        """Add a chunk above the cap (primed audio is queued first)"""
+        self._primed_bytes += len(chunk)
+        self.max_bytes += len(chunk)
+        self._chunks.append(chunk)
+        self._bytes += len(chunk)
+        self.enqueued_chunks += 1
+        self.peak_bytes = max(self.peak_bytes, self._bytes)
+
+    def _release_primed(self, size: int):
+        """Shrink the cap back as primed audio (at the front) leaves"""
+        released = min(self._primed_bytes, size)
+        self._primed_bytes -= released
+        self.max_bytes -= released
+
+    def _take(self) -> bytes:
+        """Remove the next request's audio (merged under COALESCE)"""
+        chunk = self._chunks.popleft()
+        if self.policy is BackpressurePolicy.COALESCE and self._chunks:
+            merged = [chunk]
+            size = len(chunk)
+            while self._chunks and size + len(self._chunks[0]) <= self.max_request_bytes:
+                size += len(self._chunks[0])
+                merged.append(self._chunks.popleft())
+            if len(merged) > 1:
+                self.coalesced_chunks += len(merged) - 1
+                chunk = b"".join(merged)
+        self._bytes -= len(chunk)
+        self._release_primed(len(chunk))
+        return chunk
+
+    def get_stats(self) -> Dict:
+        """
+        Get queue gauges and counters.
+
+        Returns:
+            dict with policy, depth (chunks/bytes/ms), capacity, peak, and
+            enqueued/dropped/coalesced counts
+        """
+        return {
+            'policy': self.policy.value,
+            'depth_chunks': len(self._chunks),
+            'depth_bytes': self._bytes,
+            'depth_ms': self.depth_ms,
+            'max_ms': self.max_bytes / self.bytes_per_ms,
+            'peak_ms': self.peak_bytes / self.bytes_per_ms,
+            'enqueued_chunks': self.enqueued_chunks,
+            'dropped_chunks': self.dropped_chunks,
+            'dropped_ms': self.dropped_bytes / self.bytes_per_ms,
+            'coalesced_chunks': self.coalesced_chunks,
+            'blocked_seconds': self.blocked_seconds,
+        }
+
+
+class AudioSendQueue(_AudioQueueState):
+    """
+    Thread-safe bounded audio queue.
+
+    get() follows queue.Queue (raises queue.Empty on timeout) and returns
+    None once the queue is closed and drained.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cond = threading.Condition()
+
+    def put(self, chunk: bytes, timeout: Optional[float] = None) -> bool:
+        """
+        Queue a chunk according to the backpressure policy.
+
+        Args:
+            chunk: Audio bytes
+            timeout: BLOCK policy: wait override (default: block_timeout_s)
+
+        Returns:
+            False if the chunk itself was dropped (queue closed, or BLOCK
+            timed out); older audio evicted to make room is only counted
+        """
+        with self._cond:
+            if self._closed:
+                self._drop_new(chunk)
+                return False
+
+            if self.policy is BackpressurePolicy.BLOCK and not self._fits(len(chunk)):
+                wait = self.block_timeout_s if timeout is None else timeout
+                start = time.monotonic()
+                self._cond.wait_for(
+                    lambda: self._closed or self._fits(len(chunk)),
+                    timeout=wait
+                )
+                self.blocked_seconds += time.monotonic() - start
+                if self._closed or not self._fits(len(chunk)):
+                    self._drop_new(chunk)
+                    return False
+
+            self._admit(chunk)
+            self._cond.notify_all()
+            return True
+
+    def prime(self, chunk: bytes) -> bool:
+        """
+        Queue replayed audio ahead of live audio, outside the cap.
+
+        Never blocks or evicts; use before any live chunk is put.
+
+        Args:
+            chunk: Audio bytes
+
+        Returns:
+            False if the queue is closed
+        """
+        with self._cond:
+            if self._closed:
+                self._drop_new(chunk)
+                return False
+            self._prime(chunk)
+            self._cond.notify_all()
+            return True
+
+    def wait_for_space(self, size: int, timeout: Optional[float] = None) -> bool:
+        """
+        BLOCK policy: wait until a chunk of size bytes fits, without
+        queueing it (so callers can wait before taking their own locks and
+        then put() with timeout=0). Other policies return at once.
+
+        Args:
+            size: Chunk size in bytes
+            timeout: Longest wait (default: block_timeout_s)
+
+        Returns:
+            True if the chunk fits now (or the policy never blocks)
+        """
+        if self.policy is not BackpressurePolicy.BLOCK:
+            return True
+        with self._cond:
+            if self._closed or self._fits(size):
+                return True
+            start = time.monotonic()
+            fits = self._cond.wait_for(
+                lambda: self._closed or self._fits(size),
+                timeout=self.block_timeout_s if timeout is None else timeout
+            )
+            self.blocked_seconds += time.monotonic() - start
+            return fits
+
+    def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        Take the next request's audio.
+
+        Args:
+            timeout: Seconds to wait for audio (None waits forever)
+
+        Returns:
+            Audio bytes, or None when closed and drained
+
+        Raises:
+            queue.Empty: If no audio arrived within timeout
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._chunks or self._closed, timeout=timeout):
+                raise queue.Empty
+            if not self._chunks:
+                return None
+            chunk = self._take()
+            self._cond.notify_all()
+            return chunk
+
+    def close(self):
+        """Stop accepting audio; get() returns None after the queued audio"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class AsyncAudioSendQueue(_AudioQueueState):
+    """
+    Bounded audio queue for a single event loop.
+
+    get() returns None once the queue is closed and drained.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+
+    async def put(self, chunk: bytes, timeout: Optional[float] = None) -> bool:
+        """
+        Queue a chunk according to the backpressure policy.
+
+        Args:
+            chunk: Audio bytes
+            timeout: BLOCK policy: wait override (default: block_timeout_s)
+
+        Returns:
+            False if the chunk itself was dropped (queue closed, or BLOCK
+            timed out); older audio evicted to make room is only counted
+        """
+        if self._closed:
+            self._drop_new(chunk)
+            return False
+
+        await self.wait_for_space(len(chunk), timeout)
+        return self.put_nowait(chunk)
+
+    def put_nowait(self, chunk: bytes) -> bool:
+        """
+        Queue a chunk without waiting (a full BLOCK queue drops it).
+
+        Never suspends, so callers can check state and queue the chunk
+        without another task running in between.
+
+        Args:
+            chunk: Audio bytes
+
+        Returns:
+            False if the chunk itself was dropped
+        """
+        if self._closed or (
+            self.policy is BackpressurePolicy.BLOCK and not self._fits(len(chunk))
+        ):
+            self._drop_new(chunk)
+            return False
+
+        self._admit(chunk)
+        self._readable.set()
+        return True
+
+    def prime(self, chunk: bytes) -> bool:
+        """
+        Queue replayed audio ahead of live audio, outside the cap.
+
+        Never waits or evicts; use before any live chunk is put.
+
+        Args:
+            chunk: Audio bytes
+
+        Returns:
+            False if the queue is closed
+        """
+        if self._closed:
+            self._drop_new(chunk)
+            return False
+        self._prime(chunk)
+        self._readable.set()
+        return True
+
+    async def wait_for_space(self, size: int, timeout: Optional[float] = None) -> bool:
+        """
+        BLOCK policy: wait until a chunk of size bytes fits, without
+        queueing it (callers then put_nowait()). Other policies return
+        at once.
+
+        Args:
+            size: Chunk size in bytes
+            timeout: Longest wait (default: block_timeout_s)
+
+        Returns:
+            True if the chunk fits now (or the policy never blocks)
+        """
+        if self.policy is not BackpressurePolicy.BLOCK or self._closed or self._fits(size):
+            return True
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + (self.block_timeout_s if timeout is None else timeout)
+        while not (self._closed or self._fits(size)):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            self._writable.clear()
+            try:
+                await asyncio.wait_for(self._writable.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+        self.blocked_seconds += loop.time() - start
+        return self._closed or self._fits(size)
+
+    async def get(self) -> Optional[bytes]:
+        """
+        Take the next request's audio, waiting until some is queued.
+
+        Returns:
+            Audio bytes, or None when closed and drained
+        """
+        while not self._chunks:
+            if self._closed:
+                return None
+            self._readable.clear()
+            await self._readable.wait()
+
+        chunk = self._take()
+        self._writable.set()
+        return chunk
+
+    def close(self):
+        """Stop accepting audio; get() returns None after the queued audio"""
+        self._closed = True
+        self._readable.set()
+        self._writable.set()
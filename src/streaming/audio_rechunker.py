@@ -0,0 +1,222 @@
+"""
+Adaptive re-chunking of client audio frames.
+
+Browser and mobile clients send frames of whatever size their audio APIs
+produce (20ms WebAudio/WebRTC frames, 256ms MediaRecorder slices, ...),
+while AudioChunkValidator only accepts 100-200ms requests. The
+re-chunker sits in front of the validator:
+- Small frames are aggregated until at least target_ms is pending, and
+  everything pending goes out while it fits in one request
+- Large frames are split so that what is left is still a valid request
+  (a 256ms frame becomes 100ms + 156ms, not 100 + 100 + a 56ms stub)
+- A pending partial request is flushed once its oldest audio has waited
+  max_delay_ms (poll() from a timer), zero-padded up to the validator's
+  minimum, so added latency stays bounded when frames stop arriving
+
+Added latency (oldest byte's wait per request) and padding are tracked.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+from .audio_handler import AudioChunkValidator
+
+logger = logging.getLogger(__name__)
+
+
+class AudioRechunker:
+    """
+    Turns arbitrary-size LINEAR16 frames into fixed-size requests.
+
+    Not thread-safe by itself; callers that push and poll from different
+    threads hold `lock` around both (and around sending the result).
+    """
+
+    def __init__(
+        self,
+        target_ms: float = 100.0,
+        max_delay_ms: float = 200.0,
+        sample_rate: int = 16000,
+        bytes_per_sample: int = 2
+    ):
+        """
+        Initialize re-chunker.
+
+        Args:
+            target_ms: Request size in milliseconds (clamped to 100-200ms)
+            max_delay_ms: Longest time audio may wait before a partial
+                request is flushed
+            sample_rate: Audio sample rate (mono)
+            bytes_per_sample: Bytes per sample (2 for LINEAR16)
+        """
+        self.bytes_per_ms = sample_rate * bytes_per_sample / 1000
+        self.bytes_per_sample = bytes_per_sample
+
+        target_bytes = int(target_ms * self.bytes_per_ms)
+        target_bytes -= target_bytes % bytes_per_sample
+        self.target_bytes = min(
+            max(target_bytes, AudioChunkValidator.MIN_CHUNK_SIZE),
+            AudioChunkValidator.MAX_CHUNK_SIZE
+        )
+        self.min_bytes = AudioChunkValidator.MIN_CHUNK_SIZE
+        self.max_bytes = AudioChunkValidator.MAX_CHUNK_SIZE
+        self.max_delay_s = max_delay_ms / 1000
+
+        self.lock = threading.Lock()
+
+        self._pending = bytearray()
+        # (cumulative end byte of a frame in _pending, arrival time)
+        self._arrivals: Deque[Tuple[int, float]] = deque()
+        self._consumed = 0  # bytes of _arrivals' running total already emitted
+        self._received = 0
+
+        # Counters
+        self.frames_in = 0
+        self.bytes_in = 0
+        self.chunks_out = 0
+        self.timer_flushes = 0
+        self.padded_bytes = 0
+        self.total_wait_s = 0.0
+        self.max_wait_s = 0.0
+
+    @property
+    def pending_bytes(self) -> int:
+        return len(self._pending)
+
+    @property
+    def pending_since(self) -> Optional[float]:
+        """Arrival time of the oldest pending audio"""
+        return self._arrivals[0][1] if self._arrivals else None
+
+    def push(self, frame: Union[bytes, bytearray, memoryview], now: Optional[float] = None) -> List[bytes]:
+        """
+        Add a client frame.
+
+        Args:
+            frame: LINEAR16 audio of any length
+            now: Arrival time (default: time.monotonic())
+
+        Returns:
+            Requests that are complete (possibly none)
+        """
+        now = time.monotonic() if now is None else now
+        if not frame:
+            return []
+
+        self.frames_in += 1
+        self.bytes_in += len(frame)
+        self._pending += frame
+        self._received += len(frame)
+        self._arrivals.append((self._received, now))
+
+        chunks = []
+        while len(self._pending) >= self.target_bytes:
+            size = len(self._pending)
+            if size > self.max_bytes:
+                # Split, leaving a remainder of at least min_bytes
+                size = min(self.target_bytes, size - self.min_bytes)
+                size -= size % self.bytes_per_sample
+            chunks.append(self._emit(size, now))
+
+        # Audio that has already waited too long goes out now
+        chunk = self.poll(now)
+        if chunk is not None:
+            chunks.append(chunk)
+        return chunks
+
+    def poll(self, now: Optional[float] = None) -> Optional[bytes]:
+        """
+        Timer check: flush the pending partial request if it is overdue.
+
+        Args:
+            now: Current time (default: time.monotonic())
+
+        Returns:
+            The flushed (zero-padded) request, or None
+        """
+        since = self.pending_since
+        if since is None:
+            return None
+        now = time.monotonic() if now is None else now
+        if now - since < self.max_delay_s:
+            return None
+
+        self.timer_flushes += 1
+        return self._emit(len(self._pending), now)
+
+    def flush(self, now: Optional[float] = None) -> Optional[bytes]:
+        """
+        Flush any pending audio (e.g. at end of stream), zero-padded.
+
+        Returns:
+            The last request, or None if nothing is pending
+        """
+        if not self._pending:
+            return None
+        now = time.monotonic() if now is None else now
+        return self._emit(len(self._pending), now)
+
+    def time_until_due(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until poll() would flush (None when nothing is pending)"""
+        since = self.pending_since
+        if since is None:
+            return None
+        now = time.monotonic() if now is None else now
+        return max(0.0, since + self.max_delay_s - now)
+
+    def _emit(self, size: int, now: float) -> bytes:
+        """Cut size bytes off the front, padding short requests"""
+        chunk = bytes(self._pending[:size])
+        del self._pending[:size]
+
+        # Added latency of this request: how long its oldest byte waited
+        wait = now - self._arrivals[0][1]
+        self.total_wait_s += wait
+        self.max_wait_s = max(self.max_wait_s, wait)
+
+        self._consumed += size
+        while self._arrivals and self._arrivals[0][0] <= self._consumed:
+            self._arrivals.popleft()
+
+        # Keep whole samples and the validator's minimum size
+        if len(chunk) % self.bytes_per_sample:
+            pad = self.bytes_per_sample - len(chunk) % self.bytes_per_sample
+            chunk += b'\x00' * pad
+            self.padded_bytes += pad
+        if len(chunk) < self.min_bytes:
+            self.padded_bytes += self.min_bytes - len(chunk)
+            chunk += b'\x00' * (self.min_bytes - len(chunk))
+
+        self.chunks_out += 1
+        return chunk
+
+    def reset(self):
+        """Drop pending audio (keeps counters)"""
+        self._pending.clear()
+        self._arrivals.clear()
+        self._consumed = self._received = 0
+
+    def get_stats(self) -> Dict:
+        """
+        Get re-chunking statistics.
+
+        Returns:
+            dict with frames in, requests out, messages saved, timer
+            flushes, padding and added latency (avg/max ms)
+        """
+        return {
+            'target_ms': self.target_bytes / self.bytes_per_ms,
+            'frames_in': self.frames_in,
+            'chunks_out': self.chunks_out,
+            'messages_saved': self.frames_in - self.chunks_out,
+            'timer_flushes': self.timer_flushes,
+            'padded_ms': self.padded_bytes / self.bytes_per_ms,
+            'pending_ms': len(self._pending) / self.bytes_per_ms,
+            'avg_added_latency_ms': (
+                self.total_wait_s / self.chunks_out * 1000 if self.chunks_out else 0.0
+            ),
+            'max_added_latency_ms': self.max_wait_s * 1000,
+        }
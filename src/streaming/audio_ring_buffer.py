@@ -0,0 +1,203 @@
+"""
+Preallocated ring buffer for a session's audio.
+
+Audio is written once into a fixed bytearray and every later stage
+(chunk handler, send queue, renewal buffer, preprocessing) reads
+memoryview slices of it instead of holding its own copies.
+
+Positions are absolute byte offsets since the session started (the
+session's audio clock: offset / bytes_per_ms = milliseconds), so a slice
+can be referred to by (start, end) long after the write, as long as the
+writer has not lapped it. Capacity is rounded up to whole chunks
+(align_bytes) so fixed-size chunks never straddle the wrap point and
+every view is zero-copy.
+
+Single writer; readers must be done with a view before the writer
+laps it (size the capacity above the send queue and renewal buffers).
+"""
+
+import logging
+import math
+from typing import Callable, Dict, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class AudioRingBuffer:
+    """
+    Fixed-size audio ring addressed by absolute byte offsets.
+
+    Example:
+        ring = AudioRingBuffer(capacity_ms=12000)
+        start = ring.write(chunk)
+        view = ring.view(start, start + len(chunk))   # no copy
+        samples = ring.samples(start, start + len(chunk))  # int16 view
+    """
+
+    def __init__(
+        self,
+        capacity_ms: float = 12000.0,
+        sample_rate: int = 16000,
+        bytes_per_sample: int = 2,
+        align_bytes: int = 3200
+    ):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity_ms: Audio retained, in milliseconds (rounded up to align_bytes)
+            sample_rate: Audio sample rate (mono)
+            bytes_per_sample: Bytes per sample (2 for LINEAR16)
+            align_bytes: Capacity granularity; chunks of this size (or a
+                divisor of the capacity) never wrap
+        """
+        self.bytes_per_ms = sample_rate * bytes_per_sample / 1000
+        self.bytes_per_sample = bytes_per_sample
+        self.capacity = max(1, math.ceil(capacity_ms * self.bytes_per_ms / align_bytes)) * align_bytes
+
+        self._buffer = bytearray(self.capacity)
+        self._view = memoryview(self._buffer)
+
+        # Absolute offset of the next byte to be written
+        self.end_offset = 0
+
+        # Counters
+        self.writes = 0
+        self.wrap_copies = 0
+
+    @property
+    def start_offset(self) -> int:
+        """Oldest absolute offset still held"""
+        return max(0, self.end_offset - self.capacity)
+
+    @property
+    def duration_ms(self) -> float:
+        """Audio written so far, in milliseconds (the audio clock)"""
+        return self.end_offset / self.bytes_per_ms
+
+    def offset_to_ms(self, offset: int) -> float:
+        """Convert an absolute offset to milliseconds of audio"""
+        return offset / self.bytes_per_ms
+
+    def owns(self, data: BytesLike) -> bool:
+        """Whether data is a view into this ring"""
+        return isinstance(data, memoryview) and data.obj is self._buffer
+
+    def available(self, start: int, end: int) -> bool:
+        """Whether [start, end) is written and not yet overwritten"""
+        return self.start_offset <= start <= end <= self.end_offset
+
+    def write(self, data: BytesLike) -> int:
+        """
+        Append audio (one copy, into the preallocated buffer).
+
+        Args:
+            data: Audio bytes or any buffer
+
+        Returns:
+            Absolute offset of the first written byte
+        """
+        data = memoryview(data).cast('B')
+        size = len(data)
+        start = self.end_offset
+
+        if size > self.capacity:
+            # Only the tail survives; skip the rest of the clock
+            data = data[size - self.capacity:]
+            self.end_offset += size - self.capacity
+            size = self.capacity
+
+        pos = self.end_offset % self.capacity
+        first = min(size, self.capacity - pos)
+        self._view[pos:pos + first] = data[:first]
+        if first < size:
+            self._view[:size - first] = data[first:]
+
+        self.end_offset += size
+        self.writes += 1
+        return start
+
+    def write_from(self, readinto: Callable[[memoryview], int], size: int) -> Tuple[int, int]:
+        """
+        Fill the next size bytes straight from a reader, without an
+        intermediate bytes object (e.g. file.readinto, socket.recv_into).
+
+        Args:
+            readinto: Callable filling a writable buffer, returning bytes read
+            size: Bytes requested
+
+        Returns:
+            (start, end) absolute offsets of the bytes actually read
+        """
+        start = self.end_offset
+        pos = start % self.capacity
+
+        if pos + size <= self.capacity and size <= self.capacity:
+            count = readinto(self._view[pos:pos + size]) or 0
+            self.end_offset += count
+            self.writes += 1
+            return start, start + count
+
+        # Would wrap: read into scratch space and copy
+        scratch = bytearray(size)
+        count = readinto(memoryview(scratch)) or 0
+        self.wrap_copies += 1
+        self.write(memoryview(scratch)[:count])
+        return start, start + count
+
+    def view(self, start: int, end: int) -> memoryview:
+        """
+        Read-only access to [start, end).
+
+        Zero-copy unless the range straddles the wrap point.
+
+        Raises:
+            ValueError: If the range was overwritten or not yet written
+        """
+        if not self.available(start, end):
+            raise ValueError(
+                f"Audio range [{start}, {end}) not in ring "
+                f"[{self.start_offset}, {self.end_offset})"
+            )
+
+        pos = start % self.capacity
+        size = end - start
+        if pos + size <= self.capacity:
+            return self._view[pos:pos + size]
+
+        self.wrap_copies += 1
+        first = self.capacity - pos
+        return memoryview(bytes(self._view[pos:]) + bytes(self._view[:size - first]))
+
+    def samples(self, start: int, end: int) -> np.ndarray:
+        """
+        int16 samples of [start, end) as a numpy view (writable in place
+        unless the range wraps).
+        """
+        return np.frombuffer(self.view(start, end), dtype=np.int16)
+
+    def reset(self):
+        """Forget all audio (keeps the allocation)"""
+        self.end_offset = 0
+
+    def get_stats(self) -> Dict:
+        """
+        Get ring buffer statistics.
+
+        Returns:
+            dict with capacity (bytes/ms), audio clock, retained range,
+            write and wrap-copy counts
+        """
+        return {
+            'capacity_bytes': self.capacity,
+            'capacity_ms': self.capacity / self.bytes_per_ms,
+            'duration_ms': self.duration_ms,
+            'start_offset': self.start_offset,
+            'end_offset': self.end_offset,
+            'writes': self.writes,
+            'wrap_copies': self.wrap_copies,
+        }
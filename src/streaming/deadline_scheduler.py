@@ -0,0 +1,287 @@
+"""
+Deadline scheduler for per-session timers.
+
+One thread and one heap serve every session's deadlines (renewal,
+silence/idle, stuck-stream checks) instead of a loop that wakes every
+second and scans all sessions:
+- schedule()/cancel() are O(log n) / O(1) (cancelled entries are
+  skipped lazily and compacted when they pile up)
+- The thread sleeps until the earliest deadline, and is woken early only
+  when a new deadline becomes the earliest
+- Rescheduling a key replaces its deadline, so callers can re-arm a timer
+  from inside its own callback
+
+Callbacks run on the scheduler thread, outside the lock; they should be
+short (hand long work such as a renewal to another thread). Re-arming a
+timer with the same callback object allocates nothing that outlives the
+young GC generation, so long-lived timers do not drive full collections.
+
+AsyncDeadlineScheduler keeps the same heap but is driven by a task on
+one event loop, so its callbacks run on the loop (and hand long work to
+tasks) instead of on a thread.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    """
+    Heap of keyed deadlines driven by a single thread.
+
+    Example:
+        scheduler = DeadlineScheduler()
+        scheduler.start()
+        scheduler.schedule(("idle", session_id), 60.0, check_idle)
+        scheduler.cancel(("idle", session_id))
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, name: str = "deadline-scheduler"):
+        """
+        Initialize scheduler.
+
+        Args:
+            clock: Monotonic time source (injectable for tests)
+            name: Scheduler thread name
+        """
+        self.clock = clock
+        self.name = name
+
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        # key -> (due, sequence); heap entries not matching are stale
+        self._entries: Dict[Hashable, Tuple[float, int]] = {}
+        self._callbacks: Dict[Hashable, Callable[[], None]] = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+        # Counters
+        self.scheduled = 0
+        self.fired = 0
+        self.cancelled = 0
+        self.wakeups = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def schedule(self, key: Hashable, delay_s: float, callback: Callable[[], None]) -> float:
+        """
+        Set (or replace) the deadline for key.
+
+        Args:
+            key: Timer identity, e.g. ("renewal", session_id)
+            delay_s: Seconds from now (negative means due now)
+            callback: Called with no arguments when due
+
+        Returns:
+            Due time on the scheduler clock
+        """
+        with self._condition:
+            due = self.clock() + max(0.0, delay_s)
+            sequence = next(self._sequence)
+            self._entries[key] = (due, sequence)
+            self._callbacks[key] = callback
+            heapq.heappush(self._heap, (due, sequence, key))
+            self.scheduled += 1
+
+            if self._heap[0][1] == sequence:
+                self._wake()
+            self._compact()
+        return due
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Remove key's deadline.
+
+        Returns:
+            True if a deadline was pending
+        """
+        with self._condition:
+            if self._entries.pop(key, None) is None:
+                return False
+            del self._callbacks[key]
+            self.cancelled += 1
+            self._compact()
+            return True
+
+    def due_in(self, key: Hashable) -> Optional[float]:
+        """Seconds until key is due (None if not scheduled)"""
+        with self._condition:
+            entry = self._entries.get(key)
+            return None if entry is None else max(0.0, entry[0] - self.clock())
+
+    def run_due(self) -> int:
+        """
+        Run every callback that is due now (on the calling thread).
+
+        Returns:
+            Number of callbacks run
+        """
+        with self._condition:
+            callbacks = self._pop_due(self.clock())
+        self._run(callbacks)
+        return len(callbacks)
+
+    def start(self):
+        """Start the scheduler thread (once)."""
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+            self._thread.start()
+        logger.info("Deadline scheduler started")
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the scheduler thread (pending deadlines are kept)."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        logger.info("Deadline scheduler stopped")
+
+    def get_stats(self) -> Dict:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            dict with pending deadlines, heap size (including stale
+            entries), scheduled/fired/cancelled counts and thread wakeups
+        """
+        with self._condition:
+            return {
+                'pending': len(self._entries),
+                'heap_size': len(self._heap),
+                'scheduled': self.scheduled,
+                'fired': self.fired,
+                'cancelled': self.cancelled,
+                'wakeups': self.wakeups,
+            }
+
+    def _loop(self):
+        """Sleep until the earliest deadline, run what is due, repeat."""
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    timeout = self._next_timeout()
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                    self.wakeups += 1
+                if self._stopped:
+                    return
+                callbacks = self._pop_due(self.clock())
+            self._run(callbacks)
+
+    def _wake(self):
+        """Wake the loop early (a new earliest deadline; lock held)"""
+        self._condition.notify()
+
+    def _next_timeout(self) -> Optional[float]:
+        """Seconds until the earliest live deadline (None if none)"""
+        while self._heap:
+            due, sequence, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == sequence:
+                return due - self.clock()
+            heapq.heappop(self._heap)  # Cancelled or rescheduled
+        return None
+
+    def _pop_due(self, now: float) -> List[Callable[[], None]]:
+        """Remove and return the callbacks of live deadlines due by now"""
+        callbacks = []
+        while self._heap and self._heap[0][0] <= now:
+            _, sequence, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != sequence:
+                continue
+            del self._entries[key]
+            callbacks.append(self._callbacks.pop(key))
+        return callbacks
+
+    def _run(self, callbacks: List[Callable[[], None]]):
+        for callback in callbacks:
+            self.fired += 1
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in scheduled callback: {e}", exc_info=True)
+
+    def _compact(self):
+        """Drop stale heap entries once they outnumber live ones."""
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                (due, sequence, key) for key, (due, sequence) in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
+
+
+class AsyncDeadlineScheduler(DeadlineScheduler):
+    """
+    Heap of keyed deadlines driven by a task on one event loop.
+
+    Schedule, cancel and start from the loop; callbacks run on it.
+
+    Example:
+        scheduler = AsyncDeadlineScheduler()
+        scheduler.start()  # In a coroutine
+        scheduler.schedule(("idle", session_id), 60.0, check_idle)
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, name: str = "deadline-scheduler"):
+        """
+        Initialize scheduler.
+
+        Args:
+            clock: Monotonic time source (injectable for tests)
+            name: Scheduler task name
+        """
+        super().__init__(clock=clock, name=name)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the scheduler task on the running loop (once)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._stopped = False
+        self._task = asyncio.get_running_loop().create_task(self._loop(), name=self.name)
+        logger.info("Deadline scheduler started")
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the scheduler task (pending deadlines are kept)."""
+        self._stopped = True
+        self._wakeup.set()
+        logger.info("Deadline scheduler stopped")
+
+    async def _loop(self):
+        """Sleep until the earliest deadline, run what is due, repeat."""
+        while not self._stopped:
+            with self._condition:
+                timeout = self._next_timeout()
+                if timeout is not None and timeout <= 0:
+                    callbacks = self._pop_due(self.clock())
+                else:
+                    callbacks = None
+                    self._wakeup.clear()
+            if callbacks is not None:
+                self._run(callbacks)
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeups += 1
+
+    def _wake(self):
+        self._wakeup.set()
@@ -8,6 +8,7 @@ Tracks:
 - Confidence scores
 - Cost per minute
 - Throughput metrics
+- Audio send queue depth and drops
 """
 
 import logging
@@ -19,6 +20,8 @@ from collections import defaultdict, deque
 from datetime import datetime
 import statistics
 
+from ..slide_processing.stage_timing import StageTimer
+
 logger = logging.getLogger(__name__)
 
 
@@ -104,11 +107,16 @@ class CostMetrics:
     
     total_audio_seconds: float = 0.0
     total_sessions: int = 0
+    saved_audio_seconds: float = 0.0  # Withheld by VAD gating, never billed
     
     def add_audio_duration(self, duration_seconds: float):
         """Add audio duration."""
         self.total_audio_seconds += duration_seconds
     
+    def add_saved_audio(self, duration_seconds: float):
+        """Add audio that was not sent (and not billed)."""
+        self.saved_audio_seconds += duration_seconds
+    
     def add_session(self):
         """Add session count."""
         self.total_sessions += 1
@@ -131,6 +139,8 @@ class CostMetrics:
             "total_cost_usd": self.get_total_cost(),
             "cost_per_session_usd": self.get_cost_per_session(),
             "total_sessions": self.total_sessions,
+            "saved_audio_seconds": self.saved_audio_seconds,
+            "saved_cost_usd": self.saved_audio_seconds * self.COST_PER_SECOND,
         }
 
 
@@ -205,6 +215,13 @@ class MetricsCollector:
         # Throughput metrics
         self.throughput = ThroughputMetrics()
         
+        # Slide matching stage latencies (all sessions)
+        self.matching_stages = StageTimer(budget_ms=None)
+        
+        # Audio send queues: depth gauge per session, drops across sessions
+        self.audio_queue_depth_ms: Dict[str, float] = {}
+        self.audio_chunks_dropped: int = 0
+        
         # Thread safety
         self.lock = threading.Lock()
         
@@ -222,6 +239,7 @@ class MetricsCollector:
                 "chunks_sent": 0,
                 "bytes_sent": 0,
                 "results_received": 0,
+                "audio_saved_seconds": 0.0,
             }
             self.cost.add_session()
             
@@ -274,6 +292,48 @@ class MetricsCollector:
             # Track throughput
             self.throughput.add_result(is_final)
     
+    def record_matching_stages(self, spans: Dict[str, float]):
+        """
+        Record per-stage slide matching latencies for one segment.
+        
+        Args:
+            spans: Stage name -> latency in ms (e.g. StageTimer.last_spans)
+        """
+        with self.lock:
+            self.matching_stages.record(spans)
+    
+    def record_audio_queue(self, session_id: str, depth_ms: float, dropped_chunks: int = 0):
+        """
+        Record a session's audio send queue depth and newly dropped chunks.
+        
+        Args:
+            session_id: Session identifier
+            depth_ms: Audio currently queued (ms)
+            dropped_chunks: Chunks dropped since the last report
+        """
+        with self.lock:
+            self.audio_queue_depth_ms[session_id] = depth_ms
+            self.audio_chunks_dropped += dropped_chunks
+    
+    def record_audio_saved(self, session_id: str, duration_seconds: float):
+        """
+        Record session audio withheld from the stream (VAD gating).
+        
+        Args:
+            session_id: Session identifier
+            duration_seconds: Audio not sent, in seconds
+        """
+        with self.lock:
+            if session_id in self.active_sessions:
+                self.active_sessions[session_id]["audio_saved_seconds"] += duration_seconds
+            
+            self.cost.add_saved_audio(duration_seconds)
+    
+    def remove_audio_queue(self, session_id: str):
+        """Stop reporting a closed session's audio queue depth."""
+        with self.lock:
+            self.audio_queue_depth_ms.pop(session_id, None)
+    
     def record_error(self, error_type: str, error_message: str):
         """Record an error."""
         with self.lock:
@@ -312,6 +372,7 @@ class MetricsCollector:
                 "latency": {
                     "interim_results": self.latency_interim.get_percentiles(),
                     "final_results": self.latency_final.get_percentiles(),
+                    "slide_matching": self.matching_stages.get_stats()["stages"],
                 },
                 
                 # Error metrics
@@ -330,6 +391,14 @@ class MetricsCollector:
                 # Cost metrics
                 "cost": self.cost.get_stats(),
                 
+                # Audio send queues
+                "audio_queues": {
+                    "sessions": len(self.audio_queue_depth_ms),
+                    "total_depth_ms": sum(self.audio_queue_depth_ms.values()),
+                    "max_depth_ms": max(self.audio_queue_depth_ms.values(), default=0.0),
+                    "dropped_chunks": self.audio_chunks_dropped,
+                },
+                
                 # Throughput metrics
                 "throughput": {
                     "total_chunks": self.throughput.total_chunks,
@@ -387,6 +456,13 @@ class MetricsCollector:
             f"  Total Audio: {summary['cost']['total_audio_hours']:.2f} hours",
             f"  Total Cost:  ${summary['cost']['total_cost_usd']:.2f} USD",
             f"  Per Session: ${summary['cost']['cost_per_session_usd']:.4f} USD",
+            f"  Saved (VAD): {summary['cost']['saved_audio_seconds'] / 60:.1f} min, "
+            f"${summary['cost']['saved_cost_usd']:.2f} USD",
+            "",
+            "AUDIO QUEUES:",
+            f"  Total Depth: {summary['audio_queues']['total_depth_ms']:.0f}ms",
+            f"  Max Depth:   {summary['audio_queues']['max_depth_ms']:.0f}ms",
+            f"  Dropped:     {summary['audio_queues']['dropped_chunks']} chunks",
             "",
             "THROUGHPUT:",
             f"  Total Chunks:  {summary['throughput']['total_chunks']}",
@@ -418,6 +494,9 @@ class MetricsCollector:
             self.confidence = ConfidenceMetrics()
             self.cost = CostMetrics()
             self.throughput = ThroughputMetrics()
+            self.matching_stages.reset()
+            self.audio_queue_depth_ms.clear()
+            self.audio_chunks_dropped = 0
             
             self.start_time = time.time()
             
@@ -11,16 +11,21 @@ Handles:
 
 import logging
 import time
-from typing import Optional, Callable, List, Dict
+from typing import Optional, Callable, List, Dict, Deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 import tempfile
+from collections import deque
 
-from ..slide_processing import SlideProcessor, PDFProcessingError
+from ..slide_processing import SlideProcessor, PDFProcessingError, RollingContext
+from .speculative_matcher import SpeculativeMatcher
 
 logger = logging.getLogger(__name__)
 
+# Most recent total match latencies kept for get_matching_stats()
+MAX_LATENCY_SAMPLES = 1000
+
 
 @dataclass
 class StreamingResult:
@@ -84,7 +89,10 @@ class StreamingResultHandler:
     def __init__(
         self,
         result_callback: Optional[Callable] = None,
-        enable_slide_matching: bool = False
+        enable_slide_matching: bool = False,
+        metrics_collector = None,
+        context_window_s: Optional[float] = 30.0,
+        speculative_matching: bool = False
     ):
         """
         Initialize result handler.
@@ -93,6 +101,14 @@ class StreamingResultHandler:
             result_callback: Optional callback function to forward results.
                            Called with (result: StreamingResult) -> None
             enable_slide_matching: Enable real-time slide matching (Phase 4)
+            metrics_collector: Optional MetricsCollector receiving per-stage
+                           slide matching latencies
+            context_window_s: Seconds of recent finals used as rolling
+                           context for short finals (None to match each
+                           final in isolation)
+            speculative_matching: Match interim results in the background
+                           so slide switches show before the final arrives
+                           (opt-in: one worker thread per handler)
         """
         self.result_callback = result_callback
         self.current_interim: Optional[StreamingResult] = None
@@ -103,7 +119,16 @@ class StreamingResultHandler:
         self.enable_slide_matching = enable_slide_matching
         self.slide_processor: Optional[SlideProcessor] = None
         self.slides_loaded = False
-        self.match_latencies: List[float] = []
+        self.match_latencies: Deque[float] = deque(maxlen=MAX_LATENCY_SAMPLES)
+        self.metrics_collector = metrics_collector
+        
+        # Rolling context of recent finals (created with the slides)
+        self.context_window_s = context_window_s
+        self.rolling_context: Optional[RollingContext] = None
+        
+        # Background matching of interims (created with the slides)
+        self.speculative_matching = speculative_matching
+        self.speculative_matcher: Optional[SpeculativeMatcher] = None
         
         logger.info(
             f"StreamingResultHandler initialized "
@@ -172,6 +197,12 @@ class StreamingResultHandler:
             stats = self.slide_processor.process_pdf(local_path)
             self.slides_loaded = True
             
+            if self.context_window_s:
+                self.rolling_context = RollingContext(window_s=self.context_window_s)
+            
+            if self.speculative_matching:
+                self._start_speculative_matching()
+            
             load_time = time.time() - start_time
             logger.info(
                 f"Slides preloaded in {load_time:.2f}s: "
@@ -190,7 +221,46 @@ class StreamingResultHandler:
                 except Exception:
                     pass
     
-    def _match_slide(self, text: str, timestamp: float) -> Optional[Dict]:
+    def _start_speculative_matching(self):
+        """(Re)create the interim matcher for the loaded slides"""
+        if self.speculative_matcher:
+            self.speculative_matcher.close()
+        self.speculative_matcher = SpeculativeMatcher(
+            self.slide_processor,
+            on_match=self._on_speculative_match
+        )
+    
+    def _on_speculative_match(self, generation: int, match_result) -> None:
+        """
+        Attach a speculative match to the current interim and re-forward it.
+        
+        Runs on the speculative matcher's worker thread. Matches for an
+        interim that has since been replaced (or finalized) are dropped.
+        """
+        speculative = self.speculative_matcher
+        interim = self.current_interim
+        if match_result is None or interim is None or speculative is None:
+            return
+        if not speculative.is_current(generation):
+            return
+        
+        interim.slide_id = match_result.slide_id
+        interim.slide_score = match_result.score
+        interim.slide_confidence = match_result.confidence
+        interim.matched_keywords = match_result.matched_keywords
+        
+        if self.result_callback and speculative.is_current(generation):
+            try:
+                self.result_callback(interim)
+            except Exception as e:
+                logger.error(f"Error in result callback: {e}", exc_info=True)
+    
+    def _match_slide(
+        self,
+        text: str,
+        timestamp: float,
+        work_cache: Optional[Dict] = None
+    ) -> Optional[Dict]:
         """
         Match transcript segment to slide (fast path for streaming).
         
@@ -199,6 +269,7 @@ class StreamingResultHandler:
         Args:
             text: Transcript text
             timestamp: Segment timestamp for temporal smoothing
+            work_cache: Work cache of this utterance's speculative matches
             
         Returns:
             dict with slide_id, score, confidence, keywords, latency
@@ -207,13 +278,22 @@ class StreamingResultHandler:
         if not self.slides_loaded or not self.slide_processor:
             return None
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            match_result = self.slide_processor.match_segment(text, timestamp)
+            match_result = self.slide_processor.match_segment(
+                text,
+                timestamp,
+                context=self.rolling_context,
+                work_cache=work_cache
+            )
+            
+            latency = (time.perf_counter() - start_time) * 1000  # Convert to ms
+            self.match_latencies.append(latency)  # Oldest samples fall off
             
-            latency = (time.time() - start_time) * 1000  # Convert to ms
-            self.match_latencies.append(latency)
+            stage_timer = self.slide_processor.stage_timer
+            if self.metrics_collector and stage_timer is not None:
+                self.metrics_collector.record_matching_stages(stage_timer.last_spans)
             
             if match_result:
                 return {
@@ -234,7 +314,8 @@ class StreamingResultHandler:
         self,
         text: str,
         confidence: float,
-        words: Optional[List[dict]] = None
+        words: Optional[List[dict]] = None,
+        timestamp: Optional[float] = None
     ) -> StreamingResult:
         """
         Handle interim (non-final) result.
@@ -243,10 +324,15 @@ class StreamingResultHandler:
         as more audio arrives. The current interim is replaced with each
         new interim result.
         
+        With speculative matching, the interim is queued for a background
+        match; if it is still current when the match completes, it is
+        forwarded again with slide info attached.
+        
         Args:
             text: Transcribed text
             confidence: Confidence score (0.0-1.0)
             words: Optional word-level details
+            timestamp: Optional timestamp for speculative slide matching
             
         Returns:
             StreamingResult object
@@ -261,6 +347,12 @@ class StreamingResultHandler:
         # Replace current interim
         self.current_interim = result
         
+        if self.speculative_matcher and self.slides_loaded:
+            self.speculative_matcher.submit(
+                text,
+                timestamp if timestamp is not None else time.time()
+            )
+        
         # Update metrics
         self.metrics.total_interim_results += 1
         self.metrics.last_result_time = time.time()
@@ -305,7 +397,10 @@ class StreamingResultHandler:
         slide_match = None
         if self.enable_slide_matching and self.slides_loaded:
             ts = timestamp if timestamp is not None else time.time()
-            slide_match = self._match_slide(text, ts)
+            work_cache = None
+            if self.speculative_matcher:
+                work_cache = self.speculative_matcher.finalize()
+            slide_match = self._match_slide(text, ts, work_cache)
         
         result = StreamingResult(
             text=text,
@@ -392,6 +487,10 @@ class StreamingResultHandler:
         self.match_latencies.clear()
         self.slides_loaded = False
         self.slide_processor = None
+        self.rolling_context = None
+        if self.speculative_matcher:
+            self.speculative_matcher.close()
+            self.speculative_matcher = None
         logger.debug("Result handler reset")
     
     def get_slide_timeline(self) -> List[Dict]:
@@ -446,6 +545,15 @@ class StreamingResultHandler:
             stats['min_latency_ms'] = min(self.match_latencies)
             stats['latency_p95_ms'] = sorted(self.match_latencies)[int(len(self.match_latencies) * 0.95)]
         
+        if self.speculative_matcher:
+            stats['speculative'] = self.speculative_matcher.get_stats()
+        
+        # Per-stage breakdown (tokenize, exact, fuzzy, semantic, combine)
+        if self.slide_processor:
+            stage_stats = self.slide_processor.get_stage_stats()
+            if stage_stats:
+                stats['stages'] = stage_stats
+        
         return stats
     
     def export_results(self) -> dict:
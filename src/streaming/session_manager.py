@@ -12,16 +12,26 @@ import logging
 import time
 import threading
 import queue
-from typing import Optional, Dict, Callable
+from typing import Optional, Dict, Callable, List, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import partial
 
 from google.cloud.speech_v2 import SpeechClient
 from google.cloud.speech_v2.types import cloud_speech
 from google.api_core import exceptions as google_exceptions
 
-from .audio_handler import AudioChunkHandler
+from .audio_handler import AudioChunkHandler, AudioChunkValidator
+from .audio_ring_buffer import AudioRingBuffer
+from .audio_queue import AudioSendQueue, BackpressurePolicy
+from .audio_rechunker import AudioRechunker
+from .audio_frontend import AudioFrontend, AudioInputFormat
+from .audio_encoder import check_encoding, create_encoder
+from .audio_preprocessing import AudioActivity, AudioPreprocessor
+from .batch_preprocessor import BatchPreprocessor
+from .speech_gate import SpeechGate
+from .deadline_scheduler import DeadlineScheduler
 from .result_handler import StreamingResultHandler, StreamingResult
 from .errors import (
     SessionTimeoutError,
@@ -32,6 +42,27 @@ from .errors import (
 
 logger = logging.getLogger(__name__)
 
+# Languages whose transcripts join words without spaces
+UNSPACED_LANGUAGES = ("ja", "zh", "th", "lo", "km", "my")
+
+# Words ending this close to the last final are treated as already final
+DEDUPE_TOLERANCE_MS = 1.0
+
+# LINEAR16, 16kHz, mono
+BYTES_PER_MS = 32
+
+# Stream errors after which a new stream (with replayed audio) can continue
+RECOVERABLE_STREAM_ERRORS = (
+    google_exceptions.Aborted,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.OutOfRange,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+)
+
+# Size of replayed requests
+REPLAY_CHUNK_BYTES = 3200
+
 
 class SessionStatus(Enum):
     """Session status states."""
@@ -55,21 +86,46 @@ class StreamingSession:
     
     # Handlers
     audio_handler: Optional[AudioChunkHandler] = None
+    ring_buffer: Optional[AudioRingBuffer] = None  # Session audio, written once
+    rechunker: Optional[AudioRechunker] = None  # For feed_audio() frames
+    frontend: Optional[AudioFrontend] = None  # Client format -> 16kHz mono, ahead of the re-chunker
+    speech_gate: Optional[SpeechGate] = None  # VAD gating (opt-in)
     result_handler: Optional[StreamingResultHandler] = None
     
     # gRPC stream
     stream: Optional[any] = None
-    audio_queue: queue.Queue = field(default_factory=queue.Queue)  # Queue for audio chunks
+    audio_queue: AudioSendQueue = field(default_factory=AudioSendQueue)  # Bounded audio send queue
     result_listener_thread: Optional[threading.Thread] = None
     stop_listener: threading.Event = field(default_factory=threading.Event)
+    stream_config: Dict = field(default_factory=dict)  # start_session() options
+    
+    # Make-before-break renewal: the next stream while both are open
+    overlap_queue: Optional[AudioSendQueue] = None  # Receives a copy of each chunk
+    overlap_stream: Optional[any] = None
+    held_responses: Optional[List] = None  # Next stream's responses during overlap
+    renewal_lock: threading.Lock = field(default_factory=threading.Lock)
+    enqueue_lock: threading.Lock = field(default_factory=threading.Lock)  # Serializes producers
+    
+    # Audio clock (ms of audio queued) and end of the last final on it
+    audio_clock_ms: float = 0.0
+    queued_offset: int = 0  # Ring offset after the last queued chunk
+    final_end_ms: float = 0.0
+    duplicate_results: int = 0
+    duplicate_words: int = 0
+    stream_restarts: int = 0  # After stream errors
+    replayed_ms: float = 0.0  # Audio sent again to new streams
     
     # Timing
     last_audio_time: float = field(default_factory=time.time)
+    last_sent_time: float = field(default_factory=time.time)  # Request generator
+    deadline_checks: Dict[str, Callable] = field(default_factory=dict)  # Scheduler callbacks
     renewal_count: int = 0
     
     # Metadata
     total_chunks_sent: int = 0
     total_bytes_sent: int = 0
+    wire_bytes_sent: int = 0  # Encoded audio handed to streams (replays included)
+    encode_cpu_s: float = 0.0
     
     def duration(self) -> float:
         """Get session duration in seconds."""
@@ -109,6 +165,13 @@ class StreamingSession:
             "total_chunks_sent": self.total_chunks_sent,
             "total_bytes_sent": self.total_bytes_sent,
             "time_since_last_audio": self.time_since_last_audio(),
+            "duplicate_results": self.duplicate_results,
+            "duplicate_words": self.duplicate_words,
+            "stream_restarts": self.stream_restarts,
+            "replayed_ms": self.replayed_ms,
+            "audio_encoding": self.stream_config.get("audio_encoding", "LINEAR16"),
+            "wire_bytes_sent": self.wire_bytes_sent,
+            "encode_cpu_ms": self.encode_cpu_s * 1000,
         }
 
 
@@ -124,11 +187,38 @@ class StreamingSessionManager:
     MAX_SILENCE_DURATION_SECONDS = 60  # 1 minute of silence
     RENEWAL_THRESHOLD_SECONDS = 270  # Renew at 4.5 minutes
     
+    # Ring buffer audio kept beyond the send queue (replayed to new streams)
+    RING_HEADROOM_MS = 10000
+    
+    # Re-check interval while a due renewal has not happened yet
+    RENEWAL_RETRY_SECONDS = 10.0
+    
+    session_class = StreamingSession
+    
     def __init__(
         self,
         credentials_path: Optional[str] = None,
         project_id: Optional[str] = None,
-        result_callback: Optional[Callable] = None
+        result_callback: Optional[Callable] = None,
+        client=None,
+        audio_queue_ms: float = 2000.0,
+        backpressure_policy: Union[BackpressurePolicy, str] = BackpressurePolicy.DROP_OLDEST,
+        metrics_collector=None,
+        rechunk_target_ms: float = 100.0,
+        rechunk_max_delay_ms: float = 200.0,
+        replay_ms: float = 3000.0,
+        max_stream_restarts: int = 3,
+        scheduler: Optional[DeadlineScheduler] = None,
+        idle_timeout_s: float = MAX_SILENCE_DURATION_SECONDS,
+        stuck_timeout_s: float = 30.0,
+        vad_gating: bool = False,
+        preroll_ms: float = 500.0,
+        keepalive_interval_s: Optional[float] = 5.0,
+        preprocessor_factory: Optional[Callable[[], AudioPreprocessor]] = None,
+        batch_preprocessor: Optional[BatchPreprocessor] = None,
+        preprocess_tick_ms: float = 20.0,
+        audio_encoding: str = "LINEAR16",
+        speculative_matching: bool = False
     ):
         """
         Initialize session manager.
@@ -137,18 +227,88 @@ class StreamingSessionManager:
             credentials_path: Path to GCP service account key
             project_id: GCP project ID (required for V2 API)
             result_callback: Callback for streaming results
+            client: Optional pre-built speech client (e.g.
+                tests.fake_recognizer.FakeSpeechClient for load tests);
+                credentials_path is ignored when given
+            audio_queue_ms: Per-session cap on audio waiting to be sent (ms)
+            backpressure_policy: What a full audio queue does (block,
+                drop_oldest or coalesce)
+            metrics_collector: Optional MetricsCollector receiving audio
+                queue depth and drop counts
+            rechunk_target_ms: Request size that feed_audio() frames are
+                re-chunked into (100-200ms)
+            rechunk_max_delay_ms: Longest wait before a partial request
+                from feed_audio() is flushed
+            replay_ms: Recent audio replayed into a new stream on renewal
+                or error recovery (at most RING_HEADROOM_MS)
+            max_stream_restarts: Stream errors per session recovered by
+                opening a new stream before the session goes to ERROR
+            scheduler: Optional DeadlineScheduler driving per-session
+                renewal, idle-cleanup and stuck-stream deadlines
+            idle_timeout_s: With a scheduler, sessions without audio for
+                this long are closed
+            stuck_timeout_s: With a scheduler, a stream that has not taken
+                queued audio for this long is restarted
+            vad_gating: Withhold audio the VAD does not mark as speech
+                (see SpeechGate); saved seconds go to metrics_collector
+            preroll_ms: With gating, withheld audio sent ahead of speech
+                onsets
+            keepalive_interval_s: With gating, longest gap between sent
+                chunks during silence (None disables keep-alives)
+            preprocessor_factory: With gating, builds each session's
+                AudioPreprocessor (default: VAD only)
+            batch_preprocessor: With gating, preprocess all sessions'
+                chunks together in this engine instead of per session
+                (adds up to preprocess_tick_ms of latency)
+            preprocess_tick_ms: Interval of batch preprocessing ticks
+            audio_encoding: Default encoding of audio on the wire
+                (LINEAR16, MULAW, FLAC or OGG_OPUS; see audio_encoder)
+            speculative_matching: Match interim results to slides in the
+                background (one worker thread per session with slides)
         """
         self.credentials_path = credentials_path
         self.project_id = project_id
         self.result_callback = result_callback
+        self.audio_queue_ms = audio_queue_ms
+        self.backpressure_policy = BackpressurePolicy(backpressure_policy)
+        self.metrics_collector = metrics_collector
+        self.rechunk_target_ms = rechunk_target_ms
+        self.rechunk_max_delay_ms = rechunk_max_delay_ms
+        self.replay_ms = min(replay_ms, self.RING_HEADROOM_MS)
+        self.max_stream_restarts = max_stream_restarts
+        self.audio_encoding = check_encoding(audio_encoding)
+        self.speculative_matching = speculative_matching
+        self._rechunk_flusher = None
+        self._rechunk_stop = threading.Event()
+        
+        # Session deadlines; renewal_handler(session_id, session) is set by
+        # SessionRenewer, otherwise a due renewal is only logged
+        self.scheduler = scheduler
+        self.idle_timeout_s = idle_timeout_s
+        self.stuck_timeout_s = stuck_timeout_s
+        self.renewal_handler: Optional[Callable] = None
+        
+        # VAD gating
+        self.vad_gating = vad_gating
+        self.preroll_ms = preroll_ms
+        self.keepalive_interval_s = keepalive_interval_s
+        self.preprocessor_factory = preprocessor_factory
+        self.batch_preprocessor = batch_preprocessor
+        self.preprocess_tick_ms = preprocess_tick_ms
+        self._preprocess_ticker = None
+        self._preprocess_stop = threading.Event()
+        self._preprocess_lock = threading.Lock()  # Keeps gated chunks in order
         
         # Thread-safe session storage
         self.sessions: Dict[str, StreamingSession] = {}
         self.lock = threading.Lock()
         
         # Google Cloud client (V2 API)
-        self.client = SpeechClient.from_service_account_file(credentials_path) \
-            if credentials_path else SpeechClient()
+        if client is not None:
+            self.client = client
+        else:
+            self.client = SpeechClient.from_service_account_file(credentials_path) \
+                if credentials_path else SpeechClient()
         
         logger.info(
             f"StreamingSessionManager initialized: "
@@ -161,7 +321,8 @@ class StreamingSessionManager:
         presentation_id: str,
         language_code: str = "ja-JP",
         model: str = "latest_long",
-        enable_interim_results: bool = True
+        enable_interim_results: bool = True,
+        input_format: Optional[AudioInputFormat] = None
     ) -> StreamingSession:
         """
         Create a new streaming session.
@@ -172,6 +333,8 @@ class StreamingSessionManager:
             language_code: Language code (default: ja-JP)
             model: Speech model (default: latest_long)
             enable_interim_results: Enable interim results (default: True)
+            input_format: Client audio format of feed_audio() frames, converted
+                to 16kHz mono LINEAR16 (default: already 16kHz mono LINEAR16)
             
         Returns:
             StreamingSession object
@@ -183,13 +346,30 @@ class StreamingSessionManager:
             if session_id in self.sessions:
                 raise ValueError(f"Session {session_id} already exists")
             
-            # Create session
-            session = StreamingSession(
+            # Create session; its audio is written once into the ring and
+            # queued/buffered as views
+            ring_buffer = AudioRingBuffer(
+                capacity_ms=self.audio_queue_ms + self.RING_HEADROOM_MS
+            )
+            session = self.session_class(
                 session_id=session_id,
                 presentation_id=presentation_id,
-                audio_handler=AudioChunkHandler(max_buffer_size=2),
+                audio_queue=self._new_audio_queue(),
+                ring_buffer=ring_buffer,
+                rechunker=AudioRechunker(
+                    target_ms=self.rechunk_target_ms,
+                    max_delay_ms=self.rechunk_max_delay_ms
+                ),
+                frontend=(
+                    AudioFrontend(input_format)
+                    if input_format is not None and not input_format.is_native else None
+                ),
+                speech_gate=self._new_speech_gate() if self.vad_gating else None,
+                audio_handler=AudioChunkHandler(max_buffer_size=2, ring_buffer=ring_buffer),
                 result_handler=StreamingResultHandler(
-                    result_callback=self.result_callback
+                    result_callback=self.result_callback,
+                    metrics_collector=self.metrics_collector,
+                    speculative_matching=self.speculative_matching
                 )
             )
             
@@ -225,7 +405,8 @@ class StreamingSessionManager:
         session_id: str,
         language_code: str = "ja-JP",
         model: str = "latest_long",
-        enable_interim_results: bool = True
+        enable_interim_results: bool = True,
+        audio_encoding: Optional[str] = None
     ) -> bool:
         """
         Start (initialize) a streaming session.
@@ -238,6 +419,7 @@ class StreamingSessionManager:
             language_code: Language code
             model: Speech model
             enable_interim_results: Enable interim results
+            audio_encoding: Encoding on the wire (default: the manager's)
             
         Returns:
             True if started successfully
@@ -248,63 +430,20 @@ class StreamingSessionManager:
         session = self.get_session(session_id)
         
         try:
-            # Build V2 streaming config
-            config = self._build_streaming_config(
-                language_code=language_code,
-                model=model,
-                enable_interim_results=enable_interim_results
-            )
-            
-            # Create recognizer path for V2 API
-            recognizer = f"projects/{self.project_id}/locations/global/recognizers/_"
-            
-            # Create streaming config
-            streaming_config = cloud_speech.StreamingRecognitionConfig(
-                config=config,
-                streaming_features=cloud_speech.StreamingRecognitionFeatures(
-                    interim_results=enable_interim_results
-                )
-            )
-            
-            # Create request generator that reads from queue
-            def request_generator():
-                # First request: config only
-                yield cloud_speech.StreamingRecognizeRequest(
-                    recognizer=recognizer,
-                    streaming_config=streaming_config
-                )
-                
-                # Subsequent requests: audio chunks from queue
-                while not session.stop_listener.is_set():
-                    try:
-                        # Get chunk from queue - block until audio is available
-                        chunk = session.audio_queue.get(timeout=5.0)  # Longer timeout
-                        if chunk is None:  # Sentinel value to stop
-                            break
-                        
-                        yield cloud_speech.StreamingRecognizeRequest(
-                            audio=chunk
-                        )
-                    except queue.Empty:
-                        # If no audio for 5 seconds, log warning but continue
-                        logger.warning(f"No audio received for session {session_id} after 5s")
-                        continue
-            
-            # Open bidirectional gRPC stream
-            session.stream = self.client.streaming_recognize(
-                requests=request_generator()
-            )
-            
-            # Start result listener thread
-            session.result_listener_thread = threading.Thread(
-                target=self._result_listener,
-                args=(session_id, session.stream),
-                daemon=True
+            session.stream_config = {
+                "language_code": language_code,
+                "model": model,
+                "enable_interim_results": enable_interim_results,
+                "audio_encoding": check_encoding(audio_encoding or self.audio_encoding),
+            }
+            session.stream, session.result_listener_thread = self._open_stream(
+                session_id, session, session.audio_queue, audio_start_ms=0.0
             )
             session.result_listener_thread.start()
             
             session.status = SessionStatus.ACTIVE
-            session.last_audio_time = time.time()
+            session.last_audio_time = session.last_sent_time = time.time()
+            self._watch_session(session_id, session)
             
             logger.info(
                 f"Session started: {session_id} "
@@ -318,6 +457,275 @@ class StreamingSessionManager:
             logger.error(f"Failed to start session {session_id}: {e}")
             raise
     
+    def _open_stream(
+        self,
+        session_id: str,
+        session: StreamingSession,
+        audio_queue: AudioSendQueue,
+        audio_start_ms: float
+    ):
+        """
+        Open a streaming call fed from audio_queue and create its listener.
+        
+        Args:
+            session_id: Session identifier
+            session: Session the stream belongs to
+            audio_queue: Queue the request generator reads audio from
+            audio_start_ms: Session audio clock at the stream's first byte
+                (shifts the stream's result offsets onto the session clock)
+            
+        Returns:
+            (stream, listener thread not yet started)
+        """
+        config_request = self._build_config_request(**session.stream_config)
+        
+        # Create request generator that reads from queue
+        def request_generator():
+            # First request: config only
+            yield config_request
+            
+            # Each stream is its own bitstream (codec headers first)
+            encoder = create_encoder(session.stream_config.get("audio_encoding", "LINEAR16"))
+            
+            # Subsequent requests: audio chunks from queue
+            while not session.stop_listener.is_set():
+                try:
+                    # Get chunk from queue - block until audio is available
+                    chunk = audio_queue.get(timeout=5.0)  # Longer timeout
+                    if chunk is None:  # Sentinel value to stop
+                        # End of stream: what the codec still holds
+                        audio = encoder.flush()
+                        if audio:
+                            session.wire_bytes_sent += len(audio)
+                            yield cloud_speech.StreamingRecognizeRequest(audio=audio)
+                        break
+                    
+                    session.last_sent_time = time.time()
+                    cpu_before = encoder.cpu_s
+                    audio = encoder.encode(chunk)
+                    session.encode_cpu_s += encoder.cpu_s - cpu_before
+                    if audio:  # Empty while the codec fills a frame
+                        session.wire_bytes_sent += len(audio)
+                        yield cloud_speech.StreamingRecognizeRequest(audio=audio)
+                except queue.Empty:
+                    # If no audio for 5 seconds, log warning but continue
+                    # (expected while a speech gate withholds silence)
+                    log = logger.debug if session.speech_gate else logger.warning
+                    log(f"No audio received for session {session_id} after 5s")
+                    continue
+        
+        # Open bidirectional gRPC stream
+        stream = self.client.streaming_recognize(
+            requests=request_generator()
+        )
+        
+        # Result listener thread (started by the caller)
+        listener = threading.Thread(
+            target=self._result_listener,
+            args=(session_id, stream, audio_start_ms),
+            daemon=True
+        )
+        
+        return stream, listener
+    
+    def renew_stream(self, session_id: str, overlap_ms: float = 1000.0) -> dict:
+        """
+        Replace a session's streaming call without a gap (make-before-break).
+        
+        The next call is opened first, primed with the last replay_ms of
+        audio, and receives a copy of every chunk for overlap_ms while the
+        current call keeps running, so the session stays ACTIVE throughout.
+        The current call is then closed and drained; the next call's
+        results from the replay and overlap are held until then and
+        de-duplicated against the last final by audio offset.
+        
+        Args:
+            session_id: Session identifier
+            overlap_ms: Wall-clock time both calls receive audio
+            
+        Returns:
+            dict with open latency, replayed and overlap audio (ms) and
+            duplicates removed
+            
+        Raises:
+            SessionNotFoundError: If session doesn't exist
+            SessionRenewalError: If the session is not active
+        """
+        session = self.get_session(session_id)
+        if session.status != SessionStatus.ACTIVE:
+            raise SessionRenewalError(
+                f"Cannot renew session {session_id}: "
+                f"status is {session.status.value}"
+            )
+        
+        started = time.time()
+        duplicates_before = (session.duplicate_results, session.duplicate_words)
+        next_queue = self._new_audio_queue()
+        
+        # Make: recent audio, then from here on every chunk, goes to the next call
+        with session.renewal_lock:
+            audio_start_ms = self._replay_audio(session, next_queue, self.replay_ms)
+            overlap_start_ms = session.audio_clock_ms
+            session.overlap_queue = next_queue
+            session.held_responses = []
+        
+        try:
+            next_stream, next_listener = self._open_stream(
+                session_id, session, next_queue, audio_start_ms
+            )
+        except Exception:
+            with session.renewal_lock:
+                session.overlap_queue = None
+                session.held_responses = None
+            raise
+        session.overlap_stream = next_stream
+        next_listener.start()
+        open_latency = time.time() - started
+        
+        time.sleep(overlap_ms / 1000)
+        
+        # Break: the next call becomes the session's call
+        with session.renewal_lock:
+            session.overlap_queue = None
+            old_queue, old_stream, old_listener = (
+                session.audio_queue, session.stream, session.result_listener_thread
+            )
+            session.audio_queue = next_queue
+            session.stream = next_stream
+            session.result_listener_thread = next_listener
+            session.created_at = started
+            session.renewal_count += 1
+            overlap_audio_ms = session.audio_clock_ms - overlap_start_ms
+        
+        # The old call sends its last finals once its requests end
+        old_queue.close()
+        if old_listener:
+            old_listener.join(timeout=5.0)
+            if old_listener.is_alive():
+                logger.warning(
+                    f"Result listener for renewed stream of {session_id} "
+                    "did not stop gracefully"
+                )
+        if old_stream:
+            try:
+                old_stream.cancel()
+            except Exception as e:
+                logger.warning(f"Error closing renewed stream for {session_id}: {e}")
+        
+        # Release held finals (stale interims are dropped), then go live
+        with session.renewal_lock:
+            held, session.held_responses = session.held_responses, None
+            session.overlap_stream = None
+            for response in held:
+                if any(result.is_final for result in response.results):
+                    self._handle_response(session_id, session, response, audio_start_ms)
+        
+        stats = {
+            "open_latency_s": open_latency,
+            "renewal_duration_s": time.time() - started,
+            "overlap_audio_ms": overlap_audio_ms,
+            "replayed_ms": overlap_start_ms - audio_start_ms,
+            "duplicate_results": session.duplicate_results - duplicates_before[0],
+            "duplicate_words": session.duplicate_words - duplicates_before[1],
+        }
+        
+        logger.info(
+            f"Stream renewed for {session_id}: "
+            f"open {open_latency * 1000:.0f}ms, "
+            f"replay {stats['replayed_ms']:.0f}ms + "
+            f"overlap {overlap_audio_ms:.0f}ms of audio, "
+            f"{stats['duplicate_results']} duplicate results / "
+            f"{stats['duplicate_words']} words removed"
+        )
+        
+        return stats
+    
+    def _replay_audio(self, session: StreamingSession, audio_queue, replay_ms: float) -> float:
+        """
+        Queue the session's most recent audio (from its ring) for a new stream.
+        
+        Call with session.renewal_lock held, so no chunk is queued in between.
+        Replay is primed outside the queue's cap (it never evicts or blocks);
+        the stream's start is where the admitted replay begins.
+        
+        Args:
+            session: Session whose audio is replayed
+            audio_queue: The new stream's (empty) queue
+            replay_ms: Audio to replay (less if the ring holds less)
+            
+        Returns:
+            Session audio clock (ms) at the first replayed byte
+        """
+        ring = session.ring_buffer
+        if ring is None or replay_ms <= 0:
+            return session.audio_clock_ms
+        
+        # Replay ends at the last queued chunk (the audio clock now)
+        end = session.queued_offset
+        start = end - int(replay_ms * BYTES_PER_MS)
+        start = max(ring.start_offset, start - start % REPLAY_CHUNK_BYTES)
+        
+        admitted = end  # Start of the replay the queue holds without gaps
+        for offset in range(start, end, REPLAY_CHUNK_BYTES):
+            if audio_queue.prime(ring.view(offset, min(offset + REPLAY_CHUNK_BYTES, end))):
+                admitted = min(admitted, offset)
+            else:
+                admitted = end
+        
+        replayed_ms = (end - admitted) / BYTES_PER_MS
+        session.replayed_ms += replayed_ms
+        return session.audio_clock_ms - replayed_ms
+    
+    def _restart_stream(self, session_id: str, session: StreamingSession, stream) -> bool:
+        """
+        Replace a stream that failed with a recoverable error.
+        
+        The new stream is primed with recent audio (and anything the failed
+        stream had not sent yet), so words at the break are recognized again;
+        overlap with earlier finals is removed by audio offset.
+        
+        Args:
+            session_id: Session identifier
+            session: Session whose stream failed
+            stream: The failed stream
+            
+        Returns:
+            True if the session continues (restarted, or a renewal in
+            progress already has the audio)
+        """
+        if session.overlap_stream is not None:
+            # Mid-renewal: the next stream already hears the audio
+            return stream is session.stream
+        if (
+            session.status != SessionStatus.ACTIVE
+            or session.stop_listener.is_set()
+            or stream is not session.stream
+            or session.stream_restarts >= self.max_stream_restarts
+        ):
+            return False
+        
+        with session.renewal_lock:
+            failed_queue = session.audio_queue
+            next_queue = self._new_audio_queue()
+            audio_start_ms = self._replay_audio(
+                session, next_queue, max(self.replay_ms, failed_queue.depth_ms)
+            )
+            session.audio_queue = next_queue
+            session.stream, session.result_listener_thread = self._open_stream(
+                session_id, session, next_queue, audio_start_ms
+            )
+            session.stream_restarts += 1
+        
+        failed_queue.close()
+        session.result_listener_thread.start()
+        
+        logger.warning(
+            f"Stream restarted for {session_id} "
+            f"(restart #{session.stream_restarts}, "
+            f"replaying {session.audio_clock_ms - audio_start_ms:.0f}ms)"
+        )
+        return True
+    
     def send_audio_chunk(
         self,
         session_id: str,
@@ -346,53 +754,296 @@ class StreamingSessionManager:
             )
             return False
         
-        try:
-            # Validate and process chunk
-            if session.audio_handler.process_chunk(chunk):
-                # Put audio chunk into queue for request generator
+        return self._submit_chunk(session_id, session, chunk)
+    
+    def feed_audio(
+        self,
+        session_id: str,
+        frame: bytes
+    ) -> int:
+        """
+        Send client audio frames of any size.
+        
+        Frames are re-chunked into valid requests (see AudioRechunker);
+        a partial request is flushed after rechunk_max_delay_ms. Audio
+        fed before start_session() waits in the session's queue.
+        
+        Args:
+            session_id: Session identifier
+            frame: Audio bytes in the session's input format (default
+                LINEAR16, 16kHz, mono), any length
+            
+        Returns:
+            Number of requests queued (or withheld by VAD gating)
+            
+        Raises:
+            SessionNotFoundError: If session doesn't exist
+        """
+        session = self.get_session(session_id)
+        
+        if session.status not in (SessionStatus.INITIALIZING, SessionStatus.ACTIVE):
+            logger.warning(
+                f"Cannot feed audio: session {session_id} "
+                f"status is {session.status.value}"
+            )
+            return 0
+        
+        rechunker = session.rechunker
+        with rechunker.lock:
+            if session.frontend is not None:
+                frame = session.frontend.process(frame)
+            sent = sum(
+                self._submit_chunk(session_id, session, chunk)
+                for chunk in rechunker.push(frame)
+            )
+        
+        self._start_rechunk_flusher()
+        return sent
+    
+    def _submit_chunk(
+        self,
+        session_id: str,
+        session: StreamingSession,
+        chunk: bytes
+    ) -> bool:
+        """
+        Queue a chunk, through the session's speech gate if gating is on.
+        
+        Returns:
+            True if queued or withheld as silence
+        """
+        chunks = self._gate_chunk(session_id, session, chunk)
+        if chunks is None:
+            return self._enqueue_chunk(session_id, session, chunk)
+        return all([self._enqueue_chunk(session_id, session, c) for c in chunks])
+    
+    def _gate_chunk(
+        self,
+        session_id: str,
+        session: StreamingSession,
+        chunk: bytes
+    ) -> Optional[List[bytes]]:
+        """
+        Run a chunk through the session's speech gate.
+        
+        Returns:
+            Chunks to queue in order (pre-roll, keep-alive or the chunk
+            itself), or None when the session is not gated
+            
+        Raises:
+            AudioChunkError: If chunk is invalid
+        """
+        if session.speech_gate is None:
+            return None
+        
+        AudioChunkValidator.validate_chunk(chunk)
+        # The client is still sending, even when nothing goes out
+        session.last_audio_time = time.time()
+        
+        if self.batch_preprocessor is not None:
+            # Preprocessed with every other session's audio on the next tick
+            self.batch_preprocessor.submit(session_id, chunk)
+            self._start_preprocess_ticker()
+            return []
+        
+        return self._run_gate(session_id, session, lambda gate: gate.process(chunk))
+    
+    def _run_gate(self, session_id: str, session: StreamingSession, step: Callable) -> List[bytes]:
+        """Run step(gate) under the gate's lock and report newly saved audio."""
+        gate = session.speech_gate
+        with gate.lock:
+            saved_before = gate.saved_bytes
+            chunks = step(gate)
+            saved_ms = (gate.saved_bytes - saved_before) / BYTES_PER_MS
+        self._record_saved_audio(session_id, saved_ms)
+        return chunks
+    
+    def _preprocess_tick(self) -> list:
+        """
+        Run the batch preprocessor over all pending chunks and gate its
+        output per session.
+        
+        Returns:
+            (session_id, session, chunks to queue) per session with output
+        """
+        engine = self.batch_preprocessor
+        ready = []
+        for session_id, processed, activity in engine.tick():
+            session = self.sessions.get(session_id)
+            if session is None or session.speech_gate is None:
+                continue
+            is_speech = activity == AudioActivity.SPEECH or not engine.enable_vad
+            chunks = self._run_gate(
+                session_id, session, lambda gate: gate.admit(processed, is_speech)
+            )
+            if chunks and session.status in (SessionStatus.INITIALIZING, SessionStatus.ACTIVE):
+                ready.append((session_id, session, chunks))
+        return ready
+    
+    def _run_preprocess_tick(self):
+        """One batch preprocessing tick; queues what the gates let through."""
+        with self._preprocess_lock:
+            for session_id, session, chunks in self._preprocess_tick():
                 try:
-                    session.audio_queue.put(chunk, timeout=1.0)
+                    for chunk in chunks:
+                        self._enqueue_chunk(session_id, session, chunk)
+                except Exception as e:
+                    logger.error(f"Error queuing gated audio for {session_id}: {e}")
+    
+    def _start_preprocess_ticker(self):
+        """Start the thread that ticks the batch preprocessor (once)."""
+        if self._preprocess_ticker is not None:
+            return
+        with self.lock:
+            if self._preprocess_ticker is None:
+                # A fresh event per thread, so a stop cannot race a restart
+                self._preprocess_stop = threading.Event()
+                self._preprocess_ticker = threading.Thread(
+                    target=self._preprocess_tick_loop,
+                    args=(self._preprocess_stop,),
+                    name="preprocess-ticker",
+                    daemon=True
+                )
+                self._preprocess_ticker.start()
+    
+    def _stop_preprocess_ticker(self):
+        """Stop the ticker thread; the next gated session starts a new one."""
+        with self.lock:
+            ticker, stop = self._preprocess_ticker, self._preprocess_stop
+            self._preprocess_ticker = None
+        if ticker is not None:
+            stop.set()
+            ticker.join(timeout=5.0)
+    
+    def _preprocess_tick_loop(self, stop: threading.Event):
+        """Tick the batch preprocessor (one thread for all sessions)."""
+        interval = self.preprocess_tick_ms / 1000
+        while not stop.wait(interval):
+            try:
+                self._run_preprocess_tick()
+            except Exception as e:
+                logger.error(f"Error in batch preprocessing: {e}")
+    
+    def _speech_gate_stats(self, session_id: str, session: StreamingSession) -> dict:
+        """Gate statistics, with VAD stats from the batch preprocessor if used."""
+        stats = session.speech_gate.get_stats()
+        if self.batch_preprocessor is not None:
+            stats['vad'] = self.batch_preprocessor.get_stats(session_id).get('vad', {})
+        return stats
+    
+    def _record_saved_audio(self, session_id: str, saved_ms: float):
+        """Report gated audio that will never be sent."""
+        if saved_ms and self.metrics_collector:
+            self.metrics_collector.record_audio_saved(session_id, saved_ms / 1000)
+    
+    def _new_speech_gate(self) -> SpeechGate:
+        """Create a session's speech gate."""
+        return SpeechGate(
+            preprocessor=self.preprocessor_factory() if self.preprocessor_factory else None,
+            preroll_ms=self.preroll_ms,
+            keepalive_interval_s=self.keepalive_interval_s
+        )
+    
+    def _enqueue_chunk(
+        self,
+        session_id: str,
+        session: StreamingSession,
+        chunk: bytes
+    ) -> bool:
+        """
+        Validate a chunk and put it on the session's send queue.
+        
+        Args:
+            session_id: Session identifier
+            session: Session receiving the chunk
+            chunk: Audio bytes (LINEAR16, 16kHz, mono)
+            
+        Returns:
+            True if queued
+        """
+        # One producer at a time per session (feed_audio, the re-chunk
+        # flusher and the preprocess ticker), so a BLOCK wait and its put
+        # are not raced and last_chunk belongs to this chunk
+        with session.enqueue_lock:
+            try:
+                # Validate and process chunk
+                if session.audio_handler.process_chunk(chunk):
+                    # Put audio chunk into queue for request generator
+                    try:
+                        # BLOCK policy: wait for room (in the overlap queue too)
+                        # before taking renewal_lock, which restarts and renewals
+                        # need; producers are serialized and a swapped-in queue
+                        # has its full cap, so the room is still there for the put
+                        session.audio_queue.wait_for_space(len(chunk))
+                        overlap_queue = session.overlap_queue
+                        if overlap_queue is not None:
+                            overlap_queue.wait_for_space(len(chunk))
+                        overlap_dropped = False
+                        with session.renewal_lock:
+                            dropped_before = session.audio_queue.dropped_chunks
+                            queued = session.audio_queue.put(session.audio_handler.last_chunk, timeout=0)
+                            if queued and session.overlap_queue is not None:
+                                # Renewal overlap: the next stream hears it too
+                                # (its queue's cap is on top of the primed replay)
+                                overlap_dropped = not session.overlap_queue.put(
+                                    session.audio_handler.last_chunk, timeout=0
+                                )
+                            if queued:
+                                session.audio_clock_ms += len(chunk) / BYTES_PER_MS
+                                if session.audio_handler.last_offset is not None:
+                                    session.queued_offset = session.audio_handler.last_offset + len(chunk)
+                        self._record_queue_metrics(session_id, session, dropped_before)
+                        if overlap_dropped:
+                            # Only BLOCK timeouts get here; the next stream misses it
+                            logger.error(
+                                f"Renewal overlap queue full for session {session_id}, "
+                                "dropping the next stream's copy of a chunk"
+                            )
+                            if self.metrics_collector:
+                                self.metrics_collector.record_audio_queue(
+                                    session_id, depth_ms=session.audio_queue.depth_ms, dropped_chunks=1
+                                )
+                        
+                        if not queued:
+                            logger.error(
+                                f"Audio queue full for session {session_id}, dropping chunk"
+                            )
+                            return False
+                        
+                        session.total_chunks_sent += 1
+                        session.total_bytes_sent += len(chunk)
+                        session.last_audio_time = time.time()
                     
-                    session.total_chunks_sent += 1
-                    session.total_bytes_sent += len(chunk)
-                    session.last_audio_time = time.time()
+                    except Exception as e:
+                        logger.error(
+                            f"Error queuing audio for {session_id}: {e}"
+                        )
+                        raise StreamInterruptedError(f"Failed to queue audio: {e}")
                     
-                except queue.Full:
-                    logger.error(
-                        f"Audio queue full for session {session_id}, dropping chunk"
-                    )
-                    return False
-                
-                except Exception as e:
-                    logger.error(
-                        f"Error queuing audio for {session_id}: {e}"
-                    )
-                    raise StreamInterruptedError(f"Failed to queue audio: {e}")
-                
-                # Check if renewal needed
-                if session.should_renew(self.RENEWAL_THRESHOLD_SECONDS):
-                    logger.warning(
-                        f"Session {session_id} approaching timeout, "
-                        "renewal needed"
+                    # Check if renewal needed
+                    if session.should_renew(self.RENEWAL_THRESHOLD_SECONDS):
+                        logger.warning(
+                            f"Session {session_id} approaching timeout, "
+                            "renewal needed"
+                        )
+                        # Renewal will be handled by monitoring thread
+                    
+                    logger.debug(
+                        f"Sent chunk to session {session_id}: "
+                        f"{len(chunk)} bytes "
+                        f"(total: {session.total_chunks_sent} chunks, "
+                        f"{session.total_bytes_sent} bytes)"
                     )
-                    # Renewal will be handled by monitoring thread
-                
-                logger.debug(
-                    f"Sent chunk to session {session_id}: "
-                    f"{len(chunk)} bytes "
-                    f"(total: {session.total_chunks_sent} chunks, "
-                    f"{session.total_bytes_sent} bytes)"
-                )
+                    
+                    return True
                 
-                return True
-            
-            return False
+                return False
             
-        except Exception as e:
-            logger.error(
-                f"Error sending audio chunk to session {session_id}: {e}"
-            )
-            raise
+            except Exception as e:
+                logger.error(
+                    f"Error sending audio chunk to session {session_id}: {e}"
+                )
+                raise
     
     def close_session(self, session_id: str) -> dict:
         """
@@ -410,14 +1061,21 @@ class StreamingSessionManager:
         session = self.get_session(session_id)
         
         try:
+            # Send what is left of fed frames
+            self._flush_rechunker(session_id, session, force=True)
+            if self.batch_preprocessor is not None:
+                self._run_preprocess_tick()
+            self._close_speech_gate(session_id, session)
+            
             session.status = SessionStatus.CLOSING
             
             # Stop result listener thread
             if session.result_listener_thread:
-                # Send sentinel value to stop request generator
-                session.audio_queue.put(None)
-                session.stop_listener.set()
+                # Closing the queue ends the request generator; the listener
+                # drains the final results and exits when the stream ends
+                session.audio_queue.close()
                 session.result_listener_thread.join(timeout=5.0)
+                session.stop_listener.set()
                 if session.result_listener_thread.is_alive():
                     logger.warning(
                         f"Result listener thread for {session_id} "
@@ -440,12 +1098,22 @@ class StreamingSessionManager:
                 "results": session.result_handler.export_results(),
                 "audio_metrics": session.audio_handler.get_metrics(),
             }
+            if session.speech_gate:
+                summary["speech_gate"] = self._speech_gate_stats(session_id, session)
+            if session.frontend:
+                summary["audio_frontend"] = session.frontend.get_stats()
             
             session.status = SessionStatus.CLOSED
             
             # Remove from active sessions
             with self.lock:
                 del self.sessions[session_id]
+            self._unwatch_session(session_id, session)
+            if self.batch_preprocessor is not None:
+                self.batch_preprocessor.remove_session(session_id)
+            
+            if self.metrics_collector:
+                self.metrics_collector.remove_audio_queue(session_id)
             
             logger.info(
                 f"Session closed: {session_id} "
@@ -460,6 +1128,30 @@ class StreamingSessionManager:
             logger.error(f"Error closing session {session_id}: {e}")
             raise
     
+    def close_all_sessions(self) -> Dict[str, dict]:
+        """
+        Close every session and stop the background threads (shutdown).
+        
+        Returns:
+            Session summaries by session ID; sessions that fail to close
+            are logged and left out
+        """
+        with self.lock:
+            session_ids = list(self.sessions)
+        
+        summaries = {}
+        for session_id in session_ids:
+            try:
+                summaries[session_id] = self.close_session(session_id)
+            except SessionNotFoundError:
+                pass  # Closed meanwhile
+            except Exception as e:
+                logger.error(f"Error closing session {session_id}: {e}")
+        
+        self._stop_rechunk_flusher()
+        self._stop_preprocess_ticker()
+        return summaries
+    
     def get_active_sessions(self) -> Dict[str, StreamingSession]:
         """Get all active sessions."""
         with self.lock:
@@ -472,11 +1164,211 @@ class StreamingSessionManager:
         """Get total number of active sessions."""
         return len(self.sessions)
     
+    def get_queue_stats(self) -> Dict[str, dict]:
+        """Get audio queue depth and drop counters per session."""
+        with self.lock:
+            return {
+                sid: s.audio_queue.get_stats()
+                for sid, s in self.sessions.items()
+            }
+    
+    def _new_audio_queue(self) -> AudioSendQueue:
+        """Create a session's bounded audio queue."""
+        return AudioSendQueue(
+            max_ms=self.audio_queue_ms,
+            policy=self.backpressure_policy
+        )
+    
+    def _watch_session(self, session_id: str, session: StreamingSession):
+        """Register a started session's deadlines with the scheduler."""
+        if self.scheduler is None:
+            return
+        self.scheduler.start()
+        # One callback per check for the session's lifetime, so re-arming
+        # allocates nothing long-lived
+        session.deadline_checks = {
+            "renewal": partial(self._check_renewal, session_id, session),
+            "idle": partial(self._check_idle, session_id, session),
+            "stuck": partial(self._check_stuck, session_id, session),
+        }
+        self._rearm("renewal", session_id, session, self.RENEWAL_THRESHOLD_SECONDS)
+        self._rearm("idle", session_id, session, self.idle_timeout_s)
+        self._rearm("stuck", session_id, session, self.stuck_timeout_s)
+    
+    def _rearm(self, kind: str, session_id: str, session: StreamingSession, delay_s: float):
+        """(Re)schedule one of a session's checks."""
+        self.scheduler.schedule((kind, session_id), delay_s, session.deadline_checks[kind])
+    
+    def _unwatch_session(self, session_id: str, session: StreamingSession):
+        """Cancel a session's deadlines."""
+        if self.scheduler is None:
+            return
+        for kind in ("renewal", "idle", "stuck"):
+            self.scheduler.cancel((kind, session_id))
+        session.deadline_checks = {}  # They reference the session
+    
+    def _is_current(self, session_id: str, session: StreamingSession) -> bool:
+        """Whether session is still the registered, active one for session_id."""
+        return (
+            self.sessions.get(session_id) is session
+            and session.status == SessionStatus.ACTIVE
+        )
+    
+    def _check_renewal(self, session_id: str, session: StreamingSession):
+        """Renewal deadline: hand the session to the renewal handler when due."""
+        if not self._is_current(session_id, session):
+            return
+        
+        # Deadlines are re-checked lazily: a renewal resets created_at
+        remaining = self.RENEWAL_THRESHOLD_SECONDS - session.duration()
+        if remaining <= 0:
+            if self.renewal_handler:
+                self.renewal_handler(session_id, session)
+            else:
+                logger.warning(
+                    f"Session {session_id} approaching timeout, "
+                    "renewal needed"
+                )
+            remaining = self.RENEWAL_RETRY_SECONDS
+        
+        self._rearm("renewal", session_id, session, remaining)
+    
+    def _check_idle(self, session_id: str, session: StreamingSession):
+        """Silence deadline: close sessions that stopped sending audio."""
+        if not self._is_current(session_id, session):
+            return
+        
+        remaining = self.idle_timeout_s - session.time_since_last_audio()
+        if remaining > 0:
+            self._rearm("idle", session_id, session, remaining)
+            return
+        
+        logger.info(
+            f"Closing idle session {session_id} "
+            f"(no audio for {session.time_since_last_audio():.0f}s)"
+        )
+        self._close_in_background(session_id)
+    
+    def _check_stuck(self, session_id: str, session: StreamingSession):
+        """Stuck check: restart a stream that stopped taking queued audio."""
+        if not self._is_current(session_id, session):
+            return
+        
+        stalled_s = time.time() - session.last_sent_time
+        if session.audio_queue.qsize() and stalled_s >= self.stuck_timeout_s:
+            logger.warning(
+                f"Stream for {session_id} took no audio for {stalled_s:.0f}s "
+                f"({session.audio_queue.depth_ms:.0f}ms queued), restarting"
+            )
+            self._replace_stuck_stream(session_id, session)
+        
+        self._rearm("stuck", session_id, session, self.stuck_timeout_s)
+    
+    def _replace_stuck_stream(self, session_id: str, session: StreamingSession):
+        """Restart a session's stuck stream, then cancel the stuck one."""
+        stream = session.stream
+        if self._restart_stream(session_id, session, stream) and stream:
+            try:
+                stream.cancel()
+            except Exception as e:
+                logger.warning(f"Error cancelling stuck stream for {session_id}: {e}")
+    
+    def _close_in_background(self, session_id: str):
+        """Close a session off the scheduler thread."""
+        threading.Thread(
+            target=self._close_quietly, args=(session_id,), daemon=True
+        ).start()
+    
+    def _close_quietly(self, session_id: str):
+        """Close a session from a background check."""
+        try:
+            self.close_session(session_id)
+        except SessionNotFoundError:
+            pass  # Closed meanwhile
+        except Exception as e:
+            logger.error(f"Error closing idle session {session_id}: {e}")
+    
+    def _start_rechunk_flusher(self):
+        """Start the thread that flushes overdue partial requests (once)."""
+        if self._rechunk_flusher is not None:
+            return
+        with self.lock:
+            if self._rechunk_flusher is None:
+                # A fresh event per thread, so a stop cannot race a restart
+                self._rechunk_stop = threading.Event()
+                self._rechunk_flusher = threading.Thread(
+                    target=self._rechunk_flush_loop,
+                    args=(self._rechunk_stop,),
+                    name="rechunk-flusher",
+                    daemon=True
+                )
+                self._rechunk_flusher.start()
+    
+    def _stop_rechunk_flusher(self):
+        """Stop the flusher thread; the next fed session starts a new one."""
+        with self.lock:
+            flusher, stop = self._rechunk_flusher, self._rechunk_stop
+            self._rechunk_flusher = None
+        if flusher is not None:
+            stop.set()
+            flusher.join(timeout=5.0)
+    
+    def _rechunk_flush_loop(self, stop: threading.Event):
+        """Poll every session's re-chunker (one thread for all sessions)."""
+        interval = self.rechunk_max_delay_ms / 2000
+        while not stop.wait(interval):
+            with self.lock:
+                sessions = list(self.sessions.items())
+            for session_id, session in sessions:
+                if session.rechunker.pending_bytes:
+                    try:
+                        self._flush_rechunker(session_id, session)
+                    except Exception as e:
+                        logger.error(f"Error flushing audio for {session_id}: {e}")
+    
+    def _flush_rechunker(self, session_id: str, session: StreamingSession, force: bool = False):
+        """Queue a session's overdue (or, with force, any) partial request."""
+        rechunker = session.rechunker
+        if rechunker is None:
+            return
+        with rechunker.lock:
+            chunks = []
+            if force and session.frontend is not None:
+                # End of stream: the resampler's last samples
+                chunks += rechunker.push(session.frontend.flush())
+            if rechunker.pending_bytes:
+                chunk = rechunker.flush() if force else rechunker.poll()
+                chunks += [chunk] if chunk is not None else []
+            if session.status in (SessionStatus.INITIALIZING, SessionStatus.ACTIVE):
+                for chunk in chunks:
+                    self._submit_chunk(session_id, session, chunk)
+    
+    def _close_speech_gate(self, session_id: str, session: StreamingSession):
+        """Drop a closing session's withheld pre-roll (it is never sent)."""
+        gate = session.speech_gate
+        if gate is None:
+            return
+        with gate.lock:
+            dropped = gate.discard()
+        self._record_saved_audio(session_id, dropped / BYTES_PER_MS)
+    
+    def _record_queue_metrics(self, session_id: str, session: StreamingSession, dropped_before: int):
+        """Export a session's queue depth and new drops after a put."""
+        if not self.metrics_collector:
+            return
+        audio_queue = session.audio_queue
+        self.metrics_collector.record_audio_queue(
+            session_id,
+            depth_ms=audio_queue.depth_ms,
+            dropped_chunks=audio_queue.dropped_chunks - dropped_before
+        )
+    
     def _build_streaming_config(
         self,
         language_code: str,
         model: str,
-        enable_interim_results: bool
+        enable_interim_results: bool,
+        audio_encoding: str = "LINEAR16"
     ) -> cloud_speech.RecognitionConfig:
         """
         Build V2 API streaming recognition config.
@@ -485,15 +1377,17 @@ class StreamingSessionManager:
             language_code: Language code (ja-JP)
             model: Speech model (latest_long)
             enable_interim_results: Enable interim results
+            audio_encoding: Encoding of the audio requests
+                (ExplicitDecodingConfig.AudioEncoding name)
             
         Returns:
             RecognitionConfig for V2 streaming API
         """
-        # V2 API audio format config
+        # V2 API audio format config (16kHz mono, whatever the encoding)
         explicit_decoding_config = cloud_speech.ExplicitDecodingConfig(
-            encoding=cloud_speech.ExplicitDecodingConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=16000,
-            audio_channel_count=1,
+            encoding=cloud_speech.ExplicitDecodingConfig.AudioEncoding[audio_encoding],
+            sample_rate_hertz=AudioChunkValidator.SAMPLE_RATE,
+            audio_channel_count=AudioChunkValidator.CHANNELS,
         )
         
         # V2 API recognition features
@@ -513,15 +1407,167 @@ class StreamingSessionManager:
         
         return config
     
-    def _result_listener(self, session_id: str, stream):
+    def _build_config_request(
+        self,
+        language_code: str,
+        model: str,
+        enable_interim_results: bool,
+        audio_encoding: str = "LINEAR16"
+    ) -> cloud_speech.StreamingRecognizeRequest:
+        """
+        Build the first (config-only) request of a streaming call.
+        
+        Args:
+            language_code: Language code (ja-JP)
+            model: Speech model (latest_long)
+            enable_interim_results: Enable interim results
+            audio_encoding: Encoding of the audio requests
+            
+        Returns:
+            StreamingRecognizeRequest with recognizer and streaming config
+        """
+        # Build V2 streaming config
+        config = self._build_streaming_config(
+            language_code=language_code,
+            model=model,
+            enable_interim_results=enable_interim_results,
+            audio_encoding=audio_encoding
+        )
+        
+        # Create recognizer path for V2 API
+        recognizer = f"projects/{self.project_id}/locations/global/recognizers/_"
+        
+        # Create streaming config
+        streaming_config = cloud_speech.StreamingRecognitionConfig(
+            config=config,
+            streaming_features=cloud_speech.StreamingRecognitionFeatures(
+                interim_results=enable_interim_results
+            )
+        )
+        
+        return cloud_speech.StreamingRecognizeRequest(
+            recognizer=recognizer,
+            streaming_config=streaming_config
+        )
+    
+    def _handle_response(
+        self,
+        session_id: str,
+        session: StreamingSession,
+        response,
+        audio_start_ms: float = 0.0
+    ) -> bool:
+        """
+        Dispatch one streaming response to the session's result handler.
+        
+        Word offsets are shifted onto the session audio clock, and words
+        already covered by an earlier final (a renewal overlap heard by
+        both streams) are removed.
+        
+        Args:
+            session_id: Session identifier
+            session: Session receiving the response
+            response: StreamingRecognizeResponse
+            audio_start_ms: Session audio clock at the stream's first byte
+            
+        Returns:
+            False if the response carried an error and listening should stop
+        """
+        # Process each result in the response
+        for result in response.results:
+            if not result.alternatives:
+                continue
+            
+            # Get top alternative
+            alternative = result.alternatives[0]
+            transcript = alternative.transcript
+            confidence = alternative.confidence if hasattr(alternative, 'confidence') else 0.0
+            
+            # Extract word-level timestamps if available
+            shift_s = audio_start_ms / 1000
+            words = []
+            if hasattr(alternative, 'words'):
+                for word_info in alternative.words:
+                    words.append({
+                        "word": word_info.word,
+                        "start_time": word_info.start_offset.total_seconds() + shift_s if hasattr(word_info, 'start_offset') else 0.0,
+                        "end_time": word_info.end_offset.total_seconds() + shift_s if hasattr(word_info, 'end_offset') else 0.0,
+                        "confidence": word_info.confidence if hasattr(word_info, 'confidence') else 0.0,
+                    })
+            
+            # Drop what an earlier final already covered
+            end_ms = audio_start_ms + result.result_end_offset.total_seconds() * 1000
+            if session.final_end_ms and end_ms:
+                if end_ms <= session.final_end_ms + DEDUPE_TOLERANCE_MS:
+                    if result.is_final:
+                        session.duplicate_results += 1
+                        session.duplicate_words += len(words)
+                    continue
+                
+                new_words = [
+                    w for w in words
+                    if w["end_time"] * 1000 > session.final_end_ms + DEDUPE_TOLERANCE_MS
+                ]
+                if len(new_words) < len(words):
+                    if result.is_final:
+                        session.duplicate_words += len(words) - len(new_words)
+                    words = new_words
+                    transcript = self._join_words(words, session)
+            
+            # Handle based on is_final flag
+            if result.is_final:
+                session.final_end_ms = max(session.final_end_ms, end_ms)
+                # Final result
+                session.result_handler.handle_final_result(
+                    text=transcript,
+                    confidence=confidence,
+                    words=words
+                )
+                logger.debug(
+                    f"Final result for {session_id}: "
+                    f"{transcript[:50]}... (confidence: {confidence:.2f})"
+                )
+            else:
+                # Interim result
+                session.result_handler.handle_interim_result(
+                    text=transcript,
+                    confidence=confidence,
+                    words=words
+                )
+                logger.debug(
+                    f"Interim result for {session_id}: "
+                    f"{transcript[:50]}..."
+                )
+        
+        # Check for errors in response
+        if hasattr(response, 'error') and response.error:
+            logger.error(
+                f"Error in streaming response for {session_id}: "
+                f"{response.error}"
+            )
+            session.status = SessionStatus.ERROR
+            return False
+        
+        return True
+    
+    @staticmethod
+    def _join_words(words: List[dict], session: StreamingSession) -> str:
+        """Rebuild a transcript from (trimmed) words."""
+        language = session.stream_config.get("language_code", "")
+        separator = "" if language.split("-")[0] in UNSPACED_LANGUAGES else " "
+        return separator.join(w["word"] for w in words)
+    
+    def _result_listener(self, session_id: str, stream, audio_start_ms: float = 0.0):
         """
         Listen to streaming results from Google Cloud in a separate thread.
         
-        This runs continuously until the session is closed.
+        This runs continuously until the session is closed (or, for a
+        renewed stream, until its requests end).
         
         Args:
             session_id: Session identifier
             stream: gRPC streaming response iterator
+            audio_start_ms: Session audio clock at the stream's first byte
         """
         logger.info(f"Result listener started for session {session_id}")
         
@@ -534,58 +1580,13 @@ class StreamingSessionManager:
                     logger.debug(f"Stop signal received for {session_id}")
                     break
                 
-                # Process each result in the response
-                for result in response.results:
-                    if not result.alternatives:
+                # A renewal's next stream is held until the old one drains
+                with session.renewal_lock:
+                    if stream is session.overlap_stream and session.held_responses is not None:
+                        session.held_responses.append(response)
                         continue
-                    
-                    # Get top alternative
-                    alternative = result.alternatives[0]
-                    transcript = alternative.transcript
-                    confidence = alternative.confidence if hasattr(alternative, 'confidence') else 0.0
-                    
-                    # Extract word-level timestamps if available
-                    words = []
-                    if hasattr(alternative, 'words'):
-                        for word_info in alternative.words:
-                            words.append({
-                                "word": word_info.word,
-                                "start_time": word_info.start_offset.total_seconds() if hasattr(word_info, 'start_offset') else 0.0,
-                                "end_time": word_info.end_offset.total_seconds() if hasattr(word_info, 'end_offset') else 0.0,
-                                "confidence": word_info.confidence if hasattr(word_info, 'confidence') else 0.0,
-                            })
-                    
-                    # Handle based on is_final flag
-                    if result.is_final:
-                        # Final result
-                        session.result_handler.handle_final_result(
-                            text=transcript,
-                            confidence=confidence,
-                            words=words
-                        )
-                        logger.debug(
-                            f"Final result for {session_id}: "
-                            f"{transcript[:50]}... (confidence: {confidence:.2f})"
-                        )
-                    else:
-                        # Interim result
-                        session.result_handler.handle_interim_result(
-                            text=transcript,
-                            confidence=confidence,
-                            words=words
-                        )
-                        logger.debug(
-                            f"Interim result for {session_id}: "
-                            f"{transcript[:50]}..."
-                        )
                 
-                # Check for errors in response
-                if hasattr(response, 'error') and response.error:
-                    logger.error(
-                        f"Error in streaming response for {session_id}: "
-                        f"{response.error}"
-                    )
-                    session.status = SessionStatus.ERROR
+                if not self._handle_response(session_id, session, response, audio_start_ms):
                     break
         
         except google_exceptions.GoogleAPICallError as e:
@@ -594,7 +1595,13 @@ class StreamingSessionManager:
             )
             try:
                 session = self.get_session(session_id)
-                session.status = SessionStatus.ERROR
+                if stream is not session.stream and stream is not session.overlap_stream:
+                    pass  # Superseded by a restart or renewal
+                elif not (
+                    isinstance(e, RECOVERABLE_STREAM_ERRORS)
+                    and self._restart_stream(session_id, session, stream)
+                ):
+                    session.status = SessionStatus.ERROR
             except SessionNotFoundError:
                 pass  # Session already closed
         
@@ -4,16 +4,20 @@ Session Renewal Manager for Long-Running Streaming Sessions.
 Handles:
 - Monitoring session duration
 - Triggering renewal at 4.5 minutes
-- Seamless transition without dropping audio
-- Buffering during renewal
-- Logging renewal events
+- Make-before-break transition: the next stream is opened and hears
+  the same audio for a short overlap before the old one is closed, so
+  no chunk is refused or lost
+- Replaying recent audio into the new stream so words at the boundary
+  are recognized with context
+- De-duplicating replay/overlap results by audio offset
+- Logging renewal events (latency, overlap, duplicates)
 """
 
 import logging
 import time
 import threading
 import queue
-from typing import Optional, Callable, Dict, List
+from typing import Optional, Callable, Dict, List, Set
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -43,6 +47,11 @@ class RenewalEvent:
     buffered_chunks_count: int
     status: RenewalStatus
     error_message: Optional[str] = None
+    open_latency: float = 0.0  # Seconds to open the next stream
+    overlap_audio_ms: float = 0.0  # Audio both streams received
+    replayed_ms: float = 0.0  # Recent audio replayed into the new stream
+    duplicate_results: int = 0  # Overlap finals removed
+    duplicate_words: int = 0  # Overlap words trimmed from finals
     
     def renewal_duration(self) -> float:
         """Get duration of renewal process in seconds."""
@@ -61,12 +70,22 @@ class RenewalEvent:
             "buffered_chunks_count": self.buffered_chunks_count,
             "status": self.status.value,
             "error_message": self.error_message,
+            "open_latency": self.open_latency,
+            "overlap_audio_ms": self.overlap_audio_ms,
+            "replayed_ms": self.replayed_ms,
+            "duplicate_results": self.duplicate_results,
+            "duplicate_words": self.duplicate_words,
         }
 
 
 @dataclass
 class AudioBuffer:
-    """Buffer for audio chunks during session renewal."""
+    """
+    Buffer for audio chunks during session renewal.
+    
+    Holds references only: chunks may be memoryviews into the session's
+    AudioRingBuffer, which must retain at least max_size chunks of audio.
+    """
     chunks: List[bytes] = field(default_factory=list)
     max_size: int = 50  # Maximum chunks to buffer
     total_bytes: int = 0
@@ -94,8 +113,9 @@ class AudioBuffer:
     
     def get_all(self) -> List[bytes]:
         """Get all buffered chunks and clear buffer."""
-        chunks = self.chunks.copy()
-        self.clear()
+        chunks = self.chunks
+        self.chunks = []
+        self.total_bytes = 0
         return chunks
     
     def clear(self):
@@ -126,10 +146,14 @@ class SessionRenewer:
     # Grace period after renewal before allowing another
     RENEWAL_COOLDOWN_SECONDS = 10.0
     
+    # Time both streams receive audio during renewal
+    RENEWAL_OVERLAP_MS = 1000.0
+    
     def __init__(
         self,
         session_manager,
-        renewal_callback: Optional[Callable] = None
+        renewal_callback: Optional[Callable] = None,
+        overlap_ms: float = RENEWAL_OVERLAP_MS
     ):
         """
         Initialize session renewer.
@@ -137,16 +161,24 @@ class SessionRenewer:
         Args:
             session_manager: StreamingSessionManager instance
             renewal_callback: Optional callback when renewal occurs
+            overlap_ms: Time both streams receive audio during renewal
         """
         self.session_manager = session_manager
         self.renewal_callback = renewal_callback
+        self.overlap_ms = overlap_ms
         
         # Track renewal events
         self.renewal_history: List[RenewalEvent] = []
         
-        # Audio buffer for renewal transition
+        # Audio buffers for callers that hold audio during renewal
         self.audio_buffers: Dict[str, AudioBuffer] = {}
         
+        # Sessions with a renewal in progress
+        self.renewing: Set[str] = set()
+        
+        # When each session last renewed (cooldown check)
+        self.last_renewal_at: Dict[str, float] = {}
+        
         # Monitor thread
         self.monitor_thread: Optional[threading.Thread] = None
         self.stop_monitor = threading.Event()
@@ -157,7 +189,18 @@ class SessionRenewer:
         logger.info("SessionRenewer initialized")
     
     def start_monitoring(self):
-        """Start background thread to monitor sessions."""
+        """
+        Start renewing sessions when due.
+        
+        With a session manager that has a DeadlineScheduler, renewals are
+        driven by per-session deadlines; otherwise a background thread
+        polls the active sessions every second.
+        """
+        if getattr(self.session_manager, "scheduler", None) is not None:
+            self.session_manager.renewal_handler = self._on_renewal_due
+            logger.info("Session renewal monitoring started (deadline scheduler)")
+            return
+        
         if self.monitor_thread and self.monitor_thread.is_alive():
             logger.warning("Monitor thread already running")
             return
@@ -173,6 +216,9 @@ class SessionRenewer:
     
     def stop_monitoring(self):
         """Stop monitoring thread."""
+        if getattr(self.session_manager, "renewal_handler", None) == self._on_renewal_due:
+            self.session_manager.renewal_handler = None
+        
         if not self.monitor_thread:
             return
         
@@ -193,13 +239,8 @@ class SessionRenewer:
                 for session_id, session in active_sessions.items():
                     # Check if renewal needed
                     if self._should_renew(session):
-                        logger.info(
-                            f"Session {session_id} needs renewal "
-                            f"(duration: {session.duration():.1f}s)"
-                        )
-                        
-                        # Trigger renewal
-                        self._renew_session(session_id, session)
+                        # Trigger renewal (on its own worker thread)
+                        self._on_renewal_due(session_id, session)
                 
                 # Sleep before next check
                 time.sleep(1.0)
@@ -230,150 +271,135 @@ class SessionRenewer:
         
         # Check cooldown period (prevent rapid renewals)
         if session.renewal_count > 0:
-            # Check last renewal event
-            for event in reversed(self.renewal_history):
-                if event.session_id == session.session_id:
-                    time_since_renewal = time.time() - event.new_session_start
-                    if time_since_renewal < self.RENEWAL_COOLDOWN_SECONDS:
-                        return False
-                    break
+            last_renewal = self.last_renewal_at.get(session.session_id)
+            if last_renewal is not None:
+                time_since_renewal = time.time() - last_renewal
+                if time_since_renewal < self.RENEWAL_COOLDOWN_SECONDS:
+                    return False
         
         return True
     
+    def _on_renewal_due(self, session_id: str, session):
+        """
+        Scheduler (or monitor loop) callback: renew on a worker thread
+        (the overlap takes a while and must not hold up other deadlines
+        or the other sessions' renewals).
+        """
+        if not self._should_renew(session):
+            return
+        with self.lock:
+            if self.is_renewing(session_id):
+                return
+            self.renewing.add(session_id)
+        
+        logger.info(
+            f"Session {session_id} needs renewal "
+            f"(duration: {session.duration():.1f}s)"
+        )
+        threading.Thread(
+            target=self._renew_session,
+            args=(session_id, session),
+            name=f"renew-{session_id}",
+            daemon=True
+        ).start()
+    
     def _renew_session(self, session_id: str, session):
         """
-        Renew a streaming session.
+        Renew a streaming session (make-before-break).
         
         Process:
-        1. Create audio buffer for incoming chunks
-        2. Close old session gracefully
-        3. Wait for all results to arrive
-        4. Open new session with same config
-        5. Send buffered chunks to new session
-        6. Resume normal operation
+        1. Open the next stream while the current one keeps running,
+           primed with the session's most recent audio
+        2. Send every chunk to both streams for the overlap
+        3. Close the old stream and wait for its final results
+        4. Release the next stream's overlap results, de-duplicated
+           against the old stream's finals by audio offset
+        
+        The session stays ACTIVE throughout, so send_audio_chunk() never
+        refuses audio during renewal.
+        
+        The renewer's lock only guards its bookkeeping; renew_stream runs
+        outside it, so sessions falling due together renew in parallel
+        (the renewing set keeps a session from renewing twice at once).
         
         Args:
             session_id: Session identifier
             session: StreamingSession object
         """
-        with self.lock:
-            renewal_start = time.time()
+        renewal_start = time.time()
+        
+        logger.info(
+            f"Starting renewal for session {session_id} "
+            f"(duration: {session.duration():.1f}s, "
+            f"renewal #{session.renewal_count + 1})"
+        )
+        
+        # Create renewal event
+        event = RenewalEvent(
+            session_id=session_id,
+            old_session_start=session.created_at,
+            old_session_duration=session.duration(),
+            new_session_start=0.0,  # Will be set later
+            renewal_trigger_time=renewal_start,
+            renewal_complete_time=0.0,  # Will be set later
+            buffered_chunks_count=0,
+            status=RenewalStatus.PREPARING
+        )
+        
+        try:
+            with self.lock:
+                self.renewing.add(session_id)
+            event.status = RenewalStatus.IN_PROGRESS
             
-            logger.info(
-                f"Starting renewal for session {session_id} "
-                f"(duration: {session.duration():.1f}s, "
-                f"renewal #{session.renewal_count + 1})"
+            stats = self.session_manager.renew_stream(
+                session_id,
+                overlap_ms=self.overlap_ms
             )
             
-            # Create renewal event
-            event = RenewalEvent(
-                session_id=session_id,
-                old_session_start=session.created_at,
-                old_session_duration=session.duration(),
-                new_session_start=0.0,  # Will be set later
-                renewal_trigger_time=renewal_start,
-                renewal_complete_time=0.0,  # Will be set later
-                buffered_chunks_count=0,
-                status=RenewalStatus.PREPARING
+            event.new_session_start = renewal_start + stats["open_latency_s"]
+            with self.lock:
+                self.last_renewal_at[session_id] = event.new_session_start
+            event.open_latency = stats["open_latency_s"]
+            event.overlap_audio_ms = stats["overlap_audio_ms"]
+            event.replayed_ms = stats["replayed_ms"]
+            event.duplicate_results = stats["duplicate_results"]
+            event.duplicate_words = stats["duplicate_words"]
+            
+            # Mark completion
+            event.renewal_complete_time = time.time()
+            event.status = RenewalStatus.COMPLETED
+            
+            logger.info(
+                f"Session renewal completed: {session_id} "
+                f"(took {event.renewal_duration():.2f}s, "
+                f"open latency {event.open_latency * 1000:.0f}ms, "
+                f"{event.duplicate_results} duplicate results)"
             )
             
-            try:
-                # Step 1: Create audio buffer
-                buffer = AudioBuffer(max_size=50)
-                self.audio_buffers[session_id] = buffer
-                event.status = RenewalStatus.IN_PROGRESS
-                
-                logger.debug(f"Audio buffer created for {session_id}")
-                
-                # Step 2: Close old session
-                # Note: During closing, incoming chunks will be buffered
-                old_session_summary = self.session_manager.close_session(
-                    session_id
-                )
-                
-                logger.info(
-                    f"Old session closed: {session_id} "
-                    f"({old_session_summary['session']['total_chunks_sent']} chunks)"
-                )
-                
-                # Step 3: Wait briefly for final results
-                time.sleep(0.5)  # 500ms grace period
-                
-                # Step 4: Create new session with same config
-                new_session = self.session_manager.create_session(
-                    session_id=session_id,
-                    presentation_id=session.presentation_id,
-                )
-                
-                # Start new session
-                self.session_manager.start_session(
-                    session_id=session_id,
-                    language_code="ja-JP",
-                    model="latest_long",
-                    enable_interim_results=True
-                )
-                
-                event.new_session_start = time.time()
-                new_session.renewal_count = session.renewal_count + 1
-                
-                logger.info(
-                    f"New session started: {session_id} "
-                    f"(renewal #{new_session.renewal_count})"
-                )
-                
-                # Step 5: Send buffered chunks
-                buffered_chunks = buffer.get_all()
-                event.buffered_chunks_count = len(buffered_chunks)
-                
-                if buffered_chunks:
-                    logger.info(
-                        f"Sending {len(buffered_chunks)} buffered chunks "
-                        f"to new session {session_id}"
+            # Invoke callback
+            if self.renewal_callback:
+                try:
+                    self.renewal_callback(event)
+                except Exception as e:
+                    logger.error(
+                        f"Error in renewal callback: {e}",
+                        exc_info=True
                     )
-                    
-                    for chunk in buffered_chunks:
-                        self.session_manager.send_audio_chunk(
-                            session_id, chunk
-                        )
-                
-                # Step 6: Clean up buffer
-                del self.audio_buffers[session_id]
-                
-                # Mark completion
-                event.renewal_complete_time = time.time()
-                event.status = RenewalStatus.COMPLETED
-                
-                logger.info(
-                    f"Session renewal completed: {session_id} "
-                    f"(took {event.renewal_duration():.2f}s, "
-                    f"buffered {event.buffered_chunks_count} chunks)"
-                )
-                
-                # Invoke callback
-                if self.renewal_callback:
-                    try:
-                        self.renewal_callback(event)
-                    except Exception as e:
-                        logger.error(
-                            f"Error in renewal callback: {e}",
-                            exc_info=True
-                        )
+        
+        except Exception as e:
+            event.status = RenewalStatus.FAILED
+            event.error_message = str(e)
+            event.renewal_complete_time = time.time()
             
-            except Exception as e:
-                event.status = RenewalStatus.FAILED
-                event.error_message = str(e)
-                event.renewal_complete_time = time.time()
-                
-                logger.error(
-                    f"Session renewal failed for {session_id}: {e}",
-                    exc_info=True
-                )
+            logger.error(
+                f"Session renewal failed for {session_id}: {e}",
+                exc_info=True
+            )
+        
+        finally:
+            with self.lock:
+                self.renewing.discard(session_id)
                 
-                # Clean up buffer on error
-                if session_id in self.audio_buffers:
-                    del self.audio_buffers[session_id]
-            
-            finally:
                 # Record event
                 self.renewal_history.append(event)
     
@@ -381,8 +407,8 @@ class SessionRenewer:
         """
         Buffer audio chunk during renewal.
         
-        This is called by the session manager when a session is being renewed
-        and cannot accept new chunks temporarily.
+        Renewal is make-before-break, so the session manager never needs
+        this; it remains for callers that hold audio back themselves.
         
         Args:
             session_id: Session identifier
@@ -399,7 +425,7 @@ class SessionRenewer:
     
     def is_renewing(self, session_id: str) -> bool:
         """Check if session is currently renewing."""
-        return session_id in self.audio_buffers
+        return session_id in self.renewing or session_id in self.audio_buffers
     
     def get_renewal_history(
         self,
@@ -430,6 +456,10 @@ class SessionRenewer:
                 "failed_renewals": 0,
                 "avg_renewal_duration": 0.0,
                 "avg_buffered_chunks": 0.0,
+                "avg_open_latency": 0.0,
+                "max_open_latency": 0.0,
+                "duplicate_results": 0,
+                "duplicate_words": 0,
             }
         
         successful = [
@@ -453,4 +483,13 @@ class SessionRenewer:
                 sum(e.buffered_chunks_count for e in successful) / len(successful)
                 if successful else 0.0
             ),
+            "avg_open_latency": (
+                sum(e.open_latency for e in successful) / len(successful)
+                if successful else 0.0
+            ),
+            "max_open_latency": max(
+                (e.open_latency for e in successful), default=0.0
+            ),
+            "duplicate_results": sum(e.duplicate_results for e in successful),
+            "duplicate_words": sum(e.duplicate_words for e in successful),
         }
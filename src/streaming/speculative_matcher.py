@@ -0,0 +1,247 @@
+"""
+Speculative slide matching on interim results.
+
+Finals can arrive seconds after the speaker has moved on, so interim
+results are matched speculatively in a background thread:
+- Debounced: a burst of interims is matched once, after a quiet period
+  (or after max_delay_ms if interims never pause)
+- Throttled: at most one match every min_interval_ms per session
+- Superseded: every new interim (and every final) bumps a generation
+  counter; results of older generations are dropped, never emitted
+- Reused: matching work is kept in a per-utterance cache that the final
+  result's match picks up (fuzzy matches of keywords already seen, the
+  embedding of an identical interim)
+
+Speculative matches never change temporal smoothing state; only finals
+commit slide switches.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from ..matching.score_combiner import MatchResult
+from ..slide_processing import SlideProcessor, MatchingError
+
+logger = logging.getLogger(__name__)
+
+
+class SpeculativeMatcher:
+    """
+    Debounced, cancellable background matcher for interim results.
+
+    Example:
+        speculative = SpeculativeMatcher(processor, on_match=show_slide)
+        speculative.submit(interim_text)          # per interim
+        cache = speculative.finalize()            # on final
+        processor.match_segment(final_text, work_cache=cache)
+    """
+
+    def __init__(
+        self,
+        slide_processor: SlideProcessor,
+        on_match: Callable[[int, Optional[MatchResult]], None],
+        debounce_ms: float = 150.0,
+        max_delay_ms: float = 600.0,
+        min_interval_ms: float = 400.0,
+        min_chars: int = 4
+    ):
+        """
+        Initialize speculative matcher.
+
+        Args:
+            slide_processor: Processor with a built deck
+            on_match: Called from the worker thread with (generation, MatchResult
+                or None) for every speculative match that is still current
+            debounce_ms: Quiet period after the latest interim before matching
+            max_delay_ms: Match anyway once an interim has waited this long
+            min_interval_ms: Minimum time between speculative matches
+            min_chars: Interims shorter than this are not matched
+        """
+        self.slide_processor = slide_processor
+        self.on_match = on_match
+        self.debounce_s = debounce_ms / 1000
+        self.max_delay_s = max_delay_ms / 1000
+        self.min_interval_s = min_interval_ms / 1000
+        self.min_chars = min_chars
+
+        self.generation = 0
+        self.work_cache: Dict = {}
+
+        self._cond = threading.Condition()
+        self._pending: Optional[Tuple[int, str, Optional[float]]] = None
+        self._pending_since = 0.0
+        self._last_submit = 0.0
+        self._last_run = float('-inf')
+        self._last_text: Optional[str] = None
+        self._last_match = None
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Counters
+        self.submitted = 0
+        self.matched = 0
+        self.superseded = 0
+        self.coalesced = 0
+        self.skipped = 0
+
+    def submit(self, text: str, timestamp: Optional[float] = None) -> int:
+        """
+        Queue an interim for speculative matching.
+
+        Replaces any interim still waiting; a match already running for
+        an older interim is discarded when it finishes.
+
+        Args:
+            text: Interim transcript
+            timestamp: Optional timestamp for the match
+
+        Returns:
+            Generation number of this interim
+        """
+        with self._cond:
+            self.generation += 1
+            self.submitted += 1
+
+            if len(text.strip()) < self.min_chars:
+                self.skipped += 1
+                if self._pending is not None:
+                    self.superseded += 1
+                    self._pending = None
+                return self.generation
+
+            now = time.monotonic()
+            if self._pending is None:
+                self._pending_since = now
+            else:
+                self.coalesced += 1
+            self._pending = (self.generation, text, timestamp)
+            self._last_submit = now
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="speculative-matcher",
+                    daemon=True
+                )
+                self._thread.start()
+
+            self._cond.notify()
+            return self.generation
+
+    def finalize(self) -> Dict:
+        """
+        End the current utterance (call when its final result arrives).
+
+        Supersedes pending and in-flight interim matches and hands over
+        the utterance's work cache for the final match.
+
+        Returns:
+            Work cache to pass to SlideProcessor.match_segment()
+        """
+        with self._cond:
+            self.generation += 1
+            if self._pending is not None:
+                self.superseded += 1
+                self._pending = None
+
+            cache = self.work_cache
+            self.work_cache = {}
+            self._last_text = None
+            self._last_match = None
+            return cache
+
+    def is_current(self, generation: int) -> bool:
+        """Whether no newer interim or final has arrived since generation"""
+        return generation == self.generation
+
+    def close(self, timeout: float = 1.0):
+        """Stop the worker thread"""
+        with self._cond:
+            self._stopping = True
+            self._pending = None
+            self._cond.notify()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def _next_job(self) -> Optional[Tuple[int, str, Optional[float], Dict]]:
+        """Wait until the pending interim is due (called without the lock)"""
+        with self._cond:
+            while not self._stopping:
+                if self._pending is None:
+                    self._cond.wait()
+                    continue
+
+                due = max(
+                    min(self._last_submit + self.debounce_s,
+                        self._pending_since + self.max_delay_s),
+                    self._last_run + self.min_interval_s
+                )
+                remaining = due - time.monotonic()
+                if remaining <= 0:
+                    generation, text, timestamp = self._pending
+                    self._pending = None
+                    return generation, text, timestamp, self.work_cache
+                self._cond.wait(remaining)
+
+            return None
+
+    def _run(self):
+        """Worker loop"""
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            generation, text, timestamp, work_cache = job
+
+            unchanged = text == self._last_text
+            if unchanged:
+                # Same text as the last match (e.g. only stability changed)
+                match = self._last_match
+            else:
+                try:
+                    match = self.slide_processor.peek_segment(
+                        text,
+                        timestamp,
+                        work_cache=work_cache
+                    )
+                except MatchingError as e:
+                    logger.warning(f"Speculative match failed: {e}")
+                    continue
+
+            with self._cond:
+                self._last_run = time.monotonic()
+                if generation != self.generation:
+                    self.superseded += 1
+                    continue
+                if unchanged:
+                    self.skipped += 1
+                self._last_text = text
+                self._last_match = match
+                self.matched += 1
+
+            try:
+                self.on_match(generation, match)
+            except Exception as e:
+                logger.error(f"Error in speculative match callback: {e}", exc_info=True)
+
+    def get_stats(self) -> Dict:
+        """
+        Get speculative matching counters.
+
+        Returns:
+            dict with submitted, matched, superseded, coalesced and skipped
+            interim counts, and cached keyword/embedding entries
+        """
+        return {
+            'submitted': self.submitted,
+            'matched': self.matched,
+            'superseded': self.superseded,
+            'coalesced': self.coalesced,
+            'skipped': self.skipped,
+            'cached_keywords': len(self.work_cache.get('fuzzy', {})),
+            'cached_embeddings': len(self.work_cache.get('embeddings', {})),
+        }
@@ -0,0 +1,184 @@
+"""
+VAD-gated sending of session audio.
+
+Streaming bills every second of audio sent, including long pauses. The
+gate runs each chunk through an AudioPreprocessor and only lets speech
+through:
+- Chunks the VAD does not mark as speech are withheld; the most recent
+  preroll_ms of them are kept and sent ahead of the first speech chunk,
+  so onsets the VAD confirms late (min_speech_duration) are not clipped
+- The VAD's min_silence_duration acts as hangover: speech state, and
+  sending, continue into short pauses so the recognizer still sees the
+  silence that ends an utterance
+- During long silences one chunk goes out every keepalive_interval_s so
+  the stream does not hit its silence timeout
+
+Withheld audio is never written to the session ring buffer or queue, so
+the session audio clock (and replay after renewals/restarts) covers only
+audio the recognizer actually heard.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Union
+
+from .audio_preprocessing import AudioPreprocessor
+
+logger = logging.getLogger(__name__)
+
+
+class SpeechGate:
+    """
+    Withholds silence from a session's stream.
+
+    Not thread-safe by itself; callers hold `lock` around process() and
+    around queueing what it returns.
+    """
+
+    def __init__(
+        self,
+        preprocessor: Optional[AudioPreprocessor] = None,
+        preroll_ms: float = 500.0,
+        keepalive_interval_s: Optional[float] = 5.0,
+        sample_rate: int = 16000,
+        bytes_per_sample: int = 2
+    ):
+        """
+        Initialize speech gate.
+
+        Args:
+            preprocessor: Per-session preprocessing for process(); its VAD
+                decides what is sent (default: VAD only, since AGC ahead of
+                an energy VAD lifts background noise over the speech
+                threshold). Not needed when chunks come preprocessed
+                through admit().
+            preroll_ms: Withheld audio sent ahead of speech onsets
+            keepalive_interval_s: Longest gap between sent chunks during
+                silence (None disables keep-alives)
+            sample_rate: Audio sample rate (mono)
+            bytes_per_sample: Bytes per sample (2 for LINEAR16)
+        """
+        self.preprocessor = preprocessor
+        self.bytes_per_ms = sample_rate * bytes_per_sample / 1000
+        self.preroll_bytes = int(preroll_ms * self.bytes_per_ms)
+        self.keepalive_interval_s = keepalive_interval_s
+
+        self.lock = threading.Lock()
+
+        self._preroll: Deque[bytes] = deque()
+        self._preroll_size = 0
+        self._last_sent: Optional[float] = None
+
+        # Counters (bytes)
+        self.speech_bytes = 0
+        self.preroll_sent_bytes = 0
+        self.keepalive_bytes = 0
+        self.saved_bytes = 0  # Withheld and never sent
+
+    def process(self, chunk: Union[bytes, memoryview], now: Optional[float] = None) -> List[bytes]:
+        """
+        Gate one chunk.
+
+        Args:
+            chunk: LINEAR16 audio
+            now: Arrival time (default: time.monotonic())
+
+        Returns:
+            Chunks to send now, in order (possibly none)
+        """
+        if self.preprocessor is None:
+            self.preprocessor = AudioPreprocessor(enable_vad=True, enable_agc=False)
+        processed, activity = self.preprocessor.process_chunk(chunk)
+        return self.admit(processed, self.preprocessor.should_send_chunk(activity), now)
+
+    def admit(
+        self,
+        processed: Union[bytes, memoryview],
+        is_speech: bool,
+        now: Optional[float] = None
+    ) -> List[bytes]:
+        """
+        Gate a chunk that was already preprocessed (e.g. by a
+        BatchPreprocessor shared by all sessions).
+
+        Args:
+            processed: Preprocessed LINEAR16 audio
+            is_speech: Whether the VAD passes it (SPEECH state)
+            now: Arrival time (default: time.monotonic())
+
+        Returns:
+            Chunks to send now, in order (possibly none)
+        """
+        now = time.monotonic() if now is None else now
+        if self._last_sent is None:
+            self._last_sent = now
+        processed = bytes(processed)
+
+        if is_speech:
+            chunks = list(self._preroll)
+            self.preroll_sent_bytes += self._preroll_size
+            self._preroll.clear()
+            self._preroll_size = 0
+
+            chunks.append(processed)
+            self.speech_bytes += len(processed)
+            self._last_sent = now
+            return chunks
+
+        if self.keepalive_interval_s is not None and now - self._last_sent >= self.keepalive_interval_s:
+            # Older withheld audio is not sent after this one
+            self.discard()
+            self.keepalive_bytes += len(processed)
+            self._last_sent = now
+            return [processed]
+
+        self._preroll.append(processed)
+        self._preroll_size += len(processed)
+        while self._preroll_size > self.preroll_bytes and self._preroll:
+            evicted = self._preroll.popleft()
+            self._preroll_size -= len(evicted)
+            self.saved_bytes += len(evicted)
+        return []
+
+    def discard(self) -> int:
+        """
+        Drop withheld pre-roll audio (e.g. when the session closes).
+
+        Returns:
+            Bytes dropped
+        """
+        dropped = self._preroll_size
+        self.saved_bytes += dropped
+        self._preroll.clear()
+        self._preroll_size = 0
+        return dropped
+
+    @property
+    def saved_ms(self) -> float:
+        return self.saved_bytes / self.bytes_per_ms
+
+    def get_stats(self) -> Dict:
+        """
+        Get gating statistics.
+
+        Returns:
+            dict with audio sent as speech, pre-roll and keep-alive, audio
+            saved (withheld and never sent), the share of audio saved and
+            the VAD statistics
+        """
+        sent = self.speech_bytes + self.preroll_sent_bytes + self.keepalive_bytes
+        total = sent + self.saved_bytes + self._preroll_size
+        return {
+            'speech_ms': self.speech_bytes / self.bytes_per_ms,
+            'preroll_ms': self.preroll_sent_bytes / self.bytes_per_ms,
+            'keepalive_ms': self.keepalive_bytes / self.bytes_per_ms,
+            'saved_ms': self.saved_ms,
+            'withheld_ms': self._preroll_size / self.bytes_per_ms,
+            'saved_ratio': self.saved_bytes / total if total else 0.0,
+            'vad': (
+                self.preprocessor.vad.get_stats()
+                if self.preprocessor and self.preprocessor.vad else {}
+            ),
+        }
@@ -0,0 +1,369 @@
+"""
+Fake Speech-to-Text V2 streaming clients for tests and load tests.
+
+Drop-in stand-ins for SpeechClient / SpeechAsyncClient.streaming_recognize
+that need no credentials or network. Results are derived from the audio
+itself, so pipelines can be exercised end to end:
+- Speech is any chunk whose RMS reaches speech_rms; silence is ignored
+- Speech produces words at words_per_second from a fixed vocabulary
+- Interim results every interim_interval_s of speech
+- A final result after endpoint_silence_s of silence or max_utterance_s
+  of speech, and for any pending words when the request stream ends
+- result_end_offset and word offsets follow the audio clock (audio
+  received on this stream), like the real API
+- Audio is decoded as the stream's ExplicitDecodingConfig says
+  (LINEAR16, MULAW, FLAC or OGG_OPUS; see StreamingAudioDecoder)
+- Optionally the first stream aborts after fail_after_s of audio, as
+  real streams do on server errors or the ~5 minute limit, or stops
+  taking requests after stall_after_s, like a hung call
+
+The sync client consumes requests on its own thread, as grpc does for
+streaming calls, so thread counts in load tests are realistic.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+from collections import deque
+from datetime import timedelta
+from typing import Deque, List, Optional, Tuple
+
+import numpy as np
+from google.api_core import exceptions as google_exceptions
+from google.cloud.speech_v2.types import cloud_speech
+
+from src.streaming.audio_encoder import STREAMING_ENCODINGS, StreamingAudioDecoder
+
+logger = logging.getLogger(__name__)
+
+
+# Words emitted in order for detected speech
+FAKE_VOCABULARY = (
+    "本日は", "機械学習", "の", "基本", "について", "説明", "します",
+    "データ", "から", "パターン", "を", "学習", "する", "モデル", "です",
+)
+
+_END = object()
+
+
+class FakeRecognizerModel:
+    """
+    Turns a LINEAR16 (or set_encoding()) audio byte stream into streaming
+    responses.
+    """
+
+    def __init__(self,
+                 sample_rate: int = 16000,
+                 speech_rms: float = 300.0,
+                 words_per_second: float = 3.0,
+                 interim_interval_s: float = 0.5,
+                 endpoint_silence_s: float = 0.6,
+                 max_utterance_s: float = 5.0,
+                 fail_after_s: Optional[float] = None):
+        """
+        Initialize fake recognizer.
+
+        Args:
+            sample_rate: Audio sample rate (16-bit mono)
+            speech_rms: Chunk RMS (int16 units) at or above which a chunk is speech
+            words_per_second: Word rate during speech
+            interim_interval_s: Seconds of speech between interim results
+            endpoint_silence_s: Silence that ends an utterance
+            max_utterance_s: Speech after which a final is forced
+            fail_after_s: Raise Aborted once this much audio was received
+        """
+        self.sample_rate = sample_rate
+        self.speech_rms = speech_rms
+        self.word_duration_s = 1.0 / words_per_second
+        self.interim_interval_s = interim_interval_s
+        self.endpoint_silence_s = endpoint_silence_s
+        self.max_utterance_s = max_utterance_s
+        self.fail_after_s = fail_after_s
+
+        # Audio clock: seconds of audio received on this stream
+        self.audio_offset_s = 0.0
+        self.decoder = StreamingAudioDecoder("LINEAR16", sample_rate)
+
+        self._words: List[Tuple[str, float, float]] = []  # (word, start, end)
+        self._word_index = 0
+        self._speech_carry = 0.0
+        self._silence_run = 0.0
+        self._since_interim = 0.0
+
+        # Counters
+        self.audio_bytes = 0  # As received (encoded)
+        self.interim_count = 0
+        self.final_count = 0
+
+    def set_encoding(self, encoding: str):
+        """
+        Decode this stream's audio as encoding (ExplicitDecodingConfig name).
+
+        Args:
+            encoding: One of STREAMING_ENCODINGS; anything else is LINEAR16
+        """
+        if encoding not in STREAMING_ENCODINGS:
+            encoding = "LINEAR16"
+        self.decoder = StreamingAudioDecoder(encoding, self.sample_rate)
+
+    def feed(self, audio: bytes) -> List[cloud_speech.StreamingRecognizeResponse]:
+        """
+        Process one audio request.
+
+        Args:
+            audio: Request audio in the stream's encoding
+
+        Returns:
+            Responses triggered by this audio (possibly none)
+
+        Raises:
+            google.api_core.exceptions.Aborted: After fail_after_s of audio
+        """
+        if self.fail_after_s is not None and self.audio_offset_s >= self.fail_after_s:
+            raise google_exceptions.Aborted("Fake stream aborted")
+
+        samples, duration = self.decoder.decode(audio)
+        self.audio_bytes += len(audio)
+        self.audio_offset_s += duration
+
+        if samples.size == 0:
+            return []
+
+        rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float32))))
+        responses = []
+
+        if rms >= self.speech_rms:
+            self._silence_run = 0.0
+            self._speech_carry += duration
+            self._since_interim += duration
+
+            while self._speech_carry >= self.word_duration_s:
+                self._speech_carry -= self.word_duration_s
+                end = self.audio_offset_s - self._speech_carry
+                word = FAKE_VOCABULARY[self._word_index % len(FAKE_VOCABULARY)]
+                self._word_index += 1
+                self._words.append((word, end - self.word_duration_s, end))
+
+            if self._words and self._words[-1][2] - self._words[0][1] >= self.max_utterance_s:
+                responses.append(self._finalize())
+            elif self._words and self._since_interim >= self.interim_interval_s:
+                self._since_interim = 0.0
+                responses.append(self._response(is_final=False))
+        else:
+            self._silence_run += duration
+            if self._words and self._silence_run >= self.endpoint_silence_s:
+                responses.append(self._finalize())
+
+        return responses
+
+    def flush(self) -> List[cloud_speech.StreamingRecognizeResponse]:
+        """Final result for pending words when the request stream ends"""
+        if not self._words:
+            return []
+        return [self._finalize()]
+
+    def _finalize(self) -> cloud_speech.StreamingRecognizeResponse:
+        response = self._response(is_final=True)
+        self._words = []
+        self._speech_carry = 0.0
+        self._since_interim = 0.0
+        return response
+
+    def _response(self, is_final: bool) -> cloud_speech.StreamingRecognizeResponse:
+        if is_final:
+            self.final_count += 1
+        else:
+            self.interim_count += 1
+
+        alternative = cloud_speech.SpeechRecognitionAlternative(
+            transcript="".join(word for word, _, _ in self._words),
+            confidence=0.9 if is_final else 0.0,
+            words=[
+                cloud_speech.WordInfo(
+                    word=word,
+                    start_offset=timedelta(seconds=start),
+                    end_offset=timedelta(seconds=end),
+                    confidence=0.9,
+                )
+                for word, start, end in self._words
+            ],
+        )
+        return cloud_speech.StreamingRecognizeResponse(results=[
+            cloud_speech.StreamingRecognitionResult(
+                alternatives=[alternative],
+                is_final=is_final,
+                stability=0.0 if is_final else 0.8,
+                result_end_offset=timedelta(seconds=self.audio_offset_s),
+            )
+        ])
+
+
+class FakeStreamingCall:
+    """
+    Sync streaming call: iterate for responses, cancel() to abort.
+
+    A daemon thread consumes the request iterator (like grpc's request
+    consumer thread) and queues responses.
+    """
+
+    def __init__(self, requests, model: FakeRecognizerModel, stall_after_s: Optional[float] = None):
+        self.model = model
+        self.stall_after_s = stall_after_s
+        self.config: Optional[cloud_speech.StreamingRecognitionConfig] = None
+        self._responses: queue.Queue = queue.Queue()
+        self._cancelled = threading.Event()
+        self._consumer = threading.Thread(
+            target=self._consume,
+            args=(iter(requests),),
+            name="fake-stt-requests",
+            daemon=True
+        )
+        self._consumer.start()
+
+    def _consume(self, requests):
+        try:
+            for request in requests:
+                if self._cancelled.is_set():
+                    break
+                if 'streaming_config' in request:
+                    self.config = request.streaming_config
+                    self.model.set_encoding(self.config.config.explicit_decoding_config.encoding.name)
+                    continue
+                for response in self.model.feed(request.audio):
+                    self._responses.put(response)
+                if self.stall_after_s is not None and self.model.audio_offset_s >= self.stall_after_s:
+                    self._cancelled.wait()  # Hung: no more requests until cancelled
+
+            if not self._cancelled.is_set():
+                for response in self.model.flush():
+                    self._responses.put(response)
+        except google_exceptions.GoogleAPICallError as e:
+            self._responses.put(e)  # Raised to the reader, like grpc
+        except Exception as e:
+            logger.error(f"Fake recognizer request stream failed: {e}")
+        finally:
+            self._responses.put(_END)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> cloud_speech.StreamingRecognizeResponse:
+        if self._cancelled.is_set():
+            raise StopIteration
+        item = self._responses.get()
+        if item is _END:
+            raise StopIteration
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def cancel(self) -> bool:
+        self._cancelled.set()
+        self._responses.put(_END)
+        return True
+
+
+class FakeAsyncStreamingCall:
+    """
+    Async streaming call: async-iterate for responses, cancel() to abort.
+
+    Requests are pulled from the async request iterator as responses are
+    consumed, on the caller's event loop (no threads).
+    """
+
+    def __init__(self, requests, model: FakeRecognizerModel, stall_after_s: Optional[float] = None):
+        self.model = model
+        self.stall_after_s = stall_after_s
+        self.config: Optional[cloud_speech.StreamingRecognitionConfig] = None
+        self._requests = requests.__aiter__()
+        self._pending: Deque[cloud_speech.StreamingRecognizeResponse] = deque()
+        self._exhausted = False
+        self._cancelled = asyncio.Event()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> cloud_speech.StreamingRecognizeResponse:
+        while not self._pending:
+            if self._exhausted or self._cancelled.is_set():
+                raise StopAsyncIteration
+            if self.stall_after_s is not None and self.model.audio_offset_s >= self.stall_after_s:
+                await self._cancelled.wait()  # Hung: no more requests until cancelled
+                continue
+            try:
+                request = await self._requests.__anext__()
+            except StopAsyncIteration:
+                self._exhausted = True
+                self._pending.extend(self.model.flush())
+                continue
+
+            if 'streaming_config' in request:
+                self.config = request.streaming_config
+                self.model.set_encoding(self.config.config.explicit_decoding_config.encoding.name)
+                continue
+            self._pending.extend(self.model.feed(request.audio))
+
+        return self._pending.popleft()
+
+    def cancel(self) -> bool:
+        self._cancelled.set()
+        return True
+
+
+class FakeSpeechClient:
+    """Stand-in for SpeechClient (streaming_recognize only)"""
+
+    def __init__(self,
+                 fail_after_s: Optional[float] = None,
+                 stall_after_s: Optional[float] = None,
+                 **model_options):
+        """
+        Args:
+            fail_after_s: Abort the first stream after this much audio
+            stall_after_s: Stop consuming the first stream's requests
+                after this much audio
+            **model_options: FakeRecognizerModel options for every stream
+        """
+        self.fail_after_s = fail_after_s
+        self.stall_after_s = stall_after_s
+        self.model_options = model_options
+        self.calls: List[FakeStreamingCall] = []
+
+    def streaming_recognize(self, requests=None, **kwargs) -> FakeStreamingCall:
+        first = not self.calls
+        model = FakeRecognizerModel(
+            fail_after_s=self.fail_after_s if first else None, **self.model_options
+        )
+        call = FakeStreamingCall(requests, model, stall_after_s=self.stall_after_s if first else None)
+        self.calls.append(call)
+        return call
+
+
+class FakeSpeechAsyncClient:
+    """Stand-in for SpeechAsyncClient (streaming_recognize only)"""
+
+    def __init__(self,
+                 fail_after_s: Optional[float] = None,
+                 stall_after_s: Optional[float] = None,
+                 **model_options):
+        """
+        Args:
+            fail_after_s: Abort the first stream after this much audio
+            stall_after_s: Stop consuming the first stream's requests
+                after this much audio
+            **model_options: FakeRecognizerModel options for every stream
+        """
+        self.fail_after_s = fail_after_s
+        self.stall_after_s = stall_after_s
+        self.model_options = model_options
+        self.calls: List[FakeAsyncStreamingCall] = []
+
+    async def streaming_recognize(self, requests=None, **kwargs) -> FakeAsyncStreamingCall:
+        first = not self.calls
+        model = FakeRecognizerModel(
+            fail_after_s=self.fail_after_s if first else None, **self.model_options
+        )
+        call = FakeAsyncStreamingCall(requests, model, stall_after_s=self.stall_after_s if first else None)
+        self.calls.append(call)
+        return call
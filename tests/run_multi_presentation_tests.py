@@ -16,9 +16,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 # Import E2EMatchingTest directly
-test_file = Path(__file__).parent / 'test_phase4_e2e_matching.py'
+test_file = Path(__file__).parent / 'test_slide_matching_algorithm.py'
 import importlib.util
-spec = importlib.util.spec_from_file_location("test_phase4_e2e_matching", test_file)
+spec = importlib.util.spec_from_file_location("test_slide_matching_algorithm", test_file)
 test_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(test_module)
 E2EMatchingTest = test_module.E2EMatchingTest
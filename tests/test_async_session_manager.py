@@ -0,0 +1,346 @@
+"""
+Test Asyncio Streaming Session Manager
+
+Tests the fake recognizer and the asyncio session manager against the
+threaded manager, without Google Cloud credentials.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.fake_recognizer import FakeRecognizerModel, FakeSpeechClient, FakeSpeechAsyncClient
+from src.streaming.session_manager import StreamingSessionManager
+from src.streaming.async_session_manager import AsyncStreamingSessionManager
+from src.streaming.deadline_scheduler import AsyncDeadlineScheduler, DeadlineScheduler
+
+
+SAMPLE_RATE = 16000
+CHUNK_MS = 100
+
+
+def _chunk(speech: bool) -> bytes:
+    """100ms chunk of a 220Hz tone or silence"""
+    t = np.arange(SAMPLE_RATE * CHUNK_MS // 1000) / SAMPLE_RATE
+    amplitude = 3000 if speech else 0
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.int16).tobytes()
+
+
+def _talk(utterances=3, speech_s=2.0, pause_s=1.0):
+    """Chunks for utterances separated by pauses"""
+    chunks = []
+    for _ in range(utterances):
+        chunks += [_chunk(True)] * int(speech_s * 1000 / CHUNK_MS)
+        chunks += [_chunk(False)] * int(pause_s * 1000 / CHUNK_MS)
+    return chunks
+
+
+def test_fake_recognizer_follows_audio():
+    """Test 1: Speech yields interims and finals on the audio clock; silence yields nothing"""
+    print("\n" + "="*60)
+    print("TEST 1: Fake Recognizer")
+    print("="*60)
+
+    model = FakeRecognizerModel()
+    responses = []
+    for chunk in [_chunk(False)] * 20:
+        responses += model.feed(chunk)
+    assert responses == []
+
+    for chunk in _talk(utterances=2):
+        responses += model.feed(chunk)
+
+    finals = [r.results[0] for r in responses if r.results[0].is_final]
+    interims = [r.results[0] for r in responses if not r.results[0].is_final]
+    assert len(finals) == 2
+    assert interims
+
+    first_words = finals[0].alternatives[0].words
+    assert len(first_words) == 6
+    assert abs(first_words[0].start_offset.total_seconds() - 2.0) < 1e-6
+    assert abs(first_words[-1].end_offset.total_seconds() - 4.0) < 1e-6
+    assert abs(model.audio_offset_s - 8.0) < 1e-6
+
+    print(f"✅ {len(interims)} interims, {len(finals)} finals: {finals[0].alternatives[0].transcript}")
+
+
+def test_async_manager_session_lifecycle():
+    """Test 2: Async manager streams audio and drains finals on close"""
+    print("\n" + "="*60)
+    print("TEST 2: Async Session Lifecycle")
+    print("="*60)
+
+    results = []
+
+    async def run():
+        manager = AsyncStreamingSessionManager(
+            project_id="test-project",
+            result_callback=results.append,
+            client=FakeSpeechAsyncClient()
+        )
+        manager.create_session("s1", "p1")
+        assert await manager.start_session("s1")
+        assert manager.get_session_count() == 1
+
+        # Last utterance has no trailing pause: its final comes from close
+        for chunk in _talk(utterances=3)[:-10]:
+            assert await manager.send_audio_chunk("s1", chunk)
+            await asyncio.sleep(0)
+
+        summary = await manager.close_session("s1")
+        assert manager.get_session_count() == 0
+        return manager, summary
+
+    manager, summary = asyncio.run(run())
+
+    finals = [r for r in results if r.is_final]
+    assert len(finals) == 3
+    assert summary["session"]["total_chunks_sent"] == 80
+    assert manager.client.calls[0].config.config.language_codes == ["ja-JP"]
+
+    print(f"✅ {len(finals)} finals, {len(results) - len(finals)} interims")
+
+
+def test_async_matches_threaded_manager():
+    """Test 3: Async and threaded managers produce the same transcripts"""
+    print("\n" + "="*60)
+    print("TEST 3: Async vs Threaded Transcripts")
+    print("="*60)
+
+    chunks = _talk(utterances=4)
+    session_ids = [f"s{i}" for i in range(5)]
+
+    threaded_results = []
+    # Audio is pushed faster than real time: queues must hold all of it
+    threaded = StreamingSessionManager(
+        project_id="test-project",
+        result_callback=threaded_results.append,
+        client=FakeSpeechClient(),
+        audio_queue_ms=60000
+    )
+    for session_id in session_ids:
+        threaded.create_session(session_id, "p1")
+        threaded.start_session(session_id)
+    for chunk in chunks:
+        for session_id in session_ids:
+            threaded.send_audio_chunk(session_id, chunk)
+    for session_id in session_ids:
+        threaded.close_session(session_id)
+
+    async_results = []
+
+    async def run():
+        manager = AsyncStreamingSessionManager(
+            project_id="test-project",
+            result_callback=async_results.append,
+            client=FakeSpeechAsyncClient(),
+            audio_queue_ms=60000
+        )
+        for session_id in session_ids:
+            manager.create_session(session_id, "p1")
+            await manager.start_session(session_id)
+        for chunk in chunks:
+            for session_id in session_ids:
+                await manager.send_audio_chunk(session_id, chunk)
+            await asyncio.sleep(0)
+        for session_id in session_ids:
+            await manager.close_session(session_id)
+
+    asyncio.run(run())
+
+    threaded_finals = sorted(r.text for r in threaded_results if r.is_final)
+    async_finals = sorted(r.text for r in async_results if r.is_final)
+    assert len(threaded_finals) == 4 * len(session_ids)
+    assert async_finals == threaded_finals
+
+    print(f"✅ {len(async_finals)} identical finals across {len(session_ids)} sessions")
+
+
+def _words(session):
+    return [w for r in session.result_handler.get_final_results() for w in r.words]
+
+
+async def _stream(manager, session_id, chunks, pace_s=0.005, mid=None):
+    """Send chunks in real time (sped up); run mid() halfway through"""
+    refused = 0
+    for idx, chunk in enumerate(chunks):
+        if mid is not None and idx == len(chunks) // 2:
+            mid = asyncio.create_task(mid())
+        if not await manager.send_audio_chunk(session_id, chunk):
+            refused += 1
+        await asyncio.sleep(pace_s)
+    if isinstance(mid, asyncio.Task):
+        return refused, await mid
+    return refused, None
+
+
+def test_async_make_before_break_renewal():
+    """Test 4: Renewal overlaps calls without refusing audio or duplicating words"""
+    print("\n" + "="*60)
+    print("TEST 4: Async Make-Before-Break Renewal")
+    print("="*60)
+
+    chunks = _talk(utterances=3)
+
+    async def run():
+        client = FakeSpeechAsyncClient()
+        manager = AsyncStreamingSessionManager(
+            project_id="test-project", client=client, audio_queue_ms=60000
+        )
+        session = manager.create_session("s1", "p1")
+        await manager.start_session("s1")
+        refused, stats = await _stream(
+            manager, "s1", chunks, mid=lambda: manager.renew_stream("s1", overlap_ms=200)
+        )
+        assert session.status.value == "active"
+        summary = await manager.close_session("s1")
+        return client, session, refused, stats, summary
+
+    client, session, refused, stats, summary = asyncio.run(run())
+
+    assert refused == 0
+    assert len(client.calls) == 2 and session.renewal_count == 1
+    assert stats["overlap_audio_ms"] > 0 and stats["replayed_ms"] > 0
+
+    # Both calls heard the overlap; nothing was lost
+    old_bytes, new_bytes = (call.model.audio_bytes for call in client.calls)
+    resent_ms = stats["replayed_ms"] + stats["overlap_audio_ms"]
+    assert old_bytes + new_bytes == len(chunks) * 3200 + resent_ms * 32
+
+    # Words are on one audio clock and never repeat
+    words = _words(session)
+    assert len(words) == 18
+    for prev, word in zip(words, words[1:]):
+        assert word["start_time"] >= prev["end_time"] - 1e-6, (prev, word)
+    assert summary["session"]["duplicate_results"] == stats["duplicate_results"]
+
+    print(f"✅ Replay {stats['replayed_ms']:.0f}ms + overlap {stats['overlap_audio_ms']:.0f}ms, "
+          f"{stats['duplicate_words']} duplicate words removed, 0 chunks refused")
+
+
+def test_async_restart_replays_audio():
+    """Test 5: A failed call is restarted with replayed audio instead of ERROR"""
+    print("\n" + "="*60)
+    print("TEST 5: Async Restart With Replay")
+    print("="*60)
+
+    chunks = _talk(utterances=3)
+
+    async def run(client, **options):
+        manager = AsyncStreamingSessionManager(
+            project_id="test-project", client=client, audio_queue_ms=60000, **options
+        )
+        session = manager.create_session("s1", "p1")
+        await manager.start_session("s1")
+        refused, _ = await _stream(manager, "s1", chunks)
+        status = session.status.value
+        await manager.close_session("s1")
+        return session, status, refused
+
+    # Fails 1.0s in, in the middle of the first utterance
+    client = FakeSpeechAsyncClient(fail_after_s=1.0)
+    session, status, refused = asyncio.run(run(client, replay_ms=3000))
+    assert status == "active" and refused == 0
+    assert session.stream_restarts == 1 and len(client.calls) == 2
+    assert len(_words(session)) == 18
+
+    exhausted, status, _ = asyncio.run(run(FakeSpeechAsyncClient(fail_after_s=1.0), max_stream_restarts=0))
+    assert status == "error" and exhausted.stream_restarts == 0
+
+    print(f"✅ Restarted once ({session.replayed_ms:.0f}ms replayed); "
+          "ERROR when restarts are exhausted")
+
+
+def test_async_session_deadlines():
+    """Test 6: Idle sessions closed, stuck calls restarted, renewals driven on the loop"""
+    print("\n" + "="*60)
+    print("TEST 6: Async Session Deadlines")
+    print("="*60)
+
+    try:
+        AsyncStreamingSessionManager(
+            project_id="test-project", client=FakeSpeechAsyncClient(), scheduler=DeadlineScheduler()
+        )
+        assert False, "Expected TypeError for a thread-driven scheduler"
+    except TypeError as e:
+        assert "AsyncDeadlineScheduler" in str(e)
+
+    async def run():
+        scheduler = AsyncDeadlineScheduler()
+
+        # Idle cleanup
+        manager = AsyncStreamingSessionManager(
+            project_id="test-project", client=FakeSpeechAsyncClient(),
+            scheduler=scheduler, idle_timeout_s=0.2
+        )
+        manager.create_session("idle", "p1")
+        await manager.start_session("idle")
+        await asyncio.sleep(0.6)
+        assert manager.get_session_count() == 0
+
+        # Stuck call: stops taking audio after 0.5s
+        client = FakeSpeechAsyncClient(stall_after_s=0.5)
+        manager = AsyncStreamingSessionManager(
+            project_id="test-project", client=client, scheduler=scheduler,
+            audio_queue_ms=10000, stuck_timeout_s=0.2
+        )
+        session = manager.create_session("stuck", "p1")
+        await manager.start_session("stuck")
+        await _stream(manager, "stuck", [_chunk(True)] * 20, pace_s=0.03)
+        await asyncio.sleep(0.5)
+        assert session.stream_restarts == 1 and len(client.calls) == 2
+        await manager.close_session("stuck")
+        assert client.calls[1].model.audio_bytes >= 15 * 3200  # Everything not yet sent
+
+        # Renewal: the deadline starts renew_stream as a task
+        client = FakeSpeechAsyncClient()
+        manager = AsyncStreamingSessionManager(
+            project_id="test-project", client=client, scheduler=scheduler, audio_queue_ms=10000
+        )
+        manager.RENEWAL_THRESHOLD_SECONDS = 0.3
+        session = manager.create_session("long", "p1")
+        await manager.start_session("long")
+        await _stream(manager, "long", [_chunk(True)] * 30, pace_s=0.03)
+        await manager.close_session("long")
+        assert session.renewal_count >= 1 and len(client.calls) == session.renewal_count + 1
+        assert len(scheduler) == 0
+
+        scheduler.stop()
+        return scheduler.get_stats()
+
+    stats = asyncio.run(run())
+    print(f"✅ Idle close, stuck restart and renewal on the loop; scheduler stats: {stats}")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("ASYNC SESSION MANAGER TESTS")
+    print("="*60)
+
+    try:
+        test_fake_recognizer_follows_audio()
+        test_async_manager_session_lifecycle()
+        test_async_matches_threaded_manager()
+        test_async_make_before_break_renewal()
+        test_async_restart_replays_audio()
+        test_async_session_deadlines()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Test Streaming Audio Encoder
+
+Tests mu-law, FLAC and Opus encoding of LINEAR16 chunks as they are sent
+(decoded request by request, as the fake recognizer does), encoding
+validation and the config request, and sessions streaming compressed
+audio through the threaded and asyncio session managers.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.audio_encoder import (
+    SOUNDFILE_AVAILABLE,
+    MULAW_DECODE,
+    MULAW_ENCODE,
+    StreamingAudioDecoder,
+    check_encoding,
+    create_encoder,
+)
+from src.streaming.session_manager import StreamingSessionManager
+from src.streaming.async_session_manager import AsyncStreamingSessionManager
+from tests.fake_recognizer import FakeSpeechClient, FakeSpeechAsyncClient
+
+
+ENCODINGS = ["LINEAR16", "MULAW"] + (["FLAC", "OGG_OPUS"] if SOUNDFILE_AVAILABLE else [])
+
+
+def _stream(encoding: str, pcm: np.ndarray, chunk_samples: int) -> tuple:
+    """Encode pcm in chunks and decode each request; (samples, seconds, encoder)"""
+    encoder = create_encoder(encoding)
+    decoder = StreamingAudioDecoder(encoding)
+    requests = [encoder.encode(pcm[pos:pos + chunk_samples].tobytes()) for pos in range(0, pcm.size, chunk_samples)]
+    requests.append(encoder.flush())
+    decoded = [decoder.decode(request) for request in requests if request]
+    samples = np.concatenate([samples for samples, _ in decoded])
+    return samples, sum(seconds for _, seconds in decoded), encoder
+
+
+def test_codecs_round_trip():
+    """Test 1: Chunk-by-chunk encoding, request-by-request decoding"""
+    print("\n" + "="*60)
+    print("TEST 1: Codec Round Trip")
+    print("="*60)
+
+    rng = np.random.default_rng(0)
+    t = np.arange(16000 * 4)
+    pcm = (np.sin(2 * np.pi * 300 * t / 16000) * 8000 * ((t // 16000) % 2) + rng.normal(0, 300, t.size))
+    pcm = pcm.astype(np.int16)
+
+    # mu-law: error within half a step, which grows with the level (~1/32)
+    samples, seconds, encoder = _stream("MULAW", pcm, 1600)
+    error = np.abs(samples.astype(np.int32) - pcm)
+    assert np.all(error <= np.abs(pcm.astype(np.int32)) / 32 + 8), "mu-law error above half a step"
+    assert abs(seconds - 4.0) < 1e-9 and encoder.get_stats()['ratio'] == 0.5
+    assert MULAW_DECODE[MULAW_ENCODE[np.uint16(0)]] == 0
+    print("  MULAW: 8 bits per sample, error within half a step")
+
+    if SOUNDFILE_AVAILABLE:
+        # FLAC: lossless, whatever the chunk sizes
+        for chunk_samples in (1600, 320, 4000):
+            samples, seconds, encoder = _stream("FLAC", pcm, chunk_samples)
+            assert np.array_equal(samples, pcm), chunk_samples
+            assert abs(seconds - 4.0) < 1e-9
+        print(f"  FLAC: lossless, {encoder.get_stats()['ratio']:.0%} of LINEAR16")
+
+        # Opus: lossy; the clock and the per-chunk level survive
+        samples, seconds, encoder = _stream("OGG_OPUS", pcm, 1600)
+        assert abs(seconds - 4.0) < 1e-9 and samples.size == pcm.size
+        level = lambda x: 20 * np.log10(np.sqrt(np.mean(x.reshape(-1, 1600).astype(np.float64) ** 2, axis=1)))
+        difference = np.abs(level(samples) - level(pcm))
+        assert np.median(difference) < 1.0, difference
+        assert encoder.get_stats()['ratio'] < 0.2
+        print(f"  OGG_OPUS: {encoder.get_stats()['ratio']:.0%} of LINEAR16, "
+              f"median level error {np.median(difference):.2f} dB")
+
+    print("✅ Encoded requests decode to the sent audio")
+
+
+def test_encoding_validation():
+    """Test 2: Encoding names and the streaming config"""
+    print("\n" + "="*60)
+    print("TEST 2: Encoding Validation")
+    print("="*60)
+
+    logging.disable(logging.INFO)
+    assert check_encoding("flac") == "FLAC"
+    for make in (lambda: check_encoding("MP3"),
+                 lambda: StreamingSessionManager(project_id="p", client=FakeSpeechClient(), audio_encoding="WAV")):
+        try:
+            make()
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+
+    manager = StreamingSessionManager(project_id="test-project", client=FakeSpeechClient(), audio_encoding="mulaw")
+    request = manager._build_config_request("ja-JP", "latest_long", True, audio_encoding=manager.audio_encoding)
+    decoding = request.streaming_config.config.explicit_decoding_config
+    assert decoding.encoding.name == "MULAW" and decoding.sample_rate_hertz == 16000
+    logging.disable(logging.NOTSET)
+
+    print("✅ Unknown encodings are rejected; the config names the encoding")
+
+
+# 2s tone bursts every 4s, 12s in total
+SPEECH = np.concatenate([
+    np.concatenate([0.2 * np.sin(2 * np.pi * 300 * np.arange(32000) / 16000), np.zeros(32000)])
+    for _ in range(3)
+])
+
+
+def _words(summary):
+    return [w["word"] for r in summary["results"]["segments"] for w in r["words"]]
+
+
+def test_managers_stream_compressed_audio():
+    """Test 3: Sessions in each encoding, with a stream restart"""
+    print("\n" + "="*60)
+    print("TEST 3: Session Managers with Compressed Audio")
+    print("="*60)
+
+    logging.disable(logging.INFO)
+    native = (SPEECH * 32767).astype(np.int16).tobytes()
+    frames = [native[pos:pos + 640] for pos in range(0, len(native), 640)]
+
+    def run_threaded(encoding, fail_after_s=None):
+        manager = StreamingSessionManager(
+            project_id="test-project", client=FakeSpeechClient(fail_after_s=fail_after_s),
+            audio_queue_ms=20000, audio_encoding=encoding
+        )
+        manager.create_session("s1", "p1")
+        manager.start_session("s1")
+        for frame in frames:
+            manager.feed_audio("s1", frame)
+            if fail_after_s is not None:
+                time.sleep(0.002)  # Let the listener recover the failed stream
+        return manager.close_session("s1")
+
+    async def run_async(encoding):
+        manager = AsyncStreamingSessionManager(
+            project_id="test-project", client=FakeSpeechAsyncClient(), audio_queue_ms=20000
+        )
+        manager.create_session("s1", "p1")
+        await manager.start_session("s1", audio_encoding=encoding)
+        for frame in frames:
+            await manager.feed_audio("s1", frame)
+        return await manager.close_session("s1")
+
+    expected = _words(run_threaded("LINEAR16"))
+    assert expected
+    for encoding in ENCODINGS:
+        summary = run_threaded(encoding)
+        session = summary["session"]
+        assert _words(summary) == expected, encoding
+        assert session["audio_encoding"] == encoding
+        assert session["total_bytes_sent"] == len(native)
+        if encoding != "LINEAR16":
+            assert session["wire_bytes_sent"] < 0.8 * len(native), (encoding, session["wire_bytes_sent"])
+        assert _words(asyncio.run(run_async(encoding))) == expected, encoding
+        print(f"  {encoding}: {session['wire_bytes_sent']:,} bytes on the wire "
+              f"({session['encode_cpu_ms']:.1f}ms encoding)")
+
+    # A restarted stream starts a new bitstream (headers first)
+    encoding = ENCODINGS[-1]
+    summary = run_threaded(encoding, fail_after_s=3.0)
+    assert summary["session"]["stream_restarts"] == 1
+    assert _words(summary) == _words(run_threaded("LINEAR16", fail_after_s=3.0))
+    logging.disable(logging.NOTSET)
+
+    print(f"✅ Same words in every encoding; {encoding} survives a stream restart")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*60)
+    print("STREAMING AUDIO ENCODER TESTS")
+    print("="*60)
+
+    try:
+        test_codecs_round_trip()
+        test_encoding_validation()
+        test_managers_stream_compressed_audio()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+        return 0
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,10 +14,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.streaming.audio_preprocessing import (
     VoiceActivityDetector,
     AutomaticGainControl,
+    NoiseSuppressor,
     AudioPreprocessor,
     AudioActivity,
     VADConfig,
     AGCConfig,
+    NoiseSuppressionConfig,
 )
 
 
@@ -275,6 +277,213 @@ def test_vad_config():
     print("\n✅ VAD configuration tests completed")
 
 
+def _reference_states(flags, min_speech_frames, min_silence_frames):
+    """Frame-by-frame hangover state machine (reference for the vectorized one)"""
+    states, speech_run, silence_run, state = [], 0, 0, False
+    for flag in flags:
+        speech_run = speech_run + 1 if flag else 0
+        silence_run = 0 if flag else silence_run + 1
+        if speech_run >= min_speech_frames:
+            state = True
+        elif silence_run >= min_silence_frames:
+            state = False
+        states.append(state)
+    return states
+
+
+def test_vad_frame_level():
+    """Test 5: Frame-Level VAD With Hangover"""
+    print("\n" + "="*60)
+    print("TEST 5: Frame-Level VAD With Hangover")
+    print("="*60)
+    
+    vad = VoiceActivityDetector(
+        config=VADConfig(min_speech_duration=0.05, min_silence_duration=0.2)
+    )
+    
+    # Speech starting 30ms into a 100ms chunk is flagged from that frame
+    chunk = generate_silence_chunk(duration_ms=30) + generate_audio_chunk(duration_ms=70)
+    states = vad.process_frames(chunk)
+    assert list(vad.last_frame_flags) == [False] * 3 + [True] * 7
+    assert list(states) == [False] * 7 + [True] * 3  # SPEECH after 5 frames
+    assert vad.current_state == AudioActivity.SPEECH
+    print(f"✅ Onset at frame 3, SPEECH from frame 7")
+    
+    # Random speech/silence, in chunks of odd sizes (frames span chunks):
+    # same states as a frame-by-frame state machine
+    rng = np.random.default_rng(0)
+    flags = np.repeat(rng.random(300) < 0.5, rng.integers(1, 30, 300))
+    tone = np.frombuffer(generate_audio_chunk(duration_ms=10), dtype=np.int16)
+    audio = np.where(flags[:, None], tone[None, :], 0).astype(np.int16).tobytes()
+    
+    vad.reset()
+    got, offset = [], 0
+    while offset < len(audio):
+        size = int(rng.integers(1, 200)) * 2 * 16
+        got.extend(vad.process_frames(audio[offset:offset + size]))
+        offset += size
+    assert got == _reference_states(flags, 5, 20)
+    assert vad.current_state == (AudioActivity.SPEECH if got[-1] else AudioActivity.SILENCE)
+    print(f"✅ {len(got)} frames match the reference state machine")
+
+
+def test_vad_noise_features():
+    """Test 6: Zero-Crossing Rate and Spectral Flatness Checks"""
+    print("\n" + "="*60)
+    print("TEST 6: Zero-Crossing Rate and Spectral Flatness")
+    print("="*60)
+    
+    noise = (np.random.default_rng(1).normal(0, 0.1, 1600) * 32767).astype(np.int16).tobytes()
+    tone = generate_audio_chunk(duration_ms=100, frequency_hz=300, amplitude=0.1)
+    
+    energy_only = VoiceActivityDetector()
+    zcr = VoiceActivityDetector(VADConfig(zcr_threshold=0.25))
+    flatness = VoiceActivityDetector(VADConfig(flatness_threshold=0.3))
+    
+    for vad in (energy_only, zcr, flatness):
+        vad.process_frames(tone)
+        assert vad.last_frame_flags.all(), "Tone frames are speech"
+    
+    energy_only.process_frames(noise)
+    zcr.process_frames(noise)
+    flatness.process_frames(noise)
+    assert energy_only.last_frame_flags.all(), "Loud noise passes the energy check"
+    assert not zcr.last_frame_flags.any(), "Noise crosses zero too often"
+    assert not flatness.last_frame_flags.any(), "Noise spectrum is flat"
+    print(f"✅ Loud white noise rejected by ZCR and flatness checks")
+
+
+def _reference_agc(chunks, config):
+    """Previous AGC: float copies per chunk and a list of every gain"""
+    gain_db, gains, outputs = 0.0, [], []
+    for chunk in chunks:
+        audio = np.frombuffer(chunk, dtype=np.int16).astype(np.float32) / 32768.0
+        rms = np.sqrt(np.mean(audio ** 2))
+        if rms < 1e-10:
+            outputs.append(chunk)
+            continue
+        required = max(config.min_gain_db, min(config.max_gain_db, config.target_db - 20 * np.log10(rms)))
+        gain_db = config.smoothing_factor * required + (1 - config.smoothing_factor) * gain_db
+        gained = np.clip(audio * 10 ** (gain_db / 20.0), -1.0, 1.0)
+        outputs.append((gained * 32767).astype(np.int16).tobytes())
+        gains.append(gain_db)
+    return outputs, gains
+
+
+def test_agc_in_place():
+    """Test 7: In-Place AGC Path and Running Statistics"""
+    print("\n" + "="*60)
+    print("TEST 7: In-Place AGC and Running Statistics")
+    print("="*60)
+    
+    rng = np.random.default_rng(2)
+    chunks = []
+    for idx in range(300):
+        amplitude = (0.0, 0.001, 0.05, 0.9)[idx % 4]
+        samples = (800, 1600, 3200)[idx % 3]
+        audio = amplitude * np.sin(np.arange(samples) / (3 + idx % 5)) + rng.normal(0, amplitude / 50 + 1e-9, samples)
+        chunks.append((np.clip(audio, -1, 1) * 32767).astype(np.int16).tobytes())
+    
+    config = AGCConfig(target_db=-20.0, smoothing_factor=0.3)
+    want, gains = _reference_agc(chunks, config)
+    agc = AutomaticGainControl(config)
+    max_diff = 0
+    for chunk, expected in zip(chunks, want):
+        got = np.frombuffer(agc.process_chunk(chunk), dtype=np.int16).astype(np.int32)
+        max_diff = max(max_diff, int(np.abs(got - np.frombuffer(expected, dtype=np.int16)).max()))
+    assert max_diff <= 1, max_diff
+    
+    stats = agc.get_stats()
+    assert stats["total_chunks"] == len(gains)
+    assert abs(stats["avg_gain_db"] - np.mean(gains)) < 1e-4
+    assert abs(stats["min_gain_db"] - min(gains)) < 1e-4
+    assert abs(stats["max_gain_db"] - max(gains)) < 1e-4
+    assert not any(isinstance(value, list) for value in vars(agc).values()), "No per-chunk history"
+    
+    # In place into a caller's buffer, without growing the scratch buffers
+    scratch = agc._scratch
+    buffer = bytearray(chunks[2])
+    samples = np.frombuffer(buffer, dtype=np.int16)
+    expected = AutomaticGainControl(config)
+    expected.current_gain_db = agc.current_gain_db
+    assert agc.process_into(samples, out=samples) is samples
+    assert bytes(buffer) == expected.process_chunk(chunks[2])
+    assert agc._scratch is scratch
+    print(f"✅ {len(chunks)} chunks within {max_diff} LSB of the previous AGC; stats in O(1) memory")
+
+
+def test_noise_suppression():
+    """Test 8: Overlap-Add Reconstruction and HVAC Noise Suppression"""
+    print("\n" + "="*60)
+    print("TEST 8: Spectral Noise Suppression")
+    print("="*60)
+    
+    rng = np.random.default_rng(3)
+    
+    # With nothing subtracted the STFT/overlap-add returns the input, one
+    # frame late, whatever the chunk sizes
+    suppressor = NoiseSuppressor(NoiseSuppressionConfig(over_subtraction=0.0))
+    audio = (rng.normal(0, 0.1, 16000) * 32767).astype(np.int16)
+    output, pos = [], 0
+    for size in [333, 1600, 77, 5000] * 3:
+        chunk = audio[pos:pos + size].tobytes()
+        pos += size
+        denoised = suppressor.process_chunk(chunk)
+        assert len(denoised) == len(chunk)
+        output.append(np.frombuffer(denoised, dtype=np.int16))
+    delay = suppressor.frame_size
+    output = np.concatenate(output).astype(np.int32)
+    assert not output[:delay].any()
+    assert np.abs(output[delay:] - audio[:-delay]).max() <= 1
+    
+    # Speech bursts every 4 s over steady low-pass noise at -36 dBFS (above
+    # the VAD threshold)
+    sr = 16000
+    t = np.arange(sr * 20) / sr
+    noise = np.convolve(rng.normal(0, 1, t.size), np.ones(8) / 8, 'same')
+    noise *= 10 ** (-36 / 20) / noise.std()
+    speech = ((t % 4) > 3) * 0.2 * np.sin(2 * np.pi * 300 * t) * (1 + 0.5 * np.sin(2 * np.pi * 4 * t))
+    audio = ((noise + speech) * 32767).astype(np.int16)
+    
+    def run(enable: bool):
+        preprocessor = AudioPreprocessor(
+            enable_agc=False,
+            vad_config=VADConfig(min_silence_duration=0.5),
+            enable_noise_suppression=enable
+        )
+        output, flags, states = [], [], []
+        for start in range(0, audio.size, 1600):
+            processed, activity = preprocessor.process_chunk(audio[start:start + 1600].tobytes())
+            output.append(np.frombuffer(processed, dtype=np.int16))
+            flags.append(preprocessor.vad.last_frame_flags.copy())
+            states.append(activity)
+        output = np.concatenate(output).astype(np.float64) / 32767
+        return output, np.concatenate(flags), states, preprocessor.get_stats()
+    
+    def level_db(output, start_s, end_s, delay_s):
+        segment = output[int((start_s + delay_s) * sr):int((end_s + delay_s) * sr)]
+        return 10 * np.log10(np.mean(segment ** 2))
+    
+    plain, plain_flags, plain_states, _ = run(False)
+    denoised, flags, states, stats = run(True)
+    delay_s = stats["noise_suppression"]["latency_ms"] / 1000
+    
+    noise_reduction = level_db(plain, 12.1, 14.9, 0) - level_db(denoised, 12.1, 14.9, delay_s)
+    speech_change = level_db(plain, 15.1, 15.9, 0) - level_db(denoised, 15.1, 15.9, delay_s)
+    assert noise_reduction > 6.0, noise_reduction
+    assert abs(speech_change) < 0.5, speech_change
+    
+    # Noise frames no longer pass the VAD energy check
+    assert plain_flags[1210:1490].mean() > 0.9
+    assert flags[1210:1490].mean() < 0.3
+    assert AudioActivity.SILENCE not in plain_states[30:]
+    assert AudioActivity.SILENCE in states[30:]
+    assert abs(stats["noise_suppression"]["noise_floor_db"] + 36) < 3
+    
+    print(f"✅ Noise reduced {noise_reduction:.1f} dB, speech changed {speech_change:+.2f} dB, "
+          f"latency {delay_s * 1000:.0f}ms")
+
+
 def main():
     """Run all tests"""
     print("\n" + "="*60)
@@ -286,14 +495,19 @@ def main():
         test_agc_normalization()
         test_audio_preprocessor_pipeline()
         test_vad_config()
+        test_vad_frame_level()
+        test_vad_noise_features()
+        test_agc_in_place()
+        test_noise_suppression()
         
         print("\n" + "="*60)
         print("✅ ALL TESTS PASSED")
         print("="*60)
         print("\nAudio preprocessing module is ready!")
         print("\nKey features:")
-        print("  • Voice Activity Detection (VAD)")
+        print("  • Voice Activity Detection (VAD), per 10ms frame")
         print("  • Automatic Gain Control (AGC)")
+        print("  • Spectral noise suppression (optional)")
         print("  • Combined preprocessing pipeline")
         print("  • Configurable thresholds")
         print("  • Statistics tracking")
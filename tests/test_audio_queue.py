@@ -0,0 +1,292 @@
+"""
+Test Bounded Audio Send Queues
+
+Tests backpressure policies, close semantics and queue metrics export
+from the session manager when the upstream stream stalls.
+"""
+
+import sys
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.audio_queue import AudioSendQueue, AsyncAudioSendQueue, BackpressurePolicy
+from src.streaming.session_manager import StreamingSessionManager
+from src.streaming.metrics_collector import MetricsCollector
+from tests.fake_recognizer import FakeSpeechClient
+
+
+CHUNK_100MS = 3200  # bytes of 16kHz LINEAR16
+
+
+def _chunk(idx: int) -> bytes:
+    return bytes([idx % 256]) * CHUNK_100MS
+
+
+def test_drop_oldest_keeps_latest_audio():
+    """Test 1: DROP_OLDEST caps depth in ms and keeps the newest chunks"""
+    print("\n" + "="*60)
+    print("TEST 1: Drop Oldest")
+    print("="*60)
+
+    audio_queue = AudioSendQueue(max_ms=500, policy=BackpressurePolicy.DROP_OLDEST)
+    for idx in range(10):
+        assert audio_queue.put(_chunk(idx))
+
+    stats = audio_queue.get_stats()
+    assert stats['depth_ms'] == 500
+    assert stats['dropped_chunks'] == 5
+    assert stats['dropped_ms'] == 500
+    assert [audio_queue.get(timeout=0)[0] for _ in range(5)] == [5, 6, 7, 8, 9]
+
+    audio_queue.close()
+    assert audio_queue.get(timeout=0) is None
+    assert not audio_queue.put(_chunk(0))
+
+    print(f"✅ Depth capped at {stats['depth_ms']:.0f}ms, oldest {stats['dropped_chunks']} chunks dropped")
+
+
+def test_block_waits_for_space():
+    """Test 2: BLOCK waits for the consumer and drops only on timeout"""
+    print("\n" + "="*60)
+    print("TEST 2: Block")
+    print("="*60)
+
+    audio_queue = AudioSendQueue(max_ms=200, policy=BackpressurePolicy.BLOCK)
+    assert audio_queue.put(_chunk(0))
+    assert audio_queue.put(_chunk(1))
+
+    # Nobody consumes: the new chunk is dropped after the timeout
+    assert not audio_queue.put(_chunk(2), timeout=0.05)
+    assert audio_queue.dropped_chunks == 1
+
+    # A consumer frees space while the producer waits
+    consumer = threading.Timer(0.05, audio_queue.get)
+    consumer.start()
+    start = time.monotonic()
+    assert audio_queue.put(_chunk(3), timeout=2.0)
+    assert time.monotonic() - start < 1.0
+    consumer.join()
+
+    assert [audio_queue.get(timeout=0)[0] for _ in range(2)] == [1, 3]
+    assert audio_queue.blocked_seconds > 0
+
+    print(f"✅ Blocked {audio_queue.blocked_seconds * 1000:.0f}ms in total, 1 chunk dropped")
+
+
+def test_coalesce_merges_requests():
+    """Test 3: COALESCE hands a lagging stream merged requests"""
+    print("\n" + "="*60)
+    print("TEST 3: Coalesce")
+    print("="*60)
+
+    audio_queue = AudioSendQueue(
+        max_ms=2000,
+        policy=BackpressurePolicy.COALESCE,
+        max_request_bytes=4 * CHUNK_100MS
+    )
+    for idx in range(10):
+        audio_queue.put(_chunk(idx))
+
+    requests = []
+    while audio_queue.qsize():
+        requests.append(audio_queue.get(timeout=0))
+
+    assert [len(r) // CHUNK_100MS for r in requests] == [4, 4, 2]
+    assert b"".join(requests) == b"".join(_chunk(idx) for idx in range(10))
+    assert audio_queue.coalesced_chunks == 7
+    assert audio_queue.depth_bytes == 0
+
+    print(f"✅ 10 chunks sent as {len(requests)} requests")
+
+
+def test_async_queue_policies():
+    """Test 4: Async queue blocks, drains after close and drops on timeout"""
+    print("\n" + "="*60)
+    print("TEST 4: Async Queue")
+    print("="*60)
+
+    async def run():
+        audio_queue = AsyncAudioSendQueue(max_ms=200, policy=BackpressurePolicy.BLOCK)
+        assert await audio_queue.put(_chunk(0))
+        assert await audio_queue.put(_chunk(1))
+        assert not await audio_queue.put(_chunk(2), timeout=0.02)
+
+        async def consume_later():
+            await asyncio.sleep(0.02)
+            return await audio_queue.get()
+
+        consumer = asyncio.create_task(consume_later())
+        assert await audio_queue.put(_chunk(3), timeout=1.0)
+        assert (await consumer)[0] == 0
+
+        audio_queue.close()
+        drained = [await audio_queue.get() for _ in range(3)]
+        return audio_queue, drained
+
+    audio_queue, drained = asyncio.run(run())
+    assert drained[0][0] == 1 and drained[1][0] == 3 and drained[2] is None
+    assert audio_queue.dropped_chunks == 1
+
+    print("✅ Async queue honours BLOCK and close")
+
+
+class _StalledClient:
+    """Speech client whose stream never reads requests"""
+
+    class _Stream:
+        def __init__(self):
+            self._done = threading.Event()
+
+        def __iter__(self):
+            self._done.wait()
+            return iter(())
+
+        def cancel(self):
+            self._done.set()
+
+    def streaming_recognize(self, requests=None, **kwargs):
+        return self._Stream()
+
+
+def test_stalled_stream_is_bounded():
+    """Test 5: A stalled upstream can't grow the queue; metrics show it"""
+    print("\n" + "="*60)
+    print("TEST 5: Stalled Stream")
+    print("="*60)
+
+    collector = MetricsCollector()
+    manager = StreamingSessionManager(
+        project_id="test-project",
+        client=_StalledClient(),
+        audio_queue_ms=1000,
+        metrics_collector=collector
+    )
+    manager.create_session("s1", "p1")
+    manager.start_session("s1")
+
+    for idx in range(50):
+        assert manager.send_audio_chunk("s1", _chunk(idx))
+
+    stats = manager.get_queue_stats()["s1"]
+    assert stats['depth_ms'] == 1000
+    assert stats['dropped_chunks'] == 40
+
+    queues = collector.get_summary()["audio_queues"]
+    assert queues['max_depth_ms'] == 1000
+    assert queues['dropped_chunks'] == 40
+
+    manager.sessions["s1"].stream.cancel()
+    manager.close_session("s1")
+    assert collector.get_summary()["audio_queues"]['sessions'] == 0
+
+    print(f"✅ 5s of audio into a stalled stream held at {stats['depth_ms']:.0f}ms")
+
+
+def test_primed_replay_is_outside_the_cap():
+    """Test 6: Primed replay never evicts or blocks; the cap returns as it drains"""
+    print("\n" + "="*60)
+    print("TEST 6: Primed Replay")
+    print("="*60)
+
+    for policy in (BackpressurePolicy.DROP_OLDEST, BackpressurePolicy.BLOCK):
+        audio_queue = AudioSendQueue(max_ms=200, policy=policy, block_timeout_s=5.0)
+        start = time.monotonic()
+        for idx in range(5):
+            assert audio_queue.prime(_chunk(idx))
+        # Live audio still gets the full cap on top of the replay
+        assert audio_queue.put(_chunk(5), timeout=0) and audio_queue.put(_chunk(6), timeout=0)
+        assert time.monotonic() - start < 0.1
+        assert audio_queue.dropped_chunks == 0 and audio_queue.depth_ms == 700
+
+        assert [audio_queue.get(timeout=0)[0] for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert audio_queue.get_stats()['max_ms'] == 200
+        assert audio_queue.wait_for_space(CHUNK_100MS, timeout=0) == (policy is not BackpressurePolicy.BLOCK)
+
+    print("✅ 500ms replay + 200ms live audio in a 200ms queue, nothing dropped")
+
+
+class _SlowQueue(AudioSendQueue):
+    """A slow stream's queue, with a wide gap between a BLOCK wait and the put"""
+
+    def get(self, timeout=None):
+        time.sleep(0.002)
+        return super().get(timeout)
+
+    def wait_for_space(self, size, timeout=None):
+        fits = super().wait_for_space(size, timeout)
+        time.sleep(0.001)
+        return fits
+
+
+def test_block_never_drops_with_concurrent_producers():
+    """Test 7: BLOCK drops nothing when several threads feed one session"""
+    print("\n" + "="*60)
+    print("TEST 7: BLOCK with Concurrent Producers")
+    print("="*60)
+
+    class SlowStreamManager(StreamingSessionManager):
+        def _new_audio_queue(self):
+            return _SlowQueue(max_ms=self.audio_queue_ms, policy=self.backpressure_policy)
+
+    manager = SlowStreamManager(
+        project_id="test-project", client=FakeSpeechClient(),
+        audio_queue_ms=300, backpressure_policy="block"
+    )
+    manager.create_session("s1", "p1")
+    manager.start_session("s1")
+
+    refused = []
+
+    def produce(base):
+        for idx in range(50):
+            if not manager.send_audio_chunk("s1", _chunk(base + idx)):
+                refused.append(idx)
+
+    producers = [threading.Thread(target=produce, args=(n * 50,)) for n in range(4)]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+
+    stats = manager.get_queue_stats()["s1"]
+    summary = manager.close_session("s1")["session"]
+    assert not refused and stats['dropped_chunks'] == 0, (len(refused), stats)
+    assert summary['total_chunks_sent'] == 200
+
+    print(f"✅ 4 producers, 200 chunks through a 300ms BLOCK queue, none dropped "
+          f"({stats['blocked_seconds']:.1f}s blocked)")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("AUDIO QUEUE TESTS")
+    print("="*60)
+
+    try:
+        test_drop_oldest_keeps_latest_audio()
+        test_block_waits_for_space()
+        test_coalesce_merges_requests()
+        test_async_queue_policies()
+        test_stalled_stream_is_bounded()
+        test_primed_replay_is_outside_the_cap()
+        test_block_never_drops_with_concurrent_producers()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
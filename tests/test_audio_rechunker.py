@@ -0,0 +1,193 @@
+"""
+Test Audio Re-Chunker
+
+Tests aggregation and splitting of client frames into valid requests,
+the bounded-latency flush timer, and feeding frames through the
+threaded and asyncio session managers.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.audio_rechunker import AudioRechunker
+from src.streaming.audio_handler import AudioChunkValidator
+from src.streaming.session_manager import StreamingSessionManager
+from src.streaming.async_session_manager import AsyncStreamingSessionManager
+from tests.fake_recognizer import FakeSpeechClient, FakeSpeechAsyncClient
+
+
+def _tone(ms: int) -> bytes:
+    samples = 16 * ms
+    return (3000 * np.sin(np.arange(samples) / 5)).astype(np.int16).tobytes()
+
+
+def test_aggregate_and_split():
+    """Test 1: Small frames are merged, large frames split, bytes preserved"""
+    print("\n" + "="*60)
+    print("TEST 1: Aggregate and Split")
+    print("="*60)
+
+    # 20ms frames -> 100ms requests
+    rechunker = AudioRechunker(target_ms=100)
+    frames = [_tone(20) for _ in range(25)]
+    out = []
+    for idx, frame in enumerate(frames):
+        out += rechunker.push(frame, now=idx * 0.02)
+    assert len(out) == 5
+    assert all(len(chunk) == 3200 for chunk in out)
+    assert b''.join(out) == b''.join(frames)
+
+    # 256ms frames -> 100ms + 156ms, no remainder left for the timer
+    rechunker = AudioRechunker(target_ms=100)
+    frame = _tone(256)
+    out = rechunker.push(frame, now=0.0)
+    assert [len(chunk) for chunk in out] == [3200, 4992]
+    assert b''.join(out) == frame
+    assert rechunker.pending_bytes == 0
+    for chunk in out:
+        AudioChunkValidator.validate_chunk(chunk)  # raises if invalid
+
+    stats = rechunker.get_stats()
+    assert stats['padded_ms'] == 0 and stats['timer_flushes'] == 0
+    print(f"✅ 25 x 20ms -> 5 requests; 256ms -> {[len(c) // 32 for c in out]}ms")
+
+
+def test_timer_flush_bounds_latency():
+    """Test 2: A partial request goes out after max_delay, padded to the minimum"""
+    print("\n" + "="*60)
+    print("TEST 2: Timer Flush")
+    print("="*60)
+
+    rechunker = AudioRechunker(target_ms=200, max_delay_ms=150)
+
+    assert rechunker.push(_tone(40), now=0.0) == []
+    assert rechunker.push(_tone(20), now=0.04) == []
+    assert rechunker.poll(now=0.1) is None
+    assert abs(rechunker.time_until_due(now=0.1) - 0.05) < 1e-9
+
+    chunk = rechunker.poll(now=0.15)
+    assert chunk is not None and len(chunk) == AudioChunkValidator.MIN_CHUNK_SIZE
+    assert chunk[-1280:] == b'\x00' * 1280  # 60ms of audio, 40ms of padding
+
+    stats = rechunker.get_stats()
+    assert stats['timer_flushes'] == 1
+    assert stats['padded_ms'] == 40
+    assert stats['max_added_latency_ms'] <= 150 + 1e-6
+    assert rechunker.flush() is None
+
+    print(f"✅ Flushed after {stats['max_added_latency_ms']:.0f}ms with {stats['padded_ms']:.0f}ms padding")
+
+
+def test_managers_feed_audio():
+    """Test 3: Threaded and async managers re-chunk fed frames end to end"""
+    print("\n" + "="*60)
+    print("TEST 3: Session Managers")
+    print("="*60)
+
+    frames = [_tone(20) for _ in range(52)]  # 1040ms
+
+    # Threaded: frames fed before start wait in the queue; close sends the rest
+    client = FakeSpeechClient()
+    manager = StreamingSessionManager(project_id="test-project", client=client, audio_queue_ms=10000)
+    manager.create_session("s1", "p1")
+    queued = sum(manager.feed_audio("s1", frame) for frame in frames[:10])
+    manager.start_session("s1")
+    queued += sum(manager.feed_audio("s1", frame) for frame in frames[10:])
+    assert queued >= 10
+    manager.close_session("s1")
+    assert client.calls[0].model.audio_bytes == 11 * 3200  # 40ms padded to 100ms
+
+    # Async
+    async def run_async():
+        client = FakeSpeechAsyncClient()
+        manager = AsyncStreamingSessionManager(project_id="test-project", client=client, audio_queue_ms=10000)
+        manager.create_session("s1", "p1")
+        await manager.start_session("s1")
+        for frame in frames:
+            await manager.feed_audio("s1", frame)
+        await manager.close_session("s1")
+        return client.calls[0].model.audio_bytes
+
+    assert asyncio.run(run_async()) == 11 * 3200
+    print("✅ 52 x 20ms frames -> 11 requests (threaded and async)")
+
+
+def test_close_all_sessions_stops_flusher():
+    """Test 4: close_all_sessions closes every session and stops the flusher"""
+    print("\n" + "="*60)
+    print("TEST 4: Flusher Shutdown")
+    print("="*60)
+
+    frame = _tone(20)
+
+    # Threaded: the thread exits, and the next fed session starts a new one
+    manager = StreamingSessionManager(project_id="test-project", client=FakeSpeechClient())
+    for session_id in ("s1", "s2"):
+        manager.create_session(session_id, "p1")
+        manager.start_session(session_id)
+        manager.feed_audio(session_id, frame)
+    flusher = manager._rechunk_flusher
+    assert flusher.is_alive()
+
+    summaries = manager.close_all_sessions()
+    assert sorted(summaries) == ["s1", "s2"]
+    assert manager.get_session_count() == 0
+    assert not flusher.is_alive()
+    assert manager._rechunk_flusher is None
+
+    manager.create_session("s3", "p1")
+    manager.start_session("s3")
+    manager.feed_audio("s3", frame)
+    assert manager._rechunk_flusher.is_alive()
+    manager.close_all_sessions()
+    assert manager._rechunk_flusher is None
+
+    # Async: the task finishes without waiting for the sessions to drain
+    async def run_async():
+        manager = AsyncStreamingSessionManager(project_id="test-project", client=FakeSpeechAsyncClient())
+        for session_id in ("s1", "s2"):
+            manager.create_session(session_id, "p1")
+            await manager.start_session(session_id)
+            await manager.feed_audio(session_id, frame)
+        flusher = manager._rechunk_flusher
+        assert not flusher.done()
+
+        summaries = await manager.close_all_sessions()
+        assert sorted(summaries) == ["s1", "s2"]
+        assert flusher.done() and manager._rechunk_flusher is None
+
+    asyncio.run(run_async())
+    print("✅ Flusher stopped on close_all_sessions (threaded and async)")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("AUDIO RE-CHUNKER TESTS")
+    print("="*60)
+
+    try:
+        test_aggregate_and_split()
+        test_timer_flush_bounds_latency()
+        test_managers_feed_audio()
+        test_close_all_sessions_stops_flusher()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
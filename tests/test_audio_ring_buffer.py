@@ -0,0 +1,137 @@
+"""
+Test Audio Ring Buffer
+
+Tests absolute offsets and wrap-around, zero-copy views shared by the
+chunk handler, and streaming from ring views end to end.
+"""
+
+import sys
+import io
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.audio_ring_buffer import AudioRingBuffer
+from src.streaming.audio_handler import AudioChunkHandler
+from src.streaming.session_manager import StreamingSessionManager
+from tests.fake_recognizer import FakeSpeechClient
+
+
+def test_offsets_and_wraparound():
+    """Test 1: Absolute offsets survive wrap-around; lapped audio is rejected"""
+    print("\n" + "="*60)
+    print("TEST 1: Offsets and Wrap-Around")
+    print("="*60)
+
+    ring = AudioRingBuffer(capacity_ms=500)  # 16000 bytes = 5 chunks of 100ms
+    assert ring.capacity == 16000
+
+    chunks = [bytes([idx]) * 3200 for idx in range(12)]
+    offsets = [ring.write(chunk) for chunk in chunks]
+    assert offsets == [idx * 3200 for idx in range(12)]
+    assert ring.start_offset == 7 * 3200
+    assert ring.duration_ms == 1200
+
+    for idx in range(7, 12):
+        assert bytes(ring.view(offsets[idx], offsets[idx] + 3200)) == chunks[idx]
+    assert ring.wrap_copies == 0
+
+    try:
+        ring.view(offsets[6], offsets[6] + 3200)
+        assert False, "Lapped audio must not be readable"
+    except ValueError:
+        pass
+
+    # Odd-sized writes straddle the wrap point and still read back correctly
+    odd = bytes(range(200)) * 50
+    start = ring.write(odd)
+    assert bytes(ring.view(start, start + len(odd))) == odd
+    assert ring.wrap_copies == 1
+
+    print(f"✅ Ring holds [{ring.start_offset}, {ring.end_offset}) of {ring.capacity} bytes")
+
+
+def test_handler_shares_ring_memory():
+    """Test 2: Captured audio is written once and shared as views"""
+    print("\n" + "="*60)
+    print("TEST 2: Zero-Copy Handler")
+    print("="*60)
+
+    ring = AudioRingBuffer(capacity_ms=1000)
+    handler = AudioChunkHandler(max_buffer_size=2, ring_buffer=ring)
+    source = io.BytesIO(np.arange(16000, dtype=np.int16).tobytes())
+
+    views = []
+    for _ in range(3):
+        start, end = ring.write_from(source.readinto, 3200)
+        assert handler.process_chunk(ring.view(start, end))
+        assert handler.last_offset == start
+        views.append(handler.last_chunk)
+
+    assert ring.writes == 3
+    assert len(handler.get_buffered_chunks(clear=False)) == 2
+    assert all(ring.owns(view) for view in views)
+
+    # Same memory: the int16 samples view sees in-place edits
+    samples = ring.samples(3200, 6400)
+    assert samples[0] == 1600
+    samples[0] = -1
+    assert np.frombuffer(views[1], dtype=np.int16)[0] == -1
+
+    # Bytes from elsewhere are copied in once
+    handler.process_chunk(b'\x01' * 3200)
+    assert handler.last_offset == 9600 and ring.writes == 4
+
+    print("✅ Handler buffers ring views; no per-chunk copies")
+
+
+def test_manager_streams_ring_views():
+    """Test 3: Sessions queue ring views and the recognizer receives the same audio"""
+    print("\n" + "="*60)
+    print("TEST 3: Streaming From the Ring")
+    print("="*60)
+
+    client = FakeSpeechClient()
+    manager = StreamingSessionManager(project_id="test-project", client=client, audio_queue_ms=10000)
+    session = manager.create_session("s1", "p1")
+    manager.start_session("s1")
+
+    tone = (3000 * np.sin(np.arange(1600) / 5)).astype(np.int16).tobytes()
+    for _ in range(30):
+        assert manager.send_audio_chunk("s1", tone)
+
+    assert session.ring_buffer.end_offset == 30 * 3200
+    assert session.ring_buffer.owns(session.audio_handler.last_chunk)
+    manager.close_session("s1")
+
+    assert client.calls[0].model.audio_bytes == 30 * 3200
+    print(f"✅ {session.ring_buffer.duration_ms:.0f}ms streamed from ring views")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("AUDIO RING BUFFER TESTS")
+    print("="*60)
+
+    try:
+        test_offsets_and_wraparound()
+        test_handler_shares_ring_memory()
+        test_manager_streams_ring_views()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Test Batch Preprocessor
+
+Tests that batched AGC + VAD over many sessions matches per-session
+AudioPreprocessor output, that session state and chunk order are kept
+per session, and that gated sessions can share one batch engine.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.audio_preprocessing import AudioPreprocessor, AudioActivity, VADConfig
+from src.streaming.batch_preprocessor import BatchPreprocessor
+from src.streaming.session_manager import StreamingSessionManager
+from src.streaming.async_session_manager import AsyncStreamingSessionManager
+from tests.fake_recognizer import FakeSpeechClient, FakeSpeechAsyncClient
+
+
+def _chunk(rng, samples: int, amplitude: float, period: float) -> bytes:
+    audio = amplitude * np.sin(np.arange(samples) / period)
+    if amplitude:
+        audio += rng.normal(0, 0.0002, samples)
+    return (audio * 32767).astype(np.int16).tobytes()
+
+
+def test_matches_per_session_preprocessing():
+    """Test 1: Batched output equals per-session AudioPreprocessor output"""
+    print("\n" + "="*60)
+    print("TEST 1: Batched vs Per-Session Output")
+    print("="*60)
+
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(0)
+    config = VADConfig(min_speech_duration=0.2, min_silence_duration=0.5, zcr_threshold=0.3)
+    sessions = [f"s{idx}" for idx in range(12)]
+    single = {sid: AudioPreprocessor(vad_config=config) for sid in sessions}
+    engine = BatchPreprocessor(vad_config=config, capacity=4)  # Grows
+
+    max_diff = 0
+    for tick in range(40):
+        expected = {}
+        for idx, sid in enumerate(sessions):
+            # Silent, quiet and loud chunks; every third session sends 156ms
+            # chunks some of the time (VAD frames span chunks)
+            samples = 2496 if idx % 3 == 0 and tick % 2 else 1600
+            amplitude = (0.0, 0.002, 0.05, 0.5)[(idx + tick // 5) % 4]
+            chunk = _chunk(rng, samples, amplitude, 3 + idx)
+            engine.submit(sid, chunk)
+            expected[sid] = single[sid].process_chunk(chunk)
+
+        for sid, processed, activity in engine.tick():
+            want_audio, want_activity = expected.pop(sid)
+            assert activity == want_activity, (tick, sid, activity, want_activity)
+            got = np.frombuffer(processed, dtype=np.int16).astype(np.int32)
+            max_diff = max(max_diff, int(np.abs(got - np.frombuffer(want_audio, dtype=np.int16)).max()))
+        assert not expected
+
+    assert max_diff <= 1, max_diff
+    for sid in sessions:
+        got, want = engine.get_stats(sid), single[sid].get_stats()
+        assert got["vad"] == want["vad"], (got["vad"], want["vad"])
+        assert got["agc"]["total_chunks"] == want["agc"]["total_chunks"]
+        assert abs(got["agc"]["current_gain_db"] - want["agc"]["current_gain_db"]) < 1e-3
+
+    stats = engine.get_engine_stats()
+    assert stats["chunks"] == 40 * len(sessions)
+    logging.disable(logging.NOTSET)
+    print(f"✅ {stats['chunks']} chunks in {stats['batches']} passes, "
+          f"max sample difference {max_diff}")
+
+
+def test_order_and_slots():
+    """Test 2: Per-session order, slot reuse and removal"""
+    print("\n" + "="*60)
+    print("TEST 2: Order and Session Slots")
+    print("="*60)
+
+    engine = BatchPreprocessor(enable_agc=False, capacity=2)
+    chunks = [np.full(1600, value, dtype=np.int16).tobytes() for value in range(5)]
+    for chunk in chunks:
+        engine.submit("a", chunk)
+    engine.submit("b", chunks[0])
+
+    results = engine.tick()
+    assert [processed for sid, processed, _ in results if sid == "a"] == chunks
+    assert engine.get_engine_stats()["batches"] == 5  # One pass per queued depth
+    assert engine.pending_chunks() == 0
+
+    # A removed session's slot is reused with fresh state
+    loud = _chunk(np.random.default_rng(1), 1600, 0.5, 4)
+    for _ in range(5):
+        engine.process_batch(["a"], [loud])
+    assert engine.get_stats("a")["vad"]["current_state"] == AudioActivity.SPEECH.value
+    engine.submit("a", loud)
+    assert engine.remove_session("a") == 1
+    engine.submit("c", loud)
+    assert engine.get_stats("c")["vad"]["total_frames"] == 0
+    assert len(engine) == 2
+
+    print("✅ Chunks stay in order; removed sessions free their slots")
+
+
+CHUNKS = (
+    [_chunk(np.random.default_rng(2), 1600, 0.0006, 4)] * 20
+    + [_chunk(np.random.default_rng(3), 1600, 0.1, 5)] * 20
+    + [_chunk(np.random.default_rng(4), 1600, 0.0006, 4)] * 40
+)
+
+
+def _words(summary):
+    return [w["word"] for r in summary["results"]["segments"] for w in r["words"]]
+
+
+def test_managers_share_batch_engine():
+    """Test 3: Gated sessions preprocessed together in one engine"""
+    print("\n" + "="*60)
+    print("TEST 3: Managers Sharing a Batch Engine")
+    print("="*60)
+
+    def run_threaded(**options):
+        manager = StreamingSessionManager(
+            project_id="test-project", client=FakeSpeechClient(),
+            audio_queue_ms=20000, vad_gating=True, **options
+        )
+        for idx in range(4):
+            manager.create_session(f"s{idx}", "p1")
+            manager.start_session(f"s{idx}")
+        for chunk in CHUNKS:
+            for idx in range(4):
+                assert manager.send_audio_chunk(f"s{idx}", chunk)
+            time.sleep(0.005)
+        return [manager.close_session(f"s{idx}") for idx in range(4)]
+
+    per_session = run_threaded()
+    engine = BatchPreprocessor(enable_agc=False)
+    batched = run_threaded(batch_preprocessor=engine, preprocess_tick_ms=20)
+
+    for want, got in zip(per_session, batched):
+        assert _words(got) and _words(got) == _words(want)
+        assert got["session"]["total_bytes_sent"] == want["session"]["total_bytes_sent"]
+        assert got["speech_gate"]["vad"] == want["speech_gate"]["vad"]
+    stats = engine.get_engine_stats()
+    assert stats["avg_batch_size"] >= 4 and len(engine) == 0, stats
+
+    async def run_async():
+        manager = AsyncStreamingSessionManager(
+            project_id="test-project", client=FakeSpeechAsyncClient(),
+            audio_queue_ms=20000, vad_gating=True,
+            batch_preprocessor=BatchPreprocessor(enable_agc=False)
+        )
+        manager.create_session("s1", "p1")
+        await manager.start_session("s1")
+        for chunk in CHUNKS:
+            assert await manager.send_audio_chunk("s1", chunk)
+            await asyncio.sleep(0.002)
+        return await manager.close_session("s1")
+
+    summary = asyncio.run(run_async())
+    assert _words(summary) == _words(per_session[0])
+
+    print(f"✅ Same words and bytes sent; {stats['avg_batch_size']:.1f} chunks per pass")
+
+
+def test_close_all_sessions_stops_ticker():
+    """Test 4: close_all_sessions closes every session and stops the ticker"""
+    print("\n" + "="*60)
+    print("TEST 4: Ticker Shutdown")
+    print("="*60)
+
+    manager = StreamingSessionManager(
+        project_id="test-project", client=FakeSpeechClient(), vad_gating=True,
+        batch_preprocessor=BatchPreprocessor(enable_agc=False), preprocess_tick_ms=20
+    )
+    for idx in range(2):
+        manager.create_session(f"s{idx}", "p1")
+        manager.start_session(f"s{idx}")
+        assert manager.send_audio_chunk(f"s{idx}", CHUNKS[0])
+    ticker = manager._preprocess_ticker
+    assert ticker.is_alive()
+
+    summaries = manager.close_all_sessions()
+    assert sorted(summaries) == ["s0", "s1"]
+    assert not ticker.is_alive() and manager._preprocess_ticker is None
+
+    async def run_async():
+        manager = AsyncStreamingSessionManager(
+            project_id="test-project", client=FakeSpeechAsyncClient(), vad_gating=True,
+            batch_preprocessor=BatchPreprocessor(enable_agc=False)
+        )
+        manager.create_session("s1", "p1")
+        await manager.start_session("s1")
+        assert await manager.send_audio_chunk("s1", CHUNKS[0])
+        ticker = manager._preprocess_ticker
+        assert not ticker.done()
+
+        assert list(await manager.close_all_sessions()) == ["s1"]
+        assert ticker.done() and manager._preprocess_ticker is None
+
+    asyncio.run(run_async())
+    print("✅ Ticker stopped on close_all_sessions (threaded and async)")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*60)
+    print("BATCH PREPROCESSOR TESTS")
+    print("="*60)
+
+    try:
+        test_matches_per_session_preprocessing()
+        test_order_and_slots()
+        test_managers_share_batch_engine()
+        test_close_all_sessions_stops_ticker()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+        return 0
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+Test Deadline Scheduler
+
+Tests keyed deadlines (ordering, replacement, cancellation), the
+scheduler thread (and the loop-driven scheduler) waking only when
+something is due, and the session manager's renewal, idle-cleanup and
+stuck-stream deadlines.
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.deadline_scheduler import AsyncDeadlineScheduler, DeadlineScheduler
+from src.streaming.session_manager import StreamingSessionManager
+from src.streaming.session_renewer import SessionRenewer, RenewalStatus
+from tests.fake_recognizer import FakeSpeechClient
+
+
+SPEECH = (3000 * np.sin(np.arange(1600) / 5)).astype(np.int16).tobytes()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_deadlines():
+    """Test 1: Deadlines fire in order; rescheduling replaces, cancel removes"""
+    print("\n" + "="*60)
+    print("TEST 1: Keyed Deadlines")
+    print("="*60)
+
+    clock = FakeClock()
+    scheduler = DeadlineScheduler(clock=clock)
+    fired = []
+
+    for idx in range(1000):
+        scheduler.schedule(("idle", idx), 10 + idx % 7, lambda idx=idx: fired.append(idx))
+    scheduler.schedule(("idle", 3), 1.0, lambda: fired.append("early"))  # Replaces
+    for idx in range(500, 1000):
+        assert scheduler.cancel(("idle", idx))
+    assert not scheduler.cancel(("idle", 500))
+    assert len(scheduler) == 500
+    assert scheduler.due_in(("idle", 3)) == 1.0
+
+    clock.now = 5.0
+    assert scheduler.run_due() == 1 and fired == ["early"]
+
+    clock.now = 20.0
+    assert scheduler.run_due() == 499
+    assert sorted(fired[1:]) == [idx for idx in range(500) if idx != 3]
+    assert len(scheduler) == 0
+
+    # Stale entries are compacted rather than accumulating
+    for _ in range(10000):
+        scheduler.schedule("renewal", 100.0, lambda: None)
+    assert scheduler.get_stats()['heap_size'] < 200
+
+    print(f"✅ {scheduler.fired} fired, {scheduler.cancelled} cancelled, "
+          f"heap {scheduler.get_stats()['heap_size']}")
+
+
+def test_thread_wakes_when_due():
+    """Test 2: The scheduler thread sleeps until the earliest deadline"""
+    print("\n" + "="*60)
+    print("TEST 2: Wakeups")
+    print("="*60)
+
+    scheduler = DeadlineScheduler()
+    scheduler.start()
+    fired = []
+    try:
+        scheduler.schedule("b", 0.2, lambda: fired.append(("b", time.monotonic())))
+        scheduler.schedule("a", 0.1, lambda: fired.append(("a", time.monotonic())))
+        scheduler.schedule("later", 60.0, lambda: fired.append(("later", 0)))
+        start = time.monotonic()
+        time.sleep(0.4)
+    finally:
+        scheduler.stop()
+
+    assert [name for name, _ in fired] == ["a", "b"]
+    assert fired[0][1] - start >= 0.09
+    # Woken by the two new earliest deadlines and the two due times
+    assert scheduler.wakeups <= 6, scheduler.wakeups
+
+    print(f"✅ Fired in order with {scheduler.wakeups} wakeups")
+
+
+def test_session_deadlines():
+    """Test 3: Idle sessions are closed, stuck streams restarted, renewals driven"""
+    print("\n" + "="*60)
+    print("TEST 3: Session Deadlines")
+    print("="*60)
+
+    scheduler = DeadlineScheduler()
+
+    # Idle cleanup
+    manager = StreamingSessionManager(
+        project_id="test-project", client=FakeSpeechClient(),
+        scheduler=scheduler, idle_timeout_s=0.2
+    )
+    manager.create_session("idle", "p1")
+    manager.start_session("idle")
+    time.sleep(0.6)
+    assert manager.get_session_count() == 0
+    print("✅ Idle session closed")
+
+    # Stuck stream: stops taking audio after 0.5s
+    client = FakeSpeechClient(stall_after_s=0.5)
+    manager = StreamingSessionManager(
+        project_id="test-project", client=client, scheduler=scheduler,
+        audio_queue_ms=10000, stuck_timeout_s=0.2
+    )
+    session = manager.create_session("stuck", "p1")
+    manager.start_session("stuck")
+    for _ in range(20):
+        assert manager.send_audio_chunk("stuck", SPEECH)
+        time.sleep(0.03)
+    time.sleep(0.5)
+    assert session.stream_restarts == 1 and len(client.calls) == 2
+    manager.close_session("stuck")
+    assert client.calls[1].model.audio_bytes >= 15 * 3200  # Everything not yet sent
+    print(f"✅ Stuck stream restarted ({session.replayed_ms:.0f}ms replayed)")
+
+    # Renewal
+    client = FakeSpeechClient()
+    manager = StreamingSessionManager(
+        project_id="test-project", client=client, scheduler=scheduler, audio_queue_ms=10000
+    )
+    manager.RENEWAL_THRESHOLD_SECONDS = 0.3
+    renewer = SessionRenewer(session_manager=manager, overlap_ms=100)
+    renewer.RENEWAL_THRESHOLD_SECONDS = 0.3
+    renewer.start_monitoring()
+    session = manager.create_session("long", "p1")
+    manager.start_session("long")
+    for _ in range(30):
+        assert manager.send_audio_chunk("long", SPEECH)
+        time.sleep(0.03)
+    renewer.stop_monitoring()
+    manager.close_session("long")
+
+    history = renewer.get_renewal_history("long")
+    assert len(history) == 1 and history[0].status == RenewalStatus.COMPLETED
+    assert session.renewal_count == 1 and len(client.calls) == 2
+    assert len(scheduler) == 0
+
+    stats = scheduler.get_stats()
+    scheduler.stop()
+    print(f"✅ Renewal driven by deadline; scheduler stats: {stats}")
+
+
+def test_loop_scheduler_wakes_when_due():
+    """Test 4: The async scheduler runs deadlines on the event loop"""
+    print("\n" + "="*60)
+    print("TEST 4: Loop-Driven Wakeups")
+    print("="*60)
+
+    scheduler = AsyncDeadlineScheduler()
+    fired = []
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        scheduler.start()
+        scheduler.schedule("later", 60.0, lambda: fired.append(("later", 0)))
+        await asyncio.sleep(0.05)  # Asleep until "later"
+        scheduler.schedule("b", 0.2, lambda: fired.append(("b", time.monotonic(), loop)))
+        scheduler.schedule("a", 0.1, lambda: fired.append(("a", time.monotonic(), loop)))
+        start = time.monotonic()
+        await asyncio.sleep(0.4)
+        scheduler.stop()
+        await asyncio.sleep(0)
+        return start, asyncio.get_running_loop()
+
+    start, loop = asyncio.run(run())
+
+    assert [entry[0] for entry in fired] == ["a", "b"]
+    assert all(entry[2] is loop for entry in fired)
+    assert fired[0][1] - start >= 0.09
+    assert scheduler._task.done() and len(scheduler) == 1
+    # Woken by the new earliest deadlines and the two due times
+    assert scheduler.wakeups <= 6, scheduler.wakeups
+
+    print(f"✅ Fired in order on the loop with {scheduler.wakeups} wakeups")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("DEADLINE SCHEDULER TESTS")
+    print("="*60)
+
+    try:
+        test_deadlines()
+        test_thread_wakes_when_due()
+        test_session_deadlines()
+        test_loop_scheduler_wakes_when_due()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Test Rolling Matching Context
+
+Tests incremental keyword/embedding context for short streaming finals.
+"""
+
+import sys
+import math
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.slide_processing import SlideProcessor, RollingContext
+from src.streaming.result_handler import StreamingResultHandler
+
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'test_presentations'
+
+
+def test_incremental_updates_match_recomputation():
+    """Test 1: Counts and decayed embedding equal a from-scratch computation"""
+    print("\n" + "="*60)
+    print("TEST 1: Incremental Context Updates")
+    print("="*60)
+
+    rng = np.random.default_rng(0)
+    context = RollingContext(window_s=10.0, half_life_s=4.0)
+    history = []
+
+    timestamp = 0.0
+    for step in range(200):
+        timestamp += float(rng.uniform(0.2, 3.0))
+        keywords = [f"kw{int(k)}" for k in rng.integers(0, 15, size=rng.integers(0, 4))]
+        vector = rng.normal(size=16)
+        context.add(timestamp, keywords, vector)
+        history.append((timestamp, keywords, vector / np.linalg.norm(vector)))
+
+        window = [h for h in history if h[0] >= timestamp - 10.0]
+        expected_counts = {}
+        for _, words, _ in window:
+            for word in words:
+                expected_counts[word] = expected_counts.get(word, 0) + 1
+        assert dict(context.keyword_counts) == expected_counts
+        assert len(context) == len(window)
+
+        expected = sum(v * math.exp(-math.log(2) / 4.0 * (timestamp - t)) for t, _, v in window)
+        expected = expected / np.linalg.norm(expected)
+        assert np.allclose(context.embedding(), expected, atol=1e-5)
+
+    # Gap longer than the window empties the context
+    context.add(timestamp + 60.0, [])
+    assert len(context) == 1
+    assert context.keywords() == []
+    assert context.embedding() is None
+
+    print("✅ Incremental context equals recomputation over 200 updates")
+
+
+def _short_finals(segments):
+    """Split fixture sentences at punctuation into short streaming finals"""
+    finals = []
+    for segment in segments:
+        parts = [part for part in re.split('[、。]', segment['text']) if part.strip()]
+        step = (segment['end_time'] - segment['start_time']) / max(len(parts), 1)
+        for idx, part in enumerate(parts):
+            finals.append((part, segment['start_time'] + idx * step, segment['expected_slide']))
+    return finals
+
+
+def test_context_improves_short_finals():
+    """Test 2: Short finals match more often and more accurately with context"""
+    print("\n" + "="*60)
+    print("TEST 2: Short Finals With Rolling Context")
+    print("="*60)
+
+    with open(FIXTURES_DIR / 'machine_learning_intro.json', encoding='utf-8') as f:
+        presentation = json.load(f)
+    finals = _short_finals(presentation['transcript_segments'])
+
+    results = {}
+    for use_context in (False, True):
+        processor = SlideProcessor(use_embeddings=False, temporal_boost=0.15, switch_multiplier=1.2)
+        processor.process_slides(presentation['slides'])
+        context = RollingContext() if use_context else None
+
+        correct = unmatched = 0
+        for text, timestamp, expected in finals:
+            match = processor.match_segment(text, timestamp, context=context)
+            unmatched += match is None
+            correct += match is not None and match.slide_id == expected
+        results[use_context] = (correct, unmatched)
+
+    print(f"  without context: {results[False]}, with context: {results[True]} "
+          f"(correct, unmatched) of {len(finals)}")
+    assert results[True][0] > results[False][0]
+    assert results[True][1] < results[False][1]
+
+    print("✅ Rolling context improves short-final matching")
+
+
+def test_handler_context_lifecycle():
+    """Test 3: Handler feeds finals into its context and reset clears it"""
+    print("\n" + "="*60)
+    print("TEST 3: Handler Context Lifecycle")
+    print("="*60)
+
+    with open(FIXTURES_DIR / 'python_tutorial.json', encoding='utf-8') as f:
+        presentation = json.load(f)
+
+    handler = StreamingResultHandler(enable_slide_matching=True)
+    handler.slide_processor = SlideProcessor(use_embeddings=False)
+    handler.slide_processor.process_slides(presentation['slides'])
+    handler.slides_loaded = True
+    handler.rolling_context = RollingContext(window_s=handler.context_window_s)
+
+    for segment in presentation['transcript_segments'][:5]:
+        handler.handle_final_result(segment['text'], 0.9, timestamp=segment['start_time'])
+
+    assert len(handler.rolling_context) == 5
+    assert handler.rolling_context.keywords()
+
+    handler.reset()
+    assert handler.rolling_context is None
+
+    print("✅ Handler context filled by finals and cleared on reset")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("ROLLING CONTEXT TESTS")
+    print("="*60)
+
+    try:
+        test_incremental_updates_match_recomputation()
+        test_context_improves_short_finals()
+        test_handler_context_lifecycle()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,11 @@ Tests the automatic session renewal mechanism for long-running streaming session
 
 import sys
 import time
+import threading
 from pathlib import Path
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -16,7 +19,9 @@ from src.streaming import (
     RenewalEvent,
     RenewalStatus,
     AudioBuffer,
+    StreamingSessionManager,
 )
+from tests.fake_recognizer import FakeSpeechClient
 
 
 def test_audio_buffer():
@@ -217,6 +222,165 @@ def test_renewal_threshold():
     print("\n✅ Renewal threshold tests completed")
 
 
+def _renew_while_streaming(**manager_options):
+    """Stream 8s of audio from another thread and renew halfway; returns everything checked"""
+    client = FakeSpeechClient()
+    manager = StreamingSessionManager(project_id="test-project", client=client, **manager_options)
+    session = manager.create_session("s1", "p1")
+    manager.start_session("s1")
+    renewer = SessionRenewer(session_manager=manager, overlap_ms=300)
+    
+    # 1.5s speech / 0.7s silence, sent from another thread during renewal
+    speech = (3000 * np.sin(np.arange(1600) / 5)).astype(np.int16).tobytes()
+    silence = b'\x00' * 3200
+    chunks = [speech if idx % 22 < 15 else silence for idx in range(80)]
+    refused = []
+    halfway = threading.Event()
+    
+    def sender():
+        for idx, chunk in enumerate(chunks):
+            if not manager.send_audio_chunk("s1", chunk):
+                refused.append(idx)
+            if idx == 25:
+                halfway.set()
+            time.sleep(0.01)
+    
+    thread = threading.Thread(target=sender)
+    thread.start()
+    halfway.wait(timeout=5.0)
+    renewer._renew_session("s1", session)
+    thread.join()
+    summary = manager.close_session("s1")
+    return client, session, renewer, chunks, refused, summary
+
+
+def test_make_before_break_renewal():
+    """Test 5: Renewal overlaps streams without refusing audio or duplicating words"""
+    print("\n" + "="*60)
+    print("TEST 5: Make-Before-Break Renewal")
+    print("="*60)
+    
+    client, session, renewer, chunks, refused, summary = _renew_while_streaming(audio_queue_ms=60000)
+    
+    event = renewer.get_renewal_history("s1")[0]
+    assert event.status == RenewalStatus.COMPLETED, event.error_message
+    assert refused == [], f"Chunks refused during renewal: {refused}"
+    assert len(client.calls) == 2 and session.renewal_count == 1
+    
+    # Both streams heard the overlap; nothing was lost
+    old_bytes, new_bytes = (call.model.audio_bytes for call in client.calls)
+    resent_ms = event.replayed_ms + event.overlap_audio_ms
+    assert old_bytes + new_bytes == len(chunks) * 3200 + resent_ms * 32
+    assert event.overlap_audio_ms > 0 and event.replayed_ms > 0
+    
+    # Words are on one audio clock and never repeat
+    words = [w for r in session.result_handler.get_final_results() for w in r.words]
+    assert words
+    for prev, word in zip(words, words[1:]):
+        assert word["start_time"] >= prev["end_time"] - 1e-6, (prev, word)
+    assert words[-1]["end_time"] <= len(chunks) * 0.1 + 1e-6
+    assert summary["session"]["duplicate_results"] == event.duplicate_results
+    
+    stats = renewer.get_renewal_stats()
+    assert stats["successful_renewals"] == 1
+    
+    print(f"✅ Open latency: {event.open_latency * 1000:.1f}ms, "
+          f"replay: {event.replayed_ms:.0f}ms, "
+          f"overlap: {event.overlap_audio_ms:.0f}ms of audio")
+    print(f"✅ Duplicates removed: {event.duplicate_results} results, "
+          f"{event.duplicate_words} words; 0 chunks refused")
+    
+    print("\n✅ Make-before-break renewal tests completed")
+
+
+def test_renewal_at_default_queue_settings():
+    """Test 6: Replay beyond the default 2s queue survives renewal; words match"""
+    print("\n" + "="*60)
+    print("TEST 6: Renewal at Default Queue Settings")
+    print("="*60)
+    
+    words = lambda s: [(w["word"], w["start_time"]) for r in s.result_handler.get_final_results() for w in r.words]
+    
+    for policy in ("drop_oldest", "block"):
+        client, session, renewer, chunks, refused, summary = _renew_while_streaming(backpressure_policy=policy)
+        event = renewer.get_renewal_history("s1")[0]
+        assert event.status == RenewalStatus.COMPLETED, event.error_message
+        assert refused == [] and event.replayed_ms >= 2500, event.replayed_ms
+        assert summary["session"]["renewal_count"] == 1
+        # Nothing was evicted from either stream's queue
+        old_bytes, new_bytes = (call.model.audio_bytes for call in client.calls)
+        assert old_bytes + new_bytes == len(chunks) * 3200 + (event.replayed_ms + event.overlap_audio_ms) * 32
+        assert event.renewal_duration() < 2.0, event.renewal_duration()
+        
+        # Same words at the same offsets as a session that was never renewed
+        manager = StreamingSessionManager(project_id="test-project", client=FakeSpeechClient(),
+                                          backpressure_policy=policy)
+        baseline_session = manager.create_session("s1", "p1")
+        manager.start_session("s1")
+        for chunk in chunks:
+            manager.send_audio_chunk("s1", chunk)
+            time.sleep(0.01)
+        manager.close_session("s1")
+        assert words(session) == words(baseline_session), (policy, words(session), words(baseline_session))
+        
+        print(f"✅ {policy}: replayed {event.replayed_ms:.0f}ms into a 2000ms queue; "
+              f"{len(words(session))} words match an unrenewed session")
+
+
+def test_sessions_renew_in_parallel():
+    """Test 7: Sessions falling due together renew at the same time"""
+    print("\n" + "="*60)
+    print("TEST 7: Parallel Renewals")
+    print("="*60)
+    
+    class MockSession:
+        def __init__(self, session_id):
+            self.session_id = session_id
+            self.created_at = time.time() - 280
+            self.renewal_count = 0
+            self.status = type('obj', (object,), {'value': 'active'})()
+        
+        def duration(self):
+            return time.time() - self.created_at
+    
+    class SlowRenewalManager:
+        """renew_stream takes as long as an overlap plus a drain"""
+        def __init__(self):
+            self.sessions = {f"s{i}": MockSession(f"s{i}") for i in range(6)}
+            self.calls = []
+        
+        def get_active_sessions(self):
+            return self.sessions
+        
+        def renew_stream(self, session_id, overlap_ms):
+            self.calls.append(session_id)
+            time.sleep(0.5)
+            self.sessions[session_id].created_at = time.time()
+            return {"open_latency_s": 0.01, "overlap_audio_ms": overlap_ms, "replayed_ms": 0.0,
+                    "duplicate_results": 0, "duplicate_words": 0}
+    
+    manager = SlowRenewalManager()
+    renewer = SessionRenewer(session_manager=manager)
+    
+    started = time.time()
+    for session_id, session in manager.sessions.items():
+        renewer._on_renewal_due(session_id, session)
+        renewer._on_renewal_due(session_id, session)  # Already renewing: ignored
+    deadline = time.time() + 5.0
+    while len(renewer.get_renewal_history()) < 6 and time.time() < deadline:
+        time.sleep(0.02)
+    elapsed = time.time() - started
+    
+    history = renewer.get_renewal_history()
+    assert len(history) == 6 and sorted(manager.calls) == sorted(manager.sessions)
+    assert all(e.status == RenewalStatus.COMPLETED for e in history)
+    # One after another would take 6 x 0.5s
+    assert elapsed < 1.5, f"Renewals ran one after another ({elapsed:.2f}s)"
+    assert not renewer.renewing
+    
+    print(f"✅ 6 renewals of 0.5s finished in {elapsed:.2f}s")
+
+
 def main():
     """Run all tests"""
     print("\n" + "="*60)
@@ -228,13 +392,16 @@ def main():
         test_renewal_event()
         test_session_renewer_basic()
         test_renewal_threshold()
+        test_make_before_break_renewal()
+        test_renewal_at_default_queue_settings()
+        test_sessions_renew_in_parallel()
         
         print("\n" + "="*60)
         print("✅ ALL TESTS PASSED")
         print("="*60)
         print("\nSession renewal module is ready!")
         print("\nKey features:")
-        print("  • Audio buffering during renewal")
+        print("  • Make-before-break renewal (no audio gap)")
         print("  • Renewal threshold at 4.5 minutes")
         print("  • Event tracking and statistics")
         print("  • Seamless session transition")
@@ -19,7 +19,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from pdf_processing import PDFExtractor, JapaneseNLP, KeywordIndexer, EmbeddingGenerator
+from pdf_processing import PDFExtractor, JapaneseNLP, KeywordIndexer, EmbeddingGenerator, TaggerPool
 from matching import ExactMatcher, FuzzyMatcher, SemanticMatcher, ScoreCombiner
 
 
@@ -58,6 +58,34 @@ class TestPhase4Basic(unittest.TestCase):
         self.assertEqual(normalized, "ABC123")
         print(f"\n✓ Normalized full-width to half-width: {text} -> {normalized}")
         
+    def test_japanese_nlp_normalization_tables(self):
+        """Test single-pass normalization matches the step-by-step conversions"""
+        text = "第三章　ＧＰＵとゼロから学ぶ  ディープラーニング（２０２５）\n十万件"
+        normalized = self.nlp.normalize_text(text)
+        stepwise = " ".join(self.nlp._kanji_to_arabic(self.nlp._full_to_half(text)).split())
+        
+        self.assertEqual(normalized, "第3章 GPUと0から学ぶ ディープラーニング(2025) 1010000件")
+        self.assertEqual(normalized, stepwise)
+        self.assertEqual(self.nlp.normalize_many([text, ""]), [normalized, ""])
+        self.assertEqual(self.nlp.to_hiragana("モデルとテストを学習"), "もでるとてすとを学習")
+        print(f"\n✓ Normalized in one pass: {normalized}")
+        
+    def test_japanese_nlp_normalization_keeps_words(self):
+        """Test kanji numerals inside ordinary words are not converted"""
+        texts = {
+            "一般的な方法です": "一般的な方法です",
+            "表記を統一する": "表記を統一する",
+            "時間は十分です": "時間は十分です",
+            "千葉県で開催": "千葉県で開催",
+            "一緒に学ぶ": "一緒に学ぶ",
+            "十分間の休憩と三つのポイント": "10分間の休憩と3つのポイント",
+            "二〇二四年の第一回": "2024年の第1回",
+        }
+        self.assertEqual(self.nlp.normalize_many(list(texts)), list(texts.values()))
+        for word in ["一般", "統一", "千葉", "一緒"]:
+            self.assertEqual(self.nlp.normalize_text(word), word)
+        print(f"\n✓ Numerals converted only in numeral tokens: {list(texts.values())[-2:]}")
+        
     def test_japanese_nlp_sentence_segmentation(self):
         """Test sentence segmentation"""
         text = "これは最初の文です。これは二番目の文です！三番目の文もあります？"
@@ -68,6 +96,41 @@ class TestPhase4Basic(unittest.TestCase):
         for i, sent in enumerate(sentences, 1):
             print(f"  {i}. {sent}")
             
+    def test_japanese_nlp_tagger_pool(self):
+        """Test threads share a tagger pool and batch APIs match single calls"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        texts = [
+            "機械学習は人工知能の一分野です。",
+            "ニューラルネットワークを使います。",
+            "",
+            "教師あり学習と教師なし学習の違いを説明します。",
+        ] * 25
+        
+        pool = TaggerPool()
+        nlp = JapaneseNLP(tagger_pool=pool)
+        expected = [nlp.extract_keywords(text) for text in texts]
+        
+        # Batch API: one checkout, same results
+        self.assertEqual(nlp.extract_keywords_many(texts), expected)
+        self.assertEqual(
+            [[t.surface for t in tokens] for tokens in nlp.tokenize_many(texts)],
+            [[t.surface for t in nlp.tokenize(text)] for text in texts]
+        )
+        
+        # Concurrent use of one instance from several threads
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(nlp.extract_keywords, texts))
+        self.assertEqual(results, expected)
+        
+        # Taggers are reused, never more than one per concurrent thread
+        self.assertLessEqual(pool.created, 4)
+        self.assertEqual(pool.idle_count, pool.created)
+        
+        # Other instances share the process-wide pool by default
+        self.assertIs(JapaneseNLP().tagger_pool, self.nlp.tagger_pool)
+        print(f"\n✓ {len(texts)} texts tokenized from 4 threads with {pool.created} taggers")
+        
     def test_keyword_indexer(self):
         """Test keyword indexing"""
         # Sample slide keywords
@@ -93,6 +156,55 @@ class TestPhase4Basic(unittest.TestCase):
         scores = indexer.calculate_slide_scores(query_keywords)
         print(f"  Query keywords {query_keywords} scored: {scores}")
         
+    def test_keyword_indexer_bm25(self):
+        """Test BM25 indexing with one posting per (keyword, slide)"""
+        slide_keywords = [
+            ["機械学習", "機械学習", "機械学習", "人工知能"],  # Slide 1: repeated keyword
+            ["機械学習", "データ", "学習", "アルゴリズム", "統計", "分析"],  # Slide 2: longer slide
+            ["深層学習", "ニューラル", "ネットワーク"],  # Slide 3
+        ]
+        slide_ids = [1, 2, 3]
+
+        tfidf_indexer = KeywordIndexer(scoring='tfidf')
+        tfidf_index = tfidf_indexer.build_index(slide_keywords, slide_ids)
+
+        bm25_indexer = KeywordIndexer(scoring='bm25')
+        bm25_index = bm25_indexer.build_index(slide_keywords, slide_ids)
+
+        # One posting per (keyword, slide) instead of one per position
+        self.assertEqual(len(tfidf_index["機械学習"]), 4)
+        self.assertEqual(len(bm25_index["機械学習"]), 2)
+        self.assertEqual(dict((sid, tf) for sid, tf, _ in bm25_index["機械学習"]), {1: 3, 2: 1})
+
+        # Length norms precomputed per slide (longer slide -> larger norm)
+        self.assertEqual(set(bm25_indexer.slide_norms), {1, 2, 3})
+        self.assertGreater(bm25_indexer.slide_norms[2], bm25_indexer.slide_norms[3])
+
+        # Single-pass matching over per-slide postings
+        matcher = ExactMatcher(bm25_index, positional=bm25_indexer.is_positional)
+        matches = matcher.match(["機械学習", "人工知能"])
+        self.assertEqual(set(matches), {1, 2})
+        self.assertGreater(matches[1]['score'], matches[2]['score'])
+        self.assertEqual(matches[1]['match_count'], 2)
+
+        # Scores agree with the indexer's own scoring
+        scores = bm25_indexer.calculate_slide_scores(["機械学習", "人工知能"])
+        self.assertAlmostEqual(scores[1], matches[1]['score'])
+
+        # Round trip through save/load keeps the mode and norms
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index_path = os.path.join(tmp_dir, 'bm25_index.pkl')
+            bm25_indexer.save_index(index_path)
+            loaded = KeywordIndexer.load_index(index_path)
+        self.assertEqual(loaded.scoring, 'bm25')
+        self.assertEqual(loaded.slide_norms, bm25_indexer.slide_norms)
+
+        with self.assertRaises(ValueError):
+            KeywordIndexer(scoring='unknown')
+
+        print(f"\n✓ BM25 index: {bm25_indexer.get_index_stats()['total_postings']} postings "
+              f"vs {tfidf_indexer.get_index_stats()['total_postings']} TF-IDF postings")
+
     def test_exact_matcher(self):
         """Test exact keyword matching"""
         # Build sample index
@@ -0,0 +1,127 @@
+"""
+Test Batch Transcript Matching
+
+Tests two-phase match_transcript: parallel segment scoring followed by
+sequential temporal smoothing must give the same results as serial matching.
+"""
+
+import sys
+import json
+import pickle
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.slide_processing import SlideProcessor
+
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'test_presentations'
+
+
+def _load_presentation(name: str) -> dict:
+    with open(FIXTURES_DIR / f'{name}.json', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_deck_state_roundtrip():
+    """Test 1: Exported deck state is picklable and scores identically"""
+    print("\n" + "="*60)
+    print("TEST 1: Deck State Round Trip")
+    print("="*60)
+
+    presentation = _load_presentation('business_strategy')
+    processor = SlideProcessor(use_embeddings=False, keyword_scoring='bm25')
+    processor.process_slides(presentation['slides'])
+
+    state = pickle.loads(pickle.dumps(processor.export_deck_state()))
+    clone = SlideProcessor.from_deck_state(state)
+
+    assert clone.slide_ids == processor.slide_ids
+    assert clone.exact_matcher.positional == processor.exact_matcher.positional
+
+    for segment in presentation['transcript_segments']:
+        assert clone._score_segment(segment['text']) == processor._score_segment(segment['text'])
+
+    print(f"✅ {len(presentation['transcript_segments'])} segments scored identically")
+
+
+def test_deck_state_caches_normalized_text():
+    """Test 2: Slides are normalized once at build time and exported normalized"""
+    print("\n" + "="*60)
+    print("TEST 2: Normalized Deck State")
+    print("="*60)
+
+    slides = [
+        {'page': 1, 'title': 'ＧＰＵ入門', 'content': '第一章　ＣＵＤＡの基礎'},
+        {'page': 2, 'title': '分散学習', 'content': '十台のサーバーで学習'},
+    ]
+    processor = SlideProcessor(use_embeddings=False)
+    processor.process_slides(slides)
+
+    assert processor.slide_texts == ['GPU入門 第1章 CUDAの基礎', '分散学習 10台のサーバーで学習']
+    assert 'GPU' in processor.slide_keywords[1]
+
+    # Deck state carries the normalized forms; loading must not redo the work
+    clone = SlideProcessor.from_deck_state(processor.export_deck_state())
+    assert clone.slide_texts == processor.slide_texts
+    assert clone.normalize
+
+    # Transcripts get the same normalization, so full-width speech matches
+    exact, _, _ = clone._score_segment('ＧＰＵを使います')
+    assert 1 in exact
+
+    print("✅ Slides and transcripts normalized identically")
+
+
+def test_parallel_matches_serial():
+    """Test 3: Parallel match_transcript equals serial for both decoders"""
+    print("\n" + "="*60)
+    print("TEST 3: Parallel vs Serial Matching")
+    print("="*60)
+
+    for name in ('machine_learning_intro', 'python_tutorial'):
+        presentation = _load_presentation(name)
+        segments = presentation['transcript_segments']
+
+        for decoder in ('greedy', 'viterbi'):
+            serial = SlideProcessor(use_embeddings=False)
+            serial.process_slides(presentation['slides'])
+            expected = serial.match_transcript(segments, decoder=decoder)
+
+            parallel = SlideProcessor(use_embeddings=False)
+            parallel.process_slides(presentation['slides'])
+            actual = parallel.match_transcript(segments, decoder=decoder, workers=2)
+
+            assert actual == expected, f"{name}/{decoder}: parallel results differ"
+            assert parallel.score_combiner.current_slide_id == serial.score_combiner.current_slide_id
+
+            print(f"   {name} ({decoder}): {len(actual)} segments identical")
+
+    print("✅ Parallel matching identical to serial")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("BATCH TRANSCRIPT MATCHING TESTS")
+    print("="*60)
+
+    try:
+        test_deck_state_roundtrip()
+        test_deck_state_caches_normalized_text()
+        test_parallel_matches_serial()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Test Speculative Interim Matching
+
+Tests background matching of interim results: non-committing peeks,
+supersession of stale interims, and reuse of interim work by finals.
+"""
+
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.slide_processing import SlideProcessor
+from src.streaming.result_handler import StreamingResultHandler
+from src.streaming.session_manager import StreamingSessionManager
+from tests.fake_recognizer import FakeSpeechClient
+from src.streaming.speculative_matcher import SpeculativeMatcher
+
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'test_presentations'
+
+
+def _load_presentation():
+    with open(FIXTURES_DIR / 'machine_learning_intro.json', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _build_processor(presentation):
+    processor = SlideProcessor(use_embeddings=False)
+    processor.process_slides(presentation['slides'])
+    return processor
+
+
+def _interims(text, step=4):
+    """Growing prefixes of a final, as a recognizer would emit them"""
+    return [text[:end] for end in range(step, len(text), step)]
+
+
+def test_peek_does_not_commit():
+    """Test 1: peek_segment returns combine()'s answer without switching slides"""
+    print("\n" + "="*60)
+    print("TEST 1: Non-Committing Peek")
+    print("="*60)
+
+    presentation = _load_presentation()
+    processor = _build_processor(presentation)
+    combiner = processor.score_combiner
+
+    for segment in presentation['transcript_segments'][:15]:
+        state = (combiner.current_slide_id, list(combiner.match_history))
+        peeked = processor.peek_segment(segment['text'], segment['start_time'])
+        assert (combiner.current_slide_id, combiner.match_history) == state
+
+        final = processor.match_segment(segment['text'], segment['start_time'])
+        assert (peeked is None) == (final is None)
+        if final is not None:
+            assert (peeked.slide_id, peeked.score) == (final.slide_id, final.score)
+
+    print("✅ Peeks match finals and leave temporal state untouched")
+
+
+def test_final_reuses_interim_work():
+    """Test 2: Finals matched with the interims' work cache are unchanged"""
+    print("\n" + "="*60)
+    print("TEST 2: Final Reuses Interim Work")
+    print("="*60)
+
+    presentation = _load_presentation()
+    cached = _build_processor(presentation)
+    plain = _build_processor(presentation)
+
+    reused = 0
+    for segment in presentation['transcript_segments']:
+        work_cache = {}
+        for interim in _interims(segment['text']):
+            cached.peek_segment(interim, segment['start_time'], work_cache=work_cache)
+        seen = set(work_cache.get('fuzzy', {}))
+
+        final_cached = cached.match_segment(segment['text'], segment['start_time'], work_cache=work_cache)
+        final_plain = plain.match_segment(segment['text'], segment['start_time'])
+
+        assert (final_cached is None) == (final_plain is None)
+        if final_plain is not None:
+            assert final_cached.slide_id == final_plain.slide_id
+            assert final_cached.score == final_plain.score
+            assert sorted(final_cached.matched_keywords) == sorted(final_plain.matched_keywords)
+
+        final_keywords = set(cached.nlp.extract_keywords(cached.nlp.normalize_text(segment['text'])))
+        reused += len(final_keywords & seen)
+
+    assert reused > 0
+    print(f"✅ Finals identical with cache; {reused} keyword scans reused from interims")
+
+
+def test_stale_interims_superseded():
+    """Test 3: Bursts are coalesced and only current generations are emitted"""
+    print("\n" + "="*60)
+    print("TEST 3: Debounce and Supersession")
+    print("="*60)
+
+    presentation = _load_presentation()
+    processor = _build_processor(presentation)
+
+    emitted = []
+    done = threading.Event()
+
+    def on_match(generation, match):
+        emitted.append(generation)
+        done.set()
+
+    speculative = SpeculativeMatcher(processor, on_match, debounce_ms=50, min_interval_ms=0)
+    try:
+        text = presentation['transcript_segments'][3]['text']
+        interims = [i for i in _interims(text, step=2) if len(i) >= speculative.min_chars]
+        for interim in interims:
+            last_generation = speculative.submit(interim)
+
+        assert done.wait(2.0)
+        time.sleep(0.1)
+
+        # One burst, one match, for the latest interim
+        assert emitted == [last_generation]
+        assert speculative.coalesced == len(interims) - 1
+
+        # A final supersedes anything still queued
+        speculative.submit(text + "です")
+        cache = speculative.finalize()
+        assert 'fuzzy' in cache
+        time.sleep(0.15)
+        assert emitted == [last_generation]
+        assert speculative.superseded >= 1
+    finally:
+        speculative.close()
+
+    print(f"✅ {len(interims)} interims -> 1 match; stats: {speculative.get_stats()}")
+
+
+def test_handler_emits_early_slide():
+    """Test 4: Handler forwards the interim again with a speculative slide"""
+    print("\n" + "="*60)
+    print("TEST 4: Handler Speculative Slide")
+    print("="*60)
+
+    # Opt-in: the matcher's worker thread only exists when asked for
+    assert not StreamingResultHandler().speculative_matching
+    manager = StreamingSessionManager(project_id="test-project", client=FakeSpeechClient(), speculative_matching=True)
+    assert manager.create_session("s1", "p1").result_handler.speculative_matching
+
+    presentation = _load_presentation()
+    results = []
+    handler = StreamingResultHandler(result_callback=results.append, enable_slide_matching=True)
+    handler.slide_processor = _build_processor(presentation)
+    handler.slides_loaded = True
+    handler._start_speculative_matching()
+
+    try:
+        segment = presentation['transcript_segments'][0]
+        handler.handle_interim_result(segment['text'], 0.8, timestamp=segment['start_time'])
+
+        deadline = time.time() + 2.0
+        while time.time() < deadline and not any(r.slide_id for r in results):
+            time.sleep(0.02)
+
+        speculative = [r for r in results if not r.is_final and r.slide_id is not None]
+        assert speculative, "Expected a speculative slide on the interim"
+
+        final = handler.handle_final_result(segment['text'], 0.9, timestamp=segment['start_time'])
+        assert final.slide_id == speculative[-1].slide_id
+        assert handler.get_matching_stats()['speculative']['matched'] == 1
+    finally:
+        handler.reset()
+
+    assert handler.speculative_matcher is None
+    print(f"✅ Slide {speculative[-1].slide_id} shown on interim before the final")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("SPECULATIVE MATCHING TESTS")
+    print("="*60)
+
+    try:
+        test_peek_does_not_commit()
+        test_final_reuses_interim_work()
+        test_stale_interims_superseded()
+        test_handler_emits_early_slide()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
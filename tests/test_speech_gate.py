@@ -0,0 +1,164 @@
+"""
+Test Speech Gate
+
+Tests VAD-gated sending: silence is withheld, speech onsets are sent with
+their pre-roll, keep-alives go out during long silences, and sessions
+that gate their audio recognize the same words while billing less audio.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.speech_gate import SpeechGate
+from src.streaming.session_manager import StreamingSessionManager
+from src.streaming.async_session_manager import AsyncStreamingSessionManager
+from src.streaming.metrics_collector import MetricsCollector
+from tests.fake_recognizer import FakeSpeechClient, FakeSpeechAsyncClient
+
+
+SPEECH = (3000 * np.sin(np.arange(1600) / 5)).astype(np.int16).tobytes()
+NOISE = (np.random.default_rng(0).normal(0, 20, 1600)).astype(np.int16).tobytes()
+
+# 3s pause, 2s talk, 8s pause, 2s talk, 3s pause (100ms chunks)
+CHUNKS = [NOISE] * 30 + [SPEECH] * 20 + [NOISE] * 80 + [SPEECH] * 20 + [NOISE] * 30
+
+
+def test_gate_preroll_and_keepalive():
+    """Test 1: Withheld silence, pre-roll at onsets, keep-alives in long pauses"""
+    print("\n" + "="*60)
+    print("TEST 1: Pre-Roll and Keep-Alive")
+    print("="*60)
+
+    gate = SpeechGate(preroll_ms=500, keepalive_interval_s=5.0)
+    sent = []
+    for idx, chunk in enumerate(CHUNKS):
+        for out in gate.process(chunk, now=idx * 0.1):
+            sent.append((idx, out))
+
+    # Nothing before the first onset; the VAD confirms speech after 300ms,
+    # and the pre-roll carries the first speech chunk and 300ms before it
+    first_idx, first_chunk = sent[0]
+    assert first_idx == 32, first_idx
+    assert [chunk for _, chunk in sent[:6]] == [NOISE] * 3 + [SPEECH] * 3
+
+    # Speech after the onset, plus 1.9s of hangover into each pause
+    stats = gate.get_stats()
+    assert stats['speech_ms'] == 2 * (1800 + 1900), stats
+    assert stats['preroll_ms'] == 2 * 500
+
+    # 8s pause: hangover sent up to 6.8s, one keep-alive 5s later
+    keepalives = [idx for idx, _ in sent if 69 <= idx < 130]
+    assert keepalives == [118], keepalives
+    assert stats['keepalive_ms'] == 100, stats
+
+    total_ms = len(CHUNKS) * 100
+    sent_ms = stats['speech_ms'] + stats['preroll_ms'] + stats['keepalive_ms']
+    assert abs(sent_ms + stats['saved_ms'] + stats['withheld_ms'] - total_ms) < 1e-6
+    assert sent_ms == len(sent) * 100
+
+    print(f"✅ Sent {sent_ms:.0f}ms of {total_ms}ms "
+          f"(saved {stats['saved_ratio']:.0%}, keep-alive {stats['keepalive_ms']:.0f}ms)")
+
+
+def _stream(manager, session_id: str):
+    manager.create_session(session_id, "p1")
+    manager.start_session(session_id)
+    for chunk in CHUNKS:
+        assert manager.send_audio_chunk(session_id, chunk)
+        time.sleep(0.002)
+    summary = manager.close_session(session_id)
+    words = [w["word"] for r in summary["results"]["segments"] for w in r["words"]]
+    return summary, words
+
+
+def test_gated_session_saves_billed_audio():
+    """Test 2: Gated sessions get the same words and report saved seconds"""
+    print("\n" + "="*60)
+    print("TEST 2: Gated Session Cost")
+    print("="*60)
+
+    plain = StreamingSessionManager(project_id="test-project", client=FakeSpeechClient(),
+                                    audio_queue_ms=20000)
+    baseline, baseline_words = _stream(plain, "s1")
+
+    metrics = MetricsCollector()
+    metrics.register_session("s2", "p1")
+    gated = StreamingSessionManager(project_id="test-project", client=FakeSpeechClient(),
+                                    audio_queue_ms=20000, metrics_collector=metrics,
+                                    vad_gating=True)
+    summary, words = _stream(gated, "s2")
+
+    assert baseline_words and words == baseline_words, (words, baseline_words)
+    sent = summary["session"]["total_bytes_sent"]
+    assert sent < 0.6 * baseline["session"]["total_bytes_sent"], sent
+
+    gate_stats = summary["speech_gate"]
+    cost = metrics.cost.get_stats()
+    assert abs(cost["saved_audio_seconds"] - gate_stats["saved_ms"] / 1000) < 1e-6
+    assert abs(cost["saved_audio_seconds"] * 32000 + sent - len(CHUNKS) * 3200) < 1
+    assert cost["saved_cost_usd"] > 0
+    assert metrics.get_session_metrics("s2")["audio_saved_seconds"] == cost["saved_audio_seconds"]
+
+    print(f"✅ {len(words)} words either way; sent {sent} of "
+          f"{baseline['session']['total_bytes_sent']} bytes, "
+          f"saved {cost['saved_audio_seconds']:.1f}s")
+
+
+def test_async_gated_session():
+    """Test 3: The async manager gates audio the same way"""
+    print("\n" + "="*60)
+    print("TEST 3: Async Gated Session")
+    print("="*60)
+
+    async def run():
+        manager = AsyncStreamingSessionManager(
+            project_id="test-project", client=FakeSpeechAsyncClient(),
+            audio_queue_ms=20000, vad_gating=True
+        )
+        manager.create_session("s1", "p1")
+        await manager.start_session("s1")
+        for chunk in CHUNKS:
+            assert await manager.send_audio_chunk("s1", chunk)
+            await asyncio.sleep(0)
+        return await manager.close_session("s1")
+
+    summary = asyncio.run(run())
+    words = [w for r in summary["results"]["segments"] for w in r["words"]]
+    gate_stats = summary["speech_gate"]
+    assert words
+    assert summary["session"]["total_bytes_sent"] / 32 == (
+        gate_stats["speech_ms"] + gate_stats["preroll_ms"] + gate_stats["keepalive_ms"]
+    )
+
+    print(f"✅ {len(words)} words, saved {gate_stats['saved_ms']:.0f}ms")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*60)
+    print("SPEECH GATE TESTS")
+    print("="*60)
+
+    try:
+        test_gate_preroll_and_keepalive()
+        test_gated_session_saves_billed_audio()
+        test_async_gated_session()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+        return 0
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Test Slide Matching Stage Timing
+
+Tests per-stage latency histograms, their export to streaming stats and
+the benchmark's baseline comparison.
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.slide_processing import SlideProcessor
+from src.slide_processing.stage_timing import LatencyHistogram, StageTimer, MATCH_STAGES
+from src.streaming.metrics_collector import MetricsCollector
+from src.streaming.result_handler import StreamingResultHandler, MAX_LATENCY_SAMPLES
+from src.streaming.session_manager import StreamingSessionManager
+from tests.fake_recognizer import FakeSpeechClient
+from scripts.benchmark_slide_matching import compare_results, median_results
+
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'test_presentations'
+
+
+def _load_processor(**kwargs) -> tuple:
+    with open(FIXTURES_DIR / 'python_tutorial.json', encoding='utf-8') as f:
+        presentation = json.load(f)
+    processor = SlideProcessor(use_embeddings=False, **kwargs)
+    processor.process_slides(presentation['slides'])
+    return processor, presentation['transcript_segments']
+
+
+def test_latency_histogram():
+    """Test 1: Fixed buckets, percentiles and merge"""
+    print("\n" + "="*60)
+    print("TEST 1: Latency Histogram")
+    print("="*60)
+
+    histogram = LatencyHistogram(buckets=(1.0, 10.0, 100.0))
+    for latency in [0.5] * 90 + [50.0] * 9 + [400.0]:
+        histogram.observe(latency)
+
+    assert histogram.counts == [90, 0, 9, 1]
+    assert histogram.percentile(50) == 1.0
+    assert histogram.percentile(95) == 100.0
+    assert histogram.percentile(100) == 400.0
+
+    other = LatencyHistogram(buckets=(1.0, 10.0, 100.0))
+    other.observe(5.0)
+    histogram.merge(other)
+    assert histogram.count == 101 and histogram.counts[1] == 1
+
+    print("✅ Histogram buckets and percentiles correct")
+
+
+def test_processor_stage_stats():
+    """Test 2: match_segment records every stage; disabled records nothing"""
+    print("\n" + "="*60)
+    print("TEST 2: SlideProcessor Stage Stats")
+    print("="*60)
+
+    processor, segments = _load_processor()
+    for segment in segments:
+        processor.match_segment(segment['text'], segment['start_time'])
+
+    stats = processor.get_stage_stats()
+    for stage in MATCH_STAGES:
+        assert stats['stages'][stage]['count'] == len(segments)
+    assert set(stats['last_spans_ms']) == set(MATCH_STAGES)
+
+    spans = stats['last_spans_ms']
+    parts = sum(spans[stage] for stage in MATCH_STAGES if stage != 'total')
+    assert parts <= spans['total'] + 1e-6
+
+    print(f"   total p95: {stats['stages']['total']['p95_ms']:.2f}ms")
+
+    # Switched off: no timer, identical results
+    plain, _ = _load_processor(enable_stage_timing=False)
+    assert plain.stage_timer is None
+    assert plain.get_stage_stats() == {}
+
+    processor.score_combiner.reset()
+    for segment in segments:
+        timed = processor.match_segment(segment['text'], segment['start_time'])
+        untimed = plain.match_segment(segment['text'], segment['start_time'])
+        assert (timed.slide_id if timed else None) == (untimed.slide_id if untimed else None)
+
+    print("✅ Stage stats recorded, disabled path unaffected")
+
+
+def test_slow_segment_budget():
+    """Test 3: Over-budget segments are counted with their spans"""
+    print("\n" + "="*60)
+    print("TEST 3: Latency Budget")
+    print("="*60)
+
+    timer = StageTimer(budget_ms=100.0)
+    timer.record({'tokenize': 1.0, 'exact': 0.5, 'fuzzy': 150.0, 'semantic': 0.0,
+                  'combine': 0.2, 'total': 151.7})
+    timer.record({'tokenize': 1.0, 'total': 2.0})
+
+    stats = timer.get_stats()
+    assert stats['over_budget'] == 1
+    assert stats['stages']['fuzzy']['count'] == 1
+    assert stats['last_spans_ms'] == {'tokenize': 1.0, 'total': 2.0}
+
+    print("✅ Over-budget segment counted")
+
+
+def test_streaming_export():
+    """Test 4: Result handler exposes stages and feeds MetricsCollector"""
+    print("\n" + "="*60)
+    print("TEST 4: Streaming Export")
+    print("="*60)
+
+    collector = MetricsCollector()
+    handler = StreamingResultHandler(enable_slide_matching=True, metrics_collector=collector)
+    handler.slide_processor, segments = _load_processor()
+    handler.slides_loaded = True
+
+    for segment in segments[:10]:
+        handler.handle_final_result(segment['text'], 0.9, timestamp=segment['start_time'])
+
+    stats = handler.get_matching_stats()
+    assert stats['stages']['stages']['total']['count'] == 10
+
+    summary = collector.get_summary()
+    assert summary['latency']['slide_matching']['fuzzy']['count'] == 10
+
+    # Total latency samples stay bounded (the oldest fall off)
+    handler.match_latencies.extend([-1.0] * MAX_LATENCY_SAMPLES)
+    handler.handle_final_result(segments[0]['text'], 0.9, timestamp=0.0)
+    assert len(handler.match_latencies) == MAX_LATENCY_SAMPLES
+    assert handler.match_latencies[0] == -1.0 and handler.match_latencies[-1] >= 0
+
+    # Sessions of a manager report to the manager's collector
+    manager = StreamingSessionManager(project_id="test-project", client=FakeSpeechClient(),
+                                      metrics_collector=collector)
+    assert manager.create_session("s1", "p1").result_handler.metrics_collector is collector
+
+    print("✅ Stage stats exported")
+
+
+def _benchmark_run(p95_ms: dict, scale: float = 1.0) -> dict:
+    """Synthetic benchmark_deck result with the given per-stage p95 latencies"""
+    return {
+        'build_time_s': 0.5,
+        'latency_ms': {
+            stage: {'p50': p95_ms[stage] * scale * 0.8, 'p95': p95_ms[stage] * scale}
+            for stage in MATCH_STAGES
+        },
+        'rss_mb': {'start': 100.0, 'after_build': 120.0, 'peak': 130.0},
+        'metrics': {'accuracy': 0.9, 'f1_score': 0.9},
+    }
+
+
+def test_benchmark_compare_ignores_noise():
+    """Test 5: Benchmark comparison ignores run-to-run noise, flags real slowdowns"""
+    print("\n" + "="*60)
+    print("TEST 5: Benchmark Baseline Comparison")
+    print("="*60)
+
+    p95 = {'tokenize': 0.2, 'exact': 0.02, 'fuzzy': 1.5, 'semantic': 0.0, 'combine': 0.05, 'total': 1.8}
+
+    def result(*scales, stage=None, factor=1.0):
+        runs = [_benchmark_run(p95, scale) for scale in scales]
+        if stage:
+            for run in runs:
+                run['latency_ms'][stage]['p95'] *= factor
+        return {'decks': {'deck': median_results(runs)}}
+
+    baseline = result(1.0, 0.9, 1.1)
+    assert baseline['decks']['deck']['runs'] == 3
+    assert abs(baseline['decks']['deck']['latency_spread_ms']['fuzzy']['p95'] - 0.3) < 1e-9
+
+    # Identical inputs, and re-runs moving within the measured noise
+    assert compare_results(baseline, baseline) == []
+    assert compare_results(result(1.1, 1.2, 0.95), baseline) == []
+    assert compare_results(baseline, result(1.1, 1.2, 0.95)) == []
+
+    # A 2x slowdown of a ~1ms stage is caught (no flat multi-ms floor)
+    regressions = compare_results(result(1.0, 0.9, 1.1, stage='fuzzy', factor=2.0), baseline)
+    assert regressions == ["deck: fuzzy p95 1.500ms -> 3.000ms (+100%)"], regressions
+
+    # Noisy runs widen that stage's floor instead of being flagged
+    noisy = result(1.6, 2.4, 1.0)
+    assert compare_results(noisy, baseline) == []
+
+    # Baselines without spreads fall back to tolerance and min_latency_ms
+    del baseline['decks']['deck']['latency_spread_ms']
+    assert compare_results(result(1.0, stage='total', factor=1.3), baseline) == []
+    assert len(compare_results(result(1.0, stage='total', factor=2.0), baseline)) == 1
+
+    print(f"✅ Noise ignored; flagged: {regressions[0]}")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("STAGE TIMING TESTS")
+    print("="*60)
+
+    try:
+        test_latency_histogram()
+        test_processor_stage_stats()
+        test_slow_segment_budget()
+        test_streaming_export()
+        test_benchmark_compare_ignores_noise()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
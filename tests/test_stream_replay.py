@@ -0,0 +1,173 @@
+"""
+Test Stream Replay
+
+Tests that a stream failing mid-utterance is restarted with recent audio
+replayed from the session ring, that results stay on one monotonic audio
+clock without duplicated words, and that unrecoverable sessions still
+end in ERROR.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.streaming.session_manager import StreamingSessionManager, SessionStatus
+from tests.fake_recognizer import FakeSpeechClient
+
+
+SPEECH = (3000 * np.sin(np.arange(1600) / 5)).astype(np.int16).tobytes()
+SILENCE = b'\x00' * 3200
+
+# 1.5s speech / 0.7s silence, 5s of audio
+CHUNKS = [SPEECH if idx % 22 < 15 else SILENCE for idx in range(50)]
+
+
+def run_session(client: FakeSpeechClient, **manager_options):
+    """Stream CHUNKS through one session and close it"""
+    manager = StreamingSessionManager(
+        project_id="test-project", client=client, audio_queue_ms=10000, **manager_options
+    )
+    session = manager.create_session("s1", "p1")
+    manager.start_session("s1")
+
+    refused = 0
+    for chunk in CHUNKS:
+        if not manager.send_audio_chunk("s1", chunk):
+            refused += 1
+        time.sleep(0.005)
+
+    status = session.status
+    if status == SessionStatus.ACTIVE:
+        manager.close_session("s1")
+    words = [w for r in session.result_handler.get_final_results() for w in r.words]
+    return session, status, refused, words
+
+
+def test_restart_replays_boundary_words():
+    """Test 1: Words pending when the stream fails are recognized again"""
+    print("\n" + "="*60)
+    print("TEST 1: Restart With Replay")
+    print("="*60)
+
+    _, _, _, baseline = run_session(FakeSpeechClient())
+
+    # Fails 1.0s in, in the middle of the first utterance
+    client = FakeSpeechClient(fail_after_s=1.0)
+    session, status, refused, words = run_session(client, replay_ms=3000)
+    assert status == SessionStatus.ACTIVE and refused == 0
+    assert session.stream_restarts == 1 and len(client.calls) == 2
+    assert len(words) == len(baseline), (len(words), len(baseline))
+
+    _, _, _, lost = run_session(FakeSpeechClient(fail_after_s=1.0), replay_ms=0)
+    assert len(lost) < len(baseline)
+
+    print(f"✅ {len(words)}/{len(baseline)} words with replay, "
+          f"{len(lost)}/{len(baseline)} without")
+
+
+def test_monotonic_clock_and_dedupe():
+    """Test 2: Replayed audio is shifted onto the session clock and de-duplicated"""
+    print("\n" + "="*60)
+    print("TEST 2: Audio Clock and De-Duplication")
+    print("="*60)
+
+    # Fails at 2.5s, after the first utterance was finalized
+    client = FakeSpeechClient(fail_after_s=2.5)
+    session, _, _, words = run_session(client, replay_ms=2000)
+
+    assert session.stream_restarts == 1
+    assert session.replayed_ms >= 2000
+    first_call, second_call = client.calls
+    # The new stream started 2s before the failure point: nothing was lost
+    new_start_ms = len(CHUNKS) * 100 - second_call.model.audio_bytes / 32
+    assert new_start_ms <= 2500 - 2000 + 100  # one chunk may be in flight
+    assert first_call.model.audio_bytes == 2500 * 32
+
+    for prev, word in zip(words, words[1:]):
+        assert word["start_time"] >= prev["end_time"] - 1e-6, (prev, word)
+    assert words[-1]["end_time"] <= len(CHUNKS) * 0.1 + 1e-6
+    assert session.duplicate_words > 0
+
+    print(f"✅ Replayed {session.replayed_ms:.0f}ms; "
+          f"{session.duplicate_words} replayed words removed")
+
+
+def test_restart_limit():
+    """Test 3: Without restarts left, a failed stream ends the session"""
+    print("\n" + "="*60)
+    print("TEST 3: Restart Limit")
+    print("="*60)
+
+    client = FakeSpeechClient(fail_after_s=1.0)
+    session, status, refused, _ = run_session(client, max_stream_restarts=0)
+
+    assert status == SessionStatus.ERROR
+    assert session.stream_restarts == 0 and len(client.calls) == 1
+    assert refused > 0
+
+    print(f"✅ Session in ERROR; {refused} chunks refused")
+
+
+def test_restart_at_default_queue_size():
+    """Test 4: Replay longer than the default 2s queue is neither dropped nor blocking"""
+    print("\n" + "="*60)
+    print("TEST 4: Restart at Default Queue Size")
+    print("="*60)
+
+    def run(client, **manager_options):
+        manager = StreamingSessionManager(project_id="test-project", client=client, **manager_options)
+        session = manager.create_session("s1", "p1")
+        manager.start_session("s1")
+        slowest = 0.0
+        for chunk in CHUNKS:
+            start = time.monotonic()
+            manager.send_audio_chunk("s1", chunk)
+            slowest = max(slowest, time.monotonic() - start)
+            time.sleep(0.005)
+        manager.close_session("s1")
+        words = [(w["word"], w["start_time"]) for r in session.result_handler.get_final_results() for w in r.words]
+        return session, words, slowest
+
+    for policy in ("drop_oldest", "block"):
+        _, baseline, _ = run(FakeSpeechClient(), backpressure_policy=policy)
+        # Default replay_ms (3000) > default audio_queue_ms (2000)
+        session, words, slowest = run(FakeSpeechClient(fail_after_s=2.5), backpressure_policy=policy)
+        assert session.stream_restarts == 1
+        assert session.audio_queue.dropped_chunks == 0
+        assert words == baseline, (policy, words, baseline)
+        assert slowest < 0.5, f"send_audio_chunk stalled {slowest:.1f}s ({policy})"
+        print(f"  {policy}: {len(words)} words at the baseline offsets, slowest send {slowest * 1000:.0f}ms")
+
+    print("✅ Full replay admitted; offsets unchanged; no blocking under renewal_lock")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("STREAM REPLAY TESTS")
+    print("="*60)
+
+    try:
+        test_restart_replays_boundary_words()
+        test_monotonic_clock_and_dedupe()
+        test_restart_limit()
+        test_restart_at_default_queue_size()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
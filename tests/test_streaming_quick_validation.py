@@ -5,6 +5,7 @@ Tests handler initialization and basic structure without requiring test PDFs.
 """
 
 import sys
+from collections import deque
 from pathlib import Path
 
 # Add src to path
@@ -39,7 +40,7 @@ def test_basic_functionality():
     assert handler.enable_slide_matching
     assert handler.slide_processor is None  # Not loaded yet
     assert not handler.slides_loaded  # Not loaded yet
-    assert isinstance(handler.match_latencies, list)
+    assert isinstance(handler.match_latencies, deque)
     assert len(handler.match_latencies) == 0
     print("   ✅ Handler initialized (slide matching enabled)")
     
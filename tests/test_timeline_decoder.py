@@ -0,0 +1,170 @@
+"""
+Test Viterbi Timeline Decoder
+
+Tests offline slide path decoding over segment x slide score matrices.
+"""
+
+import sys
+import json
+import time
+import itertools
+import numpy as np
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.matching import ViterbiDecoder
+from src.slide_processing import SlideProcessor
+
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'test_presentations'
+
+
+def test_viterbi_matches_brute_force():
+    """Test 1: Viterbi path is the best path under the transition model"""
+    print("\n" + "="*60)
+    print("TEST 1: Viterbi vs Brute Force")
+    print("="*60)
+
+    decoder = ViterbiDecoder(forward_penalty=0.5, backward_penalty=1.0, jump_penalty=3.0)
+    rng = np.random.default_rng(42)
+
+    for _ in range(100):
+        n_segments = int(rng.integers(1, 6))
+        n_slides = int(rng.integers(1, 5))
+        scores = rng.random((n_segments, n_slides)) * 3.0
+
+        path, path_score = decoder.decode(scores)
+        best_score = max(
+            decoder.score_path(scores, list(candidate))
+            for candidate in itertools.product(range(n_slides), repeat=n_segments)
+        )
+
+        assert len(path) == n_segments
+        assert abs(path_score - best_score) < 1e-9, "Viterbi must find the optimal path"
+        assert abs(decoder.score_path(scores, list(path)) - path_score) < 1e-9
+
+    print("✅ Viterbi path optimal on 100 random matrices")
+
+
+def test_viterbi_prefers_adjacent_moves():
+    """Test 2: A single noisy segment does not cause a jump"""
+    print("\n" + "="*60)
+    print("TEST 2: Transition Penalties")
+    print("="*60)
+
+    decoder = ViterbiDecoder()
+
+    # Segments 0-2 on slide 0, segment 3 noisy towards slide 4, 4-6 on slide 1
+    scores = np.zeros((7, 5))
+    scores[0:3, 0] = 3.0
+    scores[3, 4] = 2.0
+    scores[4:7, 1] = 3.0
+
+    path = decoder.decode_slide_ids(scores, [1, 2, 3, 4, 5])
+    print(f"   Decoded path: {path}")
+
+    assert 5 not in path, "Isolated jump should be smoothed away"
+    assert path[0] == 1 and path[-1] == 2
+    assert path == sorted(path), "Path should only move forward"
+
+    print("✅ Noisy segment smoothed, forward move kept")
+
+
+def test_viterbi_large_matrix_performance():
+    """Test 3: 2,000 segments x 300 slides decodes well under a second"""
+    print("\n" + "="*60)
+    print("TEST 3: Viterbi Performance")
+    print("="*60)
+
+    decoder = ViterbiDecoder()
+    scores = np.random.default_rng(0).random((2000, 300)) * 5.0
+
+    start = time.perf_counter()
+    path, _ = decoder.decode(scores)
+    elapsed = time.perf_counter() - start
+
+    print(f"   Decoded 2000 x 300 in {elapsed * 1000:.1f}ms")
+
+    assert len(path) == 2000
+    assert elapsed < 1.0, "Decode should take well under a second"
+
+    print("✅ Large matrix decoded in time")
+
+
+def test_viterbi_transcript_timeline():
+    """Test 4: Viterbi decoding produces generate_timeline-compatible output"""
+    print("\n" + "="*60)
+    print("TEST 4: Viterbi Transcript Matching")
+    print("="*60)
+
+    with open(FIXTURES_DIR / 'machine_learning_intro.json', encoding='utf-8') as f:
+        presentation = json.load(f)
+
+    processor = SlideProcessor(use_embeddings=False)
+    stats = processor.process_slides(presentation['slides'])
+    segments = presentation['transcript_segments']
+
+    assert stats['slide_count'] == len(presentation['slides'])
+
+    matched = processor.match_transcript(segments, decoder='viterbi')
+
+    assert len(matched) == len(segments)
+    for segment in matched:
+        for key in ('slide_id', 'score', 'confidence', 'matched_keywords', 'start_time', 'end_time'):
+            assert key in segment
+
+    correct = sum(1 for s in matched if s['slide_id'] == s['expected_slide'])
+    accuracy = correct / len(matched)
+    print(f"   Viterbi accuracy: {accuracy:.1%}")
+
+    timeline = processor.generate_timeline(matched)
+    print(f"   Timeline entries: {len(timeline)}")
+
+    assert timeline, "Timeline should not be empty"
+    assert timeline[0]['start_time'] == segments[0]['start_time']
+    assert timeline[-1]['end_time'] == segments[-1]['end_time']
+    assert accuracy >= 0.8
+
+    # Decoding is offline: greedy temporal state must be untouched
+    assert processor.score_combiner.current_slide_id is None
+
+    # Segments no slide scores for stay unmatched, as with the greedy decoder
+    off_topic = dict(segments[3], text="えーと、少々お待ちください。")
+    mixed = segments[:3] + [off_topic] + segments[4:8]
+    viterbi = processor.match_transcript(mixed, decoder='viterbi')
+    processor.score_combiner.reset()
+    greedy = processor.match_transcript(mixed, decoder='greedy')
+    assert viterbi[3]['slide_id'] is None and greedy[3]['slide_id'] is None
+    assert viterbi[3]['score'] == 0.0 and viterbi[3]['matched_keywords'] == []
+    assert [s['slide_id'] is None for s in viterbi] == [s['slide_id'] is None for s in greedy]
+
+    print("✅ Viterbi timeline generated")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("VITERBI TIMELINE DECODER TESTS")
+    print("="*60)
+
+    try:
+        test_viterbi_matches_brute_force()
+        test_viterbi_prefers_adjacent_moves()
+        test_viterbi_large_matrix_performance()
+        test_viterbi_transcript_timeline()
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
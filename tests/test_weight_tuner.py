@@ -0,0 +1,137 @@
+"""
+Test Matching Weight Tuner
+
+Tests that replaying cached raw scores reproduces the matching pipeline.
+"""
+
+import sys
+import json
+import numpy as np
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.slide_processing import SlideProcessor
+from src.slide_processing.weight_tuner import (
+    DeckScores,
+    WeightTuner,
+    build_grid,
+    load_or_compute_deck_scores,
+    replay_smoothing,
+)
+
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'test_presentations'
+FIXTURE_NAMES = ('machine_learning_intro', 'business_strategy', 'python_tutorial')
+
+
+def _random_configs(count: int, seed: int = 7) -> list:
+    rng = np.random.default_rng(seed)
+    configs = []
+    for _ in range(count):
+        configs.append({
+            'exact_weight': float(rng.uniform(0.2, 2.0)),
+            'fuzzy_weight': float(rng.uniform(0.0, 1.5)),
+            'semantic_weight': 0.7,
+            'title_boost': 2.0,
+            'temporal_boost': float(rng.uniform(0.0, 1.0)),
+            'min_score_threshold': float(rng.uniform(0.0, 3.0)),
+            'switch_multiplier': float(rng.uniform(0.8, 2.0)),
+        })
+    return configs
+
+
+def test_replay_matches_pipeline(tmp_path):
+    """Test 1: Vectorized replay equals match_transcript for every config"""
+    print("\n" + "="*60)
+    print("TEST 1: Replay vs Pipeline")
+    print("="*60)
+
+    configs = _random_configs(12)
+
+    for name in FIXTURE_NAMES:
+        fixture_path = FIXTURES_DIR / f'{name}.json'
+        with open(fixture_path, encoding='utf-8') as f:
+            presentation = json.load(f)
+
+        deck = load_or_compute_deck_scores(str(fixture_path), str(tmp_path))
+        predictions = replay_smoothing(deck, configs)
+
+        for idx, config in enumerate(configs):
+            processor = SlideProcessor(
+                use_embeddings=False,
+                **config
+            )
+            processor.process_slides(presentation['slides'])
+            matched = processor.match_transcript(presentation['transcript_segments'])
+            expected = [segment['slide_id'] or 0 for segment in matched]
+
+            assert predictions[idx].tolist() == expected, f"{name}: config {idx} differs"
+
+        print(f"   {name}: {len(configs)} configs identical")
+
+    print("✅ Replay reproduces pipeline results")
+
+
+def test_cache_and_tuner(tmp_path):
+    """Test 2: Scores are cached and the grid is ranked"""
+    print("\n" + "="*60)
+    print("TEST 2: Cache and Grid Search")
+    print("="*60)
+
+    fixture_path = str(FIXTURES_DIR / 'python_tutorial.json')
+    deck = load_or_compute_deck_scores(fixture_path, str(tmp_path))
+
+    cache_files = list(tmp_path.glob('*.npz'))
+    assert len(cache_files) == 1
+
+    cached = DeckScores.load(str(cache_files[0]))
+    assert np.array_equal(cached.exact, deck.exact)
+    assert np.array_equal(cached.candidates, deck.candidates)
+
+    configs = build_grid(
+        exact_weight=[0.5, 1.0, 1.5],
+        temporal_boost=[0.05, 0.5],
+        min_score_threshold=[0.5, 1.5],
+    )
+    assert len(configs) == 12
+
+    results = WeightTuner([deck], chunk_size=5).evaluate(configs)
+
+    assert len(results) == 12
+    accuracies = [r['accuracy'] for r in results]
+    assert accuracies == sorted(accuracies, reverse=True)
+    assert all(0.0 <= r['f1_score'] <= 1.0 for r in results)
+
+    print(f"   Best: {results[0]['accuracy']:.1%} with {results[0]['params']}")
+    print("✅ Grid evaluated and ranked")
+
+
+def main():
+    """Run all tests"""
+    import tempfile
+
+    print("\n" + "="*60)
+    print("WEIGHT TUNER TESTS")
+    print("="*60)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            test_replay_matches_pipeline(Path(tmp))
+        with tempfile.TemporaryDirectory() as tmp:
+            test_cache_and_tuner(Path(tmp))
+
+        print("\n" + "="*60)
+        print("✅ ALL TESTS PASSED")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()